@@ -6,7 +6,10 @@ from .usage_visualizer import (
     DEFAULT_SCREEN_HINTS,
     HeatmapData,
     MissingDependencyError,
+    UsageAggregate,
+    UsageAggregator,
     infer_screen,
+    iter_log_rows,
     load_log_rows,
     parse_timestamp,
     visualize_usage,
@@ -18,7 +21,10 @@ __all__ = [
     "DEFAULT_SCREEN_HINTS",
     "HeatmapData",
     "MissingDependencyError",
+    "UsageAggregate",
+    "UsageAggregator",
     "infer_screen",
+    "iter_log_rows",
     "load_log_rows",
     "parse_timestamp",
     "visualize_usage",
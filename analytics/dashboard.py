@@ -0,0 +1,230 @@
+"""Tablero de uso a partir de varios archivos de logs (rotados o de varios usuarios).
+
+Uso:
+    python -m analytics.dashboard "external drive/logs.csv" "external drive/logs.csv.1"
+    python -m analytics.dashboard logs/*/logs.csv --json tablero.json --output tablero.png
+
+Cada archivo se recorre una sola vez con ``UsageAggregator``. Las filas se
+asignan a un usuario con la columna ``--user-column`` si existe; si no, con
+el nombre del archivo sin sufijos de rotación (``logs.csv.1`` pertenece al
+mismo usuario que ``logs.csv``) o, si es el genérico ``logs``, con la carpeta
+que lo contiene. El tiempo por pantalla se calcula por usuario, combinando
+sus archivos como tramos ya ordenados, y luego se suma en el total.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, TextIO, Tuple
+
+
+def _ensure_repo_root_on_path() -> None:
+    repo_root = Path(__file__).resolve().parents[1]
+    if str(repo_root) not in sys.path:
+        sys.path.insert(0, str(repo_root))
+
+
+_ensure_repo_root_on_path()
+
+from analytics.usage_visualizer import (DEFAULT_SCREEN_DIMENSIONS,  # noqa: E402
+                                        DEFAULT_SCREEN_HINTS,
+                                        MissingDependencyError,
+                                        UsageAggregate, UsageAggregator,
+                                        iter_log_rows, prepare_interpretations,
+                                        render_heatmaps)
+
+DEFAULT_USER_COLUMN = "usuario"
+_ROTATION_SUFFIX = re.compile(r"(\.csv)(?:[._-][0-9][0-9_.:-]*)?$", re.IGNORECASE)
+_GENERIC_STEMS = {"logs", "log", "bitacora"}
+
+
+def source_label(path: str | Path) -> str:
+    """Usuario por defecto de un archivo: su nombre sin sufijos de rotación."""
+
+    path = Path(path)
+    base = _ROTATION_SUFFIX.sub(r"\1", path.name)
+    stem = base[:-4] if base.lower().endswith(".csv") else base
+    if stem.lower() in _GENERIC_STEMS and path.parent.name:
+        return path.parent.name
+    return stem or path.name
+
+
+@dataclass
+class Dashboard:
+    users: Dict[str, UsageAggregate]
+    total: UsageAggregate
+    files: List[str] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    def to_dict(self, top: int = 10) -> Dict[str, object]:
+        def _summary(aggregate: UsageAggregate) -> Dict[str, object]:
+            return {
+                "events": aggregate.total_events,
+                "validation_share": round(aggregate.validation_share, 4),
+                "screens": dict(aggregate.screen_counts.most_common()),
+                "top_widgets": dict(aggregate.widget_counts.most_common(top)),
+                "time_by_screen_seconds": {
+                    screen: round(seconds, 1)
+                    for screen, seconds in sorted(aggregate.time_spent_seconds.items(), key=lambda item: -item[1])
+                },
+                "clicks_by_screen": {heatmap.screen: heatmap.count for heatmap in aggregate.heatmaps},
+            }
+
+        return {
+            "files": self.files,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "total": _summary(self.total),
+            "users": {user: _summary(aggregate) for user, aggregate in sorted(self.users.items())},
+        }
+
+
+def build_dashboard(
+    log_paths: Sequence[str | Path],
+    *,
+    user_column: Optional[str] = DEFAULT_USER_COLUMN,
+    screen_hints: Dict[str, Sequence[str]] | None = None,
+    screen_dimensions: Tuple[int, int] = DEFAULT_SCREEN_DIMENSIONS,
+) -> Dashboard:
+    start = time.perf_counter()
+    hints = screen_hints or DEFAULT_SCREEN_HINTS
+    per_user: Dict[str, UsageAggregator] = {}
+    for log_path in log_paths:
+        fallback = source_label(log_path)
+        for row in iter_log_rows(log_path):
+            user = ((row.get(user_column) or "").strip() if user_column else "") or fallback
+            aggregator = per_user.get(user)
+            if aggregator is None:
+                aggregator = per_user[user] = UsageAggregator(hints, screen_dimensions)
+            aggregator.add(row)
+
+    total = UsageAggregator(hints, screen_dimensions)
+    users: Dict[str, UsageAggregate] = {}
+    for user, aggregator in per_user.items():
+        users[user] = aggregator.result()
+        total.merge(aggregator, time_spent=users[user].time_spent_seconds)
+    return Dashboard(
+        users=users,
+        total=total.result(),
+        files=[str(path) for path in log_paths],
+        elapsed_seconds=time.perf_counter() - start,
+    )
+
+
+def format_dashboard(dashboard: Dashboard, top: int = 5) -> List[str]:
+    total = dashboard.total
+    lines = [
+        f"Archivos: {len(dashboard.files)} · usuarios: {len(dashboard.users)} · eventos: {total.total_events}"
+        f" · validaciones: {total.validation_share:.1%} · {dashboard.elapsed_seconds:.2f} s",
+    ]
+    lines.extend(
+        prepare_interpretations(total.screen_counts, total.widget_counts, total.validation_share, total.time_spent_seconds)
+    )
+    lines.append("")
+    lines.append(f"{'usuario':20} {'eventos':>9} {'valid.':>7}  pantallas principales")
+    for user, aggregate in sorted(dashboard.users.items(), key=lambda item: -item[1].total_events):
+        screens = ", ".join(f"{screen} ({count})" for screen, count in aggregate.screen_counts.most_common(top))
+        lines.append(f"{user[:20]:20} {aggregate.total_events:>9} {aggregate.validation_share:>7.1%}  {screens}")
+    return lines
+
+
+def render_dashboard(dashboard: Dashboard, output_path: str | Path, screen_dimensions: Tuple[int, int]) -> Path:
+    try:
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError as exc:
+        raise MissingDependencyError(
+            "Se requiere matplotlib para generar visualizaciones. Instale matplotlib>=3.7."
+        ) from exc
+
+    # Los mapas de calor van en una imagen aparte: <salida>_heatmaps.<ext>.
+    image_path = Path(output_path)
+    heatmap_fig = render_heatmaps(plt, dashboard.total.heatmaps, screen_dimensions)
+    heatmap_fig.savefig(image_path.with_name(f"{image_path.stem}_heatmaps{image_path.suffix}"), bbox_inches="tight")
+    plt.close(heatmap_fig)
+
+    users = sorted(dashboard.users, key=lambda user: -dashboard.users[user].total_events)
+    screens = [screen for screen, _count in dashboard.total.screen_counts.most_common()]
+    fig, (events_ax, time_ax) = plt.subplots(1, 2, figsize=(14, max(4, 0.4 * len(users) + 2)))
+    offsets = [0] * len(users)
+    for screen in screens:
+        values = [dashboard.users[user].screen_counts.get(screen, 0) for user in users]
+        events_ax.barh(users, values, left=offsets, label=screen)
+        offsets = [offset + value for offset, value in zip(offsets, values)]
+    events_ax.set_title("Eventos por usuario y pantalla")
+    events_ax.invert_yaxis()
+    events_ax.legend(fontsize="small", loc="lower right")
+    time_items = sorted(dashboard.total.time_spent_seconds.items(), key=lambda item: item[1])
+    time_ax.barh([screen for screen, _ in time_items], [seconds / 3600 for _, seconds in time_items], color="#1f4e79")
+    time_ax.set_title("Horas acumuladas por pantalla")
+    fig.tight_layout()
+    fig.savefig(image_path, bbox_inches="tight")
+    plt.close(fig)
+    return image_path
+
+
+def is_log_file(path: str | Path) -> bool:
+    """``True`` para ``logs.csv`` (o ``log``/``bitacora``) y sus rotaciones."""
+
+    base = _ROTATION_SUFFIX.sub(r"\1", Path(path).name)
+    return base.lower().endswith(".csv") and base[:-4].lower() in _GENERIC_STEMS
+
+
+def _expand(paths: Iterable[str]) -> List[Path]:
+    """Archivos indicados más los logs de cada carpeta, del más antiguo al más nuevo.
+
+    En una carpeta solo se toman los nombres de log (no otros CSV exportados)
+    y se ordenan por fecha de modificación para que las rotaciones lleguen
+    en orden cronológico.
+    """
+
+    expanded: List[Path] = []
+    for raw in paths:
+        path = Path(raw)
+        if path.is_dir():
+            found = [candidate for candidate in path.rglob("*.csv*") if candidate.is_file() and is_log_file(candidate)]
+            expanded.extend(sorted(found, key=lambda candidate: (candidate.stat().st_mtime, str(candidate))))
+        else:
+            expanded.append(path)
+    return expanded
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Tablero de uso a partir de uno o varios logs.csv.")
+    parser.add_argument("logs", nargs="+", help="Archivos de logs o carpetas que los contienen.")
+    parser.add_argument("--user-column", default=DEFAULT_USER_COLUMN, help="Columna con el usuario, si existe.")
+    parser.add_argument("--json", dest="json_path", type=Path, default=None, help="Escribe el resumen en JSON.")
+    parser.add_argument("--output", type=Path, default=None, help="Imagen del tablero (requiere matplotlib).")
+    parser.add_argument("--width", type=int, default=DEFAULT_SCREEN_DIMENSIONS[0])
+    parser.add_argument("--height", type=int, default=DEFAULT_SCREEN_DIMENSIONS[1])
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None, stream: TextIO = sys.stdout) -> int:
+    args = parse_args(argv)
+    paths = _expand(args.logs)
+    missing = [str(path) for path in paths if not path.exists()]
+    if missing or not paths:
+        print(f"No se encontraron los logs: {', '.join(missing) or ', '.join(args.logs)}", file=sys.stderr)
+        return 2
+    dimensions = (args.width, args.height)
+    dashboard = build_dashboard(paths, user_column=args.user_column, screen_dimensions=dimensions)
+    for line in format_dashboard(dashboard):
+        print(line, file=stream)
+    if args.json_path:
+        args.json_path.parent.mkdir(parents=True, exist_ok=True)
+        args.json_path.write_text(json.dumps(dashboard.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
+    if args.output:
+        print(f"Tablero guardado en {render_dashboard(dashboard, args.output, dimensions)}", file=stream)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
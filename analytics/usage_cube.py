@@ -0,0 +1,596 @@
+"""Cubo de uso pre-agregado por día, usuario y pantalla.
+
+Cada ejecución de ``visualize_usage`` recorría todo ``logs.csv``. El cubo
+guarda (por defecto ``usage_cube.sqlite3`` junto al log; la aplicación usa
+una carpeta local de cada equipo para no escribir SQLite en la unidad
+compartida) una celda por ``(día, usuario, pantalla)`` con los eventos, las
+validaciones, los clics, los segundos en pantalla y la grilla del mapa de
+calor como arreglo compacto de enteros, más los conteos por widget. Los
+reportes de cualquier rango de fechas se calculan sumando celdas; las filas
+crudas solo se vuelven a leer para el detalle (``drill_down``).
+
+El cubo se actualiza por compactación incremental: ``compact`` lee solo los
+bytes que se agregaron al log desde la última vez (el desplazamiento se
+guarda en la misma transacción que las celdas, así que es reanudable y no
+cuenta dos veces). Junto al desplazamiento se guarda una huella del archivo
+(encabezado y primera fila); si el archivo se trunca o rota, aunque el nuevo
+ya supere el desplazamiento, se vuelve a leer desde el inicio. El usuario de cada fila sale de la columna ``usuario`` o, si no
+existe, del nombre del archivo como en ``analytics.dashboard``.
+
+Uso:
+    python -m analytics.usage_cube compact "external drive/logs.csv"
+    python -m analytics.usage_cube report "external drive/logs.csv" --desde 2024-01-01 --hasta 2024-01-31
+    python -m analytics.usage_cube compact "external drive/logs.csv" --carpeta-cubo logs/usage_cube
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import hashlib
+import io
+import json
+import re
+import sqlite3
+import sys
+from array import array
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, MutableMapping, Optional, Sequence, TextIO, Tuple
+
+
+def _ensure_repo_root_on_path() -> None:
+    repo_root = Path(__file__).resolve().parents[1]
+    if str(repo_root) not in sys.path:
+        sys.path.insert(0, str(repo_root))
+
+
+_ensure_repo_root_on_path()
+
+from analytics.dashboard import DEFAULT_USER_COLUMN, source_label  # noqa: E402
+from analytics.usage_visualizer import (DEFAULT_HEATMAP_BIN_SIZE,  # noqa: E402
+                                        DEFAULT_SCREEN_DIMENSIONS,
+                                        DEFAULT_SCREEN_HINTS, AnalyticsReport,
+                                        HeatmapData, MissingDependencyError,
+                                        UsageAggregate, _classifier_for,
+                                        _event_weight, _is_navigation_summary,
+                                        _parse_coords, _timestamp_seconds,
+                                        iter_log_rows, prepare_interpretations,
+                                        render_heatmaps)
+
+CUBE_FILENAME = "usage_cube.sqlite3"
+# Bytes del log que se procesan por transacción durante la compactación.
+COMPACT_CHUNK_BYTES = 4 * 1024 * 1024
+_NO_DAY = ""
+_WIDGET_MAX_CHARS = 120
+_EPOCH = datetime(1970, 1, 1)
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    """
+    CREATE TABLE IF NOT EXISTS cells (
+        day TEXT NOT NULL,
+        user TEXT NOT NULL,
+        screen TEXT NOT NULL,
+        events INTEGER NOT NULL DEFAULT 0,
+        validations INTEGER NOT NULL DEFAULT 0,
+        clicks INTEGER NOT NULL DEFAULT 0,
+        seconds REAL NOT NULL DEFAULT 0,
+        grid BLOB,
+        PRIMARY KEY (day, user, screen)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS widgets (
+        day TEXT NOT NULL,
+        user TEXT NOT NULL,
+        widget TEXT NOT NULL,
+        events INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (day, user, widget)
+    )
+    """,
+    "CREATE TABLE IF NOT EXISTS timers (user TEXT PRIMARY KEY, screen TEXT NOT NULL, last_ts REAL NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS sources (path TEXT PRIMARY KEY, offset INTEGER NOT NULL, size INTEGER NOT NULL,"
+    " identity TEXT NOT NULL DEFAULT '')",
+)
+
+
+def usage_cube_path(log_path: str | Path, cube_dir: str | Path | None = None) -> Path:
+    """Ruta del cubo de ``log_path``.
+
+    Sin ``cube_dir`` el cubo acompaña al log. Con ``cube_dir`` cada log tiene
+    su propio archivo en esa carpeta, identificado por su ruta absoluta.
+    """
+
+    log_path = Path(log_path)
+    if cube_dir is None:
+        return log_path.with_name(CUBE_FILENAME)
+    digest = hashlib.sha1(str(log_path.resolve()).encode("utf-8")).hexdigest()[:12]
+    label = re.sub(r"[^0-9A-Za-z._-]+", "_", source_label(log_path)).strip("._") or "logs"
+    return Path(cube_dir) / f"{label}-{digest}.sqlite3"
+
+
+def _file_identity(header: bytes, first_row: bytes) -> str:
+    """Huella del log: encabezado y primera fila completa, que no cambian al anexar."""
+
+    if not first_row.endswith(b"\n"):
+        first_row = b""
+    return hashlib.sha1(header + first_row).hexdigest()[:16]
+
+
+def _read_complete_records(handle, limit: int) -> bytes:
+    """Lee filas CSV completas desde la posición actual hasta reunir ``limit`` bytes.
+
+    ``old_value`` y ``new_value`` pueden traer saltos de línea entre comillas,
+    así que una fila solo termina en un salto con un número par de comillas
+    acumuladas. La fila a medio escribir del final no se incluye.
+    """
+
+    data = bytearray()
+    record = bytearray()
+    quotes = 0
+    while len(data) < limit:
+        line = handle.readline()
+        if not line.endswith(b"\n"):
+            break
+        record += line
+        quotes += line.count(b'"')
+        if quotes % 2 == 0:
+            data += record
+            record.clear()
+            quotes = 0
+    return bytes(data)
+
+
+def _day_of(seconds: float) -> str:
+    return (_EPOCH + timedelta(seconds=seconds)).date().isoformat()
+
+
+@dataclass
+class _Cell:
+    events: int = 0
+    validations: int = 0
+    clicks: int = 0
+    seconds: float = 0.0
+    grid: Optional[array] = None
+
+
+@dataclass
+class _Batch:
+    """Deltas de un bloque de filas antes de sumarlos a la base."""
+
+    cells: Dict[Tuple[str, str, str], _Cell] = field(default_factory=lambda: defaultdict(_Cell))
+    widgets: Counter = field(default_factory=Counter)
+    timers: Dict[str, Tuple[str, float]] = field(default_factory=dict)
+
+
+class UsageCube:
+    """Almacén SQLite de métricas de uso agregadas."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        screen_hints: Dict[str, Sequence[str]] | None = None,
+        screen_dimensions: Tuple[int, int] = DEFAULT_SCREEN_DIMENSIONS,
+        bin_size: int = DEFAULT_HEATMAP_BIN_SIZE,
+    ) -> None:
+        self.path = Path(path)
+        self.classifier = _classifier_for(screen_hints or DEFAULT_SCREEN_HINTS)
+        self.screen_dimensions = screen_dimensions
+        self.bin_size = bin_size
+        self.cols = max(1, -(-screen_dimensions[0] // bin_size))
+        self.rows = max(1, -(-screen_dimensions[1] // bin_size))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(self.path), timeout=30, isolation_level=None)
+        for statement in _SCHEMA:
+            self._connection.execute(statement)
+        columns = {row[1] for row in self._connection.execute("PRAGMA table_info(sources)")}
+        if "identity" not in columns:
+            self._connection.execute("ALTER TABLE sources ADD COLUMN identity TEXT NOT NULL DEFAULT ''")
+        self._check_layout()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> "UsageCube":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    def _check_layout(self) -> None:
+        layout = f"{self.screen_dimensions[0]}x{self.screen_dimensions[1]}/{self.bin_size}"
+        row = self._connection.execute("SELECT value FROM meta WHERE key = 'layout'").fetchone()
+        if row is None:
+            self._connection.execute("INSERT INTO meta (key, value) VALUES ('layout', ?)", (layout,))
+        elif row[0] != layout:
+            raise ValueError(f"El cubo {self.path} usa la grilla {row[0]}, no {layout}.")
+
+    # ------------------------------------------------------------------
+    # Ingesta
+    def _empty_grid(self) -> array:
+        return array("I", bytes(4 * self.rows * self.cols))
+
+    def _add_rows(self, batch: _Batch, rows: Iterable[MutableMapping[str, str]], default_user: str,
+                  user_column: Optional[str], timers: Dict[str, Tuple[str, float]]) -> None:
+        for row in rows:
+            weight = _event_weight(row)
+            if not weight:
+                continue
+            user = ((row.get(user_column) or "").strip() if user_column else "") or default_user
+            screen = self.classifier.classify(row)
+            ts = _timestamp_seconds(row.get("timestamp"))
+            day = _day_of(ts) if ts is not None else _NO_DAY
+            cell = batch.cells[(day, user, screen)]
+            cell.events += weight
+            if row.get("tipo") == "validacion":
+                cell.validations += weight
+            widget = (row.get("widget_id") or row.get("mensaje") or "desconocido").strip()[:_WIDGET_MAX_CHARS]
+            batch.widgets[(day, user, widget)] += weight
+            coords = _parse_coords(row.get("coords"))
+            if coords is not None:
+                cell.clicks += weight
+                x, y = coords
+                if x >= 0 and y >= 0:
+                    if cell.grid is None:
+                        cell.grid = self._empty_grid()
+                    col = min(self.cols - 1, int(x // self.bin_size))
+                    grid_row = min(self.rows - 1, int(y // self.bin_size))
+                    cell.grid[grid_row * self.cols + col] += weight
+            # Las filas resumidas llevan la hora del volcado, no la del evento.
+            if ts is None or _is_navigation_summary(row):
+                continue
+            # Tiempo en pantalla: cada intervalo entre eventos consecutivos del
+            # usuario se acredita a la pantalla abierta, en el día en que empezó.
+            previous = timers.get(user)
+            if previous is None:
+                timers[user] = (screen, ts)
+                continue
+            current_screen, last_ts = previous
+            if ts < last_ts:
+                continue
+            if ts > last_ts:
+                batch.cells[(_day_of(last_ts), user, current_screen)].seconds += ts - last_ts
+            timers[user] = (screen, ts)
+        batch.timers = timers
+
+    def _load_timers(self) -> Dict[str, Tuple[str, float]]:
+        return {
+            user: (screen, last_ts)
+            for user, screen, last_ts in self._connection.execute("SELECT user, screen, last_ts FROM timers")
+        }
+
+    def _apply(self, batch: _Batch) -> None:
+        connection = self._connection
+        for (day, user, screen), delta in batch.cells.items():
+            existing = connection.execute(
+                "SELECT events, validations, clicks, seconds, grid FROM cells WHERE day = ? AND user = ? AND screen = ?",
+                (day, user, screen),
+            ).fetchone()
+            grid = delta.grid
+            if existing is not None:
+                delta.events += existing[0]
+                delta.validations += existing[1]
+                delta.clicks += existing[2]
+                delta.seconds += existing[3]
+                if existing[4]:
+                    stored = array("I")
+                    stored.frombytes(existing[4])
+                    if grid is not None:
+                        for index, value in enumerate(grid):
+                            if value:
+                                stored[index] += value
+                    grid = stored
+            connection.execute(
+                "INSERT OR REPLACE INTO cells (day, user, screen, events, validations, clicks, seconds, grid)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (day, user, screen, delta.events, delta.validations, delta.clicks, delta.seconds,
+                 grid.tobytes() if grid is not None else None),
+            )
+        connection.executemany(
+            "INSERT INTO widgets (day, user, widget, events) VALUES (?, ?, ?, ?)"
+            " ON CONFLICT(day, user, widget) DO UPDATE SET events = events + excluded.events",
+            [(day, user, widget, count) for (day, user, widget), count in batch.widgets.items()],
+        )
+        connection.executemany(
+            "INSERT OR REPLACE INTO timers (user, screen, last_ts) VALUES (?, ?, ?)",
+            [(user, screen, last_ts) for user, (screen, last_ts) in batch.timers.items()],
+        )
+
+    def ingest_rows(
+        self,
+        rows: Iterable[MutableMapping[str, str]],
+        *,
+        user: str,
+        user_column: Optional[str] = DEFAULT_USER_COLUMN,
+    ) -> int:
+        """Suma ``rows`` al cubo en una transacción; devuelve cuántas filas procesó."""
+
+        rows = list(rows)
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            batch = _Batch()
+            self._add_rows(batch, rows, user, user_column, self._load_timers())
+            self._apply(batch)
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
+        return len(rows)
+
+    def compact(
+        self,
+        log_path: str | Path,
+        *,
+        user: Optional[str] = None,
+        user_column: Optional[str] = DEFAULT_USER_COLUMN,
+        chunk_bytes: int = COMPACT_CHUNK_BYTES,
+    ) -> int:
+        """Agrega al cubo las filas nuevas de ``log_path``; devuelve cuántas."""
+
+        path = Path(log_path)
+        if not path.exists():
+            return 0
+        key = str(path.resolve())
+        default_user = user or source_label(path)
+        processed = 0
+        with path.open("rb") as handle:
+            header = handle.readline()
+            fieldnames = next(csv.reader([header.decode("utf-8-sig")]), [])
+            if not fieldnames:
+                return 0
+            identity = _file_identity(header, handle.readline())
+            while True:
+                self._connection.execute("BEGIN IMMEDIATE")
+                try:
+                    size = path.stat().st_size
+                    row = self._connection.execute(
+                        "SELECT offset, identity FROM sources WHERE path = ?", (key,)
+                    ).fetchone()
+                    offset, stored_identity = row if row else (0, "")
+                    # Primera lectura o archivo truncado/rotado. Los cubos
+                    # anteriores a la huella la adoptan sin releer.
+                    if offset < len(header) or offset > size or stored_identity not in ("", identity):
+                        offset = len(header)
+                    handle.seek(offset)
+                    data = _read_complete_records(handle, chunk_bytes)
+                    end = len(data)
+                    if not end:
+                        # Solo queda una fila a medio escribir: se espera a la próxima vez.
+                        self._connection.execute("ROLLBACK")
+                        break
+                    text = data.decode("utf-8", errors="replace")
+                    rows = list(csv.DictReader(io.StringIO(text, newline=""), fieldnames=fieldnames))
+                    batch = _Batch()
+                    self._add_rows(batch, rows, default_user, user_column, self._load_timers())
+                    self._apply(batch)
+                    self._connection.execute(
+                        "INSERT OR REPLACE INTO sources (path, offset, size, identity) VALUES (?, ?, ?, ?)",
+                        (key, offset + end, size, identity),
+                    )
+                except BaseException:
+                    self._connection.execute("ROLLBACK")
+                    raise
+                self._connection.execute("COMMIT")
+                processed += len(rows)
+        return processed
+
+    # ------------------------------------------------------------------
+    # Consultas
+    def _filters(
+        self,
+        start: Optional[date | str],
+        end: Optional[date | str],
+        users: Optional[Sequence[str]],
+    ) -> Tuple[str, List[object]]:
+        clauses: List[str] = []
+        params: List[object] = []
+        if start is not None:
+            clauses.append("day >= ?")
+            params.append(str(start))
+        if end is not None:
+            clauses.append("day <= ? AND day != ''")
+            params.append(str(end))
+        if users:
+            clauses.append(f"user IN ({', '.join('?' for _ in users)})")
+            params.extend(users)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def query(
+        self,
+        start: Optional[date | str] = None,
+        end: Optional[date | str] = None,
+        *,
+        users: Optional[Sequence[str]] = None,
+    ) -> UsageAggregate:
+        """Métricas del rango ``[start, end]`` (días inclusive) sin leer el log."""
+
+        where, params = self._filters(start, end, users)
+        screen_counts: Counter = Counter()
+        time_spent: Dict[str, float] = defaultdict(float)
+        clicks: Counter = Counter()
+        grids: Dict[str, array] = {}
+        validations = 0
+        for screen, events, validation, click_count, seconds, grid in self._connection.execute(
+            f"SELECT screen, events, validations, clicks, seconds, grid FROM cells{where}", params
+        ):
+            if events:
+                screen_counts[screen] += events
+            validations += validation
+            if seconds:
+                time_spent[screen] += seconds
+            if click_count:
+                clicks[screen] += click_count
+            if grid:
+                stored = array("I")
+                stored.frombytes(grid)
+                total = grids.get(screen)
+                if total is None:
+                    grids[screen] = stored
+                else:
+                    for index, value in enumerate(stored):
+                        if value:
+                            total[index] += value
+        widget_counts: Counter = Counter(
+            dict(self._connection.execute(f"SELECT widget, SUM(events) FROM widgets{where} GROUP BY widget", params))
+        )
+        heatmaps = [
+            HeatmapData(
+                screen=screen,
+                coords=[],
+                grid=[list(grids[screen][row * self.cols:(row + 1) * self.cols]) for row in range(self.rows)]
+                if screen in grids
+                else [[0] * self.cols for _ in range(self.rows)],
+                count=count,
+            )
+            for screen, count in clicks.most_common()
+        ]
+        return UsageAggregate(
+            total_events=sum(screen_counts.values()),
+            screen_counts=screen_counts,
+            widget_counts=widget_counts,
+            validation_events=validations,
+            time_spent_seconds=dict(time_spent),
+            heatmaps=heatmaps,
+        )
+
+    def users(self) -> List[str]:
+        return [row[0] for row in self._connection.execute("SELECT DISTINCT user FROM cells ORDER BY user")]
+
+    def days(self) -> List[str]:
+        return [row[0] for row in self._connection.execute("SELECT DISTINCT day FROM cells WHERE day != '' ORDER BY day")]
+
+
+def compact_usage_log(log_path: str | Path, *, cube_dir: str | Path | None = None, **kwargs) -> int:
+    """Compacta ``log_path`` en su cubo (ver ``usage_cube_path``); para tareas de fondo."""
+
+    with UsageCube(usage_cube_path(log_path, cube_dir)) as cube:
+        return cube.compact(log_path, **kwargs)
+
+
+def drill_down(
+    log_paths: Sequence[str | Path],
+    *,
+    day: Optional[date | str] = None,
+    user: Optional[str] = None,
+    screen: Optional[str] = None,
+    user_column: Optional[str] = DEFAULT_USER_COLUMN,
+    screen_hints: Dict[str, Sequence[str]] | None = None,
+) -> Iterator[MutableMapping[str, str]]:
+    """Filas crudas de una celda del cubo; es la única consulta que relee los logs."""
+
+    classifier = _classifier_for(screen_hints or DEFAULT_SCREEN_HINTS)
+    day_prefix = str(day) if day is not None else None
+    for log_path in log_paths:
+        fallback = source_label(log_path)
+        for row in iter_log_rows(log_path):
+            if day_prefix is not None and not (row.get("timestamp") or "").startswith(day_prefix):
+                continue
+            if user is not None:
+                row_user = ((row.get(user_column) or "").strip() if user_column else "") or fallback
+                if row_user != user:
+                    continue
+            if screen is not None and classifier.classify(row) != screen:
+                continue
+            yield row
+
+
+def usage_report_from_cube(
+    cube: UsageCube,
+    start: Optional[date | str] = None,
+    end: Optional[date | str] = None,
+    *,
+    users: Optional[Sequence[str]] = None,
+    output_path: str | Path | None = None,
+) -> AnalyticsReport:
+    """Equivalente de ``visualize_usage`` para un rango, calculado desde el cubo."""
+
+    try:
+        import matplotlib.pyplot as plt
+    except ImportError as exc:
+        raise MissingDependencyError(
+            "Se requiere matplotlib para generar visualizaciones. Instale matplotlib>=3.7."
+        ) from exc
+
+    aggregate = cube.query(start, end, users=users)
+    fig = render_heatmaps(plt, aggregate.heatmaps, cube.screen_dimensions)
+    if output_path:
+        fig.savefig(output_path, bbox_inches="tight")
+    interpretations = prepare_interpretations(
+        aggregate.screen_counts, aggregate.widget_counts, aggregate.validation_share, aggregate.time_spent_seconds
+    )
+    return AnalyticsReport(
+        fig,
+        interpretations,
+        aggregate.screen_counts,
+        aggregate.widget_counts,
+        aggregate.validation_share,
+        aggregate.time_spent_seconds,
+    )
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Cubo de uso pre-agregado junto a logs.csv.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    compact = commands.add_parser("compact", help="Agrega al cubo las filas nuevas de los logs.")
+    compact.add_argument("logs", nargs="+", type=Path)
+    compact.add_argument("--user", default=None, help="Usuario de las filas sin columna 'usuario'.")
+    compact.add_argument("--carpeta-cubo", dest="cube_dir", type=Path, default=None,
+                         help="Carpeta local de los cubos (por defecto, junto a cada log).")
+    report = commands.add_parser("report", help="Resumen de un rango de fechas desde el cubo.")
+    report.add_argument("log", type=Path, help="Log (o cubo .sqlite3) a consultar.")
+    report.add_argument("--desde", default=None, help="Día inicial (AAAA-MM-DD).")
+    report.add_argument("--hasta", default=None, help="Día final (AAAA-MM-DD).")
+    report.add_argument("--usuario", action="append", default=None)
+    report.add_argument("--output", type=Path, default=None, help="Imagen de mapas de calor (requiere matplotlib).")
+    report.add_argument("--carpeta-cubo", dest="cube_dir", type=Path, default=None,
+                        help="Carpeta local de los cubos (por defecto, junto al log).")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None, stream: TextIO = sys.stdout) -> int:
+    args = parse_args(argv)
+    if args.command == "compact":
+        for log_path in args.logs:
+            processed = compact_usage_log(log_path, cube_dir=args.cube_dir, user=args.user)
+            print(f"{log_path}: {processed} filas nuevas en {usage_cube_path(log_path, args.cube_dir)}", file=stream)
+        return 0
+
+    cube_path = args.log if args.log.suffix == ".sqlite3" else usage_cube_path(args.log, args.cube_dir)
+    if not cube_path.exists():
+        print(f"No existe el cubo {cube_path}; ejecute primero 'compact'.", file=sys.stderr)
+        return 2
+    with UsageCube(cube_path) as cube:
+        aggregate = cube.query(args.desde, args.hasta, users=args.usuario)
+        if args.output:
+            usage_report_from_cube(cube, args.desde, args.hasta, users=args.usuario, output_path=args.output)
+    interpretations = prepare_interpretations(
+        aggregate.screen_counts, aggregate.widget_counts, aggregate.validation_share, aggregate.time_spent_seconds
+    )
+    summary = {
+        "events": aggregate.total_events,
+        "validation_share": round(aggregate.validation_share, 4),
+        "screens": dict(aggregate.screen_counts.most_common()),
+        "time_by_screen_seconds": {screen: round(seconds, 1) for screen, seconds in aggregate.time_spent_seconds.items()},
+        "interpretations": interpretations,
+    }
+    json.dump(summary, stream, ensure_ascii=False, indent=2)
+    stream.write("\n")
+    return 0
+
+
+__all__ = [
+    "CUBE_FILENAME",
+    "UsageCube",
+    "compact_usage_log",
+    "drill_down",
+    "usage_cube_path",
+    "usage_report_from_cube",
+]
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,15 +1,40 @@
+"""Mapas de calor, conteos y tiempo por pantalla a partir de ``logs.csv``.
+
+Los registros se procesan en streaming: ``UsageAggregator`` consume las filas
+una a una y solo conserva contadores, las grillas de los mapas de calor, una
+muestra acotada de coordenadas por pantalla y pares compactos
+``(segundos, pantalla)`` para el tiempo por pantalla, así que el
+``logs.csv`` compartido de la unidad externa (millones de filas) no se carga
+como lista de diccionarios.
+"""
+
 from __future__ import annotations
 
 import csv
+import heapq
 import math
+import random
 import re
+from array import array
 from collections import Counter, defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Iterable, List, MutableMapping, Optional, Sequence, Tuple
+from typing import Dict, Iterable, Iterator, List, MutableMapping, Optional, Sequence, Tuple
+
+try:  # NumPy acelera el binning de coordenadas, pero no es obligatorio.
+    import numpy as np
+except ImportError:  # pragma: no cover - depende del entorno
+    np = None
 
 DEFAULT_SCREEN_DIMENSIONS = (1200, 800)
+DEFAULT_HEATMAP_BIN_SIZE = 80
+# Puntos por pantalla que se conservan para dibujar la nube sobre el mapa.
+DEFAULT_COORD_SAMPLE_SIZE = 2000
+_HEATMAP_CHUNK_SIZE = 8192
+_TOKEN_CACHE_LIMIT = 65536
+_TOKEN_SPLIT = re.compile(r"[\s\._\-/]+")
 DEFAULT_SCREEN_HINTS: Dict[str, Sequence[str]] = {
     "clientes": ["cliente"],
     "colaboradores": ["colaborador", "team"],
@@ -42,19 +67,30 @@ class HeatmapData:
     screen: str
     coords: List[Tuple[float, float]]
     grid: List[List[int]]
+    # Total de clics de la pantalla; ``coords`` puede ser solo una muestra.
+    count: int = 0
 
 
 class MissingDependencyError(RuntimeError):
     pass
 
 
-def load_log_rows(log_path: str | Path) -> List[MutableMapping[str, str]]:
+def iter_log_rows(log_path: str | Path) -> Iterator[MutableMapping[str, str]]:
+    """Itera las filas del log sin cargar el archivo completo."""
+
     path = Path(log_path)
     if not path.exists():
         raise FileNotFoundError(f"No se encontró el archivo de logs en {path}")
+    return _read_rows(path)
+
+
+def _read_rows(path: Path) -> Iterator[MutableMapping[str, str]]:
     with path.open(newline="", encoding="utf-8") as csvfile:
-        reader = csv.DictReader(csvfile)
-        return [row for row in reader]
+        yield from csv.DictReader(csvfile)
+
+
+def load_log_rows(log_path: str | Path) -> List[MutableMapping[str, str]]:
+    return list(iter_log_rows(log_path))
 
 
 def _parse_coords(value: str | None) -> Optional[Tuple[float, float]]:
@@ -73,6 +109,30 @@ def _parse_coords(value: str | None) -> Optional[Tuple[float, float]]:
     return x_val, y_val
 
 
+# Filas resumidas que la aplicación escribe al volcar la telemetría de
+# navegación. Su marca de tiempo es la del volcado, no la de los eventos.
+_NAVIGATION_SUMMARY_SUBTYPES = frozenset({"focus_metrics", "click_heatmap", "navigation_summary"})
+
+
+def _is_navigation_summary(row: MutableMapping[str, str]) -> bool:
+    return (row.get("subtipo") or "").strip() in _NAVIGATION_SUMMARY_SUBTYPES
+
+
+def _event_weight(row: MutableMapping[str, str]) -> int:
+    """Cantidad de eventos que representa ``row``.
+
+    En modo compacto las filas resumidas traen el conteo en ``new_value``; sin
+    conteo (modo detallado) repiten eventos ya registrados y valen 0.
+    """
+
+    if not _is_navigation_summary(row):
+        return 1
+    try:
+        return max(0, int(row.get("new_value") or 0))
+    except ValueError:
+        return 0
+
+
 def parse_timestamp(value: str) -> Optional[datetime]:
     try:
         return datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
@@ -82,98 +142,425 @@ def parse_timestamp(value: str) -> Optional[datetime]:
 
 def _tokenize(text: str) -> List[str]:
     sanitized = (text or "").lower()
-    tokens = re.split(r"[\s\._\-/]+", sanitized)
+    tokens = _TOKEN_SPLIT.split(sanitized)
     return [token for token in tokens if token]
 
 
-def infer_screen(row: MutableMapping[str, str], screen_hints: Dict[str, Sequence[str]] | None = None) -> str:
+class ScreenClassifier:
+    """``infer_screen`` con memoización por token.
+
+    Una fila pertenece a la primera pantalla (en el orden de las pistas) con
+    alguna palabra clave que contenga o esté contenida en alguno de sus
+    tokens, así que basta con saber, para cada token, cuál es la primera
+    pantalla que lo reconoce. Ese índice se calcula una vez por token
+    distinto y por ``widget_id`` distinto; los mensajes libres solo pagan la
+    tokenización.
+    """
+
+    def __init__(self, screen_hints: Dict[str, Sequence[str]] | None = None) -> None:
+        hints = screen_hints or DEFAULT_SCREEN_HINTS
+        self.screens: List[str] = list(hints)
+        self._keywords = [
+            (index, keyword.lower()) for index, keywords in enumerate(hints.values()) for keyword in keywords
+        ]
+        self._unmatched = len(self.screens)
+        self._token_cache: Dict[str, int] = {}
+        self._widget_cache: Dict[str, int] = {}
+
+    def _token_screen(self, token: str) -> int:
+        cached = self._token_cache.get(token)
+        if cached is not None:
+            return cached
+        result = self._unmatched
+        for index, keyword in self._keywords:
+            if keyword in token or token in keyword:
+                result = index
+                break
+        if len(self._token_cache) >= _TOKEN_CACHE_LIMIT:
+            self._token_cache.clear()
+        self._token_cache[token] = result
+        return result
+
+    def _text_screen(self, text: str, best: int) -> int:
+        for token in _tokenize(text):
+            best = min(best, self._token_screen(token))
+            if best == 0:
+                break
+        return best
+
+    def screen_index(self, widget_id: str, mensaje: str) -> int:
+        widget_id = widget_id or ""
+        best = self._widget_cache.get(widget_id)
+        if best is None:
+            best = self._text_screen(widget_id, self._unmatched)
+            if len(self._widget_cache) >= _TOKEN_CACHE_LIMIT:
+                self._widget_cache.clear()
+            self._widget_cache[widget_id] = best
+        if best and mensaje:
+            best = self._text_screen(mensaje, best)
+        return best
+
+    def name(self, index: int) -> str:
+        return self.screens[index] if index < self._unmatched else "general"
+
+    def classify(self, row: MutableMapping[str, str]) -> str:
+        return self.name(self.screen_index(row.get("widget_id", ""), row.get("mensaje", "")))
+
+
+_classifiers: Dict[Tuple[Tuple[str, Tuple[str, ...]], ...], ScreenClassifier] = {}
+
+
+def _classifier_for(screen_hints: Dict[str, Sequence[str]] | None) -> ScreenClassifier:
     hints = screen_hints or DEFAULT_SCREEN_HINTS
-    widget_tokens = _tokenize(row.get("widget_id", ""))
-    content_tokens = widget_tokens + _tokenize(row.get("mensaje", ""))
-    for screen, keywords in hints.items():
-        for keyword in keywords:
-            lowered = keyword.lower()
-            if any(lowered in token or token in lowered for token in widget_tokens):
-                return screen
-            if any(lowered in token or token in lowered for token in content_tokens):
-                return screen
-    return "general"
+    key = tuple((screen, tuple(keywords)) for screen, keywords in hints.items())
+    classifier = _classifiers.get(key)
+    if classifier is None:
+        if len(_classifiers) >= 32:
+            _classifiers.clear()
+        classifier = _classifiers[key] = ScreenClassifier(hints)
+    return classifier
+
+
+def infer_screen(row: MutableMapping[str, str], screen_hints: Dict[str, Sequence[str]] | None = None) -> str:
+    return _classifier_for(screen_hints).classify(row)
 
 
 def _build_heatmap_grid(
     coords: Iterable[Tuple[float, float]],
     width: int,
     height: int,
-    bin_size: int = 80,
+    bin_size: int = DEFAULT_HEATMAP_BIN_SIZE,
 ) -> List[List[int]]:
-    cols = max(1, math.ceil(width / bin_size))
-    rows = max(1, math.ceil(height / bin_size))
-    grid = [[0 for _ in range(cols)] for _ in range(rows)]
+    grid = _HeatmapGrid(width, height, bin_size)
     for x, y in coords:
+        grid.add(x, y)
+    return grid.to_list()
+
+
+class _HeatmapGrid:
+    """Grilla de conteos de una pantalla, llenada por bloques de coordenadas.
+
+    Las celdas tienen ``bin_size`` píxeles; las coordenadas negativas se
+    descartan y las que exceden el ancho o el alto caen en la última fila o
+    columna. Con NumPy cada bloque se agrega con ``histogram2d`` (el último
+    borde es infinito para reproducir ese recorte); sin NumPy se cuenta celda
+    por celda.
+    """
+
+    def __init__(self, width: int, height: int, bin_size: int = DEFAULT_HEATMAP_BIN_SIZE) -> None:
+        self.bin_size = bin_size
+        self.cols = max(1, math.ceil(width / bin_size))
+        self.rows = max(1, math.ceil(height / bin_size))
+        self._xs: List[float] = []
+        self._ys: List[float] = []
+        if np is not None:
+            self._counts = np.zeros((self.rows, self.cols), dtype=np.int64)
+            self._x_edges = np.append(np.arange(self.cols, dtype=float) * bin_size, np.inf)
+            self._y_edges = np.append(np.arange(self.rows, dtype=float) * bin_size, np.inf)
+        else:
+            self._counts = [[0] * self.cols for _ in range(self.rows)]
+
+    def add(self, x: float, y: float, weight: int = 1) -> None:
         if x < 0 or y < 0:
-            continue
-        col = min(cols - 1, int(x // bin_size))
-        row = min(rows - 1, int(y // bin_size))
-        grid[row][col] += 1
-    return grid
-
-
-def _accumulate_time_by_screen(rows: List[MutableMapping[str, str]], screen_hints) -> Dict[str, float]:
-    ordered = sorted(rows, key=lambda r: parse_timestamp(r.get("timestamp", "")) or datetime.min)
-    current_screen: Optional[str] = None
-    last_ts: Optional[datetime] = None
-    last_processed_ts: Optional[datetime] = None
-    time_spent: Dict[str, float] = defaultdict(float)
-    for row in ordered:
-        ts = parse_timestamp(row.get("timestamp", ""))
-        screen = infer_screen(row, screen_hints)
-        if ts is None:
-            continue
-        last_processed_ts = ts
-        if current_screen is None:
-            current_screen = screen
-            last_ts = ts
-            continue
-        if screen != current_screen and last_ts:
-            elapsed = (ts - last_ts).total_seconds()
+            return
+        if np is None or weight != 1:
+            col = min(self.cols - 1, int(x // self.bin_size))
+            row = min(self.rows - 1, int(y // self.bin_size))
+            self._counts[row][col] += weight
+            return
+        self._xs.append(x)
+        self._ys.append(y)
+        if len(self._xs) >= _HEATMAP_CHUNK_SIZE:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._xs:
+            return
+        hist, _x_edges, _y_edges = np.histogram2d(self._ys, self._xs, bins=[self._y_edges, self._x_edges])
+        self._counts += hist.astype(np.int64)
+        self._xs.clear()
+        self._ys.clear()
+
+    def merge(self, other: "_HeatmapGrid") -> None:
+        counts = other.to_list()
+        if np is not None:
+            self._flush()
+            self._counts += np.asarray(counts, dtype=np.int64)
+            return
+        for row_index, row in enumerate(counts):
+            target = self._counts[row_index]
+            for col_index, value in enumerate(row):
+                target[col_index] += value
+
+    def to_list(self) -> List[List[int]]:
+        if np is None:
+            return [list(row) for row in self._counts]
+        self._flush()
+        return self._counts.tolist()
+
+
+class _ScreenHeatmaps:
+    """Grillas por pantalla más una muestra uniforme (reservorio) de coordenadas."""
+
+    def __init__(
+        self,
+        screen_dimensions: Tuple[int, int],
+        *,
+        bin_size: int = DEFAULT_HEATMAP_BIN_SIZE,
+        sample_size: int = DEFAULT_COORD_SAMPLE_SIZE,
+    ) -> None:
+        self.width, self.height = screen_dimensions
+        self.bin_size = bin_size
+        self.sample_size = sample_size
+        self.grids: Dict[str, _HeatmapGrid] = {}
+        self.counts: Counter = Counter()
+        self.samples: Dict[str, List[Tuple[float, float]]] = {}
+        self._random = random.Random(0)
+
+    def add(self, screen: str, coords: Tuple[float, float], weight: int = 1) -> None:
+        grid = self.grids.get(screen)
+        if grid is None:
+            grid = self.grids[screen] = _HeatmapGrid(self.width, self.height, self.bin_size)
+            self.samples[screen] = []
+        grid.add(*coords, weight)
+        self.counts[screen] += weight
+        sample = self.samples[screen]
+        if len(sample) < self.sample_size:
+            sample.append(coords)
+            return
+        slot = self._random.randrange(self.counts[screen])
+        if slot < self.sample_size:
+            sample[slot] = coords
+
+    def merge(self, other: "_ScreenHeatmaps") -> None:
+        for screen, grid in other.grids.items():
+            if screen not in self.grids:
+                self.grids[screen] = _HeatmapGrid(self.width, self.height, self.bin_size)
+                self.samples[screen] = []
+            self.grids[screen].merge(grid)
+            self.counts[screen] += other.counts[screen]
+            room = self.sample_size - len(self.samples[screen])
+            self.samples[screen].extend(other.samples[screen][:max(0, room)])
+
+    def datasets(self) -> List[HeatmapData]:
+        datasets = [
+            HeatmapData(screen=screen, coords=list(self.samples[screen]), grid=grid.to_list(), count=self.counts[screen])
+            for screen, grid in self.grids.items()
+        ]
+        return sorted(datasets, key=lambda d: d.count, reverse=True)
+
+
+class _ScreenTimer:
+    """Tiempo por pantalla sobre eventos ``(segundos, pantalla)`` ya ordenados.
+
+    El tiempo transcurrido se asigna a la pantalla actual cuando aparece un
+    evento de otra pantalla; al cerrar, la pantalla abierta suma hasta el
+    último evento registrado.
+    """
+
+    def __init__(self) -> None:
+        self.current: Optional[str] = None
+        self.last_ts: Optional[float] = None
+        self.last_processed: Optional[float] = None
+        self.totals: Dict[str, float] = defaultdict(float)
+
+    def add(self, ts: float, screen: str) -> None:
+        self.last_processed = ts
+        if self.current is None:
+            self.current = screen
+            self.last_ts = ts
+            return
+        if screen != self.current:
+            elapsed = ts - self.last_ts
+            if elapsed >= 0:
+                self.totals[self.current] += elapsed
+            self.current = screen
+            self.last_ts = ts
+
+    def result(self) -> Dict[str, float]:
+        totals = dict(self.totals)
+        if self.current and self.last_ts is not None:
+            elapsed = (self.last_processed or self.last_ts) - self.last_ts
             if elapsed >= 0:
-                time_spent[current_screen] += elapsed
-            current_screen = screen
-            last_ts = ts
-    if current_screen and last_ts:
-        final_ts = last_processed_ts or last_ts
-        elapsed = (final_ts - last_ts).total_seconds()
-        if elapsed >= 0:
-            time_spent[current_screen] += elapsed
-    return dict(time_spent)
+                totals[self.current] = totals.get(self.current, 0.0) + elapsed
+        return totals
+
+
+class _TimelineRuns:
+    """Eventos ``(segundos, pantalla)`` agrupados en tramos ya ordenados.
+
+    Los logs se escriben en orden cronológico, así que normalmente hay un
+    solo tramo; cuando se mezclan archivos o sesiones, cada retroceso del
+    reloj abre un tramo nuevo y ``ordered`` los combina con ``heapq.merge``
+    (estable, igual que ordenar la secuencia completa) en lugar de ordenar
+    todas las filas. Cada tramo guarda los segundos en un ``array('d')`` y
+    la pantalla como índice de ``screens``: unos 12 bytes por evento en vez
+    de una tupla por fila.
+    """
+
+    def __init__(self) -> None:
+        self.screens: List[str] = []
+        self._screen_ids: Dict[str, int] = {}
+        self.runs: List[Tuple[array, array]] = []
+        self._last: Optional[float] = None
+
+    def add(self, ts: float, screen: str) -> None:
+        if self._last is None or ts < self._last:
+            self.runs.append((array("d"), array("I")))
+        index = self._screen_ids.get(screen)
+        if index is None:
+            index = self._screen_ids[screen] = len(self.screens)
+            self.screens.append(screen)
+        times, screens = self.runs[-1]
+        times.append(ts)
+        screens.append(index)
+        self._last = ts
+
+    def ordered(self) -> Iterable[Tuple[float, str]]:
+        names = self.screens
+        runs = [zip(times, map(names.__getitem__, screens)) for times, screens in self.runs]
+        if len(runs) == 1:
+            return runs[0]
+        return heapq.merge(*runs, key=itemgetter(0))
+
+    def time_by_screen(self) -> Dict[str, float]:
+        timer = _ScreenTimer()
+        for ts, screen in self.ordered():
+            timer.add(ts, screen)
+        return timer.result()
+
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _timestamp_seconds(value: str | None) -> Optional[float]:
+    parsed = parse_timestamp(value or "")
+    if parsed is None:
+        return None
+    return (parsed - _EPOCH).total_seconds()
+
+
+@dataclass
+class UsageAggregate:
+    """Resultado de ``UsageAggregator``: todo lo que necesita el reporte."""
+
+    total_events: int
+    screen_counts: Counter
+    widget_counts: Counter
+    validation_events: int
+    time_spent_seconds: Dict[str, float]
+    heatmaps: List[HeatmapData] = field(default_factory=list)
+
+    @property
+    def validation_share(self) -> float:
+        return self.validation_events / (self.total_events or 1)
+
+
+class UsageAggregator:
+    """Acumula en una sola pasada las métricas de ``visualize_usage``."""
+
+    def __init__(
+        self,
+        screen_hints: Dict[str, Sequence[str]] | None = None,
+        screen_dimensions: Tuple[int, int] = DEFAULT_SCREEN_DIMENSIONS,
+        *,
+        coord_sample_size: int = DEFAULT_COORD_SAMPLE_SIZE,
+    ) -> None:
+        self.classifier = _classifier_for(screen_hints)
+        self.total_events = 0
+        self.validation_events = 0
+        self.screen_counts: Counter = Counter()
+        self.widget_counts: Counter = Counter()
+        self.heatmaps = _ScreenHeatmaps(screen_dimensions, sample_size=coord_sample_size)
+        self.timeline = _TimelineRuns()
+        self._merged_time: Dict[str, float] = defaultdict(float)
+
+    def add(self, row: MutableMapping[str, str]) -> None:
+        weight = _event_weight(row)
+        if not weight:
+            return
+        screen = self.classifier.classify(row)
+        self.total_events += weight
+        self.screen_counts[screen] += weight
+        self.widget_counts[(row.get("widget_id") or row.get("mensaje") or "desconocido").strip()] += weight
+        if row.get("tipo") == "validacion":
+            self.validation_events += weight
+        coords = _parse_coords(row.get("coords"))
+        if coords is not None:
+            self.heatmaps.add(screen, coords, weight)
+        if _is_navigation_summary(row):
+            return
+        ts = _timestamp_seconds(row.get("timestamp"))
+        if ts is not None:
+            self.timeline.add(ts, screen)
+
+    def add_rows(self, rows: Iterable[MutableMapping[str, str]]) -> "UsageAggregator":
+        for row in rows:
+            self.add(row)
+        return self
+
+    def merge(self, other: "UsageAggregator", *, time_spent: Optional[Dict[str, float]] = None) -> None:
+        """Suma ``other``; el tiempo por pantalla de cada fuente se calcula aparte."""
+
+        self.total_events += other.total_events
+        self.validation_events += other.validation_events
+        self.screen_counts.update(other.screen_counts)
+        self.widget_counts.update(other.widget_counts)
+        self.heatmaps.merge(other.heatmaps)
+        if time_spent is None:
+            time_spent = other.result().time_spent_seconds
+        for screen, seconds in time_spent.items():
+            self._merged_time[screen] += seconds
+
+    def result(self) -> UsageAggregate:
+        time_spent = self.timeline.time_by_screen()
+        for screen, seconds in self._merged_time.items():
+            time_spent[screen] = time_spent.get(screen, 0.0) + seconds
+        return UsageAggregate(
+            total_events=self.total_events,
+            screen_counts=self.screen_counts,
+            widget_counts=self.widget_counts,
+            validation_events=self.validation_events,
+            time_spent_seconds=time_spent,
+            heatmaps=self.heatmaps.datasets(),
+        )
+
+
+def _accumulate_time_by_screen(rows: Iterable[MutableMapping[str, str]], screen_hints) -> Dict[str, float]:
+    classifier = _classifier_for(screen_hints)
+    timeline = _TimelineRuns()
+    for row in rows:
+        if _is_navigation_summary(row):
+            continue
+        ts = _timestamp_seconds(row.get("timestamp"))
+        if ts is not None:
+            timeline.add(ts, classifier.classify(row))
+    return timeline.time_by_screen()
 
 
 def _build_heatmap_dataset(
-    rows: List[MutableMapping[str, str]],
+    rows: Iterable[MutableMapping[str, str]],
     screen_hints: Dict[str, Sequence[str]],
     screen_dimensions: Tuple[int, int],
 ) -> List[HeatmapData]:
-    width, height = screen_dimensions
-    coords_by_screen: Dict[str, List[Tuple[float, float]]] = defaultdict(list)
+    classifier = _classifier_for(screen_hints)
+    heatmaps = _ScreenHeatmaps(screen_dimensions)
     for row in rows:
         coords = _parse_coords(row.get("coords"))
-        if coords is None:
-            continue
-        screen = infer_screen(row, screen_hints)
-        coords_by_screen[screen].append(coords)
-    datasets: List[HeatmapData] = []
-    for screen, coords in coords_by_screen.items():
-        grid = _build_heatmap_grid(coords, width, height)
-        datasets.append(HeatmapData(screen=screen, coords=coords, grid=grid))
-    return sorted(datasets, key=lambda d: len(d.coords), reverse=True)
+        weight = _event_weight(row)
+        if coords is not None and weight:
+            heatmaps.add(classifier.classify(row), coords, weight)
+    return heatmaps.datasets()
 
 
-def _prepare_interpretations(
+def prepare_interpretations(
     screen_counts: Counter,
     widget_counts: Counter,
     validation_share: float,
     time_spent_seconds: Dict[str, float],
 ) -> List[str]:
+    """Frases de lectura rápida (pantalla y widget más usados, validaciones, tiempo)."""
+
     interpretations: List[str] = []
     if screen_counts:
         most_used, top_count = screen_counts.most_common(1)[0]
@@ -217,25 +604,35 @@ def visualize_usage(
             "Se requiere matplotlib para generar visualizaciones. Instale matplotlib>=3.7."
         ) from exc
 
-    rows = load_log_rows(log_path)
     hints = screen_hints or DEFAULT_SCREEN_HINTS
-    datasets = _build_heatmap_dataset(rows, hints, screen_dimensions)
-    screen_counts = Counter(infer_screen(row, hints) for row in rows)
-    widget_counts = Counter(
-        (row.get("widget_id") or row.get("mensaje") or "desconocido").strip()
-        for row in rows
+    aggregate = UsageAggregator(hints, screen_dimensions).add_rows(iter_log_rows(log_path)).result()
+    interpretations = prepare_interpretations(
+        aggregate.screen_counts,
+        aggregate.widget_counts,
+        aggregate.validation_share,
+        aggregate.time_spent_seconds,
     )
-    validation_share = sum(1 for row in rows if row.get("tipo") == "validacion") / (len(rows) or 1)
-    time_spent_seconds = _accumulate_time_by_screen(rows, hints)
+    fig = render_heatmaps(plt, aggregate.heatmaps, screen_dimensions)
+    if output_path:
+        fig.savefig(output_path, bbox_inches="tight")
+    return AnalyticsReport(
+        fig,
+        interpretations,
+        aggregate.screen_counts,
+        aggregate.widget_counts,
+        aggregate.validation_share,
+        aggregate.time_spent_seconds,
+    )
+
+
+def render_heatmaps(plt, datasets: List[HeatmapData], screen_dimensions: Tuple[int, int]):
+    """Figura de ``matplotlib`` con un mapa de calor por pantalla."""
 
     if not datasets:
         fig, ax = plt.subplots(figsize=(10, 4))
         ax.set_title("Sin coordenadas registradas en el log")
         ax.axis("off")
-        interpretations = _prepare_interpretations(screen_counts, widget_counts, validation_share, time_spent_seconds)
-        if output_path:
-            fig.savefig(output_path, bbox_inches="tight")
-        return AnalyticsReport(fig, interpretations, screen_counts, widget_counts, validation_share, time_spent_seconds)
+        return fig
 
     cols = min(3, len(datasets))
     rows_count = math.ceil(len(datasets) / cols)
@@ -266,15 +663,9 @@ def visualize_usage(
     for ax in axes_list[len(datasets):]:
         ax.axis("off")
 
-    interpretations = _prepare_interpretations(screen_counts, widget_counts, validation_share, time_spent_seconds)
-
     fig.suptitle("Uso por pantalla con heatmaps y análisis automático", fontsize=14)
     fig.tight_layout(rect=[0, 0, 1, 0.95])
-
-    if output_path:
-        fig.savefig(output_path, bbox_inches="tight")
-
-    return AnalyticsReport(fig, interpretations, screen_counts, widget_counts, validation_share, time_spent_seconds)
+    return fig
 
 
 __all__ = [
@@ -283,8 +674,14 @@ __all__ = [
     "MissingDependencyError",
     "DEFAULT_SCREEN_DIMENSIONS",
     "DEFAULT_SCREEN_HINTS",
+    "ScreenClassifier",
+    "UsageAggregate",
+    "UsageAggregator",
     "infer_screen",
+    "iter_log_rows",
     "load_log_rows",
     "parse_timestamp",
+    "prepare_interpretations",
+    "render_heatmaps",
     "visualize_usage",
 ]
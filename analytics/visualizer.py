@@ -5,6 +5,11 @@ forma offline contra un archivo de logs CSV generado por ``log_event``. Produce
 figuras que muestran, lado a lado, cada pantalla de la app con un mapa de calor
 superpuesto y genera interpretaciones automáticas basadas en los patrones de
 uso y validación.
+
+Las filas se recorren una sola vez y en streaming: los mapas de calor se
+acumulan como histogramas por pantalla (``np.histogram2d`` por bloques) y las
+estadísticas como contadores, sin retener la lista de filas ni las
+coordenadas.
 """
 from __future__ import annotations
 
@@ -14,7 +19,7 @@ from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Iterable, List, MutableMapping, Optional, Sequence, Tuple
+from typing import Dict, Iterable, Iterator, List, MutableMapping, Optional, Sequence, Tuple
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -55,16 +60,22 @@ class VisualizerResult:
     stats: Dict[str, object]
 
 
-def load_log_rows(log_path: Path | str) -> List[MutableMapping[str, str]]:
-    """Carga el CSV de logs y normaliza los campos conocidos."""
+_HEATMAP_CHUNK_SIZE = 8192
+
+
+def iter_log_rows(log_path: Path | str) -> Iterator[MutableMapping[str, str]]:
+    """Itera el CSV de logs normalizando los campos conocidos."""
 
-    rows: List[MutableMapping[str, str]] = []
     with open(log_path, newline="", encoding="utf-8") as fh:
         reader = csv.DictReader(fh)
         for row in reader:
-            normalized = {field: row.get(field, "") for field in LOG_FIELDNAMES}
-            rows.append(normalized)
-    return rows
+            yield {field: row.get(field, "") for field in LOG_FIELDNAMES}
+
+
+def load_log_rows(log_path: Path | str) -> List[MutableMapping[str, str]]:
+    """Carga el CSV de logs y normaliza los campos conocidos."""
+
+    return list(iter_log_rows(log_path))
 
 
 def _parse_coords(value: str) -> Optional[Tuple[float, float]]:
@@ -106,28 +117,76 @@ def _assign_screen(
     return None
 
 
+class _HeatmapAccumulator:
+    """Histograma 2D por pantalla que se llena por bloques de coordenadas.
+
+    Sumar los histogramas de cada bloque con los mismos bordes da el mismo
+    resultado que un único ``histogram2d`` sobre todos los puntos.
+    """
+
+    def __init__(self, layouts: Sequence[ScreenLayout], bins: int) -> None:
+        self.layouts = {layout.name: layout for layout in layouts}
+        self.bins = bins
+        self.counts: Dict[str, int] = {name: 0 for name in self.layouts}
+        self._hist: Dict[str, Optional[np.ndarray]] = {name: None for name in self.layouts}
+        self._pending: Dict[str, Tuple[List[float], List[float]]] = {name: ([], []) for name in self.layouts}
+
+    def add(self, screen: Optional[str], coords: Tuple[float, float]) -> None:
+        pending = self._pending.get(screen) if screen is not None else None
+        if pending is None:
+            return
+        pending[0].append(coords[0])
+        pending[1].append(coords[1])
+        self.counts[screen] += 1
+        if len(pending[0]) >= _HEATMAP_CHUNK_SIZE:
+            self._flush(screen)
+
+    def _flush(self, screen: str) -> None:
+        xs, ys = self._pending[screen]
+        if not xs:
+            return
+        layout = self.layouts[screen]
+        heatmap, _xedges, _yedges = np.histogram2d(
+            xs, ys, bins=self.bins, range=[[0, layout.width], [0, layout.height]]
+        )
+        current = self._hist[screen]
+        self._hist[screen] = heatmap if current is None else current + heatmap
+        xs.clear()
+        ys.clear()
+
+    def heatmap(self, screen: str) -> Optional[np.ndarray]:
+        self._flush(screen)
+        return self._hist.get(screen)
+
+
 def _prepare_heatmap_data(
     rows: Iterable[MutableMapping[str, str]],
     screen_layouts: Sequence[ScreenLayout],
     widget_to_screen: Optional[Dict[str, str]],
-) -> Dict[str, List[Tuple[float, float]]]:
-    coords_by_screen: Dict[str, List[Tuple[float, float]]] = {layout.name: [] for layout in screen_layouts}
+    bins: int = 50,
+) -> _HeatmapAccumulator:
+    accumulator = _HeatmapAccumulator(screen_layouts, bins)
     for row in rows:
-        screen = _assign_screen(row, widget_to_screen)
-        coords = _parse_coords(row.get("coords", ""))
-        if screen in coords_by_screen and coords:
-            coords_by_screen[screen].append(coords)
-    return coords_by_screen
+        _add_heatmap_row(accumulator, row, widget_to_screen)
+    return accumulator
+
+
+def _add_heatmap_row(
+    accumulator: _HeatmapAccumulator,
+    row: MutableMapping[str, str],
+    widget_to_screen: Optional[Dict[str, str]],
+) -> None:
+    coords = _parse_coords(row.get("coords", ""))
+    if coords:
+        accumulator.add(_assign_screen(row, widget_to_screen), coords)
 
 
-def _draw_heatmap(ax: plt.Axes, layout: ScreenLayout, points: List[Tuple[float, float]], bins: int = 50) -> None:
+def _draw_heatmap(ax: plt.Axes, layout: ScreenLayout, heatmap: Optional[np.ndarray]) -> None:
     ax.set_title(layout.name)
     if layout.background_path and Path(layout.background_path).exists():
         image = plt.imread(layout.background_path)
         ax.imshow(image, extent=(0, layout.width, layout.height, 0))
-    if points:
-        xs, ys = zip(*points)
-        heatmap, xedges, yedges = np.histogram2d(xs, ys, bins=bins, range=[[0, layout.width], [0, layout.height]])
+    if heatmap is not None:
         ax.imshow(
             heatmap.T,
             extent=(0, layout.width, 0, layout.height),
@@ -141,45 +200,74 @@ def _draw_heatmap(ax: plt.Axes, layout: ScreenLayout, points: List[Tuple[float,
     ax.axis("off")
 
 
-def _summarize_usage(rows: Sequence[MutableMapping[str, str]]) -> Dict[str, object]:
-    total = len(rows)
-    tipo_counter: Counter[str] = Counter()
-    widget_counter: Counter[str] = Counter()
-    screen_counter: Counter[str] = Counter()
-    hourly_counter: Counter[int] = Counter()
-    timeline: List[datetime] = []
+class _UsageSummary:
+    """Contadores de ``_summarize_usage`` acumulados fila a fila.
 
-    for row in rows:
-        tipo_counter[(row.get("tipo") or "").strip()] += 1
-        widget_counter[(row.get("widget_id") or "").strip() or "(sin id)"] += 1
-        screen_name = (row.get("subtipo") or "").strip() or "(sin pantalla)"
-        screen_counter[screen_name] += 1
+    El intervalo medio entre eventos consecutivos (una vez ordenados) es una
+    suma telescópica: (último - primero) / (n - 1), así que basta con el
+    mínimo, el máximo y la cantidad de marcas de tiempo.
+    """
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.tipo: Counter[str] = Counter()
+        self.widget: Counter[str] = Counter()
+        self.screen: Counter[str] = Counter()
+        self.hourly: Counter[int] = Counter()
+        self.timestamps = 0
+        self.first: Optional[datetime] = None
+        self.last: Optional[datetime] = None
+        self._parsed: Dict[str, Optional[datetime]] = {}
+
+    def add(self, row: MutableMapping[str, str]) -> None:
+        self.total += 1
+        self.tipo[(row.get("tipo") or "").strip()] += 1
+        self.widget[(row.get("widget_id") or "").strip() or "(sin id)"] += 1
+        self.screen[(row.get("subtipo") or "").strip() or "(sin pantalla)"] += 1
         timestamp = (row.get("timestamp") or "").strip()
-        if timestamp:
+        if not timestamp:
+            return
+        # Muchos eventos comparten segundo: se reutiliza el último parseo.
+        dt = self._parsed.get(timestamp, False)
+        if dt is False:
             try:
                 dt = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
-                timeline.append(dt)
-                hourly_counter[dt.hour] += 1
             except ValueError:
-                pass
-
-    timeline.sort()
-    durations: List[float] = []
-    for prev, curr in zip(timeline, timeline[1:]):
-        durations.append((curr - prev).total_seconds())
-    avg_gap = sum(durations) / len(durations) if durations else 0
-
-    return {
-        "total_events": total,
-        "tipo": tipo_counter,
-        "widget": widget_counter,
-        "screen": screen_counter,
-        "hourly": hourly_counter,
-        "avg_gap_seconds": avg_gap,
-    }
+                dt = None
+            if len(self._parsed) > 4096:
+                self._parsed.clear()
+            self._parsed[timestamp] = dt
+        if dt is None:
+            return
+        self.timestamps += 1
+        self.hourly[dt.hour] += 1
+        if self.first is None or dt < self.first:
+            self.first = dt
+        if self.last is None or dt > self.last:
+            self.last = dt
+
+    def stats(self) -> Dict[str, object]:
+        avg_gap = 0
+        if self.timestamps > 1:
+            avg_gap = (self.last - self.first).total_seconds() / (self.timestamps - 1)
+        return {
+            "total_events": self.total,
+            "tipo": self.tipo,
+            "widget": self.widget,
+            "screen": self.screen,
+            "hourly": self.hourly,
+            "avg_gap_seconds": avg_gap,
+        }
+
+
+def _summarize_usage(rows: Iterable[MutableMapping[str, str]]) -> Dict[str, object]:
+    summary = _UsageSummary()
+    for row in rows:
+        summary.add(row)
+    return summary.stats()
 
 
-def _interpret(stats: Dict[str, object], coords_by_screen: Dict[str, List[Tuple[float, float]]]) -> List[str]:
+def _interpret(stats: Dict[str, object], clicks_by_screen: Dict[str, int]) -> List[str]:
     interpretations: List[str] = []
     screen_counts: Counter[str] = stats.get("screen", Counter())  # type: ignore[arg-type]
     if screen_counts:
@@ -210,7 +298,7 @@ def _interpret(stats: Dict[str, object], coords_by_screen: Dict[str, List[Tuple[
         interpretations.append(
             f"El intervalo medio entre eventos consecutivos es de {avg_gap:.1f} segundos, lo que ayuda a dimensionar la cadencia de uso y tiempos de espera aceptables."
         )
-    dense_screens = [name for name, points in coords_by_screen.items() if len(points) >= 20]
+    dense_screens = [name for name, clicks in clicks_by_screen.items() if clicks >= 20]
     if dense_screens:
         interpretations.append(
             "Las pantallas con mapas de calor densos (>=20 clics) permiten construir heatmaps accionables: "
@@ -244,15 +332,18 @@ def generate_usage_visuals(
         lista de interpretaciones automáticas.
     """
 
-    rows = load_log_rows(log_path)
-    coords_by_screen = _prepare_heatmap_data(rows, screen_layouts, widget_to_screen)
-    stats = _summarize_usage(rows)
+    heatmaps = _HeatmapAccumulator(screen_layouts, heatmap_bins)
+    summary = _UsageSummary()
+    for row in iter_log_rows(log_path):
+        summary.add(row)
+        _add_heatmap_row(heatmaps, row, widget_to_screen)
+    stats = summary.stats()
 
     fig, axes = plt.subplots(1, len(screen_layouts), figsize=(6 * len(screen_layouts), 6))
     if len(screen_layouts) == 1:
         axes = [axes]  # type: ignore[list-item]
     for layout, ax in zip(screen_layouts, axes):
-        _draw_heatmap(ax, layout, coords_by_screen.get(layout.name, []), bins=heatmap_bins)
+        _draw_heatmap(ax, layout, heatmaps.heatmap(layout.name))
 
     plt.tight_layout()
 
@@ -261,7 +352,7 @@ def generate_usage_visuals(
         save_path = Path(output_path)
         fig.savefig(save_path, dpi=200)
 
-    interpretations = _interpret(stats, coords_by_screen)
+    interpretations = _interpret(stats, heatmaps.counts)
 
     return VisualizerResult(
         figure=fig,
@@ -275,5 +366,6 @@ __all__ = [
     "ScreenLayout",
     "VisualizerResult",
     "generate_usage_visuals",
+    "iter_log_rows",
     "load_log_rows",
 ]
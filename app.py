@@ -55,6 +55,7 @@ Autor: pabloillescasbuendia
 
 import base64
 import csv
+import hashlib
 import io
 import json
 import math
@@ -62,19 +63,22 @@ import os
 import random
 import re
 import shutil
+import sqlite3
 import threading
+import time
 import wave
 import zipfile
 from collections import Counter, defaultdict
 from collections.abc import Mapping
-from concurrent.futures import CancelledError
-from contextlib import suppress
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from contextlib import contextmanager, suppress
 from datetime import datetime, timedelta
 from decimal import Decimal
+from functools import partial
 from importlib import util as importlib_util
 from pathlib import Path
 from queue import SimpleQueue
-from typing import Callable, Iterable, Optional
+from typing import Callable, Iterable, Optional, TYPE_CHECKING
 
 import tkinter as tk
 from tkinter import filedialog
@@ -95,35 +99,43 @@ from models import (
     parse_involvement_entries,
     read_csv_headers_with_fallback,
 )
-from report.alerta_temprana import (
-    PPTX_AVAILABLE,
-    PPTX_MISSING_MESSAGE,
-    build_alerta_temprana_ppt,
-)
-from report.resumen_ejecutivo import (
-    build_resumen_ejecutivo_filename,
-    build_resumen_ejecutivo_md,
-)
-from report.carta_inmediatez import CartaInmediatezError, CartaInmediatezGenerator
-from report_builder import (build_docx, build_event_rows,
-                            build_llave_tecnica_rows, build_report_filename,
-                            CaseData, DOCX_AVAILABLE, DOCX_MISSING_MESSAGE,
-                            save_md)
-from settings import (AUTOSAVE_FILE, BASE_DIR, CANAL_LIST, CLIENT_ID_ALIASES,
+from report.case_data import CaseData
+from report.common_amounts import aggregate_amounts
+from report.export_pipeline import (COMENTARIO_AMPLIO_MAX_CHARS,
+                                    COMENTARIO_BREVE_MAX_CHARS, EXPORT_HEADERS,
+                                    build_export_encoding_error,
+                                    build_report_path, build_report_prefix,
+                                    build_resumen_ejecutivo_path,
+                                    normalize_analysis_texts,
+                                    normalize_export_encoding)
+from report.export_pipeline import sanitize_csv_value as _sanitize_csv_value
+from report.export_pipeline import write_case_exports
+from settings import (ALERTA_TEMPRANA_LLM_ENABLED,
+                      ALERTA_TEMPRANA_LLM_TIME_BUDGET_SECONDS, AUTOSAVE_FILE,
+                      BASE_DIR, BULK_LOAD_SLICE_MS,
+                      BULK_LOAD_SLICED_THRESHOLD, CANAL_LIST, CLIENT_ID_ALIASES,
                       CONFETTI_ENABLED, CRITICIDAD_LIST, DETAIL_LOOKUP_ALIASES,
                       ENABLE_EXTENDED_ANALYSIS_SECTIONS, EVENTOS_HEADER_CANONICO,
                       EVENTOS_PLACEHOLDER,
                       ensure_external_drive_dir, EXPORTS_DIR,
                       EXTERNAL_LOGS_FILE, FLAG_CLIENTE_LIST,
-                      FLAG_COLABORADOR_LIST, LOGS_FILE, MASSIVE_SAMPLE_FILES,
+                      FLAG_COLABORADOR_LIST, IMPORT_PREVIEW_ENABLED,
+                      IMPORT_PREVIEW_PAGE_SIZE, LOGS_FILE, MASSIVE_SAMPLE_FILES,
+                      NAVIGATION_TELEMETRY_MODE,
+                      NAVIGATION_TELEMETRY_SAMPLE_RATE,
                       PENDING_CONSOLIDATION_FILE,
+                      PENDING_CONSOLIDATION_WORKERS, PERF_HUD_ENABLED,
+                      PERF_PROFILING_ENABLED, PERF_SAMPLE_RATE,
+                      PERF_SLOW_CALLBACK_MS, PERF_TRACE_PATH,
                       NORM_ID_ALIASES, PROCESO_LIST, PRODUCT_ID_ALIASES,
                       RICH_TEXT_MAX_CHARS, RISK_ID_ALIASES, STORE_LOGS_LOCALLY,
                       TAXONOMIA, TEAM_ID_ALIASES, TEMP_AUTOSAVE_COMPRESS_OLD,
                       TEMP_AUTOSAVE_DEBOUNCE_SECONDS,
                       TEMP_AUTOSAVE_MAX_AGE_DAYS, TEMP_AUTOSAVE_MAX_PER_CASE,
                       TIPO_FALTA_LIST, TIPO_ID_LIST, TIPO_INFORME_LIST,
-                      TIPO_MONEDA_LIST, TIPO_PRODUCTO_LIST, TIPO_SANCION_LIST)
+                      TIPO_MONEDA_LIST, TIPO_PRODUCTO_LIST, TIPO_SANCION_LIST,
+                      USAGE_CUBE_COMPACT_INTERVAL_SECONDS, USAGE_CUBE_DIR,
+                      USAGE_CUBE_ENABLED)
 from theme_manager import ThemeManager
 from ui.config import COL_PADX, FONT_BASE, ROW_PADY
 from ui.effects.confetti import cancel_confetti_jobs, start_confetti_burst
@@ -136,17 +148,33 @@ from ui.frames.utils import (build_grid_container, create_scrollable_container,
 from ui.layout import ActionBar
 from ui.main_window import bind_notebook_refresh_handlers
 from ui.tooltips import HoverTooltip
-from utils.background_worker import (run_guarded_task,
+from ui.tree_diff import get_tree_renderer
+from utils.background_worker import (TASK_PRIORITY_BACKGROUND,
+                                     TASK_PRIORITY_INTERACTIVE,
+                                     CancellationToken,
+                                     get_background_executor,
+                                     run_guarded_task,
                                      shutdown_background_workers)
-from utils.auto_redaccion import auto_redact_comment
-from utils.historical_consolidator import append_historical_records
-from utils.mass_import_manager import MassImportManager
+from utils.historical_consolidator import (HistoricalBatch, ReplayCheckpoint,
+                                          append_historical_batches)
+from utils.lazy_loader import LazyModule, lazy_callable, module_available
+from utils.import_preview_dialog import ImportPreviewDialog
+from utils.mass_import_manager import (PREVIEW_UPDATED, ImportPreviewSpec,
+                                       MassImportManager, SummaryIngestSession)
+from utils.navigation_telemetry import NavigationTelemetry
+from utils.option_source import SharedOptionSource
+from utils.perf_hud import PerfHud
+from utils.perf_profiler import (LoopLagMonitor, configure_profiler,
+                                 get_profiler, instrument_after)
 from utils.persistence_manager import (CURRENT_SCHEMA_VERSION,
                                        PersistenceError, PersistenceManager,
                                        validate_schema_payload)
 from utils.progress_dialog import ProgressDialog
 from utils.technical_key import EMPTY_PART, build_technical_key
+from utils.ui_scheduler import (PRIORITY_LAYOUT, PRIORITY_PERSISTENCE,
+                                PRIORITY_SUMMARY, install_ui_scheduler)
 from utils.widget_registry import WidgetIdRegistry
+from validation_badge import destroy_badge_subtrees
 from validators import (
     drain_log_queue,
     FieldValidator,
@@ -154,7 +182,6 @@ from validators import (
     LOG_FIELDNAMES,
     normalize_log_row,
     normalize_without_accents,
-    parse_decimal_amount,
     resolve_catalog_product_type,
     sanitize_rich_text,
     should_autofill_field,
@@ -182,6 +209,29 @@ from validators import (
     normalize_team_member_identifier,
 )
 
+if TYPE_CHECKING:  # pragma: no cover - solo para anotaciones
+    from report.carta_inmediatez import CartaInmediatezGenerator
+
+# Los generadores de reportes arrastran python-docx, python-pptx y
+# transformers. Se cargan de forma diferida para no penalizar el arranque
+# de sesiones que nunca exportan.
+_alerta_temprana_module = LazyModule("report.alerta_temprana")
+_resumen_ejecutivo_module = LazyModule("report.resumen_ejecutivo")
+_carta_inmediatez_module = LazyModule("report.carta_inmediatez")
+_report_builder_module = LazyModule("report_builder")
+_auto_redaccion_module = LazyModule("utils.auto_redaccion")
+
+PPTX_AVAILABLE = module_available("pptx")
+DOCX_AVAILABLE = module_available("docx")
+
+build_alerta_temprana_ppt = lazy_callable(_alerta_temprana_module, "build_alerta_temprana_ppt")
+build_resumen_ejecutivo_md = lazy_callable(_resumen_ejecutivo_module, "build_resumen_ejecutivo_md")
+build_docx = lazy_callable(_report_builder_module, "build_docx")
+build_event_rows = lazy_callable(_report_builder_module, "build_event_rows")
+build_llave_tecnica_rows = lazy_callable(_report_builder_module, "build_llave_tecnica_rows")
+save_md = lazy_callable(_report_builder_module, "save_md")
+auto_redact_comment = lazy_callable(_auto_redaccion_module, "auto_redact_comment")
+
 PIL_AVAILABLE = importlib_util.find_spec("PIL") is not None
 if PIL_AVAILABLE:
     from PIL import Image, ImageTk  # type: ignore
@@ -201,119 +251,7 @@ POSITIVE_PHRASES = (
 CONFIRMATION_WAV_B64 = (
     "UklGRiQFAABXQVZFZm10IBAAAAABAAEAgD4AAIA+AAABAAgAZGF0YQAFAACAlai2vr63qZeBbFlKQkFHVGZ8kaW0vb+5rJuFcFxMQ0BFUWN4jaKyvL+7r56JdF9PREBET190iZ6vu7+8sqKNeGNRRUBDTFxwhZusub+9tKWRfGZUR0FCSllsgZept76+tqiVf2pXSUFBSFZofpOmtb2+uKuZg25aS0JARlNkeo+js7y/uq6ch3JdTUNARFBhdougsLu/u7Cgi3ZhUERAQ01dcoecrrq/vLOjj3pkU0ZAQktaboOZq7i+vbWmk35oVkhBQUlXaoCVqLa+vrepl4FsWUpCQUdUZnyRpbS9v7msm4VwXExDQEVRY3iNorK8v7uvnol0X09EQERPX3SJnq+7v7yyoo14Y1FFQENMXHCFm6y5v720pZF8ZlRHQUJKWWyBl6m3vr62qJWAaldJQUFIVmh+k6a1vb64q5mDblpLQkBGU2R6j6OzvL+6rpyHcl1NQ0BEUGF2i6Cwu7+7sKCLdmFQREBDTV1yh5yuur+8s6OPemRTRkBCS1pug5mruL69taaTfmhWSEFBSVdqgJWotr6+t6mXgWxZSkJBR1RmfJGltL2/uaybhXBcTENARVFjeI2isry/u6+eiXRfT0RARE9fdImer7u/vLKijXhjUUVAQ0xccIWbrLm/vbSlkXxmVEdBQkpZbIGXqbe+vraolX9qV0lBQUhWaH6TprW9vrirmYNuWktCQEZTZHqPo7O8v7qunIdyXU1DQERQYXaLoLC7v7uwoIt2YVBEQENNXXKHnK66v7yzo496ZFNGQEJLWm6Dmau4vr21ppN+aFZIQUFJV2p/lai2vr63qZeBbFlKQkFHVGZ8kaW0vb+5rJuFcFxMQ0BFUWN4jaKyvL+7r56JdF9PREBET190iZ6vu7+8sqKNeGNRRUBDTFxwhZusub+9tKWRfGZUR0FCSllsgZept76+tqiVgGpXSUFBSFZofpOmtb2+uKuZg25aS0JARlNkeo+js7y/uq6ch3JdTUNARFBhdougsLu/u7Cgi3ZhUERAQ01dcoecrrq/vLOjj3pkU0ZAQktaboOZq7i+vbWmk35oVkhBQUlXaoCVqLa+vrepl4FsWUpCQUdUZnyRpbS9v7msm4VwXExDQEVRY3iNorK8v7uvnol0X09EQERPX3SJnq+7v7yyoo14Y1FFQENMXHCFm6y5v720pZF8ZlRHQUJKWWyBl6m3vr62qJV/aldJQUFIVmh+k6a1vb64q5mDblpLQkBGU2R6j6OzvL+6rpyHcl1NQ0BEUGF2i6Cwu7+7sKCLdmFQREBDTV1yh5yuur+8s6OPemRTRkBCS1pug5mruL69taaTfmhWSEFBSVdqgJWotr6+t6mXgWxZSkJBR1RmfJGltL2/uaybhXBcTENARVFjeI2isry/u6+eiXRfT0RARE9fdImer7u/vLKijXhjUUVAQ0xccIWbrLm/vbSlkXxmVEdBQkpZbIGXqbe+vraolX9qV0lBQUhWaH6TprW9vrirmYNuWktCQEZTZHqPo7O8v7qunIdyXU1DQERQYXaLoLC7v7uwoIt2YVBEQENNXXKHnK66v7yzo496ZFNGQEJLWm6Dmau4vr21ppN+aFZIQUFJV2p/lai2vr63qZeBbFlKQkFHVGZ8kaW0vb+5rJuFcFxMQ0BFUWN4jaKyvL+7r56JdF9PREBET190iZ6vu7+8sqKNeGNRRUBDTFxwhZusub+9tA=="
 )
-COMENTARIO_BREVE_MAX_CHARS = 150
-COMENTARIO_AMPLIO_MAX_CHARS = 750
-
-EXPORT_HEADERS = {
-    "casos.csv": [
-        "id_caso",
-        "tipo_informe",
-        "categoria1",
-        "categoria2",
-        "modalidad",
-        "canal",
-        "proceso",
-        "fecha_de_ocurrencia",
-        "fecha_de_descubrimiento",
-        "centro_costos",
-        "matricula_investigador",
-        "investigador_nombre",
-        "investigador_cargo",
-    ],
-    "clientes.csv": [
-        "id_cliente",
-        "id_caso",
-        "nombres",
-        "apellidos",
-        "tipo_id",
-        "flag",
-        "telefonos",
-        "correos",
-        "direcciones",
-        "accionado",
-    ],
-    "colaboradores.csv": [
-        "id_colaborador",
-        "id_caso",
-        "flag",
-        "nombres",
-        "apellidos",
-        "division",
-        "area",
-        "servicio",
-        "puesto",
-        "fecha_carta_inmediatez",
-        "fecha_carta_renuncia",
-        "motivo_cese",
-        "nombre_agencia",
-        "codigo_agencia",
-        "tipo_falta",
-        "tipo_sancion",
-    ],
-    "productos.csv": [
-        "id_producto",
-        "id_caso",
-        "id_cliente",
-        "categoria1",
-        "categoria2",
-        "modalidad",
-        "canal",
-        "proceso",
-        "fecha_ocurrencia",
-        "fecha_descubrimiento",
-        "monto_investigado",
-        "tipo_moneda",
-        "monto_perdida_fraude",
-        "monto_falla_procesos",
-        "monto_contingencia",
-        "monto_recuperado",
-        "monto_pago_deuda",
-        "tipo_producto",
-    ],
-    "producto_reclamo.csv": [
-        "id_reclamo",
-        "id_caso",
-        "id_producto",
-        "nombre_analitica",
-        "codigo_analitica",
-    ],
-    "involucramiento.csv": [
-        "id_producto",
-        "id_caso",
-        "tipo_involucrado",
-        "id_colaborador",
-        "id_cliente_involucrado",
-        "monto_asignado",
-    ],
-    "detalles_riesgo.csv": [
-        "id_riesgo",
-        "id_caso",
-        "lider",
-        "descripcion",
-        "criticidad",
-        "exposicion_residual",
-        "planes_accion",
-    ],
-    "detalles_norma.csv": [
-        "id_norma",
-        "id_caso",
-        "descripcion",
-        "fecha_vigencia",
-        "acapite_inciso",
-        "detalle_norma",
-    ],
-    "analisis.csv": [
-        "id_caso",
-        "antecedentes",
-        "modus_operandi",
-        "hallazgos",
-        "descargos",
-        "conclusiones",
-        "recomendaciones",
-        "comentario_breve",
-        "comentario_amplio",
-    ],
-}
+
 _DETAIL_CATALOG_FILES = (
     "client_details.csv",
     "product_details.csv",
@@ -374,17 +312,6 @@ def _derive_validation_payload(field_name: str, message: Optional[str], widget):
     return message, severity, target_widget
 
 
-def _sanitize_csv_value(value):
-    sanitized = sanitize_rich_text("" if value is None else value, max_chars=None)
-    if sanitized == EVENTOS_PLACEHOLDER:
-        return sanitized
-    if sanitized == "-":
-        return sanitized
-    if sanitized.startswith(("=", "+", "-", "@")):
-        return f"'{sanitized}"
-    return sanitized
-
-
 class ValidationPanel(ttk.Frame):
     """Panel compacto para mostrar errores y advertencias de validación."""
 
@@ -394,14 +321,13 @@ class ValidationPanel(ttk.Frame):
         "warning": "⚠️",
     }
     COLLAPSED_WIDTH = 90
+    # Filas pintadas como máximo; el resto se resume en una fila "ver más".
+    RENDER_PAGE_SIZE = 300
 
     def __init__(self, parent, *, on_focus_request=None, pane_manager: ttk.Panedwindow | None = None):
         super().__init__(parent)
         self.on_focus_request = on_focus_request
-        self._entries: dict[str, str] = {}
-        self._targets: dict[str, dict[str, object] | tk.Widget] = {}
-        self._entry_status: dict[str, str] = {}
-        self._placeholder_id: Optional[str] = None
+        self._init_state()
         self._collapsed = True
         self._issue_count_var = tk.StringVar(value="⚠️ 0")
         self._pane_manager = pane_manager
@@ -409,6 +335,23 @@ class ValidationPanel(ttk.Frame):
         self._init_ui()
         self.collapse(force=True)
 
+    def _init_state(self) -> None:
+        # Modelo independiente del ``Treeview``: clave -> (estado, mensaje, origen).
+        self._records: dict[str, tuple[str, str, str]] = {}
+        self._entry_status: dict[str, str] = {}
+        self._status_counts: Counter[str] = Counter()
+        self._targets: dict[str, dict[str, object]] = {}
+        # Solo las claves pintadas tienen ``item_id``.
+        self._entries: dict[str, str] = {}
+        self._item_keys: dict[str, str] = {}
+        self._placeholder_id: Optional[str] = None
+        self._overflow_id: Optional[str] = None
+        self._render_limit = self.RENDER_PAGE_SIZE
+        self._batch_depth = 0
+        self._dirty_keys: dict[str, None] = {}
+        self._created_in_batch = False
+        self._selection_reset = False
+
     def _init_ui(self) -> None:
         self.columnconfigure(0, weight=1, minsize=self.COLLAPSED_WIDTH)
         self.rowconfigure(0, weight=1)
@@ -492,7 +435,7 @@ class ValidationPanel(ttk.Frame):
             return None
 
     def _ensure_placeholder(self) -> None:
-        if self._entries or self._placeholder_id:
+        if self._records or self._placeholder_id:
             return
         self._placeholder_id = self.tree.insert(
             "", "end", text=self.ICONS["ok"], values=("Sin validaciones registradas", ""),
@@ -509,7 +452,7 @@ class ValidationPanel(ttk.Frame):
     def _update_focus_button_state(self) -> None:
         if not hasattr(self, "_focus_button"):
             return
-        if self._entries:
+        if self._records:
             self._focus_button.state(["!disabled"])
         else:
             self._focus_button.state(["disabled"])
@@ -518,10 +461,15 @@ class ValidationPanel(ttk.Frame):
         return self.ICONS.get(status, self.ICONS["error"])
 
     def _refresh_issue_count(self) -> None:
-        issue_count = sum(1 for status in self._entry_status.values() if status != "ok")
+        issue_count = len(self._entry_status) - self._status_counts["ok"]
         icon = "⚠️" if issue_count else self.ICONS["ok"]
         self._issue_count_var.set(f"{icon} {issue_count}")
 
+    def severity_counts(self) -> dict[str, int]:
+        """Devuelve cuántas entradas hay por estado (``ok``, ``error``...)."""
+
+        return {status: count for status, count in self._status_counts.items() if count}
+
     def toggle(self) -> None:
         if self._collapsed:
             self.expand()
@@ -547,6 +495,31 @@ class ValidationPanel(ttk.Frame):
         target_width = max(self._last_expanded_width, 360)
         self._apply_pane_width(target_width)
 
+    @contextmanager
+    def batch(self):
+        """Agrupa altas, cambios y bajas y los aplica al árbol una sola vez.
+
+        Dentro del bloque ``update_entry`` y ``remove_entries`` solo
+        modifican el modelo; al salir del bloque más externo se pinta la
+        diferencia y se recalculan contadores, botón y selección.
+        """
+
+        self.begin_batch()
+        try:
+            yield self
+        finally:
+            self.end_batch()
+
+    def begin_batch(self) -> None:
+        self._batch_depth += 1
+
+    def end_batch(self) -> None:
+        if not self._batch_depth:
+            return
+        self._batch_depth -= 1
+        if not self._batch_depth:
+            self._apply_pending_changes()
+
     def update_entry(
         self,
         key: str,
@@ -558,33 +531,123 @@ class ValidationPanel(ttk.Frame):
     ) -> None:
         """Inserta o actualiza una fila en la tabla de validación."""
 
+        with self.batch():
+            self._stage_entry(key, message, severity=severity, origin=origin, widget=widget)
+
+    def _stage_entry(
+        self,
+        key: str,
+        message: Optional[str],
+        *,
+        severity: str,
+        origin: str | None,
+        widget: tk.Widget | None,
+    ) -> None:
         status = "ok" if not message else severity
-        display_message = message or "Sin errores"
-        item_id = self._entries.get(key)
-        created = False
-        if item_id:
-            self.tree.item(item_id, text=self._icon_for(status), values=(display_message, origin or ""))
+        record = (status, message or "Sin errores", origin or "")
+        previous = self._records.get(key)
+        if previous is None:
+            self._created_in_batch = True
         else:
-            self._remove_placeholder()
-            item_id = self.tree.insert(
-                "",
-                "end",
-                text=self._icon_for(status),
-                values=(display_message, origin or ""),
-            )
-            self._entries[key] = item_id
-            created = True
+            self._status_counts[previous[0]] -= 1
+        self._records[key] = record
         self._entry_status[key] = status
+        self._status_counts[status] += 1
         if widget or origin is not None:
-            self._targets[item_id] = {"widget": widget, "origin": origin}
-        elif item_id in self._targets:
-            self._targets.pop(item_id, None)
-        if not self._entries:
+            self._targets[key] = {"widget": widget, "origin": origin}
+        else:
+            self._targets.pop(key, None)
+        if previous != record or key not in self._entries:
+            self._dirty_keys[key] = None
+
+    def _stage_removal(self, key: str) -> bool:
+        record = self._records.pop(key, None)
+        if record is None:
+            return False
+        self._status_counts[record[0]] -= 1
+        self._entry_status.pop(key, None)
+        self._targets.pop(key, None)
+        self._dirty_keys[key] = None
+        self._selection_reset = True
+        return True
+
+    def _apply_pending_changes(self) -> None:
+        dirty = self._dirty_keys
+        created = self._created_in_batch
+        selection_reset = self._selection_reset
+        self._dirty_keys = {}
+        self._created_in_batch = False
+        self._selection_reset = False
+        if dirty:
+            self._render_dirty(dirty)
+        if not self._records:
             self._ensure_placeholder()
         self._refresh_issue_count()
         self._update_focus_button_state()
-        if created and (not self.tree.selection() or self.tree.selection() == (self._placeholder_id,)):
+        if selection_reset:
             self._select_first_actionable()
+        elif created:
+            selection = self.tree.selection()
+            if not selection or selection == (self._placeholder_id,):
+                self._select_first_actionable()
+
+    def _render_dirty(self, dirty: dict[str, None]) -> None:
+        tree = self.tree
+        # Primero se eliminan las filas que ya no existen en el modelo.
+        for key in dirty:
+            if key in self._records:
+                continue
+            item_id = self._entries.pop(key, None)
+            if item_id:
+                tree.delete(item_id)
+                self._item_keys.pop(item_id, None)
+        # Después se actualizan las visibles y se completan las que entran en
+        # la ventana pintada (siempre un prefijo del modelo).
+        for key in dirty:
+            item_id = self._entries.get(key)
+            record = self._records.get(key)
+            if item_id and record:
+                status, display_message, origin = record
+                tree.item(item_id, text=self._icon_for(status), values=(display_message, origin))
+        self._fill_render_window()
+
+    def _fill_render_window(self) -> None:
+        limit = self._render_limit
+        if len(self._entries) < min(limit, len(self._records)):
+            self._remove_placeholder()
+            for key, (status, display_message, origin) in self._records.items():
+                if len(self._entries) >= limit:
+                    break
+                if key in self._entries:
+                    continue
+                item_id = self.tree.insert(
+                    "",
+                    len(self._entries),
+                    text=self._icon_for(status),
+                    values=(display_message, origin),
+                )
+                self._entries[key] = item_id
+                self._item_keys[item_id] = key
+        self._sync_overflow_row()
+
+    def _sync_overflow_row(self) -> None:
+        hidden = len(self._records) - len(self._entries)
+        if hidden <= 0:
+            if self._overflow_id:
+                self.tree.delete(self._overflow_id)
+                self._overflow_id = None
+            return
+        values = (f"{hidden} validaciones más. Doble clic para mostrarlas.", "")
+        if self._overflow_id:
+            self.tree.item(self._overflow_id, values=values)
+        else:
+            self._overflow_id = self.tree.insert("", "end", text="…", values=values)
+
+    def show_more(self) -> None:
+        """Amplía la ventana pintada con la siguiente página de entradas."""
+
+        self._render_limit += self.RENDER_PAGE_SIZE
+        self._fill_render_window()
 
     def _record_width(self, _event: tk.Event | None = None) -> None:
         if self._collapsed:
@@ -628,12 +691,15 @@ class ValidationPanel(ttk.Frame):
 
     def focus_selected(self) -> None:
         selection = self.tree.selection()
+        if selection and self._overflow_id and selection[0] == self._overflow_id:
+            self.show_more()
+            return
         if not selection:
             self._select_first_actionable()
             selection = self.tree.selection()
             if not selection:
                 return
-        target_info = self._targets.get(selection[0])
+        target_info = self._targets.get(self._item_keys.get(selection[0], ""))
         widget = None
         origin = None
         if isinstance(target_info, dict):
@@ -649,39 +715,21 @@ class ValidationPanel(ttk.Frame):
 
     def _select_first_actionable(self) -> None:
         for item_id in self.tree.get_children(""):
-            if item_id != self._placeholder_id:
+            if item_id in self._item_keys:
                 self.tree.selection_set(item_id)
                 self.tree.focus(item_id)
                 return
         self.tree.selection_remove(self.tree.selection())
 
     def remove_entries(self, keys: Iterable[str]) -> None:
-        removed = False
-        for key in keys:
-            item_id = self._entries.pop(key, None)
-            if not item_id:
-                continue
-            self.tree.delete(item_id)
-            self._targets.pop(item_id, None)
-            self._entry_status.pop(key, None)
-            removed = True
-        if not removed:
-            return
-        if not self._entries:
-            self._ensure_placeholder()
-        self._refresh_issue_count()
-        self._update_focus_button_state()
-        self._select_first_actionable()
+        with self.batch():
+            for key in keys:
+                self._stage_removal(key)
 
     def _clear_batch_entries(self) -> None:
-        to_delete = [key for key in self._entries if key.startswith("batch:")]
-        for key in to_delete:
-            item_id = self._entries.pop(key, None)
-            if item_id:
-                self.tree.delete(item_id)
-                self._targets.pop(item_id, None)
-            self._entry_status.pop(key, None)
-        self._refresh_issue_count()
+        with self.batch():
+            for key in [key for key in self._records if key.startswith("batch:")]:
+                self._stage_removal(key)
 
     def show_batch_results(
         self,
@@ -690,35 +738,51 @@ class ValidationPanel(ttk.Frame):
         focus_map: Optional[dict[str, tk.Widget]] = None,
         origin: str = "Validación integral",
     ) -> None:
-        """Reemplaza el bloque de validaciones globales con los nuevos resultados."""
+        """Reemplaza el bloque de validaciones globales con los nuevos resultados.
+
+        Las entradas ``batch:`` previas se sustituyen dentro de una única
+        transacción: las que conservan su clave se actualizan en sitio y el
+        árbol recibe una sola pasada de cambios.
+        """
 
-        self._clear_batch_entries()
         focus_map = focus_map or {}
+        hints = [(hint.lower(), widget) for hint, widget in focus_map.items()]
 
         def _match_widget(message: str) -> Optional[tk.Widget]:
             lowered = message.lower()
-            for hint, widget in focus_map.items():
-                if hint.lower() in lowered:
+            for hint, widget in hints:
+                if hint in lowered:
                     return widget
             return None
 
+        fresh: dict[str, tuple[str, str]] = {}
         for index, message in enumerate(errors):
-            widget = _match_widget(message)
-            self.update_entry(
-                f"batch:error:{index}", message, severity="error", origin=origin, widget=widget
-            )
+            fresh[f"batch:error:{index}"] = (message, "error")
         for index, message in enumerate(warnings):
-            widget = _match_widget(message)
-            self.update_entry(
-                f"batch:warning:{index}", message, severity="warning", origin=origin, widget=widget
-            )
-        if not errors and not warnings:
-            self._ensure_placeholder()
+            fresh[f"batch:warning:{index}"] = (message, "warning")
+        with self.batch():
+            for key in [key for key in self._records if key.startswith("batch:") and key not in fresh]:
+                self._stage_removal(key)
+            for key, (message, severity) in fresh.items():
+                self._stage_entry(
+                    key, message, severity=severity, origin=origin, widget=_match_widget(message)
+                )
 
 class FraudCaseApp:
     AUTOSAVE_DELAY_MS = 4000
     SUMMARY_REFRESH_DELAY_MS = 250
     LOG_FLUSH_INTERVAL_MS = 5000
+    PENDING_CONSOLIDATION_POLL_MS = 250
+    # Serializa el manifiesto de consolidaciones pendientes.
+    _consolidation_lock = threading.RLock()
+    # Un candado por ``h_*.csv`` de la unidad externa: la reposición y el
+    # espejo de "Guardar y enviar" solo se excluyen sobre el mismo archivo,
+    # así que los grupos de la reposición siguen escribiéndose en paralelo.
+    _history_file_locks: dict[str, threading.Lock] = {}
+    # Lo devuelve el callback de una importación que espera la confirmación
+    # del usuario: la tarea sigue activa hasta que la confirme o la descarte.
+    _IMPORT_AWAITING_CONFIRMATION = object()
+    BULK_DESTROY_BATCH_SIZE = 25
     HEATMAP_BUCKET_SIZE = 100
     IMAGE_MAX_BYTES = 3 * 1024 * 1024
     IMAGE_MAX_DIMENSION = 2000
@@ -1032,6 +1096,7 @@ class FraudCaseApp:
 
     def __init__(self, root):
         self.root = root
+        self._ui_scheduler = install_ui_scheduler(root)
         self._pending_idle_update = False
         # FIX: Initialize autosave timestamp tracker
         self._last_temp_saved_at = None
@@ -1058,6 +1123,7 @@ class FraudCaseApp:
         self._startup_complete = False
         self._confetti_enabled = bool(CONFETTI_ENABLED)
         self._ui_notifications: list[dict[str, str]] = []
+        self._navigation_telemetry = self._build_navigation_telemetry()
         self._reset_navigation_metrics()
         self._hover_tooltips = []
         self.validators = []
@@ -1080,7 +1146,7 @@ class FraudCaseApp:
         self._external_log_file_initialized = bool(
             EXTERNAL_LOGS_FILE and os.path.exists(EXTERNAL_LOGS_FILE)
         )
-        self._process_pending_consolidations()
+        self._start_pending_consolidation_replay()
         self._export_base_path: Optional[Path] = None
         self._walkthrough_state_file = Path(AUTOSAVE_FILE).with_name("walkthrough_flags.json")
         self._walkthrough_state: dict[str, object] = self._load_walkthrough_state()
@@ -1187,6 +1253,8 @@ class FraudCaseApp:
 
         self.register_tooltip = register_tooltip
         self.root.protocol("WM_DELETE_WINDOW", self._handle_window_close)
+        self._setup_perf_profiling()
+        self._llm_features_enabled = bool(ALERTA_TEMPRANA_LLM_ENABLED)
         self._schedule_log_flush()
         # Datos en memoria: listas de frames
         self.client_frames = []
@@ -1194,6 +1262,8 @@ class FraudCaseApp:
         self.product_frames = []
         self.risk_frames = []
         self.norm_frames = []
+        self._client_option_source = SharedOptionSource(self.get_client_ids, name="clientes")
+        self._team_option_source = SharedOptionSource(self.get_team_ids, name="colaboradores")
         self._badge_window: Optional[tk.Toplevel] = None
         self._badge_destroy_after_id: Optional[str] = None
         self._client_frames_by_id = {}
@@ -1229,7 +1299,7 @@ class FraudCaseApp:
         self._carta_dialog: Optional[tk.Toplevel] = None
         self._carta_tree: Optional[ttk.Treeview] = None
         self._carta_rows: list[dict[str, str]] = []
-        self._carta_generator: CartaInmediatezGenerator | None = None
+        self._carta_generator: Optional["CartaInmediatezGenerator"] = None
         self.btn_docx = None
         self.btn_md = None
         self.btn_alerta_temprana = None
@@ -1678,7 +1748,7 @@ class FraudCaseApp:
             "encoding": normalized_encoding,
         }
         try:
-            with manifest_path.open("a", encoding="utf-8") as handle:
+            with self._consolidation_lock, manifest_path.open("a", encoding="utf-8") as handle:
                 handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
         except OSError as exc:
             log_event("validacion", f"No se pudo registrar consolidación pendiente: {exc}", self.logs)
@@ -1707,19 +1777,39 @@ class FraudCaseApp:
                 entries.append(dict(payload))
         return entries
 
-    def _write_pending_consolidations(self, entries: list[dict[str, object]]) -> None:
+    def _write_pending_consolidations(
+        self, entries: list[dict[str, object]], *, appended_after: Optional[int] = None
+    ) -> None:
+        """Reescribe el manifiesto con ``entries``.
+
+        ``appended_after`` es el tamaño del manifiesto cuando se leyó; las
+        líneas que se anexaron después (por ejemplo, desde "Guardar y
+        enviar" durante una reposición) se conservan al final.
+        """
+
         manifest_path = self._get_pending_manifest_path()
-        if not entries:
-            with suppress(FileNotFoundError):
-                manifest_path.unlink()
-            return
-        try:
-            manifest_path.write_text(
-                "\n".join(json.dumps(entry, ensure_ascii=False) for entry in entries),
-                encoding="utf-8",
-            )
-        except OSError as exc:
-            log_event("validacion", f"No se pudo actualizar el manifiesto de consolidación: {exc}", self.logs)
+        lines = [json.dumps(entry, ensure_ascii=False) for entry in entries]
+        with self._consolidation_lock:
+            if appended_after is not None:
+                try:
+                    with manifest_path.open("rb") as handle:
+                        handle.seek(appended_after)
+                        appended = handle.read().decode("utf-8", errors="replace")
+                except FileNotFoundError:
+                    appended = ""
+                except OSError as exc:
+                    # Sin poder leer lo anexado no se reescribe: se reintentará completo.
+                    log_event("validacion", f"No se pudo leer el manifiesto de consolidación: {exc}", self.logs)
+                    return
+                lines.extend(line for line in appended.splitlines() if line.strip())
+            if not lines:
+                with suppress(FileNotFoundError):
+                    manifest_path.unlink()
+                return
+            try:
+                manifest_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            except OSError as exc:
+                log_event("validacion", f"No se pudo actualizar el manifiesto de consolidación: {exc}", self.logs)
 
     def _load_history_rows_for_entry(
         self,
@@ -1728,123 +1818,344 @@ class FraudCaseApp:
         base_dir: Path,
         *,
         encoding: str = "utf-8",
+        cache: Optional[dict] = None,
     ) -> tuple[list[dict[str, object]], list[str]]:
+        """Filas de ``case_id`` en la exportación más reciente de ``history_file``.
+
+        ``cache`` permite compartir entre entradas el listado de candidatos
+        de ``base_dir`` y el contenido de cada CSV ya leído.
+        """
+
         base_dir = Path(base_dir)
         table_name = history_file.removeprefix("h_")
         base_name = table_name
         if base_name.endswith(".csv"):
             base_name = base_name[:-4]
         candidate_pattern = f"*_{base_name}.csv" if not base_name.endswith(".csv") else f"*_{base_name}"
-        try:
-            candidates = sorted(
-                base_dir.glob(candidate_pattern),
-                key=lambda p: p.stat().st_mtime if p.exists() else 0,
-                reverse=True,
-            )
-        except OSError:
-            candidates = []
+        glob_key = ("glob", str(base_dir), candidate_pattern)
+        candidates = cache.get(glob_key) if cache is not None else None
+        if candidates is None:
+            try:
+                candidates = sorted(
+                    base_dir.glob(candidate_pattern),
+                    key=lambda p: p.stat().st_mtime if p.exists() else 0,
+                    reverse=True,
+                )
+            except OSError:
+                candidates = []
+            if cache is not None:
+                cache[glob_key] = candidates
         preferred: list[Path] = [path for path in candidates if case_id in path.name]
         candidates = preferred or candidates
         for csv_path in candidates:
-            try:
-                with csv_path.open(newline="", encoding=encoding) as handle:
-                    reader = csv.DictReader(handle)
-                    header = reader.fieldnames or []
-                    rows = []
-                    for row in reader:
-                        if "id_caso" in row and row.get("id_caso") and row.get("id_caso") != case_id:
-                            continue
-                        rows.append(row)
-                    if header:
-                        return rows, header
-            except OSError as exc:
-                log_event("validacion", f"No se pudo leer {csv_path}: {exc}", self.logs)
+            file_key = ("file", str(csv_path), encoding)
+            loaded = cache.get(file_key) if cache is not None else None
+            if loaded is None:
+                try:
+                    with csv_path.open(newline="", encoding=encoding) as handle:
+                        reader = csv.DictReader(handle)
+                        loaded = (reader.fieldnames or [], list(reader))
+                except OSError as exc:
+                    log_event("validacion", f"No se pudo leer {csv_path}: {exc}", self.logs)
+                    continue
+                if cache is not None:
+                    cache[file_key] = loaded
+            header, all_rows = loaded
+            if not header:
                 continue
+            rows = [
+                row
+                for row in all_rows
+                if not ("id_caso" in row and row.get("id_caso") and row.get("id_caso") != case_id)
+            ]
+            return rows, list(header)
         return [], []
 
-    def _reapply_pending_consolidation(self, entry: Mapping[str, object], external_base: Path) -> bool:
-        case_id = str(entry.get("case_id") or "caso")
-        history_files = entry.get("history_files") or []
-        if not history_files:
-            return True
-        encoding = self._normalize_export_encoding(entry.get("encoding"))
-        timestamp_text = entry.get("timestamp")
+    def _get_pending_checkpoint(self) -> ReplayCheckpoint:
+        manifest_path = self._get_pending_manifest_path()
+        return ReplayCheckpoint(manifest_path.with_name(f"{manifest_path.name}.progress"))
+
+    @staticmethod
+    def _pending_entry_ids(entries: list[dict[str, object]]) -> list[str]:
+        """Identificador estable por entrada: su contenido y el número de repetición."""
+
+        seen: Counter = Counter()
+        ids = []
+        for entry in entries:
+            payload = json.dumps(entry, ensure_ascii=False, sort_keys=True, default=str)
+            digest = hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+            seen[digest] += 1
+            ids.append(f"{digest}#{seen[digest]}")
+        return ids
+
+    @staticmethod
+    def _parse_pending_timestamp(value: object) -> datetime:
         try:
-            timestamp = datetime.fromisoformat(timestamp_text) if timestamp_text else datetime.now()
+            return datetime.fromisoformat(str(value)) if value else datetime.now()
         except ValueError:
-            timestamp = datetime.now()
-        base_dir_text = entry.get("base_dir") or EXPORTS_DIR
-        base_dir = Path(base_dir_text)
+            return datetime.now()
+
+    @classmethod
+    def _history_file_lock(cls, path: Path) -> threading.Lock:
+        """Candado compartido por todas las escrituras sobre el histórico ``path``."""
+
+        key = os.path.normcase(os.path.abspath(os.fspath(path)))
+        with cls._consolidation_lock:
+            lock = cls._history_file_locks.get(key)
+            if lock is None:
+                lock = cls._history_file_locks[key] = threading.Lock()
+        return lock
+
+    def _replay_consolidation_group(
+        self,
+        group: tuple[str, str, str],
+        units: list[tuple[str, Mapping[str, object]]],
+        external_base: Path,
+        *,
+        cache: dict,
+        checkpoint: ReplayCheckpoint,
+        cancel_event=None,
+        on_unit_done: Optional[Callable[[], None]] = None,
+    ) -> set[str]:
+        """Adjunta a un mismo ``h_*.csv`` las unidades pendientes de ``group``.
+
+        Devuelve los identificadores de las unidades que no se pudieron
+        consolidar; las demás quedan marcadas en ``checkpoint``.
+        """
+
+        case_id, history_file, encoding = group
+        unit_ids = {unit_id for unit_id, _entry in units}
+        if cancel_event is not None and cancel_event.is_set():
+            return unit_ids
+        table_name = history_file
+        if table_name.startswith("h_"):
+            table_name = table_name[2:]
+        if table_name.endswith(".csv"):
+            table_name = table_name[:-4]
         case_folder = Path(external_base) / case_id
+        completed: set[str] = set()
+
+        def _complete(unit_id: str) -> None:
+            checkpoint.mark(unit_id)
+            completed.add(unit_id)
+            if on_unit_done:
+                on_unit_done()
+
         try:
             case_folder.mkdir(parents=True, exist_ok=True)
-        except OSError as exc:
-            log_event("validacion", f"No se pudo preparar la carpeta externa {case_folder}: {exc}", self.logs)
-            return False
-        success = True
-        for history_file in history_files:
-            rows, header = self._load_history_rows_for_entry(
-                case_id,
-                str(history_file),
-                base_dir,
-                encoding=encoding,
-            )
-            if not header:
-                continue
-            table_name = str(history_file)
-            if table_name.startswith("h_"):
-                table_name = table_name[2:]
-            if table_name.endswith(".csv"):
-                table_name = table_name[:-4]
-            try:
-                append_historical_records(
+            batches: list[HistoricalBatch] = []
+            batch_ids: list[str] = []
+            for unit_id, entry in units:
+                rows, header = self._load_history_rows_for_entry(
+                    case_id,
+                    history_file,
+                    Path(entry.get("base_dir") or EXPORTS_DIR),
+                    encoding=encoding,
+                    cache=cache,
+                )
+                if not header:
+                    _complete(unit_id)
+                    continue
+                batches.append(
+                    HistoricalBatch(rows, header, case_id, self._parse_pending_timestamp(entry.get("timestamp")))
+                )
+                batch_ids.append(unit_id)
+            with self._history_file_lock(case_folder / f"h_{table_name}.csv"):
+                append_historical_batches(
                     table_name,
-                    rows,
-                    header,
+                    batches,
                     case_folder,
-                    case_id,
-                    timestamp=timestamp,
                     encoding=encoding,
+                    on_batch_written=lambda index: _complete(batch_ids[index]),
                 )
-            except OSError as exc:
-                log_event("validacion", f"No se pudo consolidar {history_file} para {case_id}: {exc}", self.logs)
-                success = False
-        return success
+        except (OSError, UnicodeError, csv.Error) as exc:
+            log_event("validacion", f"No se pudo consolidar {history_file} para {case_id}: {exc}", self.logs)
+        return unit_ids - completed
+
+    def _replay_pending_consolidations(self, *, progress_callback=None, cancel_event=None) -> dict[str, object]:
+        """Repone en la unidad externa las consolidaciones del manifiesto.
+
+        No toca la interfaz, así que puede correr en segundo plano. Cada
+        archivo de una entrada es una unidad; las unidades se agrupan por
+        ``h_*.csv`` de destino para abrir cada uno una sola vez, y los grupos
+        se escriben en paralelo. Las unidades terminadas se anotan en un
+        archivo de avance junto al manifiesto, de modo que una reposición
+        interrumpida (cierre de la aplicación o ``cancel_event``) continúa
+        donde quedó. Devuelve ``status`` (``empty``, ``offline``, ``done`` o
+        ``cancelled``) y ``remaining``, las entradas que siguen pendientes.
+        """
 
-    def _process_pending_consolidations(self) -> None:
-        entries = self._load_pending_consolidations()
+        manifest_path = self._get_pending_manifest_path()
+        with self._consolidation_lock:
+            try:
+                manifest_size = manifest_path.stat().st_size
+            except OSError:
+                manifest_size = 0
+            entries = self._load_pending_consolidations()
+        checkpoint = self._get_pending_checkpoint()
         if not entries:
-            self.pending_consolidation_flag = False
-            return
+            checkpoint.clear()
+            return {"status": "empty", "remaining": 0}
         external_base = self._get_external_drive_path()
         if not external_base:
-            self.pending_consolidation_flag = True
-            if not getattr(self, "_suppress_messagebox", False):
-                try:
-                    messagebox.showwarning(
-                        "Copia pendiente",
-                        "Hay consolidaciones pendientes pero no se encontró la unidad externa.",
+            return {"status": "offline", "remaining": len(entries)}
+
+        done = checkpoint.load()
+        entry_ids = self._pending_entry_ids(entries)
+        groups: dict[tuple[str, str, str], list[tuple[str, Mapping[str, object]]]] = {}
+        for entry_id, entry in zip(entry_ids, entries):
+            case_id = str(entry.get("case_id") or "caso")
+            encoding = self._normalize_export_encoding(entry.get("encoding"))
+            for history_file in entry.get("history_files") or []:
+                unit_id = f"{entry_id}|{history_file}"
+                if unit_id not in done:
+                    groups.setdefault((case_id, str(history_file), encoding), []).append((unit_id, entry))
+
+        total = sum(len(units) for units in groups.values())
+        progress_lock = threading.Lock()
+        processed = 0
+
+        def _unit_done() -> None:
+            nonlocal processed
+            with progress_lock:
+                processed += 1
+                current = processed
+            if progress_callback:
+                progress_callback(current, total)
+
+        if progress_callback:
+            progress_callback(0, total)
+        cache: dict = {}
+        pending_units: set[str] = set()
+        if groups:
+            workers = max(1, min(int(PENDING_CONSOLIDATION_WORKERS or 1), len(groups)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="consolidation") as pool:
+                futures = [
+                    pool.submit(
+                        self._replay_consolidation_group,
+                        group,
+                        units,
+                        Path(external_base),
+                        cache=cache,
+                        checkpoint=checkpoint,
+                        cancel_event=cancel_event,
+                        on_unit_done=_unit_done,
                     )
-                except tk.TclError:
-                    pass
-            return
+                    for group, units in groups.items()
+                ]
+                for future in futures:
+                    pending_units.update(future.result())
+
         remaining: list[dict[str, object]] = []
-        for entry in entries:
-            if not isinstance(entry, Mapping):
-                continue
-            if not self._reapply_pending_consolidation(entry, external_base):
-                remaining.append(dict(entry))
-        self._write_pending_consolidations(remaining)
-        self.pending_consolidation_flag = bool(remaining)
-        if remaining and not getattr(self, "_suppress_messagebox", False):
-            try:
-                messagebox.showwarning(
-                    "Copia pendiente",
-                    "No se pudieron consolidar todas las exportaciones pendientes. "
-                    "Se reintentará en el próximo inicio.",
-                )
-            except tk.TclError:
-                pass
+        for entry_id, entry in zip(entry_ids, entries):
+            files = [name for name in entry.get("history_files") or [] if f"{entry_id}|{name}" in pending_units]
+            if files:
+                remaining.append({**entry, "history_files": files})
+        if cancel_event is not None and cancel_event.is_set():
+            # El manifiesto queda intacto; el archivo de avance evita duplicar lo ya escrito.
+            return {"status": "cancelled", "remaining": len(remaining)}
+        with self._consolidation_lock:
+            self._write_pending_consolidations(remaining, appended_after=manifest_size)
+            checkpoint.clear()
+        return {"status": "done", "remaining": len(remaining)}
+
+    def _finish_pending_consolidations(self, summary: Mapping[str, object]) -> None:
+        # Lo anexado durante la reposición sigue en el manifiesto.
+        self.pending_consolidation_flag = bool(summary.get("remaining")) or self._get_pending_manifest_path().exists()
+        self._set_background_status(None)
+        status = summary.get("status")
+        if status == "offline":
+            message = "Hay consolidaciones pendientes pero no se encontró la unidad externa."
+        elif status == "done" and summary.get("remaining"):
+            message = (
+                "No se pudieron consolidar todas las exportaciones pendientes. "
+                "Se reintentará en el próximo inicio."
+            )
+        else:
+            return
+        if getattr(self, "_suppress_messagebox", False):
+            return
+        try:
+            messagebox.showwarning("Copia pendiente", message)
+        except tk.TclError:
+            pass
+
+    def _process_pending_consolidations(self) -> None:
+        self._finish_pending_consolidations(self._replay_pending_consolidations())
+
+    def _start_pending_consolidation_replay(self) -> None:
+        """Vacía el manifiesto de consolidaciones en segundo plano al iniciar.
+
+        El avance se muestra junto a la barra de acciones; sin ventana raíz
+        la reposición corre en el mismo hilo.
+        """
+
+        if getattr(self, "root", None) is None:
+            self._process_pending_consolidations()
+            return
+        if not self._get_pending_manifest_path().exists():
+            self.pending_consolidation_flag = False
+            return
+        token = CancellationToken()
+        progress = {"current": 0, "total": 0}
+        self._pending_consolidation_token = token
+
+        def _on_progress(current: int, total: int) -> None:
+            progress["current"], progress["total"] = current, total
+
+        def _on_success(summary):
+            self._pending_consolidation_token = None
+            self._finish_pending_consolidations(summary)
+
+        def _on_error(exc: BaseException):
+            self._pending_consolidation_token = None
+            self.pending_consolidation_flag = True
+            self._set_background_status(None)
+            log_event("validacion", f"Se interrumpió la consolidación pendiente: {exc}", self.logs)
+
+        future = run_guarded_task(
+            lambda: self._replay_pending_consolidations(progress_callback=_on_progress, cancel_event=token),
+            _on_success,
+            _on_error,
+            self.root,
+            category="persistence",
+            priority=TASK_PRIORITY_BACKGROUND,
+            key="pending_consolidation",
+            token=token,
+        )
+        self._poll_pending_consolidation_progress(future, progress)
+
+    def _poll_pending_consolidation_progress(self, future: Future, progress: dict[str, int]) -> None:
+        if future.done():
+            return
+        if progress["total"]:
+            self._set_background_status(
+                f"Consolidando copias pendientes: {progress['current']} de {progress['total']}…"
+            )
+        with suppress(tk.TclError):
+            self.root.after(self.PENDING_CONSOLIDATION_POLL_MS, self._poll_pending_consolidation_progress, future, progress)
+
+    def _set_background_status(self, message: Optional[str]) -> None:
+        """Muestra (o retira) un aviso de tarea de fondo junto a la barra de acciones.
+
+        Solo se retira el aviso propio, para no borrar el de un guardado en curso.
+        """
+
+        status_label = getattr(self, "save_send_status", None)
+        status_var = getattr(self, "save_send_status_var", None)
+        if not (status_label and status_var):
+            return
+        previous = getattr(self, "_background_status_message", None)
+        try:
+            if message:
+                status_var.set(message)
+                status_label.pack(side="right", padx=(4, 0), pady=6)
+            elif previous and status_var.get() == previous:
+                status_var.set("")
+                status_label.pack_forget()
+        except tk.TclError:
+            return
+        self._background_status_message = message
 
     def _resolve_external_log_target(self) -> Optional[str]:
         if not EXTERNAL_LOGS_FILE:
@@ -1859,6 +2170,81 @@ class FraudCaseApp:
     def _reset_navigation_metrics(self) -> None:
         self._widget_event_counts = defaultdict(int)
         self._heatmap_counts = defaultdict(int)
+        telemetry = getattr(self, "_navigation_telemetry", None)
+        if telemetry is not None:
+            telemetry.reset()
+
+    def _build_navigation_telemetry(self) -> Optional[NavigationTelemetry]:
+        """Crea el anillo de telemetría compacta si el modo lo requiere."""
+
+        if str(NAVIGATION_TELEMETRY_MODE).strip().lower() != "compacto":
+            return None
+        return NavigationTelemetry(
+            sample_rate=NAVIGATION_TELEMETRY_SAMPLE_RATE,
+            bucket_size=self.HEATMAP_BUCKET_SIZE,
+            executor=get_background_executor("telemetry"),
+        )
+
+    def _setup_perf_profiling(self) -> None:
+        """Activa el perfilador compartido si ``PERF_PROFILING_ENABLED`` lo pide."""
+
+        self._perf_hud = None
+        self._loop_lag_monitor = None
+        profiler = configure_profiler(
+            enabled=PERF_PROFILING_ENABLED,
+            sample_rate=PERF_SAMPLE_RATE,
+            slow_callback_ms=PERF_SLOW_CALLBACK_MS,
+        )
+        if not profiler.enabled:
+            return
+        instrument_after(self.root, profiler)
+        self._loop_lag_monitor = LoopLagMonitor(self.root, profiler)
+        self._loop_lag_monitor.start()
+        self.root.bind_all("<Control-Alt-p>", lambda _event: self.toggle_perf_hud(), add="+")
+        if PERF_HUD_ENABLED:
+            self.toggle_perf_hud()
+
+    def toggle_perf_hud(self) -> None:
+        """Abre o cierra el panel de rendimiento."""
+
+        hud = getattr(self, "_perf_hud", None)
+        if hud is not None and hud.is_open():
+            hud.close()
+            self._perf_hud = None
+            return
+        try:
+            self._perf_hud = PerfHud(self.root)
+        except tk.TclError:
+            self._perf_hud = None
+
+    def _stop_perf_profiling(self) -> Optional[Path]:
+        """Detiene el latido y el panel y escribe la traza de rendimiento."""
+
+        monitor = getattr(self, "_loop_lag_monitor", None)
+        if monitor is not None:
+            monitor.stop()
+            self._loop_lag_monitor = None
+        hud = getattr(self, "_perf_hud", None)
+        if hud is not None:
+            hud.close()
+            self._perf_hud = None
+        profiler = get_profiler()
+        if not profiler.enabled or not PERF_TRACE_PATH or not profiler.event_count():
+            return None
+        try:
+            path = profiler.export_chrome_trace(PERF_TRACE_PATH)
+        except OSError as exc:
+            log_event("validacion", f"No se pudo escribir la traza de rendimiento: {exc}", self.logs)
+            return None
+        log_event("navegacion", f"Traza de rendimiento guardada en {path}", self.logs)
+        return path
+
+    def set_navigation_sample_rate(self, rate: float) -> None:
+        """Ajusta la fracción de eventos de navegación registrados."""
+
+        telemetry = getattr(self, "_navigation_telemetry", None)
+        if telemetry is not None:
+            telemetry.sample_rate = rate
 
     def _slugify_identifier(self, value: str) -> str:
         normalized = normalize_without_accents(value or "").lower()
@@ -1959,8 +2345,14 @@ class FraudCaseApp:
 
     def _emit_navigation_metrics(self) -> None:
         self._ensure_navigation_metrics_initialized()
+        self._merge_navigation_telemetry()
         if not self._widget_event_counts and not self._heatmap_counts:
             return
+        # En modo compacto estas filas son la única fuente de los eventos, así
+        # que llevan el conteo en ``new_value`` para que los lectores las
+        # ponderen; en modo detallado resumen filas ya escritas y van sin él.
+        compact = getattr(self, "_navigation_telemetry", None) is not None
+        half_bucket = self.HEATMAP_BUCKET_SIZE / 2
         for widget_id, count in self._widget_event_counts.items():
             log_event(
                 "navegacion",
@@ -1968,6 +2360,7 @@ class FraudCaseApp:
                 self.logs,
                 widget_id=widget_id,
                 event_subtipo="focus_metrics",
+                new_value=count if compact else None,
             )
         for (x_bucket, y_bucket), count in self._heatmap_counts.items():
             log_event(
@@ -1975,11 +2368,38 @@ class FraudCaseApp:
                 f"Heatmap zona ({x_bucket},{y_bucket}) acumulada: {count}",
                 self.logs,
                 widget_id="heatmap",
-                coords=(x_bucket, y_bucket),
+                coords=(x_bucket + half_bucket, y_bucket + half_bucket),
                 event_subtipo="click_heatmap",
+                new_value=count if compact else None,
             )
         self._reset_navigation_metrics()
 
+    def _merge_navigation_telemetry(self) -> None:
+        """Vuelca el anillo compacto en los contadores y registra su resumen."""
+
+        telemetry = getattr(self, "_navigation_telemetry", None)
+        if telemetry is None:
+            return
+        summary = telemetry.flush()
+        if summary.is_empty():
+            return
+        for widget_id, count in summary.widget_counts.items():
+            self._widget_event_counts[widget_id] += count
+        for zone, count in summary.heatmap_counts.items():
+            self._heatmap_counts[zone] += count
+        breakdown = ", ".join(
+            f"{name}={count}" for name, count in sorted(summary.event_counts.items())
+        )
+        elapsed = max(0.0, (summary.last_ts or 0.0) - (summary.first_ts or 0.0))
+        log_event(
+            "navegacion",
+            f"Telemetría compacta: {summary.recorded} eventos ({breakdown}) en "
+            f"{elapsed:.1f} s; {summary.sampled_out} omitidos por muestreo",
+            self.logs,
+            widget_id="telemetria",
+            event_subtipo="navigation_summary",
+        )
+
     def _normalize_root_coords(
         self, coords: Optional[tuple]
     ) -> Optional[tuple[float, float]]:
@@ -2013,7 +2433,33 @@ class FraudCaseApp:
         except Exception:
             return None
 
+    def _record_compact_navigation_event(
+        self, telemetry: NavigationTelemetry, event: tk.Event, subtype: str
+    ) -> None:
+        """Registra el evento en el anillo compacto sin tocar Tk ni la bitácora."""
+
+        if not telemetry.should_sample():
+            return
+        widget = getattr(event, "widget", None)
+        if not hasattr(widget, "winfo_class"):
+            return
+        key = getattr(widget, "_w", None) or id(widget)
+        widget_index = telemetry.widget_index(
+            key,
+            lambda: self._resolve_widget_id(widget) or self._describe_widget(widget),
+        )
+        telemetry.record(
+            subtype,
+            widget_index,
+            getattr(event, "x_root", None),
+            getattr(event, "y_root", None),
+        )
+
     def _handle_global_navigation_event(self, event: tk.Event, subtype: str) -> None:
+        telemetry = getattr(self, "_navigation_telemetry", None)
+        if telemetry is not None:
+            self._record_compact_navigation_event(telemetry, event, subtype)
+            return
         # FIX 2: focus_displayof() falla en macOS con widgets temporales (popdown, tooltips, etc.)
         # FIX FINAL: focus_get() explota con widgets temporales como .popdown (macOS)
         try:
@@ -2253,45 +2699,7 @@ class FraudCaseApp:
         self._log_navigation_change(f"Auto-redactó {label}")
 
     def _normalize_analysis_texts(self, analysis_payload):
-        def _build_entry(value, *, max_chars=RICH_TEXT_MAX_CHARS, allow_newlines=True):
-            text, tags, images = self._deserialize_rich_text_payload(value)
-            sanitized = sanitize_rich_text(text, max_chars=None)
-            if not allow_newlines and "\n" in sanitized:
-                sanitized = " ".join(sanitized.splitlines())
-            sanitized = sanitize_rich_text(sanitized, max_chars)
-            entry = {"text": sanitized, "tags": tags}
-            if images:
-                entry["images"] = images
-            return entry
-
-        comment_limits = {
-            "comentario_breve": (COMENTARIO_BREVE_MAX_CHARS, False),
-            "comentario_amplio": (COMENTARIO_AMPLIO_MAX_CHARS, False),
-        }
-        sections = [
-            "antecedentes",
-            "modus_operandi",
-            "hallazgos",
-            "descargos",
-            "conclusiones",
-            "recomendaciones",
-            "comentario_breve",
-            "comentario_amplio",
-        ]
-        payload = analysis_payload or {}
-        normalized = {}
-        for name in sections:
-            max_chars, allow_newlines = comment_limits.get(name, (RICH_TEXT_MAX_CHARS, True))
-            normalized[name] = _build_entry(
-                payload.get(name),
-                max_chars=max_chars,
-                allow_newlines=allow_newlines,
-            )
-        for name, value in payload.items():
-            if name in normalized:
-                continue
-            normalized[name] = _build_entry(value)
-        return normalized
+        return normalize_analysis_texts(analysis_payload)
 
     def _get_exports_folder(self) -> Optional[Path]:
         base_path = getattr(self, "_export_base_path", None) or EXPORTS_DIR
@@ -2323,6 +2731,7 @@ class FraudCaseApp:
             click_log="Usuario pulsó importar datos combinados",
             start_log="Inició importación de datos combinados",
             log_handler=lambda category, message: log_event(category, message, self.logs),
+            preview_spec_factory=lambda: self._build_import_preview_spec("combinado"),
         )
 
     def import_risks(self, filename=None):
@@ -2342,6 +2751,7 @@ class FraudCaseApp:
             click_log="Usuario pulsó importar riesgos",
             start_log="Inició importación de riesgos",
             log_handler=lambda category, message: log_event(category, message, self.logs),
+            preview_spec_factory=lambda: self._build_import_preview_spec("riesgos"),
         )
 
     def import_norms(self, filename=None):
@@ -2361,6 +2771,7 @@ class FraudCaseApp:
             click_log="Usuario pulsó importar normas",
             start_log="Inició importación de normas",
             log_handler=lambda category, message: log_event(category, message, self.logs),
+            preview_spec_factory=lambda: self._build_import_preview_spec("normas"),
         )
 
     def import_claims(self, filename=None):
@@ -2380,6 +2791,7 @@ class FraudCaseApp:
             click_log="Usuario pulsó importar reclamos",
             start_log="Inició importación de reclamos",
             log_handler=lambda category, message: log_event(category, message, self.logs),
+            preview_spec_factory=lambda: self._build_import_preview_spec("reclamos"),
         )
 
     # ---------------------------------------------------------------------
@@ -2925,6 +3337,7 @@ class FraudCaseApp:
                 pass
         target_id = id(target_widget) if target_widget is not None else field_name
         key = f"field:{field_name}:{target_id}"
+        self._defer_validation_panel_apply()
         self._validation_panel.update_entry(
             key,
             message,
@@ -2936,6 +3349,29 @@ class FraudCaseApp:
         self._update_completion_progress()
         self.recalculate_quality()
 
+    def _defer_validation_panel_apply(self) -> None:
+        """Agrupa en el panel los resultados publicados durante un mismo ciclo.
+
+        Los validadores de campo se drenan juntos en un ``tick`` del
+        planificador; el panel mantiene abierta una transacción que se cierra
+        en el siguiente ciclo ocioso y pinta todos los cambios de una vez.
+        """
+
+        panel = self._validation_panel
+        scheduler = self._get_ui_scheduler()
+        begin_batch = getattr(panel, "begin_batch", None)
+        if scheduler is None or not callable(begin_batch):
+            return
+        if scheduler.is_pending("panel_validacion"):
+            return
+        begin_batch()
+        scheduler.schedule(
+            "panel_validacion",
+            panel.end_batch,
+            priority=PRIORITY_SUMMARY,
+            debounce=False,
+        )
+
     def _build_validation_focus_map(self) -> dict[str, tk.Widget]:
         focus_map: dict[str, tk.Widget] = {}
         case_inputs = getattr(self, "_case_inputs", {}) or {}
@@ -3438,6 +3874,11 @@ class FraudCaseApp:
             finally:
                 self._pending_idle_update = False
 
+        scheduler = self._get_ui_scheduler()
+        if scheduler is not None:
+            self._pending_idle_update = True
+            scheduler.schedule("update_idletasks", _flush_pending_update, priority=PRIORITY_LAYOUT)
+            return
         try:
             self._pending_idle_update = True
             after_idle = getattr(root, "after_idle", None)
@@ -3452,6 +3893,11 @@ class FraudCaseApp:
             except tk.TclError:
                 pass
 
+    def _get_ui_scheduler(self):
+        """Planificador central de trabajos diferidos (``None`` en instancias parciales)."""
+
+        return getattr(self, "_ui_scheduler", None)
+
     def _register_scrollable(self, container):
         if container is None:
             return
@@ -5165,6 +5611,9 @@ class FraudCaseApp:
             self._play_feedback_sound()
 
     def remove_client(self, client_frame):
+        destroy_badge_subtrees(
+            (getattr(client_frame, "frame", None), getattr(client_frame, "section", None))
+        )
         self._handle_client_id_change(client_frame, client_frame.id_var.get(), None)
         self.client_frames.remove(client_frame)
         self._renumber_clients()
@@ -5196,10 +5645,26 @@ class FraudCaseApp:
         self._refresh_frame_collection(self.client_frames)
 
     def update_client_options_global(self):
-        """Actualiza la lista de clientes en todos los productos y envolvimientos."""
-        # Actualizar combobox de clientes en cada producto
-        for prod in self.product_frames:
-            prod.update_client_options()
+        """Publica una nueva versión de la lista de clientes.
+
+        Los ``Combobox`` de productos e involucramientos leen la lista al
+        desplegarse, por lo que un alta cuesta O(1). Solo cuando desaparece un
+        ID se liberan las selecciones que todavía lo referencian.
+        """
+        source = self._get_client_option_source()
+        source.invalidate()
+        if self._bulk_load_active():
+            self._bulk_pending_options.add("clientes")
+            return
+        removed = source.pop_removed()
+        if removed:
+            known_ids = source.known()
+            for prod in self.product_frames:
+                release = getattr(prod, "release_stale_client_selection", None)
+                if callable(release):
+                    release(known_ids)
+                else:
+                    prod.update_client_options()
         log_event("navegacion", "Actualizó opciones de cliente", self.logs)
 
     def _on_add_client_click(self):
@@ -5369,9 +5834,21 @@ class FraudCaseApp:
         self._refresh_frame_collection(self.team_frames)
 
     def update_team_options_global(self):
-        """Actualiza listas de colaboradores en productos e involucra."""
-        for prod in self.product_frames:
-            prod.update_team_options()
+        """Publica una nueva versión de la lista de colaboradores (ver clientes)."""
+        source = self._get_team_option_source()
+        source.invalidate()
+        if self._bulk_load_active():
+            self._bulk_pending_options.add("colaboradores")
+            return
+        removed = source.pop_removed()
+        if removed:
+            known_ids = source.known()
+            for prod in self.product_frames:
+                release = getattr(prod, "release_stale_team_selection", None)
+                if callable(release):
+                    release(known_ids)
+                else:
+                    prod.update_team_options()
         log_event("navegacion", "Actualizó opciones de colaborador", self.logs)
 
     def _toggle_team_detail(self):
@@ -5788,8 +6265,8 @@ class FraudCaseApp:
             self.product_container,
             idx,
             self.remove_product,
-            self.get_client_ids,
-            self.get_team_ids,
+            self._get_client_option_source(),
+            self._get_team_option_source(),
             self.logs,
             self.product_lookup,
             self.register_tooltip,
@@ -5824,6 +6301,7 @@ class FraudCaseApp:
         return prod
 
     def remove_product(self, prod_frame):
+        destroy_badge_subtrees((getattr(prod_frame, "frame", None),))
         self._handle_product_id_change(prod_frame, prod_frame.id_var.get(), None)
         self.product_frames.remove(prod_frame)
         self._renumber_products()
@@ -5838,6 +6316,20 @@ class FraudCaseApp:
     def get_team_ids(self):
         return [t.id_var.get().strip() for t in self.team_frames if t.id_var.get().strip()]
 
+    def _get_client_option_source(self) -> SharedOptionSource:
+        source = getattr(self, "_client_option_source", None)
+        if source is None:
+            source = SharedOptionSource(self.get_client_ids, name="clientes")
+            self._client_option_source = source
+        return source
+
+    def _get_team_option_source(self) -> SharedOptionSource:
+        source = getattr(self, "_team_option_source", None)
+        if source is None:
+            source = SharedOptionSource(self.get_team_ids, name="colaboradores")
+            self._team_option_source = source
+        return source
+
     def build_risk_tab(self, parent):
         frame = build_grid_container(
             parent,
@@ -8084,13 +8576,13 @@ class FraudCaseApp:
         docx_tooltip = (
             "Genera el informe principal en Word utilizando los datos validados."
             if self._docx_available
-            else f"{DOCX_MISSING_MESSAGE} Usa el informe Markdown como respaldo."
+            else f"{_report_builder_module.DOCX_MISSING_MESSAGE} Usa el informe Markdown como respaldo."
         )
         resumen_tooltip = "Genera un resumen ejecutivo estructurado (mensaje clave, soporte y evidencia)."
         alerta_tooltip = (
             "Genera una alerta temprana en formato PPT utilizando el resumen validado."
             if self._pptx_available
-            else f"{PPTX_MISSING_MESSAGE} Instala la dependencia para habilitar este botón."
+            else f"{_alerta_temprana_module.PPTX_MISSING_MESSAGE} Instala la dependencia para habilitar este botón."
         )
         carta_tooltip = "Genera cartas de inmediatez por colaborador usando la plantilla configurada."
         if self.btn_docx:
@@ -8106,7 +8598,7 @@ class FraudCaseApp:
                 pass
             self.register_tooltip(self.btn_alerta_temprana, alerta_tooltip)
         if not self._docx_available:
-            carta_tooltip = f"{DOCX_MISSING_MESSAGE} Instala python-docx para generar cartas de inmediatez."
+            carta_tooltip = f"{_report_builder_module.DOCX_MISSING_MESSAGE} Instala python-docx para generar cartas de inmediatez."
             try:
                 carta_button.state(["disabled"])
             except tk.TclError:
@@ -8436,62 +8928,76 @@ class FraudCaseApp:
 
     def _refresh_client_summary(self):
         host = getattr(self, "_client_summary_owner", None)
+        if host and hasattr(host, "schedule_summary_refresh"):
+            host.schedule_summary_refresh()
+            return
         if host and hasattr(host, "refresh_summary"):
             host.refresh_summary()
             return
         tree = getattr(self, "clients_summary_tree", None)
         if not tree:
             return
-        try:
-            tree.delete(*tree.get_children())
-        except tk.TclError:
-            return
-        for idx, client in enumerate(self.client_frames):
-            data = client.get_data()
-            values = (
-                data.get("id_cliente", ""),
-                data.get("nombres", ""),
-                data.get("apellidos", ""),
-                data.get("tipo_id", ""),
-                data.get("flag", ""),
-                data.get("telefonos", ""),
-                data.get("correos", ""),
-                data.get("direcciones", ""),
-                data.get("accionado", ""),
-            )
-            tags = ("even",) if idx % 2 == 0 else ("odd",)
-            tree.insert("", "end", iid=data.get("id_cliente", f"cliente-{idx}"), values=values, tags=tags)
-        self._apply_treeview_theme(tree)
+
+        def build_rows():
+            rows = []
+            for client in self.client_frames:
+                data = client.get_data()
+                rows.append(
+                    (
+                        data.get("id_cliente", ""),
+                        data.get("nombres", ""),
+                        data.get("apellidos", ""),
+                        data.get("tipo_id", ""),
+                        data.get("flag", ""),
+                        data.get("telefonos", ""),
+                        data.get("correos", ""),
+                        data.get("direcciones", ""),
+                        data.get("accionado", ""),
+                    )
+                )
+            return rows
+
+        renderer = get_tree_renderer(tree, fallback_key="cliente", base_tags=())
+        renderer.schedule(build_rows, lambda stats: self._apply_rendered_tree_theme(tree, stats))
 
     def _refresh_team_summary(self):
         host = getattr(self, "_team_summary_owner", None)
+        if host and hasattr(host, "schedule_summary_refresh"):
+            host.schedule_summary_refresh()
+            return
         if host and hasattr(host, "refresh_summary"):
             host.refresh_summary()
             return
         tree = getattr(self, "team_summary_tree", None)
         if not tree:
             return
-        try:
-            tree.delete(*tree.get_children())
-        except tk.TclError:
-            return
-        for idx, member in enumerate(self.team_frames):
-            data = member.get_data()
-            field_order = [field for field, _ in self.COLLABORATOR_SUMMARY_COLUMNS]
-            values = tuple(data.get(field, "") for field in field_order)
-            tags = ("even",) if idx % 2 == 0 else ("odd",)
-            tree.insert("", "end", iid=data.get("id_colaborador", f"colaborador-{idx}"), values=values, tags=tags)
-        self._apply_treeview_theme(tree)
+        field_order = [field for field, _ in self.COLLABORATOR_SUMMARY_COLUMNS]
+
+        def build_rows():
+            rows = []
+            for member in self.team_frames:
+                data = member.get_data()
+                rows.append(tuple(data.get(field, "") for field in field_order))
+            return rows
+
+        renderer = get_tree_renderer(tree, fallback_key="colaborador", base_tags=())
+        renderer.schedule(build_rows, lambda stats: self._apply_rendered_tree_theme(tree, stats))
 
     def _render_compact_rows(self, tree, rows):
-        try:
-            tree.delete(*tree.get_children())
-        except tk.TclError:
+        stats = get_tree_renderer(tree).render(rows)
+        self._apply_rendered_tree_theme(tree, stats)
+
+    def _apply_rendered_tree_theme(self, tree, stats):
+        """Aplica el tema tras un renderizado incremental de ``tree``.
+
+        Un renderizado por diferencias ya etiqueta cada fila, por lo que basta
+        con configurar los tags conocidos; solo las reconstrucciones completas
+        recorren todas las filas.
+        """
+
+        if not stats.changed:
             return
-        for idx, row in enumerate(rows):
-            tags = ("even",) if idx % 2 == 0 else ("odd",)
-            self._insert_themed_row(tree, row, tags=tags)
-        self._apply_treeview_theme(tree)
+        self._apply_treeview_theme(tree, scan_items=stats.rebuilt)
 
     def _compact_views_present(self, sections):
         return (
@@ -8518,7 +9024,7 @@ class FraudCaseApp:
         hscrollbar.grid(row=1, column=0, sticky="ew")
         return tree, frame
 
-    def _apply_treeview_theme(self, tree):
+    def _apply_treeview_theme(self, tree, scan_items=True):
         palette = ThemeManager.current()
 
         if hasattr(tree, "tag_configure"):
@@ -8543,7 +9049,9 @@ class FraudCaseApp:
 
             tags = set()
             children = ()
-            if hasattr(tree, "get_children"):
+            if not scan_items:
+                tags.update(("themed", "even", "odd"))
+            elif hasattr(tree, "get_children"):
                 try:
                     children = tree.get_children()
                 except tk.TclError:
@@ -8669,7 +9177,7 @@ class FraudCaseApp:
     def _start_background_import(self, task_label, button, worker, ui_callback, error_prefix, ui_error_prefix=None):
         self._ensure_import_runtime_state()
         ui_error_prefix = ui_error_prefix or error_prefix
-        cancel_event = threading.Event()
+        cancel_event = CancellationToken()
         progress_queue: SimpleQueue[tuple[int, int]] = SimpleQueue()
         future_holder: list = [None]
 
@@ -8696,9 +9204,13 @@ class FraudCaseApp:
         self._on_import_started(task_label)
         run_async = getattr(self, 'root', None) is not None
 
+        def _run_worker():
+            with get_profiler().span("worker", "imports", task=task_label):
+                return worker(progress_callback, cancel_event)
+
         def _execute_worker():
             try:
-                payload = worker(progress_callback, cancel_event)
+                payload = _run_worker()
             except CancelledError:
                 self._handle_import_cancelled(task_label, button)
                 return
@@ -8725,12 +9237,13 @@ class FraudCaseApp:
             self._handle_import_failure(task_label, button, exc, error_prefix)
 
         future = run_guarded_task(
-            lambda: worker(progress_callback, cancel_event),
+            _run_worker,
             _on_success,
             _on_error,
             self.root,
-            poll_interval_ms=50,
             category="imports",
+            priority=TASK_PRIORITY_INTERACTIVE,
+            token=cancel_event,
         )
         future_holder[0] = future
         dialog.track_future(future, progress_queue)
@@ -8738,9 +9251,12 @@ class FraudCaseApp:
     def _handle_import_success(self, task_label, button, ui_callback, payload, error_prefix):
         message = f"Importación de {task_label} finalizada."
         failed = False
+        awaiting_confirmation = False
         captured_error = None
         try:
-            ui_callback(payload)
+            with get_profiler().span("apply", "imports", task=task_label):
+                outcome = ui_callback(payload)
+            awaiting_confirmation = outcome is self._IMPORT_AWAITING_CONFIRMATION
         except Exception as exc:
             failed = True
             message = f"Importación de {task_label} con errores."
@@ -8751,12 +9267,16 @@ class FraudCaseApp:
             except tk.TclError:
                 pass
         finally:
-            if button is not None and not self._catalog_loading:
-                try:
-                    button.state(['!disabled'])
-                except tk.TclError:
-                    pass
-            self._finalize_import_task(message, failed=failed)
+            if awaiting_confirmation:
+                if getattr(self, "import_status_var", None) is not None:
+                    self.import_status_var.set(f"Importación de {task_label} pendiente de confirmación.")
+            else:
+                if button is not None and not self._catalog_loading:
+                    try:
+                        button.state(['!disabled'])
+                    except tk.TclError:
+                        pass
+                self._finalize_import_task(message, failed=failed)
         if captured_error is not None and getattr(self, 'root', None) is None:
             raise captured_error
 
@@ -8784,6 +9304,274 @@ class FraudCaseApp:
         self._abort_import_feedback()
         self._finalize_import_task(f"Importación de {task_label} cancelada.")
 
+    def _import_preview_enabled(self) -> bool:
+        return bool(IMPORT_PREVIEW_ENABLED) and getattr(self, "root", None) is not None
+
+    def _build_import_preview_spec(self, sample_key: str) -> ImportPreviewSpec | None:
+        """Reglas de la vista previa de ``sample_key`` con una foto del formulario.
+
+        Replica los criterios de ``_apply_*_import_payload``: qué cuenta como
+        error, qué como duplicado y si un ID ya presente se omite o se fusiona.
+        Se llama en el hilo de Tk; el resultado se evalúa en el trabajador.
+        """
+
+        catalogs = set(getattr(self, "detail_catalogs", None) or {})
+
+        def _row(entry) -> Mapping:
+            row = entry.get('row') if isinstance(entry, Mapping) and 'row' in entry else entry
+            return row if isinstance(row, Mapping) else {}
+
+        def _text(row: Mapping, key: str) -> str:
+            value = row.get(key)
+            return value.strip() if isinstance(value, str) else ""
+
+        def _catalog_observation(entry, id_column: str, found_key: str = 'found') -> list[str]:
+            if id_column in catalogs and isinstance(entry, Mapping) and not entry.get(found_key, False):
+                return [f"{id_column} sin datos en el catálogo de detalle"]
+            return []
+
+        def _by_id(id_column: str, frames, validate=None) -> ImportPreviewSpec:
+            existing = self._collect_existing_ids(frames)
+
+            def _check(entry):
+                row = _row(entry)
+                observations = _catalog_observation(entry, id_column) if 'row' in entry else []
+                message = validate(row) if validate else None
+                if message:
+                    observations.append(message)
+                return [], observations
+
+            return ImportPreviewSpec(
+                key_for=lambda entry: _text(_row(entry), id_column),
+                is_existing=lambda _entry, key: key in existing,
+                check=_check,
+            )
+
+        if sample_key == "clientes":
+            return _by_id(
+                'id_cliente',
+                self.client_frames,
+                lambda row: validate_client_id(_text(row, 'tipo_id'), _text(row, 'id_cliente'))
+                if _text(row, 'tipo_id') else None,
+            )
+        if sample_key == "colaboradores":
+            return _by_id(
+                'id_colaborador',
+                self.team_frames,
+                lambda row: validate_team_member_id(_text(row, 'id_colaborador')),
+            )
+        if sample_key == "productos":
+            return _by_id(
+                'id_producto',
+                self.product_frames,
+                lambda row: (
+                    validate_product_id(_text(row, 'tipo_producto'), _text(row, 'id_producto'))
+                    if _text(row, 'tipo_producto') else None
+                ) or validate_product_dates(
+                    _text(row, 'id_producto'), _text(row, 'fecha_ocurrencia'), _text(row, 'fecha_descubrimiento')
+                ),
+            )
+        if sample_key == "riesgos":
+            return _by_id('id_riesgo', self.risk_frames)
+        if sample_key == "normas":
+            spec = _by_id('id_norma', self.norm_frames)
+            norm_catalog = self._norm_catalog_ids()
+            spec.check = lambda entry: (self._norm_import_errors(_row(entry), norm_catalog), [])
+            return spec
+        if sample_key == "reclamos":
+            existing_claims = self._collect_existing_claim_keys()
+
+            def _claim_key(entry):
+                row = _row(entry)
+                product_id = _text(row, 'id_producto')
+                claim_fields = [_text(row, key) for key in ('id_reclamo', 'nombre_analitica', 'codigo_analitica')]
+                if not product_id or (any(claim_fields) and not claim_fields[0]):
+                    return ""
+                # Filas sin reclamo solo aseguran el producto: no se deduplican.
+                return (product_id, claim_fields[0]) if claim_fields[0] else None
+
+            def _claim_check(entry):
+                claim_id = _text(_row(entry), 'id_reclamo')
+                observations = _catalog_observation(entry, 'id_producto')
+                message = validate_reclamo_id(claim_id) if claim_id else None
+                return [], observations + ([message] if message else [])
+
+            return ImportPreviewSpec(
+                key_for=_claim_key,
+                is_existing=lambda _entry, key: key in existing_claims,
+                check=_claim_check,
+            )
+        if sample_key == "combinado":
+            # La importación combinada nunca omite filas enteras: deduplica cada
+            # involucramiento por (producto, cliente) o (producto, colaborador)
+            # y cada reclamo, así que la vista previa clasifica esas partes.
+            loaded_products = set(self._collect_existing_ids(self.product_frames))
+            existing_claims = self._collect_existing_claim_keys()
+            existing_involvements: set[tuple[str, str, str]] = set()
+            for product_frame in self.product_frames:
+                pid_var = getattr(product_frame, 'id_var', None)
+                pid_value = (pid_var.get() if hasattr(pid_var, 'get') else "").strip()
+                if not pid_value:
+                    continue
+                for kind, rows, var_name in (
+                    ('cliente', getattr(product_frame, 'client_involvements', []), 'client_var'),
+                    ('colaborador', getattr(product_frame, 'involvements', []), 'team_var'),
+                ):
+                    for inv in rows:
+                        inv_var = getattr(inv, var_name, None)
+                        inv_id = (inv_var.get() if hasattr(inv_var, 'get') else "").strip()
+                        if inv_id:
+                            existing_involvements.add((pid_value, kind, inv_id))
+            case_var = getattr(self, "id_caso_var", None)
+            current_case = (case_var.get() or "").strip() if case_var is not None else ""
+
+            def _technical_key(entry, product_id, client_id, collaborator_id, claim_id):
+                raw_row = entry.get('raw_row') or {}
+                return build_technical_key(
+                    _text(raw_row, 'id_caso') or _text(raw_row, 'case_id') or current_case,
+                    product_id,
+                    client_id,
+                    normalize_team_member_identifier(collaborator_id).strip(),
+                    _text(raw_row, 'fecha_ocurrencia')
+                    or _text(raw_row, 'fecha_ocurrencia_caso')
+                    or _text(raw_row, 'fecha_de_ocurrencia'),
+                    claim_id,
+                )
+
+            def _combined_items(entry):
+                product_row = entry.get('product_row') or {}
+                product_id = _text(product_row, 'id_producto')
+                observations = []
+                for id_column, source, found_key in (
+                    ('id_cliente', 'client_row', 'client_found'),
+                    ('id_colaborador', 'team_row', 'team_found'),
+                    ('id_producto', 'product_row', 'product_found'),
+                ):
+                    if _text(entry.get(source) or {}, id_column):
+                        observations.extend(_catalog_observation(entry, id_column, found_key))
+                items = []
+                product_known = product_id in loaded_products
+                if product_id:
+                    for involvement in entry.get('involvements') or []:
+                        if not isinstance(involvement, Mapping):
+                            continue
+                        kind = (involvement.get('tipo_involucrado') or 'colaborador').strip().lower()
+                        kind = 'cliente' if kind == 'cliente' else 'colaborador'
+                        subject = _text(involvement, 'id_cliente_involucrado' if kind == 'cliente' else 'id_colaborador')
+                        amount_text = _text(involvement, 'monto_asignado')
+                        error, _amount, normalized_text = validate_money_bounds(
+                            amount_text,
+                            f"Monto asignado del {kind} {subject or 'sin ID'} en el producto {product_id}",
+                            allow_blank=True,
+                        )
+                        if not subject and not error:
+                            continue
+                        items.append({
+                            'kind': kind,
+                            'product_id': product_id,
+                            'subject': subject,
+                            'key': _technical_key(
+                                entry,
+                                product_id,
+                                subject if kind == 'cliente' else "",
+                                subject if kind == 'colaborador' else "",
+                                "",
+                            ) if subject else None,
+                            'has_amount': bool(normalized_text or amount_text),
+                            'errors': [f"{error} La importación se detendrá en esta fila."] if error else [],
+                        })
+                    for claim in entry.get('claims') or []:
+                        if not isinstance(claim, Mapping):
+                            continue
+                        claim_id = _text(claim, 'id_reclamo')
+                        if not claim_id and not any(claim.values()):
+                            continue
+                        items.append({
+                            'kind': 'reclamo',
+                            'product_id': product_id,
+                            'subject': claim_id,
+                            'key': _technical_key(
+                                entry,
+                                product_id,
+                                _text(product_row, 'id_cliente'),
+                                _text(entry.get('raw_row') or {}, 'id_colaborador'),
+                                claim_id,
+                            ),
+                            'has_amount': False,
+                            'errors': [],
+                        })
+                if product_id:
+                    # Las filas siguientes del mismo producto ya lo encuentran.
+                    loaded_products.add(product_id)
+                if not items:
+                    # Sin partes deduplicables la fila solo asegura producto,
+                    # cliente y colaborador: no se omite nunca.
+                    has_ids = product_id or any(
+                        _text(entry.get(source) or {}, id_column)
+                        for source, id_column in (('client_row', 'id_cliente'), ('team_row', 'id_colaborador'))
+                    )
+                    items.append({
+                        'kind': 'fila',
+                        'product_id': product_id,
+                        'product_known': product_known,
+                        'subject': "",
+                        'key': None if has_ids else "",
+                        'has_amount': False,
+                        'errors': [],
+                    })
+                items[0]['observations'] = observations
+                return items
+
+            def _combined_existing(item, _key):
+                product_id = item['product_id']
+                if item['kind'] == 'fila':
+                    return item['product_known']
+                if item['kind'] == 'reclamo':
+                    return (product_id, item['subject']) in existing_claims
+                return (product_id, item['kind'], item['subject']) in existing_involvements
+
+            return ImportPreviewSpec(
+                key_for=lambda item: item['key'],
+                is_existing=_combined_existing,
+                existing_status=PREVIEW_UPDATED,
+                check=lambda item: (list(item['errors']), list(item.get('observations') or [])),
+                items_for=_combined_items,
+                keep_repeated=lambda item: item['kind'] != 'reclamo' and item['has_amount'],
+            )
+        return None
+
+    def _show_import_preview(self, preview, *, task_label: str, on_commit, error_prefix: str, button=None):
+        """Muestra el resumen de la importación; solo se aplica si el usuario confirma.
+
+        La tarea de importación queda activa (y ``button`` deshabilitado)
+        hasta que el usuario confirme o descarte la vista previa.
+        """
+
+        counts = ", ".join(f"{status}={count}" for status, count in sorted(preview.counts.items()))
+        log_event("navegacion", f"Vista previa de {task_label}: {counts or 'sin filas'}", self.logs)
+
+        def _commit() -> None:
+            log_event("navegacion", f"Confirmó la importación de {task_label}", self.logs)
+            self._handle_import_success(task_label, button, lambda _payload: on_commit(), preview.payload, error_prefix)
+
+        def _discard() -> None:
+            log_event("navegacion", f"Descartó la importación de {task_label}", self.logs)
+            if button is not None and not self._catalog_loading:
+                try:
+                    button.state(['!disabled'])
+                except tk.TclError:
+                    pass
+            self._finalize_import_task(f"Importación de {task_label} descartada.")
+
+        ImportPreviewDialog(
+            self.root,
+            preview,
+            on_commit=_commit,
+            on_discard=_discard,
+            page_size=IMPORT_PREVIEW_PAGE_SIZE,
+        )
+        return self._IMPORT_AWAITING_CONFIRMATION
+
     def _normalize_detail_catalog_payload(self, raw_catalogs):
         normalized = {
             normalize_detail_catalog_key(key): dict(value or {})
@@ -8944,6 +9732,9 @@ class FraudCaseApp:
             self._check_duplicate_technical_keys_realtime(armed=True, show_popup=True)
         if self._is_summary_tab_visible():
             self._flush_summary_refresh()
+        analysis_tab = getattr(self, "_tab_widgets", {}).get("analisis")
+        if analysis_tab is not None and selected_tab == str(analysis_tab):
+            self._warm_up_summary_model()
 
     def _collect_claim_requirement_errors(self) -> list[str]:
         errors: list[str] = []
@@ -8995,6 +9786,9 @@ class FraudCaseApp:
             messagebox.showerror("Portapapeles", "No se pudo leer el portapapeles desde el sistema.")
             return "break"
         log_event("navegacion", f"Intento de pegado en resumen:{key}", self.logs)
+        if key in self.SUMMARY_INGEST_SECTIONS and self._should_paste_in_background(clipboard_text):
+            self._start_summary_paste_import(key, clipboard_text, allowed_counts)
+            return "break"
         try:
             parsed_rows = self._parse_clipboard_rows(clipboard_text, allowed_counts)
             sanitized_rows = self._transform_summary_clipboard_rows(key, parsed_rows)
@@ -9002,16 +9796,7 @@ class FraudCaseApp:
             messagebox.showerror("Pegado no válido", str(exc))
             log_event("validacion", f"Pegado fallido en {key}: {exc}", self.logs)
             return "break"
-        ingestible_sections = {
-            "clientes",
-            "colaboradores",
-            "involucramientos",
-            "productos",
-            "reclamos",
-            "riesgos",
-            "normas",
-        }
-        if key in ingestible_sections:
+        if key in self.SUMMARY_INGEST_SECTIONS:
             try:
                 self.ingest_summary_rows(key, sanitized_rows, stay_on_summary=True)
                 log_event("navegacion", f"{key} pegados desde resumen: {len(sanitized_rows)}", self.logs)
@@ -9019,12 +9804,114 @@ class FraudCaseApp:
                 messagebox.showerror("Pegado no válido", str(exc))
                 log_event("validacion", f"Pegado fallido en {key}: {exc}", self.logs)
             return "break"
-        tree.delete(*tree.get_children())
-        for row in sanitized_rows:
-            self._insert_themed_row(tree, row)
-        self._apply_treeview_theme(tree)
+        self._render_compact_rows(tree, sanitized_rows)
         return "break"
 
+    def _should_paste_in_background(self, clipboard_text):
+        if getattr(self, "root", None) is None:
+            return False
+        return (clipboard_text or "").count("\n") + 1 >= self.SUMMARY_PASTE_BACKGROUND_MIN_ROWS
+
+    def _start_summary_paste_import(self, key, clipboard_text, allowed_counts):
+        """Procesa un pegado extenso con el mismo flujo de las importaciones CSV.
+
+        El análisis, la validación y la hidratación con catálogos corren en el
+        ejecutor de importaciones; luego las filas se aplican por tramos en el
+        hilo de Tk y se consolida un único ``MassImportSummary``.
+        """
+
+        case_id = self._summary_case_id()
+        manager = getattr(self, "mass_import_manager", None)
+        type_snapshot = self._snapshot_involvement_types()
+
+        def worker(progress_callback, cancel_event):
+            parsed_rows = self._parse_clipboard_rows(clipboard_text, allowed_counts)
+            rows = self._transform_summary_clipboard_rows(
+                key, parsed_rows, type_snapshot=type_snapshot, case_id=case_id
+            )
+            prepared = self._prepare_summary_ingest_rows(
+                key, rows, case_id, progress_callback, cancel_event
+            )
+            return rows, prepared
+
+        log_event("navegacion", f"Pegado en segundo plano en resumen:{key}", self.logs)
+        self._start_background_import(
+            f"pegado de {key}",
+            None,
+            worker,
+            lambda payload: self._apply_summary_paste_payload(key, payload, manager=manager),
+            f"Pegado no válido en {key}",
+        )
+
+    def _apply_summary_paste_payload(self, key, payload, *, manager=None):
+        """Aplica por tramos las filas pegadas ya hidratadas en segundo plano."""
+
+        rows, prepared = payload
+        manager = manager or self.mass_import_manager
+        session = self._begin_summary_ingest(key, prepared=prepared)
+        total = len(rows)
+        cancel_event = threading.Event()
+        errors: list[str] = []
+        dialog = None
+        root = getattr(self, "root", None)
+        if root is not None and total > self.SUMMARY_PASTE_BATCH_SIZE:
+            dialog = ProgressDialog(root, f"Pegando filas en {key}", on_cancel=cancel_event.set)
+
+        def process_chunk(chunk):
+            try:
+                self._ingest_summary_chunk(session, chunk)
+            except ValueError as exc:
+                errors.append(str(exc))
+                log_event("validacion", f"Pegado fallido en {key}: {exc}", self.logs)
+                cancel_event.set()
+            if dialog is not None:
+                dialog.update_progress(session.next_index - 1, total)
+
+        def finalize():
+            if dialog is not None:
+                dialog.close()
+            processed = self._finish_summary_ingest(
+                session, stay_on_summary=True, notify_duplicates=False
+            )
+            applied = session.next_index - 1
+            warnings = list(session.warnings) + errors
+            if session.duplicate_ids:
+                warnings.append("Duplicados omitidos: " + ", ".join(session.duplicate_ids))
+            cancelled = cancel_event.is_set() and not errors
+            if cancelled:
+                warnings.append(f"Pegado cancelado: se aplicaron {applied} de {total} filas.")
+            log_event("navegacion", f"{key} pegados desde resumen: {processed}", self.logs)
+            summary = manager.run_import(
+                "portapapeles",
+                key,
+                successes=session.created,
+                updates=session.updated,
+                duplicates=len(session.duplicate_ids),
+                errors=len(errors),
+                warnings=warnings,
+            )
+            if self.import_status_var is not None:
+                try:
+                    self.import_status_var.set(f"Pegado de {key}: {processed} de {total} filas aplicadas.")
+                except tk.TclError:
+                    pass
+            show = messagebox.showinfo
+            if errors or cancelled or not summary.has_changes:
+                show = messagebox.showwarning
+            try:
+                show("Pegado desde resumen", summary.summary_text)
+            except tk.TclError:
+                pass
+
+        self._run_import_batches(
+            rows,
+            f"pegado de {key}",
+            process_chunk,
+            finalize,
+            batch_size=self.SUMMARY_PASTE_BATCH_SIZE,
+            cancel_event=cancel_event,
+        )
+
     def _parse_clipboard_rows(self, text, expected_columns):
         """Convierte el texto del portapapeles en una matriz con ``expected_columns`` celdas."""
 
@@ -9055,17 +9942,24 @@ class FraudCaseApp:
             rows.append(parts)
         return rows
 
-    def _transform_summary_clipboard_rows(self, key, rows):
-        """Valida y normaliza filas de acuerdo al tipo de tabla del resumen."""
+    def _transform_summary_clipboard_rows(self, key, rows, type_snapshot=None, case_id=None):
+        """Valida y normaliza filas de acuerdo al tipo de tabla del resumen.
+
+        ``type_snapshot`` (de ``_snapshot_involvement_types``) y ``case_id``
+        reemplazan la lectura del formulario cuando la validación corre fuera
+        del hilo de Tk.
+        """
 
         handlers = {
             "clientes": self._transform_clipboard_clients,
             "colaboradores": self._transform_clipboard_colaboradores,
-            "involucramientos": self._transform_clipboard_involucramientos,
+            "involucramientos": partial(
+                self._transform_clipboard_involucramientos, type_snapshot=type_snapshot
+            ),
             "productos": self._transform_clipboard_productos,
-            "reclamos": self._transform_clipboard_reclamos,
-            "riesgos": self._transform_clipboard_riesgos,
-            "normas": self._transform_clipboard_normas,
+            "reclamos": partial(self._transform_clipboard_reclamos, case_id=case_id),
+            "riesgos": partial(self._transform_clipboard_riesgos, case_id=case_id),
+            "normas": partial(self._transform_clipboard_normas, case_id=case_id),
         }
         handler = handlers.get(key)
         if not handler:
@@ -9226,9 +10120,39 @@ class FraudCaseApp:
             sanitized.append(tuple(collaborator.get(field, "") for field in field_order))
         return sanitized
 
-    def _resolve_product_type_for_involvement(self, product_id):
+    def _snapshot_involvement_types(self):
+        """Copia los tipos de producto y de ID de cliente visibles en el formulario.
+
+        Se toma en el hilo de Tk para que la validación de involucramientos en
+        segundo plano consulte diccionarios y no ``StringVar`` ni frames.
+        """
+
+        product_types = {}
+        for product_id, frame in getattr(self, "_product_frames_by_id", {}).items():
+            tipo_var = getattr(frame, "tipo_prod_var", None)
+            if tipo_var is not None and hasattr(tipo_var, "get"):
+                product_types[product_id] = (tipo_var.get() or "").strip()
+        lookup = getattr(self, "product_lookup", None)
+        if isinstance(lookup, dict):
+            for product_id, entry in lookup.items():
+                tipo = (entry.get("tipo_producto") or "").strip() if isinstance(entry, dict) else ""
+                if tipo:
+                    product_types[product_id] = tipo
+        client_types = {}
+        for client_id, frame in getattr(self, "_client_frames_by_id", {}).items():
+            tipo_var = getattr(frame, "tipo_id_var", None)
+            if tipo_var is not None and hasattr(tipo_var, "get"):
+                client_types[client_id] = (tipo_var.get() or "").strip()
+        return {"productos": product_types, "clientes": client_types}
+
+    def _resolve_product_type_for_involvement(self, product_id, type_snapshot=None):
         """Busca el tipo de producto desde el resumen o el formulario si está disponible."""
 
+        if type_snapshot is not None:
+            product_types = type_snapshot["productos"]
+            return product_types.get(product_id) or product_types.get(
+                self._normalize_identifier(product_id), ""
+            )
         lookup = getattr(self, "product_lookup", None)
         if isinstance(lookup, dict):
             entry = lookup.get(product_id)
@@ -9244,14 +10168,18 @@ class FraudCaseApp:
                 return (tipo_var.get() or "").strip()
         return ""
 
-    def _resolve_client_type_for_involvement(self, client_id: str) -> str:
+    def _resolve_client_type_for_involvement(self, client_id: str, type_snapshot=None) -> str:
         """Obtiene el tipo de ID de un cliente desde formularios o catálogos."""
 
         client_id = (client_id or "").strip()
         if not client_id:
             return ""
         finder = getattr(self, "_find_client_frame", None)
-        if callable(finder):
+        if type_snapshot is not None:
+            tipo_value = type_snapshot["clientes"].get(self._normalize_identifier(client_id), "")
+            if tipo_value:
+                return tipo_value
+        elif callable(finder):
             frame = finder(client_id)
             tipo_var = getattr(frame, "tipo_id_var", None) if frame else None
             if tipo_var and hasattr(tipo_var, "get"):
@@ -9269,7 +10197,7 @@ class FraudCaseApp:
                 return tipo_value
         return ""
 
-    def _transform_clipboard_involucramientos(self, rows):
+    def _transform_clipboard_involucramientos(self, rows, type_snapshot=None):
         sanitized = []
         for idx, values in enumerate(rows, start=1):
             normalized_values = [(value or "").strip() for value in values]
@@ -9286,7 +10214,7 @@ class FraudCaseApp:
                     f"Involucramiento fila {idx}: se esperaban 5 columnas y se recibieron {len(normalized_values)}."
                 )
             product_id, tipo_involucrado, collaborator_id, client_id, amount_text = normalized_values
-            tipo_producto = self._resolve_product_type_for_involvement(product_id)
+            tipo_producto = self._resolve_product_type_for_involvement(product_id, type_snapshot)
             if tipo_producto:
                 product_message = validate_product_id(tipo_producto, product_id)
             else:
@@ -9307,7 +10235,7 @@ class FraudCaseApp:
                     raise ValueError(f"Involucramiento fila {idx}: {collaborator_message}")
                 client_id = ""
             else:
-                client_tipo = self._resolve_client_type_for_involvement(client_id)
+                client_tipo = self._resolve_client_type_for_involvement(client_id, type_snapshot)
                 client_message = validate_client_id(client_tipo, client_id)
                 if client_message:
                     raise ValueError(f"Involucramiento fila {idx}: {client_message}")
@@ -9439,8 +10367,9 @@ class FraudCaseApp:
             sanitized.append(tuple(product[field] for field in field_order))
         return sanitized
 
-    def _transform_clipboard_reclamos(self, rows):
+    def _transform_clipboard_reclamos(self, rows, case_id=None):
         sanitized = []
+        fallback_case = self._summary_case_id() if case_id is None else case_id
         field_order = list(self.IMPORT_CONFIG["reclamos"]["expected_headers"])
         expected_length = len(field_order)
         for idx, values in enumerate(rows, start=1):
@@ -9455,9 +10384,7 @@ class FraudCaseApp:
             claim["id_reclamo"] = claim.get("id_reclamo", "").upper()
             claim["id_reclamo"] = claim.get("id_reclamo", "").strip()
             if not claim.get("id_caso"):
-                fallback_case = getattr(self, "id_caso_var", None)
-                if fallback_case and hasattr(fallback_case, "get"):
-                    claim["id_caso"] = (fallback_case.get() or "").strip()
+                claim["id_caso"] = fallback_case
             message = validate_reclamo_id(claim["id_reclamo"])
             if message:
                 raise ValueError(f"Reclamo fila {idx}: {message}")
@@ -9479,8 +10406,9 @@ class FraudCaseApp:
             sanitized.append(tuple(claim.get(field, "") for field in field_order))
         return sanitized
 
-    def _transform_clipboard_riesgos(self, rows):
+    def _transform_clipboard_riesgos(self, rows, case_id=None):
         sanitized = []
+        fallback_case = self._summary_case_id() if case_id is None else case_id
         valid_criticidades = set(CRITICIDAD_LIST)
         valid_criticidades_text = ", ".join(CRITICIDAD_LIST)
         field_order = list(self.IMPORT_CONFIG["riesgos"]["expected_headers"])
@@ -9519,9 +10447,7 @@ class FraudCaseApp:
             risk["id_riesgo"] = (risk.get("id_riesgo") or "").upper()
             risk["criticidad"] = risk.get("criticidad") or CRITICIDAD_LIST[0]
             if not risk.get("id_caso"):
-                fallback_case = getattr(self, "id_caso_var", None)
-                if fallback_case and hasattr(fallback_case, "get"):
-                    risk["id_caso"] = (fallback_case.get() or "").strip()
+                risk["id_caso"] = fallback_case
             message = validate_risk_id(risk["id_riesgo"])
             if message:
                 raise ValueError(f"Riesgo fila {idx}: {message}")
@@ -9545,8 +10471,9 @@ class FraudCaseApp:
             sanitized.append(tuple(risk.get(field, "") for field in field_order))
         return sanitized
 
-    def _transform_clipboard_normas(self, rows):
+    def _transform_clipboard_normas(self, rows, case_id=None):
         sanitized = []
+        fallback_case = self._summary_case_id() if case_id is None else case_id
         field_order = list(self.IMPORT_CONFIG["normas"]["expected_headers"])
         expected_length = len(field_order)
         for idx, values in enumerate(rows, start=1):
@@ -9559,9 +10486,7 @@ class FraudCaseApp:
                 for pos, field in enumerate(field_order)
             }
             if not norm.get("id_caso"):
-                fallback_case = getattr(self, "id_caso_var", None)
-                if fallback_case and hasattr(fallback_case, "get"):
-                    norm["id_caso"] = (fallback_case.get() or "").strip()
+                norm["id_caso"] = fallback_case
             message = validate_norm_id(norm["id_norma"])
             if message:
                 raise ValueError(f"Norma fila {idx}: {message}")
@@ -9587,461 +10512,556 @@ class FraudCaseApp:
             sanitized.append(tuple(norm.get(field, "") for field in field_order))
         return sanitized
 
+    SUMMARY_INGEST_SECTIONS = (
+        "clientes",
+        "colaboradores",
+        "involucramientos",
+        "productos",
+        "reclamos",
+        "riesgos",
+        "normas",
+    )
+    # Pegados con más líneas se procesan en segundo plano y se aplican por tramos.
+    SUMMARY_PASTE_BACKGROUND_MIN_ROWS = 50
+    SUMMARY_PASTE_BATCH_SIZE = 25
+
     def ingest_summary_rows(self, section_key, rows, stay_on_summary=False):
         """Incorpora filas pegadas en las tablas de resumen al formulario principal."""
 
         if not rows:
             return 0
+        session = self._begin_summary_ingest(section_key)
+        self._ingest_summary_chunk(session, rows)
+        return self._finish_summary_ingest(session, stay_on_summary=stay_on_summary)
+
+    def _summary_case_id(self):
+        case_var = getattr(self, "id_caso_var", None)
+        if case_var and hasattr(case_var, "get"):
+            return (case_var.get() or "").strip()
+        return ""
+
+    def _begin_summary_ingest(self, section_key, prepared=None):
+        """Crea la sesión que acumula contadores entre tramos de pegado."""
+
         section_key = (section_key or "").strip().lower()
-        processed = 0
-        missing_ids = []
+        if section_key not in self.SUMMARY_INGEST_SECTIONS:
+            raise ValueError("Esta tabla no admite pegado directo al formulario principal.")
+        return SummaryIngestSession(
+            section=section_key,
+            case_id=self._summary_case_id(),
+            prepared=prepared,
+        )
+
+    def _ingest_summary_chunk(self, session, rows):
+        """Aplica un tramo de filas saneadas sobre el formulario."""
+
+        handlers = {
+            "clientes": self._ingest_summary_clients,
+            "colaboradores": self._ingest_summary_team,
+            "involucramientos": self._ingest_summary_involvements,
+            "productos": self._ingest_summary_products,
+            "reclamos": self._ingest_summary_claims,
+            "riesgos": self._ingest_summary_risks,
+            "normas": self._ingest_summary_norms,
+        }
+        start_index = session.next_index
+        session.next_index += len(rows)
+        handlers[session.section](session, rows, start_index)
+
+    def _summary_ingest_payload(self, section_key, values, idx, case_id=""):
+        """Arma el payload de una fila pegada y la columna con la que se hidrata.
+
+        Devuelve ``None`` para las secciones que no consultan los catálogos de
+        detalle. No toca widgets, por lo que puede ejecutarse en segundo plano.
+        """
+
         if section_key == "clientes":
-            for idx, values in enumerate(rows, start=1):
-                client_data, _is_legacy, field_order = self._normalize_client_row_values(values, idx)
-                payload = {field: client_data.get(field, "") for field in field_order}
-                hydrated, found = self._hydrate_row_from_details(payload, 'id_cliente', CLIENT_ID_ALIASES)
-                client_id = (hydrated.get('id_cliente') or '').strip()
-                if not client_id:
-                    continue
-                tipo_id = (hydrated.get('tipo_id') or '').strip()
-                if tipo_id and tipo_id not in TIPO_ID_LIST:
-                    raise ValueError(
-                        f"Cliente fila {idx}: el tipo de ID '{tipo_id}' no está en el catálogo CM."
-                        " Corrige la hoja de Excel antes de volver a intentarlo."
-                    )
-                flag_value = (hydrated.get('flag') or '').strip()
-                if flag_value and flag_value not in FLAG_CLIENTE_LIST:
-                    raise ValueError(
-                        f"Cliente fila {idx}: el flag de cliente '{flag_value}' no está en el catálogo CM."
-                        " Corrige la hoja de Excel antes de volver a intentarlo."
-                    )
-                frame = self._find_client_frame(client_id) or self._obtain_client_slot_for_import()
-                merged = self._merge_client_payload_with_frame(frame, hydrated)
-                self._populate_client_frame_from_row(frame, merged)
-                self._trigger_import_id_refresh(
-                    frame,
-                    client_id,
-                    notify_on_missing=True,
-                    preserve_existing=True,
-                )
-                processed += 1
-                if not found and 'id_cliente' in self.detail_catalogs:
-                    missing_ids.append(client_id)
-            if missing_ids:
-                self._report_missing_detail_ids("clientes", missing_ids)
-            if processed:
-                self._notify_dataset_changed(summary_sections="clientes")
-                self.sync_main_form_after_import("clientes", stay_on_summary=stay_on_summary)
-            return processed
+            client_data, _is_legacy, field_order = self._normalize_client_row_values(values, idx)
+            payload = {field: client_data.get(field, "") for field in field_order}
+            return payload, 'id_cliente', CLIENT_ID_ALIASES
         if section_key == "colaboradores":
             field_order = [field for field, _ in self.COLLABORATOR_SUMMARY_COLUMNS]
             expected_length = len(field_order)
-            for values in rows:
-                if len(values) != expected_length:
-                    raise ValueError(
-                        f"Se esperaban {expected_length} columnas de colaboradores y se recibieron {len(values)}."
-                    )
-                payload = {
-                    field: (values[pos] or "").strip()
-                    for pos, field in enumerate(field_order)
-                }
-                payload["flag_colaborador"] = payload.get("flag", "") or payload.get("flag_colaborador", "")
-                hydrated, found = self._hydrate_row_from_details(payload, 'id_colaborador', TEAM_ID_ALIASES)
-                collaborator_id = (hydrated.get('id_colaborador') or '').strip()
-                if not collaborator_id:
-                    continue
-                frame = self._find_team_frame(collaborator_id) or self._obtain_team_slot_for_import()
-                merged = self._merge_team_payload_with_frame(frame, hydrated)
-                self._populate_team_frame_from_row(frame, merged)
-                self._trigger_import_id_refresh(
-                    frame,
-                    collaborator_id,
-                    notify_on_missing=True,
-                    preserve_existing=True,
+            if len(values) != expected_length:
+                raise ValueError(
+                    f"Se esperaban {expected_length} columnas de colaboradores y se recibieron {len(values)}."
                 )
-                processed += 1
-                if not found and 'id_colaborador' in self.detail_catalogs:
-                    missing_ids.append(collaborator_id)
-            if missing_ids:
-                self._report_missing_detail_ids("colaboradores", missing_ids)
-            if processed:
-                self._notify_dataset_changed(summary_sections="colaboradores")
-                self.sync_main_form_after_import("colaboradores", stay_on_summary=stay_on_summary)
-            return processed
-        if section_key == "involucramientos":
-            processed = 0
+            payload = {
+                field: (values[pos] or "").strip()
+                for pos, field in enumerate(field_order)
+            }
+            payload["flag_colaborador"] = payload.get("flag", "") or payload.get("flag_colaborador", "")
+            return payload, 'id_colaborador', TEAM_ID_ALIASES
+        if section_key == "productos":
+            expected_fields = list(self.IMPORT_CONFIG["productos"]["expected_headers"])
+            claim_fields = ("id_reclamo", "nombre_analitica", "codigo_analitica")
+            modern_length = len(expected_fields)
+            without_claims_length = modern_length - len(claim_fields)
+            normalized: list[str]
+            if len(values) == modern_length:
+                normalized = [(value or "").strip() for value in values]
+            elif len(values) == without_claims_length:
+                normalized = [(value or "").strip() for value in values] + [""] * len(claim_fields)
+            elif len(values) == 4:
+                normalized = [""] * modern_length
+                normalized[0] = (values[0] or "").strip()
+                normalized[1] = (values[1] or "").strip()
+                normalized[2] = (values[2] or "").strip()
+                normalized[expected_fields.index("monto_investigado")] = (values[3] or "").strip()
+            else:
+                raise ValueError(
+                    f"Producto fila {idx}: se esperaban {modern_length} columnas (o 4 en formato heredado)."
+                )
+            return dict(zip(expected_fields, normalized)), 'id_producto', PRODUCT_ID_ALIASES
+        if section_key == "reclamos":
+            expected_fields = list(self.IMPORT_CONFIG["reclamos"]["expected_headers"])
+            expected_length = len(expected_fields)
+            if len(values) != expected_length:
+                raise ValueError(
+                    f"Se esperaban {expected_length} columnas de reclamos y se recibieron {len(values)}."
+                )
+            row_dict = {
+                field: (values[pos] or "").strip()
+                for pos, field in enumerate(expected_fields)
+            }
+            if not row_dict.get("id_caso"):
+                row_dict["id_caso"] = case_id
+            return row_dict, 'id_producto', PRODUCT_ID_ALIASES
+        return None
 
-            def _fallback_frame(frames, identifier):
-                normalized = (identifier or '').strip()
-                if not normalized:
-                    return None
-                for frame in frames or []:
-                    id_var = getattr(frame, 'id_var', None)
-                    current = ''
-                    if id_var and hasattr(id_var, 'get'):
-                        current = (id_var.get() or '').strip()
-                    if current == normalized:
-                        return frame
-                return None
+    def _prepare_summary_ingest_rows(self, section_key, rows, case_id="", progress_callback=None, cancel_event=None):
+        """Hidrata en segundo plano las filas pegadas con los catálogos de detalle.
 
-            for idx, values in enumerate(rows, start=1):
-                normalized = [(value or "").strip() for value in values]
-                if len(normalized) != 5:
-                    raise ValueError(
-                        f"Involucramiento fila {idx}: se esperaban 5 columnas y se recibieron {len(normalized)}."
-                    )
-                product_id, tipo_involucrado, collaborator_id, client_id, amount_text = normalized
-                if not product_id:
-                    continue
-                tipo_norm = (tipo_involucrado or "colaborador").lower()
-                if tipo_norm not in {"colaborador", "cliente"}:
+        Devuelve una lista paralela a ``rows`` con ``(payload, hidratado, encontrado)``
+        o ``None`` cuando la sección no usa catálogos.
+        """
+
+        total = len(rows)
+        if progress_callback:
+            progress_callback(0, total)
+        prepared = []
+        for idx, values in enumerate(rows, start=1):
+            if cancel_event is not None and cancel_event.is_set():
+                raise CancelledError("Pegado cancelado por el usuario")
+            spec = self._summary_ingest_payload(section_key, values, idx, case_id)
+            if spec is None:
+                prepared.append(None)
+            else:
+                payload, id_column, aliases = spec
+                hydrated, found = self._hydrate_row_from_details(payload, id_column, aliases)
+                prepared.append((payload, hydrated, found))
+            if progress_callback:
+                progress_callback(idx, total)
+        return prepared
+
+    def _hydrated_summary_row(self, session, idx, values):
+        """Devuelve ``(payload, hidratado, encontrado)`` reutilizando lo preparado en segundo plano."""
+
+        prepared = session.prepared
+        if prepared is not None and 0 < idx <= len(prepared) and prepared[idx - 1] is not None:
+            return prepared[idx - 1]
+        payload, id_column, aliases = self._summary_ingest_payload(
+            session.section, values, idx, session.case_id
+        )
+        hydrated, found = self._hydrate_row_from_details(payload, id_column, aliases)
+        return payload, hydrated, found
+
+    def _ingest_summary_clients(self, session, rows, start_index):
+        for idx, values in enumerate(rows, start=start_index):
+            _payload, hydrated, found = self._hydrated_summary_row(session, idx, values)
+            client_id = (hydrated.get('id_cliente') or '').strip()
+            if not client_id:
+                continue
+            tipo_id = (hydrated.get('tipo_id') or '').strip()
+            if tipo_id and tipo_id not in TIPO_ID_LIST:
+                raise ValueError(
+                    f"Cliente fila {idx}: el tipo de ID '{tipo_id}' no está en el catálogo CM."
+                    " Corrige la hoja de Excel antes de volver a intentarlo."
+                )
+            flag_value = (hydrated.get('flag') or '').strip()
+            if flag_value and flag_value not in FLAG_CLIENTE_LIST:
+                raise ValueError(
+                    f"Cliente fila {idx}: el flag de cliente '{flag_value}' no está en el catálogo CM."
+                    " Corrige la hoja de Excel antes de volver a intentarlo."
+                )
+            frame = self._find_client_frame(client_id)
+            session.count(created=frame is None)
+            frame = frame or self._obtain_client_slot_for_import()
+            merged = self._merge_client_payload_with_frame(frame, hydrated)
+            self._populate_client_frame_from_row(frame, merged)
+            self._trigger_import_id_refresh(
+                frame,
+                client_id,
+                notify_on_missing=True,
+                preserve_existing=True,
+            )
+            if not found and 'id_cliente' in self.detail_catalogs:
+                session.missing_ids.append(client_id)
+
+    def _ingest_summary_team(self, session, rows, start_index):
+        for idx, values in enumerate(rows, start=start_index):
+            _payload, hydrated, found = self._hydrated_summary_row(session, idx, values)
+            collaborator_id = (hydrated.get('id_colaborador') or '').strip()
+            if not collaborator_id:
+                continue
+            frame = self._find_team_frame(collaborator_id)
+            session.count(created=frame is None)
+            frame = frame or self._obtain_team_slot_for_import()
+            merged = self._merge_team_payload_with_frame(frame, hydrated)
+            self._populate_team_frame_from_row(frame, merged)
+            self._trigger_import_id_refresh(
+                frame,
+                collaborator_id,
+                notify_on_missing=True,
+                preserve_existing=True,
+            )
+            if not found and 'id_colaborador' in self.detail_catalogs:
+                session.missing_ids.append(collaborator_id)
+
+    @staticmethod
+    def _find_frame_by_id_var(frames, identifier):
+        normalized = (identifier or '').strip()
+        if not normalized:
+            return None
+        for frame in frames or []:
+            id_var = getattr(frame, 'id_var', None)
+            current = ''
+            if id_var and hasattr(id_var, 'get'):
+                current = (id_var.get() or '').strip()
+            if current == normalized:
+                return frame
+        return None
+
+    def _ingest_summary_involvements(self, session, rows, start_index):
+        _fallback_frame = self._find_frame_by_id_var
+        for idx, values in enumerate(rows, start=start_index):
+            normalized = [(value or "").strip() for value in values]
+            if len(normalized) != 5:
+                raise ValueError(
+                    f"Involucramiento fila {idx}: se esperaban 5 columnas y se recibieron {len(normalized)}."
+                )
+            product_id, tipo_involucrado, collaborator_id, client_id, amount_text = normalized
+            if not product_id:
+                continue
+            tipo_norm = (tipo_involucrado or "colaborador").lower()
+            if tipo_norm not in {"colaborador", "cliente"}:
+                raise ValueError(
+                    f"Involucramiento fila {idx}: el tipo de involucrado debe ser colaborador o cliente."
+                )
+            product_frame = self._find_product_frame(product_id) or _fallback_frame(getattr(self, 'product_frames', []), product_id)
+            if not product_frame:
+                product_payload, product_found = self._hydrate_row_from_details(
+                    {"id_producto": product_id},
+                    'id_producto',
+                    PRODUCT_ID_ALIASES,
+                )
+                if not product_found:
                     raise ValueError(
-                        f"Involucramiento fila {idx}: el tipo de involucrado debe ser colaborador o cliente."
+                        f"Involucramiento fila {idx}: el producto '{product_id}' no existe en el formulario ni en los catálogos de detalle."
                     )
-                product_frame = self._find_product_frame(product_id) or _fallback_frame(getattr(self, 'product_frames', []), product_id)
-                if not product_frame:
-                    product_payload, product_found = self._hydrate_row_from_details(
-                        {"id_producto": product_id},
-                        'id_producto',
-                        PRODUCT_ID_ALIASES,
+                client_for_product = (product_payload.get('id_cliente') or '').strip()
+                if client_for_product:
+                    client_details, _ = self._hydrate_row_from_details({'id_cliente': client_for_product}, 'id_cliente', CLIENT_ID_ALIASES)
+                    self._ensure_client_exists(client_for_product, client_details)
+                product_frame = self._obtain_product_slot_for_import()
+                merged = self._merge_product_payload_with_frame(product_frame, product_payload)
+                self._populate_product_frame_from_row(product_frame, merged)
+            self._trigger_import_id_refresh(
+                product_frame,
+                product_id,
+                notify_on_missing=True,
+                preserve_existing=True,
+            )
+
+            amount_message, _amount_decimal, normalized_amount = validate_money_bounds(
+                amount_text,
+                "el monto asignado",
+                allow_blank=False,
+            )
+            if amount_message:
+                raise ValueError(f"Involucramiento fila {idx}: {amount_message}")
+
+            if tipo_norm == "colaborador":
+                team_frame = self._find_team_frame(collaborator_id) or _fallback_frame(getattr(self, 'team_frames', []), collaborator_id)
+                if not team_frame:
+                    collaborator_payload, collaborator_found = self._hydrate_row_from_details(
+                        {"id_colaborador": collaborator_id},
+                        'id_colaborador',
+                        TEAM_ID_ALIASES,
                     )
-                    if not product_found:
+                    if not collaborator_found:
                         raise ValueError(
-                            f"Involucramiento fila {idx}: el producto '{product_id}' no existe en el formulario ni en los catálogos de detalle."
+                            f"Involucramiento fila {idx}: el colaborador '{collaborator_id}' no existe en el formulario ni en los catálogos de detalle."
                         )
-                    client_for_product = (product_payload.get('id_cliente') or '').strip()
-                    if client_for_product:
-                        client_details, _ = self._hydrate_row_from_details({'id_cliente': client_for_product}, 'id_cliente', CLIENT_ID_ALIASES)
-                        self._ensure_client_exists(client_for_product, client_details)
-                    product_frame = self._obtain_product_slot_for_import()
-                    merged = self._merge_product_payload_with_frame(product_frame, product_payload)
-                    self._populate_product_frame_from_row(product_frame, merged)
+                    team_frame, _created = self._ensure_team_member_exists(collaborator_id, collaborator_payload)
                 self._trigger_import_id_refresh(
-                    product_frame,
-                    product_id,
+                    team_frame,
+                    collaborator_id,
                     notify_on_missing=True,
                     preserve_existing=True,
                 )
-
-                amount_message, _amount_decimal, normalized_amount = validate_money_bounds(
-                    amount_text,
-                    "el monto asignado",
-                    allow_blank=False,
+                existing_row = next(
+                    (inv for inv in getattr(product_frame, 'involvements', []) if inv.team_var.get().strip() == collaborator_id),
+                    None,
                 )
-                if amount_message:
-                    raise ValueError(f"Involucramiento fila {idx}: {amount_message}")
-
-                if tipo_norm == "colaborador":
-                    team_frame = self._find_team_frame(collaborator_id) or _fallback_frame(getattr(self, 'team_frames', []), collaborator_id)
-                    if not team_frame:
-                        collaborator_payload, collaborator_found = self._hydrate_row_from_details(
-                            {"id_colaborador": collaborator_id},
-                            'id_colaborador',
-                            TEAM_ID_ALIASES,
-                        )
-                        if not collaborator_found:
-                            raise ValueError(
-                                f"Involucramiento fila {idx}: el colaborador '{collaborator_id}' no existe en el formulario ni en los catálogos de detalle."
-                            )
-                        team_frame, _created = self._ensure_team_member_exists(collaborator_id, collaborator_payload)
-                    self._trigger_import_id_refresh(
-                        team_frame,
-                        collaborator_id,
-                        notify_on_missing=True,
-                        preserve_existing=True,
-                    )
-                    existing_row = next(
-                        (inv for inv in getattr(product_frame, 'involvements', []) if inv.team_var.get().strip() == collaborator_id),
-                        None,
+                session.count(created=existing_row is None)
+                if not existing_row:
+                    existing_row = self._obtain_involvement_slot(product_frame)
+                existing_row.team_var.set(collaborator_id)
+                team_widget = getattr(existing_row, 'team_cb', None)
+                if team_widget is not None:
+                    try:
+                        team_widget.set(collaborator_id)
+                    except tk.TclError:
+                        pass
+                target_row = existing_row
+            else:
+                client_frame = self._find_client_frame(client_id) or _fallback_frame(getattr(self, 'client_frames', []), client_id)
+                if not client_frame:
+                    client_payload, client_found = self._hydrate_row_from_details(
+                        {"id_cliente": client_id},
+                        'id_cliente',
+                        CLIENT_ID_ALIASES,
                     )
-                    if not existing_row:
-                        existing_row = self._obtain_involvement_slot(product_frame)
-                    existing_row.team_var.set(collaborator_id)
-                    team_widget = getattr(existing_row, 'team_cb', None)
-                    if team_widget is not None:
-                        try:
-                            team_widget.set(collaborator_id)
-                        except tk.TclError:
-                            pass
-                    target_row = existing_row
-                else:
-                    client_frame = self._find_client_frame(client_id) or _fallback_frame(getattr(self, 'client_frames', []), client_id)
-                    if not client_frame:
-                        client_payload, client_found = self._hydrate_row_from_details(
-                            {"id_cliente": client_id},
-                            'id_cliente',
-                            CLIENT_ID_ALIASES,
+                    if not client_found:
+                        raise ValueError(
+                            f"Involucramiento fila {idx}: el cliente '{client_id}' no existe en el formulario ni en los catálogos de detalle."
                         )
-                        if not client_found:
-                            raise ValueError(
-                                f"Involucramiento fila {idx}: el cliente '{client_id}' no existe en el formulario ni en los catálogos de detalle."
-                            )
-                        client_frame, _created = self._ensure_client_exists(client_id, client_payload)
-                    existing_row = next(
-                        (
-                            inv
-                            for inv in getattr(product_frame, 'client_involvements', [])
-                            if getattr(getattr(inv, 'client_var', None), 'get', lambda: "")().strip()
-                            == client_id
-                        ),
-                        None,
-                    )
-                    if not existing_row:
-                        existing_row = self._obtain_client_involvement_slot(product_frame)
-                    if hasattr(existing_row, 'client_var'):
-                        existing_row.client_var.set(client_id)
-                    client_widget = getattr(existing_row, 'client_cb', None)
-                    if client_widget is not None:
-                        try:
-                            client_widget.set(client_id)
-                        except tk.TclError:
-                            pass
-                    target_row = existing_row
+                    client_frame, _created = self._ensure_client_exists(client_id, client_payload)
+                existing_row = next(
+                    (
+                        inv
+                        for inv in getattr(product_frame, 'client_involvements', [])
+                        if getattr(getattr(inv, 'client_var', None), 'get', lambda: "")().strip()
+                        == client_id
+                    ),
+                    None,
+                )
+                session.count(created=existing_row is None)
+                if not existing_row:
+                    existing_row = self._obtain_client_involvement_slot(product_frame)
+                if hasattr(existing_row, 'client_var'):
+                    existing_row.client_var.set(client_id)
+                client_widget = getattr(existing_row, 'client_cb', None)
+                if client_widget is not None:
+                    try:
+                        client_widget.set(client_id)
+                    except tk.TclError:
+                        pass
+                target_row = existing_row
 
-                target_row.monto_var.set(normalized_amount)
-                processed += 1
+            target_row.monto_var.set(normalized_amount)
+
+    def _ingest_summary_products(self, session, rows, start_index):
+        for idx, values in enumerate(rows, start=start_index):
+            _payload, hydrated, found = self._hydrated_summary_row(session, idx, values)
+            product_id = (hydrated.get('id_producto') or '').strip()
+            if not product_id:
+                continue
+            resolved_tipo = resolve_catalog_product_type(hydrated.get('tipo_producto', ''))
+            if resolved_tipo:
+                hydrated['tipo_producto'] = resolved_tipo
+            frame = self._find_product_frame(product_id)
+            session.count(created=frame is None)
+            frame = frame or self._obtain_product_slot_for_import()
+            client_id = (hydrated.get('id_cliente') or '').strip()
+            if client_id:
+                client_details, _ = self._hydrate_row_from_details({'id_cliente': client_id}, 'id_cliente', CLIENT_ID_ALIASES)
+                self._ensure_client_exists(client_id, client_details)
+            merged = self._merge_product_payload_with_frame(frame, hydrated)
+            self._populate_product_frame_from_row(frame, merged)
+            claim_payload = {
+                "id_reclamo": (hydrated.get("id_reclamo") or "").strip(),
+                "nombre_analitica": (hydrated.get("nombre_analitica") or "").strip(),
+                "codigo_analitica": (hydrated.get("codigo_analitica") or "").strip(),
+            }
+            if any(claim_payload.values()):
+                target_claim = frame.find_claim_by_id(claim_payload["id_reclamo"]) if claim_payload["id_reclamo"] else None
+                if not target_claim:
+                    target_claim = frame.obtain_claim_slot()
+                target_claim.set_data(claim_payload)
+                self._sync_product_lookup_claim_fields(frame, product_id)
+            self._trigger_import_id_refresh(
+                frame,
+                product_id,
+                notify_on_missing=True,
+                preserve_existing=True,
+            )
+            if not found and 'id_producto' in self.detail_catalogs:
+                session.missing_ids.append(product_id)
+
+    def _ingest_summary_claims(self, session, rows, start_index):
+        for idx, values in enumerate(rows, start=start_index):
+            row_dict, hydrated, found = self._hydrated_summary_row(session, idx, values)
+            product_id = (hydrated.get('id_producto') or '').strip()
+            if not product_id:
+                continue
+            if not found:
+                session.unhydrated_ids.append(product_id)
+            product_frame = self._find_product_frame(product_id)
+            new_product = False
+            if not product_frame:
+                product_frame = self._obtain_product_slot_for_import()
+                new_product = True
+            client_id = (hydrated.get('id_cliente') or '').strip()
+            if client_id:
+                client_details, _ = self._hydrate_row_from_details({'id_cliente': client_id}, 'id_cliente', CLIENT_ID_ALIASES)
+                self._ensure_client_exists(client_id, client_details)
+            if new_product:
+                if found:
+                    self._populate_product_frame_from_row(product_frame, hydrated)
+                else:
+                    # Solo registrar el ID y mantener defaults hasta que el usuario complete los campos obligatorios.
+                    product_frame.id_var.set(product_id)
+            self._trigger_import_id_refresh(
+                product_frame,
+                product_id,
+                preserve_existing=False,
+            )
+            claim_payload = {
+                'id_reclamo': (hydrated.get('id_reclamo') or row_dict.get('id_reclamo') or '').strip(),
+                'id_caso': (hydrated.get('id_caso') or row_dict.get('id_caso') or '').strip(),
+                'nombre_analitica': (hydrated.get('nombre_analitica') or row_dict.get('nombre_analitica') or '').strip(),
+                'codigo_analitica': (hydrated.get('codigo_analitica') or row_dict.get('codigo_analitica') or '').strip(),
+            }
+            if not claim_payload["id_caso"]:
+                claim_payload["id_caso"] = session.case_id
+            if not any(claim_payload.values()):
+                continue
+            target = product_frame.find_claim_by_id(claim_payload['id_reclamo']) if claim_payload['id_reclamo'] else None
+            session.count(created=target is None)
+            if not target:
+                target = product_frame.obtain_claim_slot()
+            target.set_data(claim_payload)
+            self._sync_product_lookup_claim_fields(product_frame, product_id)
+            product_frame.persist_lookup_snapshot()
+            if not found and 'id_producto' in self.detail_catalogs:
+                session.missing_ids.append(product_id)
+
+    def _ingest_summary_risks(self, session, rows, start_index):
+        expected_fields = list(self.IMPORT_CONFIG["riesgos"]["expected_headers"])
+        expected_length = len(expected_fields)
+        known_ids = session.known_ids(self.risk_frames)
+        for values in rows:
+            if len(values) != expected_length:
+                raise ValueError(
+                    f"Se esperaban {expected_length} columnas de riesgos y se recibieron {len(values)}."
+                )
+            payload = {
+                field: (values[pos] or "").strip()
+                for pos, field in enumerate(expected_fields)
+            }
+            risk_id = payload.get("id_riesgo", "")
+            if not risk_id:
+                continue
+            if risk_id in known_ids:
+                log_event("validacion", f"Riesgo duplicado {risk_id} en pegado", self.logs)
+                session.duplicate_ids.append(risk_id)
+                continue
+            self.add_risk()
+            frame = self.risk_frames[-1]
+            frame.id_var.set(risk_id)
+            known_ids.add(risk_id)
+            frame.lider_var.set(payload.get("lider", ""))
+            frame.descripcion_var.set(payload.get("descripcion", ""))
+            criticidad = (payload.get("criticidad") or CRITICIDAD_LIST[0]).strip()
+            if criticidad in CRITICIDAD_LIST:
+                frame.criticidad_var.set(criticidad)
+            frame.exposicion_var.set(payload.get("exposicion_residual", ""))
+            frame.planes_var.set(payload.get("planes_accion", ""))
+            if hasattr(frame, "case_id_var"):
+                frame.case_id_var.set(payload.get("id_caso", "") or session.case_id)
+            self._trigger_import_id_refresh(frame, risk_id, preserve_existing=True)
+            session.count(created=True)
+
+    def _ingest_summary_norms(self, session, rows, start_index):
+        expected_fields = list(self.IMPORT_CONFIG["normas"]["expected_headers"])
+        expected_length = len(expected_fields)
+        known_ids = session.known_ids(self.norm_frames)
+        for values in rows:
+            if len(values) != expected_length:
+                raise ValueError(
+                    f"Se esperaban {expected_length} columnas de normas y se recibieron {len(values)}."
+                )
+            payload = {
+                field: (values[pos] or "").strip()
+                for pos, field in enumerate(expected_fields)
+            }
+            norm_id = payload.get("id_norma", "")
+            if not norm_id:
+                continue
+            if norm_id in known_ids:
+                log_event("validacion", f"Norma duplicada {norm_id} en pegado", self.logs)
+                session.duplicate_ids.append(norm_id)
+                continue
+            self.add_norm()
+            frame = self.norm_frames[-1]
+            frame.id_var.set(norm_id)
+            known_ids.add(norm_id)
+            frame.descripcion_var.set(payload.get("descripcion", ""))
+            frame.fecha_var.set(payload.get("fecha_vigencia", ""))
+            frame.acapite_var.set(payload.get("acapite_inciso", ""))
+            frame._set_detalle_text(payload.get("detalle_norma", ""))
+            if hasattr(frame, "case_id_var"):
+                frame.case_id_var.set(payload.get("id_caso", "") or session.case_id)
+            session.count(created=True)
+
+    def _finish_summary_ingest(self, session, stay_on_summary=False, notify_duplicates=True):
+        """Ejecuta una sola vez los avisos y refrescos posteriores al pegado."""
+
+        section_key = session.section
+        processed = session.processed
+        warnings = []
+        if section_key in {"clientes", "colaboradores", "productos"}:
+            if session.missing_ids:
+                warnings.append(self._report_missing_detail_ids(section_key, session.missing_ids))
+            if processed:
+                summary_sections = ("productos", "reclamos") if section_key == "productos" else section_key
+                self._notify_dataset_changed(summary_sections=summary_sections)
+                self.sync_main_form_after_import(section_key, stay_on_summary=stay_on_summary)
+                if section_key == "productos":
+                    self._run_duplicate_check_post_load()
+        elif section_key == "involucramientos":
             if processed:
                 self._notify_dataset_changed(summary_sections="involucramientos")
                 self.save_auto()
                 self.sync_main_form_after_import("involucramientos", stay_on_summary=stay_on_summary)
                 self._run_duplicate_check_post_load()
-            return processed
-        if section_key == "productos":
-            expected_fields = list(self.IMPORT_CONFIG["productos"]["expected_headers"])
-            claim_fields = ("id_reclamo", "nombre_analitica", "codigo_analitica")
-            modern_length = len(expected_fields)
-            without_claims_length = modern_length - len(claim_fields)
-            for idx, values in enumerate(rows, start=1):
-                normalized: list[str]
-                if len(values) == modern_length:
-                    normalized = [(value or "").strip() for value in values]
-                elif len(values) == without_claims_length:
-                    normalized = [(value or "").strip() for value in values] + [""] * len(claim_fields)
-                elif len(values) == 4:
-                    normalized = [""] * modern_length
-                    normalized[0] = (values[0] or "").strip()
-                    normalized[1] = (values[1] or "").strip()
-                    normalized[2] = (values[2] or "").strip()
-                    normalized[expected_fields.index("monto_investigado")] = (values[3] or "").strip()
-                else:
-                    raise ValueError(
-                        f"Producto fila {idx}: se esperaban {modern_length} columnas (o 4 en formato heredado)."
-                    )
-                payload = dict(zip(expected_fields, normalized))
-                hydrated, found = self._hydrate_row_from_details(payload, 'id_producto', PRODUCT_ID_ALIASES)
-                product_id = (hydrated.get('id_producto') or '').strip()
-                if not product_id:
-                    continue
-                resolved_tipo = resolve_catalog_product_type(hydrated.get('tipo_producto', ''))
-                if resolved_tipo:
-                    hydrated['tipo_producto'] = resolved_tipo
-                frame = self._find_product_frame(product_id) or self._obtain_product_slot_for_import()
-                client_id = (hydrated.get('id_cliente') or '').strip()
-                if client_id:
-                    client_details, _ = self._hydrate_row_from_details({'id_cliente': client_id}, 'id_cliente', CLIENT_ID_ALIASES)
-                    self._ensure_client_exists(client_id, client_details)
-                merged = self._merge_product_payload_with_frame(frame, hydrated)
-                self._populate_product_frame_from_row(frame, merged)
-                claim_payload = {
-                    "id_reclamo": (hydrated.get("id_reclamo") or "").strip(),
-                    "nombre_analitica": (hydrated.get("nombre_analitica") or "").strip(),
-                    "codigo_analitica": (hydrated.get("codigo_analitica") or "").strip(),
-                }
-                if any(claim_payload.values()):
-                    target_claim = frame.find_claim_by_id(claim_payload["id_reclamo"]) if claim_payload["id_reclamo"] else None
-                    if not target_claim:
-                        target_claim = frame.obtain_claim_slot()
-                    target_claim.set_data(claim_payload)
-                    self._sync_product_lookup_claim_fields(frame, product_id)
-                self._trigger_import_id_refresh(
-                    frame,
-                    product_id,
-                    notify_on_missing=True,
-                    preserve_existing=True,
-                )
-                processed += 1
-                if not found and 'id_producto' in self.detail_catalogs:
-                    missing_ids.append(product_id)
-            if missing_ids:
-                self._report_missing_detail_ids("productos", missing_ids)
-            if processed:
-                self._notify_dataset_changed(summary_sections=("productos", "reclamos"))
-                self.sync_main_form_after_import("productos", stay_on_summary=stay_on_summary)
-                self._run_duplicate_check_post_load()
-            return processed
-        if section_key == "reclamos":
-            missing_products = []
-            unhydrated_products = []
-            expected_fields = list(self.IMPORT_CONFIG["reclamos"]["expected_headers"])
-            expected_length = len(expected_fields)
-            for values in rows:
-                if len(values) != expected_length:
-                    raise ValueError(
-                        f"Se esperaban {expected_length} columnas de reclamos y se recibieron {len(values)}."
-                    )
-                row_dict = {
-                    field: (values[pos] or "").strip()
-                    for pos, field in enumerate(expected_fields)
-                }
-                if not row_dict.get("id_caso"):
-                    case_var = getattr(self, "id_caso_var", None)
-                    if case_var and hasattr(case_var, "get"):
-                        row_dict["id_caso"] = (case_var.get() or "").strip()
-                hydrated, found = self._hydrate_row_from_details(row_dict, 'id_producto', PRODUCT_ID_ALIASES)
-                product_id = (hydrated.get('id_producto') or '').strip()
-                if not product_id:
-                    continue
-                if not found:
-                    unhydrated_products.append(product_id)
-                product_frame = self._find_product_frame(product_id)
-                new_product = False
-                if not product_frame:
-                    product_frame = self._obtain_product_slot_for_import()
-                    new_product = True
-                client_id = (hydrated.get('id_cliente') or '').strip()
-                if client_id:
-                    client_details, _ = self._hydrate_row_from_details({'id_cliente': client_id}, 'id_cliente', CLIENT_ID_ALIASES)
-                    self._ensure_client_exists(client_id, client_details)
-                if new_product:
-                    if found:
-                        self._populate_product_frame_from_row(product_frame, hydrated)
-                    else:
-                        # Solo registrar el ID y mantener defaults hasta que el usuario complete los campos obligatorios.
-                        product_frame.id_var.set(product_id)
-                self._trigger_import_id_refresh(
-                    product_frame,
-                    product_id,
-                    preserve_existing=False,
-                )
-                claim_payload = {
-                    'id_reclamo': (hydrated.get('id_reclamo') or row_dict.get('id_reclamo') or '').strip(),
-                    'id_caso': (hydrated.get('id_caso') or row_dict.get('id_caso') or '').strip(),
-                    'nombre_analitica': (hydrated.get('nombre_analitica') or row_dict.get('nombre_analitica') or '').strip(),
-                    'codigo_analitica': (hydrated.get('codigo_analitica') or row_dict.get('codigo_analitica') or '').strip(),
-                }
-                if not claim_payload["id_caso"]:
-                    case_var = getattr(self, "id_caso_var", None)
-                    if case_var and hasattr(case_var, "get"):
-                        claim_payload["id_caso"] = (case_var.get() or "").strip()
-                if not any(claim_payload.values()):
-                    continue
-                target = product_frame.find_claim_by_id(claim_payload['id_reclamo']) if claim_payload['id_reclamo'] else None
-                if not target:
-                    target = product_frame.obtain_claim_slot()
-                target.set_data(claim_payload)
-                self._sync_product_lookup_claim_fields(product_frame, product_id)
-                product_frame.persist_lookup_snapshot()
-                processed += 1
-                if not found and 'id_producto' in self.detail_catalogs:
-                    missing_products.append(product_id)
+        elif section_key == "reclamos":
             if processed:
                 self._notify_dataset_changed(summary_sections="reclamos")
                 self.sync_main_form_after_import("reclamos", stay_on_summary=stay_on_summary)
                 log_event("navegacion", f"Reclamos pegados desde resumen: {processed}", self.logs)
                 self._run_duplicate_check_post_load()
-            if missing_products:
-                self._report_missing_detail_ids("productos", missing_products)
-            if unhydrated_products:
-                self._notify_products_created_without_details(unhydrated_products)
-            return processed
-        if section_key == "riesgos":
-            duplicate_ids = []
-            expected_fields = list(self.IMPORT_CONFIG["riesgos"]["expected_headers"])
-            expected_length = len(expected_fields)
-            for values in rows:
-                if len(values) != expected_length:
-                    raise ValueError(
-                        f"Se esperaban {expected_length} columnas de riesgos y se recibieron {len(values)}."
-                    )
-                payload = {
-                    field: (values[pos] or "").strip()
-                    for pos, field in enumerate(expected_fields)
-                }
-                risk_id = payload.get("id_riesgo", "")
-                if not risk_id:
-                    continue
-                if any(r.id_var.get().strip() == risk_id for r in self.risk_frames):
-                    log_event("validacion", f"Riesgo duplicado {risk_id} en pegado", self.logs)
-                    duplicate_ids.append(risk_id)
-                    continue
-                self.add_risk()
-                frame = self.risk_frames[-1]
-                frame.id_var.set(risk_id)
-                frame.lider_var.set(payload.get("lider", ""))
-                frame.descripcion_var.set(payload.get("descripcion", ""))
-                criticidad = (payload.get("criticidad") or CRITICIDAD_LIST[0]).strip()
-                if criticidad in CRITICIDAD_LIST:
-                    frame.criticidad_var.set(criticidad)
-                frame.exposicion_var.set(payload.get("exposicion_residual", ""))
-                frame.planes_var.set(payload.get("planes_accion", ""))
-                if hasattr(frame, "case_id_var"):
-                    case_value = payload.get("id_caso", "")
-                    if not case_value:
-                        case_var = getattr(self, "id_caso_var", None)
-                        if case_var and hasattr(case_var, "get"):
-                            case_value = (case_var.get() or "").strip()
-                    frame.case_id_var.set(case_value)
-                self._trigger_import_id_refresh(frame, risk_id, preserve_existing=True)
-                processed += 1
-            if duplicate_ids:
-                messagebox.showwarning(
-                    "Riesgos duplicados",
-                    "Se ignoraron los siguientes riesgos ya existentes:\n" + ", ".join(duplicate_ids),
+            if session.missing_ids:
+                warnings.append(self._report_missing_detail_ids("productos", session.missing_ids))
+            if session.unhydrated_ids:
+                self._notify_products_created_without_details(session.unhydrated_ids)
+        elif section_key in {"riesgos", "normas"}:
+            if session.duplicate_ids and notify_duplicates:
+                title, label = (
+                    ("Riesgos duplicados", "los siguientes riesgos ya existentes")
+                    if section_key == "riesgos"
+                    else ("Normas duplicadas", "las siguientes normas ya existentes")
                 )
-            if processed:
-                self._notify_dataset_changed(summary_sections="riesgos")
-                self.sync_main_form_after_import("riesgos", stay_on_summary=stay_on_summary)
-            return processed
-        if section_key == "normas":
-            duplicate_ids = []
-            expected_fields = list(self.IMPORT_CONFIG["normas"]["expected_headers"])
-            expected_length = len(expected_fields)
-            for values in rows:
-                if len(values) != expected_length:
-                    raise ValueError(
-                        f"Se esperaban {expected_length} columnas de normas y se recibieron {len(values)}."
-                    )
-                payload = {
-                    field: (values[pos] or "").strip()
-                    for pos, field in enumerate(expected_fields)
-                }
-                norm_id = payload.get("id_norma", "")
-                if not norm_id:
-                    continue
-                if any(n.id_var.get().strip() == norm_id for n in self.norm_frames):
-                    log_event("validacion", f"Norma duplicada {norm_id} en pegado", self.logs)
-                    duplicate_ids.append(norm_id)
-                    continue
-                self.add_norm()
-                frame = self.norm_frames[-1]
-                frame.id_var.set(norm_id)
-                frame.descripcion_var.set(payload.get("descripcion", ""))
-                frame.fecha_var.set(payload.get("fecha_vigencia", ""))
-                frame.acapite_var.set(payload.get("acapite_inciso", ""))
-                frame._set_detalle_text(payload.get("detalle_norma", ""))
-                if hasattr(frame, "case_id_var"):
-                    case_value = payload.get("id_caso", "")
-                    if not case_value:
-                        case_var = getattr(self, "id_caso_var", None)
-                        if case_var and hasattr(case_var, "get"):
-                            case_value = (case_var.get() or "").strip()
-                    frame.case_id_var.set(case_value)
-                processed += 1
-            if duplicate_ids:
                 messagebox.showwarning(
-                    "Normas duplicadas",
-                    "Se ignoraron las siguientes normas ya existentes:\n" + ", ".join(duplicate_ids),
+                    title,
+                    f"Se ignoraron {label}:\n" + ", ".join(session.duplicate_ids),
                 )
             if processed:
-                self._refresh_shared_norm_tree()
-                self._notify_dataset_changed(summary_sections="normas")
-                self.sync_main_form_after_import("normas", stay_on_summary=stay_on_summary)
-            return processed
-        raise ValueError("Esta tabla no admite pegado directo al formulario principal.")
+                if section_key == "normas":
+                    self._refresh_shared_norm_tree()
+                self._notify_dataset_changed(summary_sections=section_key)
+                self.sync_main_form_after_import(section_key, stay_on_summary=stay_on_summary)
+        session.warnings.extend(warning for warning in warnings if warning)
+        return processed
 
     def _schedule_summary_refresh(self, sections=None, data=None):
         """Marca secciones como sucias y actualiza el resumen cuando proceda."""
 
+        if self._bulk_load_active():
+            self._defer_summary_refresh(sections, data)
+            return
         self._refresh_inline_section_tables(sections=sections, data=data)
         self._update_completion_progress()
         if not getattr(self, "summary_tables", None):
@@ -10070,6 +11090,16 @@ class FraudCaseApp:
             return
         if self._summary_refresh_after_id:
             return
+        scheduler = self._get_ui_scheduler()
+        if scheduler is not None:
+            self._summary_refresh_after_id = scheduler.schedule(
+                "resumen",
+                self._run_scheduled_summary_refresh,
+                priority=PRIORITY_SUMMARY,
+                delay_ms=self.SUMMARY_REFRESH_DELAY_MS,
+                debounce=False,
+            )
+            return
         try:
             self._summary_refresh_after_id = self.root.after(
                 self.SUMMARY_REFRESH_DELAY_MS,
@@ -10125,33 +11155,36 @@ class FraudCaseApp:
         else:
             targets = set(sections)
         inline_trees = getattr(self, "inline_summary_trees", {}) or {}
-        if data is None:
-            dataset = self.gather_data() if targets else {}
-        else:
-            dataset = data
-        if "clientes" in targets:
-            if inline_trees.get("clientes"):
-                rows = self._build_summary_rows("clientes", dataset)
-                self._render_inline_rows(inline_trees["clientes"], rows)
-            else:
+        dataset_cache = {}
+
+        def resolve_dataset():
+            # Las tablas en línea se pintan en el siguiente ciclo ocioso; el
+            # ``gather_data`` se difiere y se comparte entre ambas secciones.
+            if "dataset" not in dataset_cache:
+                dataset_cache["dataset"] = data if data is not None else self.gather_data()
+            return dataset_cache["dataset"]
+
+        for section in ("clientes", "colaboradores"):
+            if section not in targets:
+                continue
+            tree = inline_trees.get(section)
+            if tree:
+                self._schedule_inline_rows(
+                    tree,
+                    lambda key=section: self._build_summary_rows(key, resolve_dataset()),
+                )
+            elif section == "clientes":
                 self._refresh_client_summary()
-        if "colaboradores" in targets:
-            if inline_trees.get("colaboradores"):
-                rows = self._build_summary_rows("colaboradores", dataset)
-                self._render_inline_rows(inline_trees["colaboradores"], rows)
             else:
                 self._refresh_team_summary()
 
+    def _schedule_inline_rows(self, tree, rows_factory):
+        renderer = get_tree_renderer(tree, zebra=False)
+        renderer.schedule(rows_factory, lambda stats: self._apply_rendered_tree_theme(tree, stats))
+
     def _render_inline_rows(self, tree, rows):
-        try:
-            tree.delete(*tree.get_children())
-        except Exception:
-            try:
-                tree.delete()
-            except Exception:
-                pass
-        for row in rows:
-            self._insert_themed_row(tree, row)
+        stats = get_tree_renderer(tree, zebra=False).render(rows)
+        self._apply_rendered_tree_theme(tree, stats)
 
     def _normalize_summary_sections(self, sections):
         if not self.summary_tables:
@@ -10165,6 +11198,11 @@ class FraudCaseApp:
     def _cancel_summary_refresh_job(self):
         if not self._summary_refresh_after_id:
             return
+        scheduler = self._get_ui_scheduler()
+        if scheduler is not None and scheduler.is_pending(self._summary_refresh_after_id):
+            scheduler.cancel(self._summary_refresh_after_id)
+            self._summary_refresh_after_id = None
+            return
         try:
             self.root.after_cancel(self._summary_refresh_after_id)
         except tk.TclError:
@@ -10284,11 +11322,8 @@ class FraudCaseApp:
         tree = self.summary_tables.get(key)
         if not tree:
             return
-        tree.delete(*tree.get_children())
-        for idx, row in enumerate(rows):
-            tags = ("even",) if idx % 2 == 0 else ("odd",)
-            self._insert_themed_row(tree, row, tags=tags)
-        self._apply_treeview_theme(tree)
+        stats = get_tree_renderer(tree).render(rows)
+        self._apply_rendered_tree_theme(tree, stats)
 
     # ---------------------------------------------------------------------
     # Importación desde CSV
@@ -11374,12 +12409,7 @@ class FraudCaseApp:
         return (identifier or '').strip().upper()
 
     def _normalize_export_encoding(self, value: object) -> str:
-        normalized = str(value or "").strip().lower()
-        if normalized in {"utf8", "utf-8"}:
-            return "utf-8"
-        if normalized in {"latin1", "latin-1", "latin_1", "iso-8859-1"}:
-            return "latin-1"
-        return "utf-8"
+        return normalize_export_encoding(value)
 
     def _get_export_encoding(self) -> str:
         encoding_var = getattr(self, "export_encoding_var", None)
@@ -11397,13 +12427,7 @@ class FraudCaseApp:
 
     @staticmethod
     def _build_export_encoding_error(file_name: str, encoding: str, exc: UnicodeEncodeError) -> str:
-        if encoding == "latin-1":
-            return (
-                f"No se pudo exportar {file_name} en Latin-1 porque el texto contiene caracteres "
-                "que no existen en esa codificación. Cambia la codificación a UTF-8 o reemplaza "
-                "los caracteres especiales antes de exportar."
-            )
-        return f"No se pudo exportar {file_name} usando {encoding}: {exc}"
+        return build_export_encoding_error(file_name, encoding, exc)
 
     def _run_duplicate_check_post_load(self, from_background: Optional[bool] = None):
         """Ejecuta la validación de claves técnicas tras cargas masivas.
@@ -11686,10 +12710,12 @@ class FraudCaseApp:
     def _handle_client_id_change(self, frame, previous_id, new_id):
         self._ensure_frame_id_maps()
         self._update_frame_id_index(self._client_frames_by_id, frame, previous_id, new_id)
+        self._get_client_option_source().invalidate()
 
     def _handle_team_id_change(self, frame, previous_id, new_id):
         self._ensure_frame_id_maps()
         self._update_frame_id_index(self._team_frames_by_id, frame, previous_id, new_id)
+        self._get_team_option_source().invalidate()
 
     def _handle_product_id_change(self, frame, previous_id, new_id):
         self._ensure_frame_id_maps()
@@ -12183,10 +13209,19 @@ class FraudCaseApp:
                 identifiers.add(value)
         return identifiers
 
-    def _run_import_batches(self, entries, task_label, process_chunk, finalize, batch_size=20):
+    def _run_import_batches(self, entries, task_label, process_chunk, finalize, batch_size=20, cancel_event=None):
         rows = entries or []
         total = len(rows)
         root = getattr(self, "root", None)
+        profiler = get_profiler()
+
+        def _process(chunk):
+            with profiler.span("chunk", "imports", task=task_label, rows=len(chunk)):
+                process_chunk(chunk)
+
+        def _finalize():
+            with profiler.span("finalize", "imports", task=task_label, rows=total):
+                finalize()
 
         def _update_status(processed):
             if total and self.import_status_var is not None:
@@ -12199,16 +13234,19 @@ class FraudCaseApp:
 
         if root is None or total <= batch_size:
             if rows:
-                process_chunk(rows)
+                _process(rows)
             _update_status(total)
-            finalize()
+            _finalize()
             return
 
         def _process_batch(start_index=0):
+            if cancel_event is not None and cancel_event.is_set():
+                _finalize()
+                return
             end_index = min(start_index + batch_size, total)
             chunk = rows[start_index:end_index]
             if chunk:
-                process_chunk(chunk)
+                _process(chunk)
             _update_status(end_index)
             if end_index < total:
                 try:
@@ -12216,7 +13254,7 @@ class FraudCaseApp:
                 except tk.TclError:
                     _process_batch(end_index)
             else:
-                finalize()
+                _finalize()
 
         _update_status(0)
         _process_batch(0)
@@ -13056,6 +14094,31 @@ class FraudCaseApp:
         except tk.TclError:
             pass
 
+    def _norm_catalog_ids(self) -> set[str]:
+        catalogs = getattr(self, "detail_catalogs", None)
+        if not isinstance(catalogs, Mapping):
+            return set()
+        return set(catalogs.get('id_norma') or {})
+
+    @staticmethod
+    def _norm_import_errors(hydrated: Mapping, norm_catalog) -> list[str]:
+        """Motivos por los que una norma importada se rechaza (vacío si es válida)."""
+
+        nid = (hydrated.get('id_norma') or '').strip()
+        detalle_norma = (hydrated.get('detalle_norma') or hydrated.get('detalle') or '').strip()
+        validation_errors = [
+            None if nid in norm_catalog else validate_norm_id(nid),
+            validate_required_text((hydrated.get('descripcion') or '').strip(), "la descripción de la norma"),
+            validate_required_text(
+                (hydrated.get('acapite_inciso') or '').strip(), "el acápite o inciso de la norma"
+            ),
+            validate_required_text(detalle_norma, "el detalle de la norma"),
+            validate_date_text(
+                (hydrated.get('fecha_vigencia') or '').strip(), "la fecha de vigencia", allow_blank=False
+            ),
+        ]
+        return [msg for msg in validation_errors if msg]
+
     def _apply_norm_import_payload(self, entries, *, manager=None, file_path=""):
         manager = manager or self.mass_import_manager
         self._begin_import_feedback("normas", file_path)
@@ -13064,6 +14127,7 @@ class FraudCaseApp:
         errores = 0
         warnings: list[str] = []
         existing_ids = self._collect_existing_ids(self.norm_frames)
+        norm_catalog = self._norm_catalog_ids()
         seen_ids = set()
         for hydrated in entries or []:
             nid = (hydrated.get('id_norma') or '').strip()
@@ -13074,16 +14138,7 @@ class FraudCaseApp:
             fecha_vigencia = (hydrated.get('fecha_vigencia') or '').strip()
             acapite_inciso = (hydrated.get('acapite_inciso') or '').strip()
             detalle_norma = (hydrated.get('detalle_norma') or hydrated.get('detalle') or '').strip()
-            norm_catalog = (self.detail_catalogs.get('id_norma') or {}) if isinstance(self.detail_catalogs, Mapping) else {}
-            norm_id_error = None if nid in norm_catalog else validate_norm_id(nid)
-            validation_errors = [
-                norm_id_error,
-                validate_required_text(descripcion, "la descripción de la norma"),
-                validate_required_text(acapite_inciso, "el acápite o inciso de la norma"),
-                validate_required_text(detalle_norma, "el detalle de la norma"),
-                validate_date_text(fecha_vigencia, "la fecha de vigencia", allow_blank=False),
-            ]
-            validation_errors = [msg for msg in validation_errors if msg]
+            validation_errors = self._norm_import_errors(hydrated, norm_catalog)
             if validation_errors:
                 errores += 1
                 log_event(
@@ -13130,14 +14185,7 @@ class FraudCaseApp:
         except tk.TclError:
             pass
 
-    def _apply_claim_import_payload(self, entries, *, manager=None, file_path=""):
-        manager = manager or self.mass_import_manager
-        self._begin_import_feedback("reclamos", file_path)
-        nuevos = 0
-        duplicados = 0
-        errores = 0
-        missing_products = []
-        warnings: list[str] = []
+    def _collect_existing_claim_keys(self) -> set[tuple[str, str]]:
         existing_claims = set()
         for product_frame in self.product_frames:
             pid_var = getattr(product_frame, 'id_var', None)
@@ -13149,6 +14197,17 @@ class FraudCaseApp:
                 cid_value = (cid_var.get() if hasattr(cid_var, 'get') else "").strip()
                 if cid_value:
                     existing_claims.add((pid_value, cid_value))
+        return existing_claims
+
+    def _apply_claim_import_payload(self, entries, *, manager=None, file_path=""):
+        manager = manager or self.mass_import_manager
+        self._begin_import_feedback("reclamos", file_path)
+        nuevos = 0
+        duplicados = 0
+        errores = 0
+        missing_products = []
+        warnings: list[str] = []
+        existing_claims = self._collect_existing_claim_keys()
         seen_claims = set()
 
         def process_chunk(chunk):
@@ -13257,6 +14316,7 @@ class FraudCaseApp:
             click_log="Usuario pulsó importar clientes",
             start_log="Inició importación de clientes",
             log_handler=lambda category, message: log_event(category, message, self.logs),
+            preview_spec_factory=lambda: self._build_import_preview_spec("clientes"),
         )
 
     def import_team_members(self, filename=None):
@@ -13276,6 +14336,7 @@ class FraudCaseApp:
             click_log="Usuario pulsó importar colaboradores",
             start_log="Inició importación de colaboradores",
             log_handler=lambda category, message: log_event(category, message, self.logs),
+            preview_spec_factory=lambda: self._build_import_preview_spec("colaboradores"),
         )
 
     def import_products(self, filename=None):
@@ -13295,6 +14356,7 @@ class FraudCaseApp:
             click_log="Usuario pulsó importar productos",
             start_log="Inició importación de productos",
             log_handler=lambda category, message: log_event(category, message, self.logs),
+            preview_spec_factory=lambda: self._build_import_preview_spec("productos"),
         )
 
     # ---------------------------------------------------------------------
@@ -13355,8 +14417,9 @@ class FraudCaseApp:
     def save_auto(self, data=None):
         """Guarda automáticamente el estado actual en un archivo JSON."""
 
-        payload = self._serialize_full_form_state(data)
-        dataset = self._ensure_case_data(payload.get("dataset", {}))
+        with get_profiler().span("serialize", "autosave"):
+            payload = self._serialize_full_form_state(data)
+            dataset = self._ensure_case_data(payload.get("dataset", {}))
         manager = self._get_persistence_manager()
 
         def _on_success(_result):
@@ -13388,23 +14451,29 @@ class FraudCaseApp:
         success_dialog: tuple[str, str] | None = None,
         form_state: Mapping[str, object] | None = None,
     ) -> None:
+        def _finish_loading() -> None:
+            self._restore_form_state(form_state)
+            case_id = (dataset.get("caso", {}) or {}).get("id_caso")
+            self._update_window_title(case_id=case_id)
+            self._flush_summary_refresh(sections=self.summary_tables.keys(), data=dataset)
+            message = f"Se cargó {source_label}"
+            if autosave:
+                self._last_autosave_source = str(source_label)
+            log_event("navegacion", message, self.logs)
+            if show_toast:
+                self._display_toast(self.root, message, duration_ms=2200)
+            if success_dialog and not getattr(self, "_suppress_messagebox", False):
+                try:
+                    messagebox.showinfo(*success_dialog)
+                except tk.TclError:
+                    return
+
+        frame_count = self._count_dynamic_frames() + self._count_populate_steps(dataset)
+        if self._should_slice_bulk_load(frame_count):
+            self._populate_in_slices(dataset, on_complete=_finish_loading)
+            return
         self.populate_from_data(dataset)
-        self._restore_form_state(form_state)
-        case_id = (dataset.get("caso", {}) or {}).get("id_caso")
-        self._update_window_title(case_id=case_id)
-        self._schedule_summary_refresh(sections=self.summary_tables.keys(), data=dataset)
-        self._flush_summary_refresh(sections=self.summary_tables.keys(), data=dataset)
-        message = f"Se cargó {source_label}"
-        if autosave:
-            self._last_autosave_source = str(source_label)
-        log_event("navegacion", message, self.logs)
-        if show_toast:
-            self._display_toast(self.root, message, duration_ms=2200)
-        if success_dialog and not getattr(self, "_suppress_messagebox", False):
-            try:
-                messagebox.showinfo(*success_dialog)
-            except tk.TclError:
-                return
+        _finish_loading()
 
     def _discover_autosave_candidates(
         self, extra_patterns: Iterable[str] | None = None
@@ -13716,12 +14785,16 @@ class FraudCaseApp:
     def _handle_window_close(self):
         self.flush_autosave()
         self._cancel_summary_refresh_job()
+        self._stop_perf_profiling()
         self.flush_logs_now(reschedule=False)
         cancel_confetti_jobs(self.root)
         if self._autosave_cycle_job_id is not None:
             with suppress(tk.TclError):
                 self.root.after_cancel(self._autosave_cycle_job_id)
             self._autosave_cycle_job_id = None
+        replay_token = getattr(self, "_pending_consolidation_token", None)
+        if replay_token is not None:
+            replay_token.cancel()
         shutdown_background_workers(cancel_futures=False)
         with suppress(tk.TclError):
             self.root.destroy()
@@ -13768,6 +14841,7 @@ class FraudCaseApp:
         if not rows:
             return
         errors = []
+        written = []
         if STORE_LOGS_LOCALLY and LOGS_FILE:
             try:
                 self._append_log_rows(
@@ -13775,6 +14849,7 @@ class FraudCaseApp:
                     rows,
                     track_attr="_log_file_initialized",
                 )
+                written.append(LOGS_FILE)
             except OSError as exc:
                 errors.append((LOGS_FILE, exc))
         external_path = self._resolve_external_log_target()
@@ -13785,8 +14860,10 @@ class FraudCaseApp:
                     rows,
                     track_attr="_external_log_file_initialized",
                 )
+                written.append(external_path)
             except OSError as exc:
                 errors.append((external_path, exc))
+        self._schedule_usage_compaction(written)
         if errors:
             messages = [f"No se pudo escribir el log en {path}: {exc}" for path, exc in errors]
             for message in messages:
@@ -13794,6 +14871,42 @@ class FraudCaseApp:
             if not getattr(self, '_suppress_messagebox', False):
                 messagebox.showwarning("Registro no guardado", "\n".join(messages))
 
+    def _schedule_usage_compaction(self, log_paths, *, force: bool = False) -> Optional[Future]:
+        """Actualiza en segundo plano el cubo de uso de cada log.
+
+        Los cubos se guardan en ``USAGE_CUBE_DIR``, local a cada equipo,
+        aunque el log esté en la unidad compartida. La compactación solo lee los bytes nuevos del archivo, así que basta
+        con lanzarla cada ``USAGE_CUBE_COMPACT_INTERVAL_SECONDS``; una
+        compactación en curso no se vuelve a encolar.
+        """
+
+        if not USAGE_CUBE_ENABLED or not log_paths:
+            return None
+        now = time.monotonic()
+        pending = getattr(self, "_usage_compaction_future", None)
+        if pending is not None and not pending.done():
+            return None
+        last_run = getattr(self, "_usage_compaction_last_run", None)
+        if not force and last_run is not None and now - last_run < USAGE_CUBE_COMPACT_INTERVAL_SECONDS:
+            return None
+        self._usage_compaction_last_run = now
+        paths = [str(path) for path in log_paths]
+        cube_dir = USAGE_CUBE_DIR
+
+        def _compact_all():
+            from analytics.usage_cube import compact_usage_log
+
+            processed = 0
+            for path in paths:
+                try:
+                    processed += compact_usage_log(path, cube_dir=cube_dir)
+                except (OSError, sqlite3.Error, ValueError, UnicodeError) as exc:
+                    log_event("validacion", f"No se pudo actualizar el cubo de uso de {path}: {exc}", [])
+            return processed
+
+        self._usage_compaction_future = get_background_executor("telemetry").submit(_compact_all)
+        return self._usage_compaction_future
+
     def _append_log_rows(self, file_path: str, rows, *, track_attr: Optional[str] = None) -> None:
         target = Path(file_path)
         if target.parent:
@@ -13871,16 +14984,7 @@ class FraudCaseApp:
         )
 
     def _sum_investigated_amounts(self, products: list[dict]) -> Decimal:
-        total = Decimal("0")
-        if not products:
-            return total
-        for product in products:
-            if not isinstance(product, Mapping):
-                continue
-            amount = parse_decimal_amount(product.get("monto_investigado"))
-            if amount is not None:
-                total += amount
-        return total
+        return aggregate_amounts(products).totals["investigado"]
 
     def _should_persist_temp(self, signature, now: datetime) -> bool:
         last_signature = getattr(self, "_last_temp_signature", None)
@@ -13907,6 +15011,16 @@ class FraudCaseApp:
         self._autosave_dirty = True
         if self._autosave_job_id is not None:
             return
+        scheduler = self._get_ui_scheduler()
+        if scheduler is not None:
+            self._autosave_job_id = scheduler.schedule(
+                "autosave",
+                self._perform_debounced_autosave,
+                priority=PRIORITY_PERSISTENCE,
+                delay_ms=self.AUTOSAVE_DELAY_MS,
+                debounce=False,
+            )
+            return
         try:
             self._autosave_job_id = self.root.after(
                 self.AUTOSAVE_DELAY_MS,
@@ -13918,6 +15032,10 @@ class FraudCaseApp:
 
     def _perform_debounced_autosave(self) -> None:
         self._autosave_job_id = None
+        if self._bulk_load_active():
+            # No se guarda un formulario a medio cargar; se reintenta después.
+            self.request_autosave()
+            return
         if not self._autosave_dirty:
             return
         self._autosave_dirty = False
@@ -13925,6 +15043,10 @@ class FraudCaseApp:
         self.save_temp_version(dataset)
 
     def flush_autosave(self) -> None:
+        scheduler = self._get_ui_scheduler()
+        if scheduler is not None and scheduler.is_pending(self._autosave_job_id):
+            scheduler.cancel(self._autosave_job_id)
+            self._autosave_job_id = None
         if self._autosave_job_id is not None:
             try:
                 self.root.after_cancel(self._autosave_job_id)
@@ -14189,78 +15311,300 @@ class FraudCaseApp:
             )
             log_event("navegacion", f"Checkpoint guardado en {filename}", self.logs)
 
-        def _on_error(exc: BaseException):
-            message = f"No se pudo guardar el checkpoint: {exc}"
-            log_event("validacion", message, self.logs)
-            self._notify_user(
-                message,
-                title="Error al guardar",
-                level="error",
-                show_toast=not getattr(self, "_suppress_messagebox", False),
-            )
+        def _on_error(exc: BaseException):
+            message = f"No se pudo guardar el checkpoint: {exc}"
+            log_event("validacion", message, self.logs)
+            self._notify_user(
+                message,
+                title="Error al guardar",
+                level="error",
+                show_toast=not getattr(self, "_suppress_messagebox", False),
+            )
+
+        manager.save(Path(filename), payload, on_success=_on_success, on_error=_on_error)
+
+    # ---------------------------------------------------------------------
+    # Cargas y borrados masivos
+
+    def _bulk_load_active(self) -> bool:
+        return getattr(self, "_bulk_load_depth", 0) > 0
+
+    def _begin_bulk_load(self) -> None:
+        """Suspende validadores, difusión de opciones y resumen hasta ``_end_bulk_load``.
+
+        Las llamadas se anidan: solo la más externa reanuda y consolida.
+        """
+
+        depth = getattr(self, "_bulk_load_depth", 0)
+        if depth == 0:
+            self._bulk_pending_options: set[str] = set()
+            self._bulk_pending_summary = None
+            FieldValidator.suspend_all()
+        self._bulk_load_depth = depth + 1
+
+    def _end_bulk_load(self) -> None:
+        depth = getattr(self, "_bulk_load_depth", 0)
+        if depth <= 0:
+            return
+        self._bulk_load_depth = depth - 1
+        if depth > 1:
+            return
+        FieldValidator.resume_all()
+        pending_options = self._bulk_pending_options
+        self._bulk_pending_options = set()
+        if "clientes" in pending_options:
+            self.update_client_options_global()
+        if "colaboradores" in pending_options:
+            self.update_team_options_global()
+        if getattr(self, "_bulk_revalidation_sliced", False):
+            # Dentro de ``_run_sliced_steps`` la revalidación se reparte en
+            # tramos al agotar los pasos; aquí solo queda anotada.
+            self._bulk_revalidation_pending = True
+        else:
+            self._bulk_revalidation_pending = False
+            self._revalidate_suspended_fields()
+        pending_summary = self._bulk_pending_summary
+        self._bulk_pending_summary = None
+        if pending_summary is not None:
+            sections, data = pending_summary
+            self._schedule_summary_refresh(sections=sections, data=data)
+
+    @contextmanager
+    def _bulk_load(self):
+        self._begin_bulk_load()
+        try:
+            yield
+        finally:
+            self._end_bulk_load()
+
+    def _defer_summary_refresh(self, sections=None, data=None) -> None:
+        """Acumula las secciones pedidas durante la carga; el último ``data`` gana."""
+
+        if sections is None:
+            requested = None
+        elif isinstance(sections, str):
+            requested = {sections}
+        else:
+            requested = set(sections)
+        pending = getattr(self, "_bulk_pending_summary", None)
+        if pending is not None:
+            previous = pending[0]
+            requested = None if previous is None or requested is None else previous | requested
+        self._bulk_pending_summary = (requested, data)
+
+    def _iter_revalidate_suspended_fields(self):
+        """Valida una vez los campos que cambiaron durante la carga masiva.
+
+        Entrega una unidad por validador revisado para poder repartirse en
+        tramos; el valor de retorno es cuántos campos se revalidaron. De paso
+        descarta del registro los validadores de widgets destruidos.
+        """
+
+        registry = getattr(self, "_field_validators", None)
+        if not registry:
+            return 0
+        dead: set[int] = set()
+        revalidated = 0
+        for validator in list(registry):
+            exists = getattr(getattr(validator, "widget", None), "winfo_exists", None)
+            if callable(exists):
+                try:
+                    alive = bool(exists())
+                except tk.TclError:
+                    alive = False
+                if not alive:
+                    dead.add(id(validator))
+                    yield 1
+                    continue
+            revalidate = getattr(validator, "revalidate_if_changed", None)
+            if callable(revalidate):
+                try:
+                    if revalidate():
+                        revalidated += 1
+                except tk.TclError:
+                    pass
+            yield 1
+        if dead:
+            registry[:] = [validator for validator in registry if id(validator) not in dead]
+        return revalidated
+
+    def _revalidate_suspended_fields(self) -> int:
+        steps = self._iter_revalidate_suspended_fields()
+        while True:
+            try:
+                next(steps)
+            except StopIteration as stop:
+                return stop.value or 0
+
+    def _chain_sliced_revalidation(self, steps):
+        """Agota ``steps`` y reparte después la revalidación que dejó pendiente.
+
+        Mientras corren los pasos, ``_end_bulk_load`` no revalida de golpe: la
+        revalidación se consume aquí, en los mismos tramos que la carga. Si el
+        generador se cierra antes, queda pendiente para la próxima salida.
+        """
+
+        previous = getattr(self, "_bulk_revalidation_sliced", False)
+        self._bulk_revalidation_sliced = True
+        try:
+            yield from steps
+        finally:
+            self._bulk_revalidation_sliced = previous
+        if previous or not getattr(self, "_bulk_revalidation_pending", False) or self._bulk_load_active():
+            return
+        for _ in self._iter_revalidate_suspended_fields():
+            yield 0
+        self._bulk_revalidation_pending = False
+
+    def _count_dynamic_frames(self) -> int:
+        return sum(
+            len(getattr(self, name, None) or [])
+            for name in ("client_frames", "team_frames", "product_frames", "risk_frames", "norm_frames")
+        )
+
+    def _should_slice_bulk_load(self, frame_count: int) -> bool:
+        return getattr(self, "root", None) is not None and frame_count >= BULK_LOAD_SLICED_THRESHOLD
+
+    def _run_sliced_steps(self, steps, *, total: int, title: str, on_done, cancellable: bool = True) -> None:
+        """Consume ``steps`` en tramos de ``BULK_LOAD_SLICE_MS`` con diálogo de progreso.
+
+        Cada paso entrega cuántas unidades avanzó. Al terminar, cancelar o
+        fallar se cierra el generador (sus ``finally`` restauran el estado) y se
+        llama ``on_done(cancelled, error)``.
+        """
+
+        root = self.root
+        steps = self._chain_sliced_revalidation(steps)
+        token = CancellationToken()
+        dialog = ProgressDialog(root, title, on_cancel=token.cancel, cancellable=cancellable)
+        progress = [0]
+
+        def _finish(cancelled: bool, error: BaseException | None = None) -> None:
+            try:
+                steps.close()
+            finally:
+                dialog.close()
+            on_done(cancelled, error)
+
+        def _run_slice() -> None:
+            deadline = time.perf_counter() + BULK_LOAD_SLICE_MS / 1000.0
+            try:
+                while True:
+                    if token.cancelled:
+                        _finish(True)
+                        return
+                    progress[0] += next(steps)
+                    if time.perf_counter() >= deadline:
+                        break
+            except StopIteration:
+                _finish(False)
+                return
+            except Exception as exc:
+                _finish(False, exc)
+                return
+            dialog.update_progress(min(progress[0], total), total)
+            try:
+                root.after(1, _run_slice)
+            except tk.TclError as exc:
+                _finish(False, exc)
 
-        manager.save(Path(filename), payload, on_success=_on_success, on_error=_on_error)
+        dialog.update_progress(0, total)
+        _run_slice()
 
-    def _clear_case_state(self, *, save_autosave: bool = True) -> None:
-        """Elimina los datos cargados y restablece los frames dinámicos."""
+    def _iter_clear_case_steps(self):
+        """Vacía el formulario; entrega el avance tras cada tanda de frames destruidos."""
 
-        # Limpiar campos del caso
-        self._ensure_case_vars()
-        self._user_has_edited = False
-        self._autosave_start_guard = True
-        self.id_caso_var.set("")
-        self.id_proceso_var.set("")
-        self.tipo_informe_var.set(TIPO_INFORME_LIST[0])
-        self.cat_caso1_var.set(list(TAXONOMIA.keys())[0])
-        self.on_case_cat1_change()
-        self.canal_caso_var.set(CANAL_LIST[0])
-        self.proceso_caso_var.set(PROCESO_LIST[0])
-        self.fecha_caso_var.set("")
-        self._reset_investigator_fields()
-        # Vaciar listas dinámicas
-        for cf in self.client_frames:
-            cf.frame.destroy()
-        self.client_frames.clear()
-        for tm in self.team_frames:
-            tm.frame.destroy()
-        self.team_frames.clear()
-        for pr in self.product_frames:
-            pr.frame.destroy()
-        self.product_frames.clear()
-        for rf in self.risk_frames:
-            rf.frame.destroy()
-        self.risk_frames.clear()
-        for nf in self.norm_frames:
-            nf.frame.destroy()
-        self.norm_frames.clear()
-        self.next_risk_number = 1
-        self._rebuild_frame_id_indexes()
-        # Reiniciar bitácora antes de poblar los frames por defecto
-        self.logs.clear()
-        drain_log_queue()
-        self._reset_navigation_metrics()
-        self._last_case_cat2_event_value = None
-        self._last_fraud_warning_selection = None
-        self._last_fraud_warning_value = None
-        # Volver a crear uno por cada sección donde corresponde
-        self.add_client()
-        self.add_team()
-        self.add_risk()
-        if hasattr(self, "norm_container"):
-            self.add_norm()
-        # Limpiar análisis
-        for widget in self._analysis_text_widgets().values():
-            self._set_text_content(widget, "")
-        self._reset_extended_sections()
-        empty_dataset = self._build_empty_summary_dataset()
+        with self._bulk_load():
+            # Limpiar campos del caso
+            self._ensure_case_vars()
+            self._user_has_edited = False
+            self._autosave_start_guard = True
+            self.id_caso_var.set("")
+            self.id_proceso_var.set("")
+            self.tipo_informe_var.set(TIPO_INFORME_LIST[0])
+            self.cat_caso1_var.set(list(TAXONOMIA.keys())[0])
+            self.on_case_cat1_change()
+            self.canal_caso_var.set(CANAL_LIST[0])
+            self.proceso_caso_var.set(PROCESO_LIST[0])
+            self.fecha_caso_var.set("")
+            self._reset_investigator_fields()
+            # Vaciar listas dinámicas: los badges de cada tanda de frames se
+            # liberan en una sola pasada antes de destruirlos; las listas solo
+            # conservan frames vivos entre tandas.
+            dynamic_frames = (
+                self.client_frames,
+                self.team_frames,
+                self.product_frames,
+                self.risk_frames,
+                self.norm_frames,
+            )
+            for frames in dynamic_frames:
+                while frames:
+                    batch = frames[: self.BULK_DESTROY_BATCH_SIZE]
+                    destroy_badge_subtrees(frame.frame for frame in batch)
+                    del frames[: len(batch)]
+                    yield len(batch)
+            self.next_risk_number = 1
+            self._rebuild_frame_id_indexes()
+            # Reiniciar bitácora antes de poblar los frames por defecto
+            self.logs.clear()
+            drain_log_queue()
+            self._reset_navigation_metrics()
+            self._last_case_cat2_event_value = None
+            self._last_fraud_warning_selection = None
+            self._last_fraud_warning_value = None
+            # Volver a crear uno por cada sección donde corresponde
+            self.add_client()
+            self.add_team()
+            self.add_risk()
+            if hasattr(self, "norm_container"):
+                self.add_norm()
+            # Limpiar análisis
+            for widget in self._analysis_text_widgets().values():
+                self._set_text_content(widget, "")
+            self._reset_extended_sections()
+            summary_sections = set(getattr(self, "summary_tables", {}) or {})
+            self._schedule_summary_refresh(sections=summary_sections, data=self._build_empty_summary_dataset())
+
+    def _finish_clear_case_state(self, save_autosave: bool) -> None:
+        # Dentro de una carga el resumen se redibuja con los datos nuevos.
         summary_sections = set(getattr(self, "summary_tables", {}) or {})
-        if summary_sections:
-            self.refresh_summary_tables(data=empty_dataset, sections=summary_sections)
-        self._refresh_inline_section_tables(sections=summary_sections, data=empty_dataset)
-        self._schedule_summary_refresh(sections=summary_sections, data=empty_dataset)
+        if summary_sections and not self._bulk_load_active():
+            self.refresh_summary_tables(data=self._build_empty_summary_dataset(), sections=summary_sections)
         if save_autosave:
             self.save_auto()
 
+    def _clear_case_state(self, *, save_autosave: bool = True) -> None:
+        """Elimina los datos cargados y restablece los frames dinámicos."""
+
+        for _ in self._iter_clear_case_steps():
+            pass
+        self._finish_clear_case_state(save_autosave)
+
+    def _clear_case_state_in_slices(self, on_complete) -> None:
+        """Versión por tramos de ``_clear_case_state`` para casos grandes."""
+
+        def _done(_cancelled: bool, error: BaseException | None) -> None:
+            if error is not None:
+                log_event("validacion", f"Error al borrar los datos: {error}", self.logs)
+                self._notify_user(
+                    f"No se pudieron borrar todos los datos: {error}",
+                    title="Borrar datos",
+                    level="error",
+                    show_toast=False,
+                )
+                return
+            self._finish_clear_case_state(save_autosave=True)
+            on_complete()
+
+        self._run_sliced_steps(
+            self._iter_clear_case_steps(),
+            total=self._count_dynamic_frames(),
+            title="Borrando datos del caso",
+            on_done=_done,
+            cancellable=False,
+        )
+
     def _build_empty_summary_dataset(self) -> dict[str, object]:
         return {
             "caso": {},
@@ -14288,26 +15632,43 @@ class FraudCaseApp:
             canceló la acción.
         """
 
-        if confirm:
-            confirmed = messagebox.askyesno(
+        if confirm and not self._confirm_form_reset():
+            return False
+        self._clear_case_state(save_autosave=save_autosave)
+        return True
+
+    @staticmethod
+    def _confirm_form_reset() -> bool:
+        return bool(
+            messagebox.askyesno(
                 "Confirmar",
                 "¿Desea borrar todos los datos? Esta acción no se puede deshacer.",
             )
-            if not confirmed:
-                return False
-        self._clear_case_state(save_autosave=save_autosave)
-        return True
+        )
 
     def clear_all(self, notify=True):
-        """Elimina todos los datos actuales y restablece el formulario."""
+        """Elimina todos los datos actuales y restablece el formulario.
+
+        Con muchos frames el borrado se hace por tramos con diálogo de progreso.
+        """
 
         log_event("navegacion", "Usuario pulsó borrar datos", self.logs)
+
+        def _cleared() -> None:
+            log_event("navegacion", "Se borraron todos los datos", self.logs)
+            if notify:
+                messagebox.showinfo("Datos borrados", "Todos los datos han sido borrados.")
+
+        if self._should_slice_bulk_load(self._count_dynamic_frames()):
+            if not self._confirm_form_reset():
+                log_event("navegacion", "Canceló borrar datos", self.logs)
+                return
+            self._clear_case_state_in_slices(on_complete=_cleared)
+            return
         if not self._reset_form_state(confirm=True, save_autosave=True):
             log_event("navegacion", "Canceló borrar datos", self.logs)
             return
-        log_event("navegacion", "Se borraron todos los datos", self.logs)
-        if notify:
-            messagebox.showinfo("Datos borrados", "Todos los datos han sido borrados.")
+        _cleared()
 
     # ---------------------------------------------------------------------
     # Recolección y población de datos
@@ -14717,6 +16078,54 @@ class FraudCaseApp:
     def populate_from_data(self, data):
         """Puebla el formulario con datos previamente guardados."""
 
+        for _ in self._iter_populate_steps(data):
+            pass
+
+    @staticmethod
+    def _count_populate_steps(data) -> int:
+        return sum(
+            len(data.get(key) or []) for key in ("clientes", "colaboradores", "riesgos", "normas")
+        ) + 2 * len(data.get("productos") or [])
+
+    def _populate_in_slices(self, dataset, *, on_complete) -> None:
+        """Versión por tramos de ``populate_from_data`` para casos grandes.
+
+        Cancelar deja el formulario vacío en lugar de a medio cargar.
+        ``on_complete`` solo se llama si la carga terminó.
+        """
+
+        data = self._ensure_case_data(dataset).as_dict()
+
+        def _done(cancelled: bool, error: BaseException | None) -> None:
+            if error is not None:
+                log_event("validacion", f"Error al cargar el caso: {error}", self.logs)
+                self._notify_user(
+                    f"No se pudo cargar el caso: {error}",
+                    title="Carga del caso",
+                    level="error",
+                    show_toast=False,
+                )
+                return
+            if cancelled:
+                self._clear_case_state(save_autosave=False)
+                log_event("navegacion", "Canceló la carga del caso", self.logs)
+                return
+            on_complete()
+
+        self._run_sliced_steps(
+            self._iter_populate_steps(data, slice_clear=True),
+            total=self._count_dynamic_frames() + self._count_populate_steps(data),
+            title="Cargando caso",
+            on_done=_done,
+        )
+
+    def _iter_populate_steps(self, data, *, slice_clear: bool = False):
+        """Puebla el formulario entregando una unidad de avance por entidad.
+
+        Todo ocurre en modo de carga masiva: validadores, difusión de opciones
+        y resumen se consolidan una sola vez al terminar.
+        """
+
         dataset = self._ensure_case_data(data)
         data = dataset.as_dict()
         self._ensure_case_vars()
@@ -14724,9 +16133,14 @@ class FraudCaseApp:
         previous_suppression = getattr(self, "_suppress_post_edit_validation", False)
         self._suppress_post_edit_validation = True
         post_load_amount_refresh: list[object] = []
+        cancelled = False
+        self._begin_bulk_load()
         try:
             # Limpiar primero sin confirmar ni sobrescribir el autosave
-            self._clear_case_state(save_autosave=False)
+            if slice_clear:
+                yield from self._iter_clear_case_steps()
+            else:
+                self._clear_case_state(save_autosave=False)
             self._ensure_investigator_vars()
             # Datos de caso
             def _set_dropdown_value(var, value, valid_values):
@@ -14786,6 +16200,7 @@ class FraudCaseApp:
                 cl.set_accionado_from_text(cliente.get('accionado', ''))
                 if hasattr(cl, "on_id_change"):
                     cl.on_id_change(preserve_existing=True, silent=True)
+                yield 1
             # Colaboradores
             for i, col in enumerate(data.get('colaboradores', [])):
                 if i >= len(self.team_frames):
@@ -14808,6 +16223,7 @@ class FraudCaseApp:
                 tm.tipo_sancion_var.set(col.get('tipo_sancion', ''))
                 if hasattr(tm, "on_id_change"):
                     tm.on_id_change(preserve_existing=True, silent=True)
+                yield 1
             # Productos y sus reclamos e involuc
             claims_map = {}
             for rec in data.get('reclamos', []):
@@ -14860,6 +16276,7 @@ class FraudCaseApp:
                 pframe.set_claims_from_data(claims_map.get(pframe.id_var.get().strip(), []))
                 if hasattr(pframe, "on_id_change"):
                     pframe.on_id_change(preserve_existing=True, silent=True)
+                yield 1
             # Involucramientos
             involvement_map = {}
             for inv in data.get('involucramientos', []):
@@ -14868,8 +16285,9 @@ class FraudCaseApp:
                     continue
                 involvement_map.setdefault(pid, []).append(inv)
 
-            for pframe in self.product_frames:
+            for pframe in list(self.product_frames):
                 pid = pframe.id_var.get().strip()
+                yield 1
                 if pid not in involvement_map:
                     continue
                 pframe.clear_involvements()
@@ -14907,6 +16325,7 @@ class FraudCaseApp:
                     rf.on_id_change(preserve_existing=True, silent=True)
                 if hasattr(rf, "update_risk_validation_state"):
                     rf.update_risk_validation_state()
+                yield 1
             # Normas
             for i, norm in enumerate(data.get('normas', [])):
                 if i >= len(self.norm_frames):
@@ -14919,6 +16338,7 @@ class FraudCaseApp:
                 nf._set_detalle_text(norm.get('detalle_norma', '') or norm.get('detalle', ''))
                 if hasattr(nf, "on_id_change"):
                     nf.on_id_change(preserve_existing=True, silent=True)
+                yield 1
             self._refresh_shared_norm_tree()
             # Analisis
             analisis = data.get('analisis', {})
@@ -14954,10 +16374,14 @@ class FraudCaseApp:
             self._sync_extended_sections_to_ui()
             self._rebuild_frame_id_indexes()
             self._schedule_summary_refresh(data=data)
+        except GeneratorExit:
+            cancelled = True
+            raise
         finally:
             self._suppress_post_edit_validation = previous_suppression
             self._suppress_case_header_sync = False
-            if not previous_suppression:
+            self._end_bulk_load()
+            if not previous_suppression and not cancelled:
                 for refresh_amounts in post_load_amount_refresh:
                     refresh_amounts()
                 self._run_duplicate_check_post_load()
@@ -15871,33 +17295,17 @@ class FraudCaseApp:
 
     @staticmethod
     def _build_report_path(data: CaseData, folder: Path, extension: str) -> Path:
-        case = data.get("caso", {}) if isinstance(data, Mapping) else {}
-        report_name = build_report_filename(
-            case.get("tipo_informe"), case.get("id_caso"), extension
-        )
-        return Path(folder) / report_name
+        return build_report_path(data, folder, extension)
 
     @staticmethod
     def _build_resumen_ejecutivo_path(data: CaseData, folder: Path) -> Path:
-        case = data.get("caso", {}) if isinstance(data, Mapping) else {}
-        report_name = build_resumen_ejecutivo_filename(
-            case.get("tipo_informe"), case.get("id_caso"), "md"
-        )
-        return Path(folder) / report_name
+        return build_resumen_ejecutivo_path(data, folder)
 
     @staticmethod
     def _build_report_prefix(data: CaseData) -> str:
-        """Devuelve el prefijo normalizado para los reportes y exportaciones.
+        """Devuelve el prefijo normalizado para los reportes y exportaciones."""
 
-        Se apoya en ``build_report_filename`` para reutilizar la misma lógica
-        de limpieza aplicada a los informes DOCX/MD, eliminando la extensión
-        para poder reutilizar el prefijo en los CSV y en el JSON.
-        """
-
-        case = data.get("caso", {}) if isinstance(data, Mapping) else {}
-        return Path(
-            build_report_filename(case.get("tipo_informe"), case.get("id_caso"), "csv")
-        ).stem
+        return build_report_prefix(data)
 
     def _run_export_action(self, button: Optional[tk.Widget], action: Callable[[], None]) -> None:
         """Deshabilita temporalmente un botón mientras se ejecuta una acción de exportación."""
@@ -15922,183 +17330,33 @@ class FraudCaseApp:
                         button.configure(state="disabled" if was_disabled else "normal")
 
     def _perform_save_exports(self, data: CaseData, folder: Path, case_id: str):
-        folder = Path(folder)
-        report_prefix = self._build_report_prefix(data)
-        created_files = []
-        llave_rows, llave_header = build_llave_tecnica_rows(data)
-        event_rows, _event_header = build_event_rows(data)
-        event_header = list(EVENTOS_HEADER_CANONICO)
-        # Nota: las reglas de validación siguen el Design document CM.pdf; este bloque sólo ajusta exportaciones.
-        amount_field_names = {
-            "monto_investigado",
-            "monto_perdida_fraude",
-            "monto_falla_procesos",
-            "monto_contingencia",
-            "monto_recuperado",
-            "monto_pago_deuda",
-            "monto_fraude_interno_soles",
-            "monto_fraude_interno_dolares",
-            "monto_fraude_externo_soles",
-            "monto_fraude_externo_dolares",
-            "monto_falla_en_proceso_soles",
-            "monto_falla_en_proceso_dolares",
-            "monto_contingencia_soles",
-            "monto_contingencia_dolares",
-            "monto_recuperado_soles",
-            "monto_recuperado_dolares",
-            "monto_pagado_soles",
-            "monto_pagado_dolares",
-        }
-        eventos_amount_fields = {
-            field for field in event_header if field in amount_field_names
-        }
-        eventos_lhcl_rows = []
-        seen_products: set[str] = set()
-        for row in event_rows:
-            product_id = row.get("product_id") or row.get("id_producto") or ""
-            product_key = str(product_id)
-            if product_key not in seen_products:
-                seen_products.add(product_key)
-                eventos_lhcl_rows.append(row)
-                continue
-            sanitized_row = dict(row)
-            for field in eventos_amount_fields:
-                if field in sanitized_row:
-                    sanitized_row[field] = EVENTOS_PLACEHOLDER
-            eventos_lhcl_rows.append(sanitized_row)
-        warnings: list[str] = []
-        history_targets: list[tuple[str, list[dict[str, object]], list[str]]] = []
+        """Escribe las exportaciones del caso y las replica en la unidad externa.
+
+        Los archivos se generan con ``write_case_exports`` (el mismo canal
+        que usa ``tools.batch_export``); aquí solo se añaden el diagrama de
+        arquitectura y la copia externa.
+        """
+
         normalized_case_id = self._normalize_identifier(case_id)
         history_timestamp = datetime.now()
         export_encoding = self._get_export_encoding()
 
-        def write_csv(file_name, rows, header, *, historical_name: Optional[str] = None):
-            path = folder / f"{report_prefix}_{file_name}"
-            try:
-                with path.open('w', newline='', encoding=export_encoding) as f:
-                    writer = csv.DictWriter(f, fieldnames=header)
-                    writer.writeheader()
-                    for row in rows:
-                        sanitized_row = {
-                            field: _sanitize_csv_value(row.get(field, "")) for field in header
-                        }
-                        writer.writerow(sanitized_row)
-            except UnicodeEncodeError as exc:
-                raise ValueError(self._build_export_encoding_error(file_name, export_encoding, exc)) from exc
-            created_files.append(path)
-            if historical_name:
-                history_targets.append((historical_name, rows, header))
-
-        write_csv(
-            'casos.csv',
-            [data['caso']],
-            EXPORT_HEADERS["casos.csv"],
-        )
-        write_csv('llave_tecnica.csv', llave_rows, llave_header, historical_name='llave_tecnica')
-        write_csv('eventos.csv', event_rows, event_header, historical_name='eventos')
-        write_csv(
-            'eventos_lhcl.csv',
-            eventos_lhcl_rows,
-            event_header,
-            historical_name='eventos_lhcl',
-        )
-        write_csv(
-            'clientes.csv',
-            data['clientes'],
-            EXPORT_HEADERS["clientes.csv"],
-            historical_name='clientes',
-        )
-        write_csv(
-            'colaboradores.csv',
-            data['colaboradores'],
-            EXPORT_HEADERS["colaboradores.csv"],
-            historical_name='colaboradores',
-        )
-        write_csv(
-            'productos.csv',
-            data['productos'],
-            EXPORT_HEADERS["productos.csv"],
-            historical_name='productos',
-        )
-        write_csv(
-            'producto_reclamo.csv',
-            data['reclamos'],
-            EXPORT_HEADERS["producto_reclamo.csv"],
-            historical_name='producto_reclamo',
-        )
-        write_csv(
-            'involucramiento.csv',
-            data['involucramientos'],
-            EXPORT_HEADERS["involucramiento.csv"],
-            historical_name='involucramiento',
-        )
-        write_csv(
-            'detalles_riesgo.csv',
-            data['riesgos'],
-            EXPORT_HEADERS["detalles_riesgo.csv"],
-            historical_name='detalles_riesgo',
-        )
-        write_csv(
-            'detalles_norma.csv',
-            data['normas'],
-            EXPORT_HEADERS["detalles_norma.csv"],
-            historical_name='detalles_norma',
-        )
-        analysis_texts = self._normalize_analysis_texts(data['analisis'])
-        analysis_row = {
-            "id_caso": data['caso']['id_caso'],
-            **{
-                key: (value.get("text") if isinstance(value, Mapping) else "")
-                for key, value in analysis_texts.items()
-            },
-        }
-        write_csv(
-            'analisis.csv',
-            [analysis_row],
-            EXPORT_HEADERS["analisis.csv"],
-            historical_name='analisis',
+        def _log_warning(message: str) -> None:
+            log_event("validacion", message, self.logs)
+
+        result = write_case_exports(
+            data,
+            folder,
+            normalized_case_id,
+            logs=self.logs,
+            encoding=export_encoding,
+            timestamp=history_timestamp,
+            docx_available=self._docx_available,
+            on_warning=_log_warning,
+            analysis_normalizer=self._normalize_analysis_texts,
         )
-        if self.logs:
-            write_csv('logs.csv', [normalize_log_row(row) for row in self.logs], LOG_FIELDNAMES, historical_name='logs')
-        json_path = folder / f"{report_prefix}_version.json"
-        with json_path.open('w', encoding="utf-8") as f:
-            json.dump(data.as_dict(), f, ensure_ascii=False, indent=2)
-        created_files.append(json_path)
-        md_path = self._build_report_path(data, folder, "md")
-        created_files.append(save_md(data, md_path))
-        resumen_path = self._build_resumen_ejecutivo_path(data, folder)
-        created_files.append(build_resumen_ejecutivo_md(data, resumen_path))
-        docx_path: Optional[Path] = None
-        if not self._docx_available:
-            warnings.append(DOCX_MISSING_MESSAGE)
-        else:
-            try:
-                docx_path = build_docx(data, self._build_report_path(data, folder, "docx"))
-            except Exception as exc:  # pragma: no cover - protección frente a fallos externos
-                warning = f"Error al generar DOCX: {exc}"
-                log_event("validacion", warning, self.logs)
-                warnings.append(warning)
-                docx_path = None
-            else:
-                if docx_path:
-                    created_files.append(docx_path)
-        for table_name, rows, header in history_targets:
-            try:
-                history_path = append_historical_records(
-                    table_name,
-                    rows,
-                    header,
-                    folder,
-                    normalized_case_id,
-                    timestamp=history_timestamp,
-                    encoding=export_encoding,
-                )
-            except UnicodeEncodeError as exc:
-                raise ValueError(
-                    self._build_export_encoding_error(f"h_{table_name}.csv", export_encoding, exc)
-                ) from exc
-            if history_path:
-                created_files.append(history_path)
+        created_files = result.created_files
+        warnings = result.warnings
         export_definitions = self._build_export_definitions(data)
         architecture_path = self._update_architecture_diagram(export_definitions)
         if architecture_path:
@@ -16116,11 +17374,11 @@ class FraudCaseApp:
             warnings.extend(self._mirror_exports_to_external_drive(*mirror_args, **mirror_kwargs))
         return {
             "data": data,
-            "report_prefix": report_prefix,
+            "report_prefix": result.report_prefix,
             "created_files": created_files,
-            "md_path": md_path,
-            "resumen_path": resumen_path,
-            "docx_path": docx_path,
+            "md_path": result.md_path,
+            "resumen_path": result.resumen_path,
+            "docx_path": result.docx_path,
             "warnings": warnings,
         }
 
@@ -16132,13 +17390,14 @@ class FraudCaseApp:
         *,
         source_widget: Optional[tk.Widget] = None,
         widget_id: Optional[str] = None,
+        progress_title: Optional[str] = None,
     ) -> None:
         data, folder, case_id = self._prepare_case_data_for_export()
         if not data or not folder or not case_id:
             return
         resolved_widget_id = self._resolve_widget_id(source_widget, widget_id)
         if extension == "docx" and not self._docx_available:
-            warning = f"No se puede generar Word sin python-docx. {DOCX_MISSING_MESSAGE}"
+            warning = f"No se puede generar Word sin python-docx. {_report_builder_module.DOCX_MISSING_MESSAGE}"
             messagebox.showwarning("Informe Word no disponible", warning)
             log_event(
                 "validacion",
@@ -16149,7 +17408,7 @@ class FraudCaseApp:
             )
             return
         if extension == "pptx" and not self._pptx_available:
-            warning = f"No se puede generar la alerta temprana sin python-pptx. {PPTX_MISSING_MESSAGE}"
+            warning = f"No se puede generar la alerta temprana sin python-pptx. {_alerta_temprana_module.PPTX_MISSING_MESSAGE}"
             messagebox.showwarning("Presentación no disponible", warning)
             log_event(
                 "validacion",
@@ -16160,21 +17419,108 @@ class FraudCaseApp:
             )
             return
         report_path = self._build_report_path(data, folder, extension)
+        if progress_title and getattr(self, "root", None) is not None:
+            self._generate_report_file_in_background(
+                builder,
+                data,
+                report_path,
+                case_id,
+                extension,
+                description,
+                progress_title,
+                widget_id=resolved_widget_id,
+                source_widget=source_widget,
+            )
+            return
         try:
             created_path = builder(data, report_path)
         except Exception as exc:  # pragma: no cover - protección frente a fallos externos
-            messagebox.showerror(
-                "Error al generar informe",
-                f"No se pudo generar el informe {description.lower()}: {exc}",
-            )
-            log_event(
-                "validacion",
-                f"Error al generar informe {extension}: {exc}",
-                self.logs,
-                widget_id=resolved_widget_id,
-                action_result="failure",
-            )
+            self._report_file_failed(extension, description, exc, resolved_widget_id)
             return
+        self._report_file_created(created_path, case_id, extension, description, resolved_widget_id, source_widget)
+
+    def _generate_report_file_in_background(
+        self,
+        builder,
+        data,
+        report_path: Path,
+        case_id: str,
+        extension: str,
+        description: str,
+        progress_title: str,
+        *,
+        widget_id: Optional[str],
+        source_widget: Optional[tk.Widget],
+    ) -> None:
+        """Genera el informe en el ejecutor ``reports`` con avance y cancelación.
+
+        ``builder`` recibe ``progress_callback`` y ``cancel_event``; el avance
+        llega al diálogo por una cola que este sondea desde el hilo de Tk.
+        """
+
+        cancel_event = CancellationToken()
+        progress_queue: SimpleQueue[tuple[int, int]] = SimpleQueue()
+        dialog = ProgressDialog(self.root, progress_title, on_cancel=cancel_event.cancel)
+
+        def _progress(current: int, total: int) -> None:
+            progress_queue.put((current, total))
+
+        def _run():
+            return builder(data, report_path, progress_callback=_progress, cancel_event=cancel_event)
+
+        def _on_success(created_path):
+            dialog.close()
+            self._report_file_created(created_path, case_id, extension, description, widget_id, source_widget)
+
+        def _on_error(exc: BaseException):
+            dialog.close()
+            if isinstance(exc, CancelledError):
+                log_event(
+                    "navegacion",
+                    f"Generación de informe {extension} cancelada",
+                    self.logs,
+                    widget_id=widget_id,
+                    action_result="cancelled",
+                )
+                return
+            self._report_file_failed(extension, description, exc, widget_id)
+
+        future = run_guarded_task(
+            _run,
+            _on_success,
+            _on_error,
+            self.root,
+            category="reports",
+            priority=TASK_PRIORITY_INTERACTIVE,
+            key=("report", extension),
+            token=cancel_event,
+        )
+        dialog.track_future(future, progress_queue)
+
+    def _report_file_failed(
+        self, extension: str, description: str, exc: BaseException, widget_id: Optional[str]
+    ) -> None:
+        messagebox.showerror(
+            "Error al generar informe",
+            f"No se pudo generar el informe {description.lower()}: {exc}",
+        )
+        log_event(
+            "validacion",
+            f"Error al generar informe {extension}: {exc}",
+            self.logs,
+            widget_id=widget_id,
+            action_result="failure",
+        )
+
+    def _report_file_created(
+        self,
+        created_path: Path,
+        case_id: str,
+        extension: str,
+        description: str,
+        widget_id: Optional[str],
+        source_widget: Optional[tk.Widget],
+    ) -> None:
         self._mirror_exports_to_external_drive([created_path], case_id)
         messagebox.showinfo(
             "Informe generado",
@@ -16184,7 +17530,7 @@ class FraudCaseApp:
             "navegacion",
             f"Informe {extension} generado",
             self.logs,
-            widget_id=resolved_widget_id,
+            widget_id=widget_id,
             action_result="success",
         )
         self.flush_logs_now()
@@ -16259,21 +17605,80 @@ class FraudCaseApp:
         )
 
     def generate_alerta_temprana_ppt(self):
+        builder = build_alerta_temprana_ppt
+        progress_title = None
+        helper = self._get_llm_summary_helper()
+        if helper is not None:
+            # Con el modelo local la generación puede tardar: se hace en segundo
+            # plano con un presupuesto de tiempo y el diálogo permite cancelarla.
+            builder = partial(
+                build_alerta_temprana_ppt,
+                llm_helper=helper,
+                time_budget_s=ALERTA_TEMPRANA_LLM_TIME_BUDGET_SECONDS,
+            )
+            progress_title = "Redactando alerta temprana"
         self._run_export_action(
             getattr(self, "btn_alerta_temprana", None),
             lambda: self._generate_report_file(
                 "pptx",
-                build_alerta_temprana_ppt,
+                builder,
                 "Alerta temprana (.pptx)",
                 source_widget=self.btn_alerta_temprana,
                 widget_id="btn_alerta_temprana",
+                progress_title=progress_title,
             ),
         )
 
-    def _get_carta_generator(self) -> CartaInmediatezGenerator:
+    def set_llm_features_enabled(self, enabled: bool) -> None:
+        """Activa la redacción con el modelo local y lo precarga en segundo plano."""
+
+        self._llm_features_enabled = bool(enabled)
+        if self._llm_features_enabled:
+            self._warm_up_summary_model()
+
+    def _get_llm_summary_helper(self):
+        if not getattr(self, "_llm_features_enabled", False):
+            return None
+        if not _auto_redaccion_module.TRANSFORMERS_AVAILABLE:
+            return None
+        return _auto_redaccion_module.get_summary_helper()
+
+    def _warm_up_summary_model(self) -> None:
+        """Carga el modelo local en el ejecutor ``llm`` antes de que se necesite.
+
+        La primera generación deja de pagar la carga del tokenizador y los
+        pesos; la clave fija hace que abrir la pestaña varias veces no encole
+        más de una precarga.
+        """
+
+        helper = self._get_llm_summary_helper()
+        root = getattr(self, "root", None)
+        if helper is None or root is None or getattr(helper, "is_ready", False):
+            return
+
+        def _on_success(ready: bool) -> None:
+            if not ready:
+                log_event("validacion", "No se pudo precargar el modelo de resúmenes.", self.logs)
+
+        def _on_error(exc: BaseException) -> None:
+            log_event("validacion", f"Falló la precarga del modelo de resúmenes: {exc}", self.logs)
+
+        run_guarded_task(
+            helper.warm_up,
+            _on_success,
+            _on_error,
+            root,
+            category="llm",
+            priority=TASK_PRIORITY_BACKGROUND,
+            key="llm_warmup",
+        )
+
+    def _get_carta_generator(self) -> "CartaInmediatezGenerator":
         if self._carta_generator is None:
             external_dir = self._get_external_drive_path()
-            self._carta_generator = CartaInmediatezGenerator(Path(EXPORTS_DIR), external_dir)
+            self._carta_generator = _carta_inmediatez_module.CartaInmediatezGenerator(
+                Path(EXPORTS_DIR), external_dir
+            )
         return self._carta_generator
 
     def _collect_carta_candidates(self) -> list[dict[str, str]]:
@@ -16446,7 +17851,7 @@ class FraudCaseApp:
         data = self.gather_data()
         try:
             result = self._get_carta_generator().generate_cartas(data, members)
-        except CartaInmediatezError as exc:
+        except _carta_inmediatez_module.CartaInmediatezError as exc:
             message = str(exc)
             if not getattr(self, "_suppress_messagebox", False):
                 messagebox.showerror("No se pudo generar la carta", message)
@@ -16788,6 +18193,8 @@ class FraudCaseApp:
             on_error,
             root,
             category="reports",
+            priority=TASK_PRIORITY_INTERACTIVE,
+            key="save_send",
         )
         return self._save_send_future
 
@@ -16897,7 +18304,12 @@ class FraudCaseApp:
                 continue
             destination = case_folder / source.name
             try:
-                shutil.copy2(source, destination)
+                if source.name.startswith("h_"):
+                    # Una reposición en segundo plano puede estar anexando al mismo histórico.
+                    with self._history_file_lock(destination):
+                        shutil.copy2(source, destination)
+                else:
+                    shutil.copy2(source, destination)
             except OSError as exc:
                 failures.append((source, exc))
                 log_event(
@@ -16945,11 +18357,14 @@ class FraudCaseApp:
             # Crea un archivo como ``2025-0001_temp_20251114_154501.json`` con
             # el contenido completo del formulario.
         """
-        data = self._ensure_case_data(data or self.gather_data())
+        profiler = get_profiler()
+        with profiler.span("temp.gather", "autosave"):
+            data = self._ensure_case_data(data or self.gather_data())
         now = datetime.now()
         if self._last_temp_saved_at and now <= self._last_temp_saved_at:
             now = self._last_temp_saved_at + timedelta(seconds=1)
-        signature = self._compute_temp_signature(data)
+        with profiler.span("temp.signature", "autosave"):
+            signature = self._compute_temp_signature(data)
         if not self._should_persist_temp(signature, now):
             return
         timestamp = now.strftime("%Y%m%d_%H%M%S")
@@ -16961,65 +18376,67 @@ class FraudCaseApp:
             timestamp = now.strftime("%Y%m%d_%H%M%S")
             filename = f"{case_id}_temp_{timestamp}.json"
             target_path = Path(BASE_DIR) / filename
-        json_payload = json.dumps(data.as_dict(), ensure_ascii=False, indent=2)
+        with profiler.span("temp.serialize", "autosave"):
+            json_payload = json.dumps(data.as_dict(), ensure_ascii=False, indent=2)
         primary_written = False
         preserved = set()
         external_written = False
-        try:
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-        except OSError as exc:
-            log_event(
-                "validacion",
-                f"No se pudo preparar la carpeta local para la versión temporal: {exc}",
-                self.logs,
-            )
-        else:
-            try:
-                target_path.write_text(json_payload, encoding='utf-8')
-                primary_written = True
-                preserved.add(filename)
-            except OSError as ex:
-                # Registrar en el log pero no interrumpir
-                log_event(
-                    "validacion",
-                    f"Error guardando versión temporal en la carpeta principal: {ex}",
-                    self.logs,
-                )
-        external_base = self._get_external_drive_path()
-        if external_base:
-            case_folder = Path(external_base) / case_id
+        with profiler.span("temp.write", "autosave"):
             try:
-                case_folder.mkdir(parents=True, exist_ok=True)
+                target_path.parent.mkdir(parents=True, exist_ok=True)
             except OSError as exc:
                 log_event(
                     "validacion",
-                    f"No se pudo preparar la carpeta externa para {case_id}: {exc}",
+                    f"No se pudo preparar la carpeta local para la versión temporal: {exc}",
                     self.logs,
                 )
             else:
-                mirror_path = case_folder / filename
-                if primary_written:
-                    try:
-                        shutil.copy2(target_path, mirror_path)
-                        preserved.add(filename)
-                        external_written = True
-                    except OSError as exc:
-                        log_event(
-                            "validacion",
-                            f"No se pudo copiar la versión temporal a la carpeta externa: {exc}",
-                            self.logs,
-                        )
-                if not primary_written or not external_written:
-                    try:
-                        mirror_path.write_text(json_payload, encoding='utf-8')
-                        preserved.add(filename)
-                        external_written = True
-                    except OSError as exc:
-                        log_event(
-                            "validacion",
-                            f"No se pudo escribir la versión temporal en la carpeta externa: {exc}",
-                            self.logs,
-                        )
+                try:
+                    target_path.write_text(json_payload, encoding='utf-8')
+                    primary_written = True
+                    preserved.add(filename)
+                except OSError as ex:
+                    # Registrar en el log pero no interrumpir
+                    log_event(
+                        "validacion",
+                        f"Error guardando versión temporal en la carpeta principal: {ex}",
+                        self.logs,
+                    )
+            external_base = self._get_external_drive_path()
+            if external_base:
+                case_folder = Path(external_base) / case_id
+                try:
+                    case_folder.mkdir(parents=True, exist_ok=True)
+                except OSError as exc:
+                    log_event(
+                        "validacion",
+                        f"No se pudo preparar la carpeta externa para {case_id}: {exc}",
+                        self.logs,
+                    )
+                else:
+                    mirror_path = case_folder / filename
+                    if primary_written:
+                        try:
+                            shutil.copy2(target_path, mirror_path)
+                            preserved.add(filename)
+                            external_written = True
+                        except OSError as exc:
+                            log_event(
+                                "validacion",
+                                f"No se pudo copiar la versión temporal a la carpeta externa: {exc}",
+                                self.logs,
+                            )
+                    if not primary_written or not external_written:
+                        try:
+                            mirror_path.write_text(json_payload, encoding='utf-8')
+                            preserved.add(filename)
+                            external_written = True
+                        except OSError as exc:
+                            log_event(
+                                "validacion",
+                                f"No se pudo escribir la versión temporal en la carpeta externa: {exc}",
+                                self.logs,
+                            )
         if primary_written or external_written:
             self._last_temp_saved_at = now
             self._last_temp_signature = signature
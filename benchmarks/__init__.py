@@ -0,0 +1 @@
+"""Pruebas de rendimiento de las rutas críticas de la aplicación."""
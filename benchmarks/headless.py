@@ -0,0 +1,139 @@
+"""Instancias de ``FraudCaseApp`` sin Tk cargadas con un caso sintético.
+
+Reutiliza ``build_headless_app`` de las pruebas de validación y los stubs de
+``tests/stubs.py``: los marcos del formulario se sustituyen por objetos que
+devuelven las filas del caso sintético, de modo que ``gather_data``,
+``validate_data`` y el refresco del resumen recorren el código real.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from contextlib import contextmanager
+from tkinter import messagebox
+
+from tests.app_factory import SummaryTableStub
+from tests.stubs import DummyVar, RichTextWidgetStub
+from tests.test_validation import build_headless_app
+
+from benchmarks.synthetic_case import PRODUCT_TYPE
+
+_ANALYSIS_WIDGETS = {
+    "antecedentes": "antecedentes_text",
+    "modus_operandi": "modus_text",
+    "hallazgos": "hallazgos_text",
+    "descargos": "descargos_text",
+    "conclusiones": "conclusiones_text",
+    "recomendaciones": "recomendaciones_text",
+    "comentario_breve": "comentario_breve_text",
+    "comentario_amplio": "comentario_amplio_text",
+}
+_CASE_VARS = {
+    "id_caso_var": "id_caso",
+    "id_proceso_var": "id_proceso",
+    "tipo_informe_var": "tipo_informe",
+    "cat_caso1_var": "categoria1",
+    "cat_caso2_var": "categoria2",
+    "mod_caso_var": "modalidad",
+    "canal_caso_var": "canal",
+    "proceso_caso_var": "proceso",
+    "fecha_caso_var": "fecha_de_ocurrencia",
+    "fecha_descubrimiento_caso_var": "fecha_de_descubrimiento",
+    "centro_costo_caso_var": "centro_costo",
+}
+
+
+class RowFrame:
+    """Marco de formulario que expone una fila como variables ``<campo>_var``."""
+
+    def __init__(self, row: Mapping, id_field: str):
+        self._row = dict(row)
+        for key, value in self._row.items():
+            setattr(self, f"{key}_var", DummyVar(value))
+        self.id_var = DummyVar(self._row.get(id_field, ""))
+
+    def get_data(self):
+        return dict(self._row)
+
+
+class ProductRowFrame(RowFrame):
+    """Marco de producto con sus reclamos e involucramientos."""
+
+    def __init__(self, product: Mapping, claims: list, involvements: list):
+        super().__init__(product, "id_producto")
+        self.tipo_prod_var = DummyVar(product.get("tipo_producto", PRODUCT_TYPE))
+        self._claims = claims
+        self._collaborators = [inv for inv in involvements if inv.get("tipo_involucrado") == "colaborador"]
+        self._clients = [inv for inv in involvements if inv.get("tipo_involucrado") == "cliente"]
+
+    def get_data(self):
+        return {
+            "producto": dict(self._row),
+            "reclamos": [dict(claim) for claim in self._claims],
+            "asignaciones": [dict(inv) for inv in self._collaborators + self._clients],
+            "asignaciones_colaboradores": [dict(inv) for inv in self._collaborators],
+            "asignaciones_clientes": [dict(inv) for inv in self._clients],
+        }
+
+
+def build_case_app(case: Mapping):
+    """Devuelve una instancia sin interfaz cuyo formulario contiene ``case``."""
+
+    app = build_headless_app(PRODUCT_TYPE)
+    for attr, key in _CASE_VARS.items():
+        setattr(app, attr, DummyVar(case["caso"].get(key, "")))
+    claims_by_product: dict[str, list] = {}
+    for claim in case.get("reclamos", []):
+        claims_by_product.setdefault(claim["id_producto"], []).append(claim)
+    involvements_by_product: dict[str, list] = {}
+    for involvement in case.get("involucramientos", []):
+        involvements_by_product.setdefault(involvement["id_producto"], []).append(involvement)
+    app.client_frames = [RowFrame(row, "id_cliente") for row in case.get("clientes", [])]
+    app.team_frames = [RowFrame(row, "id_colaborador") for row in case.get("colaboradores", [])]
+    app.product_frames = [
+        ProductRowFrame(
+            product,
+            claims_by_product.get(product["id_producto"], []),
+            involvements_by_product.get(product["id_producto"], []),
+        )
+        for product in case.get("productos", [])
+    ]
+    app.risk_frames = [RowFrame(row, "id_riesgo") for row in case.get("riesgos", [])]
+    app.norm_frames = [RowFrame(row, "id_norma") for row in case.get("normas", [])]
+    for section, attr in _ANALYSIS_WIDGETS.items():
+        payload = case.get("analisis", {}).get(section) or {}
+        setattr(app, attr, RichTextWidgetStub(payload.get("text", "")))
+    return app
+
+
+def attach_summary_tables(app) -> None:
+    """Prepara tablas de resumen vacías para ``refresh_summary_tables``."""
+
+    app.summary_config = {
+        "clientes": [(name, name) for name in ("id_cliente", "nombres", "apellidos", "tipo_id", "flag")],
+        "colaboradores": [(name, name) for name, _label in app.COLLABORATOR_SUMMARY_COLUMNS],
+        "involucramientos": [(name, name) for name in ("id_producto", "tipo_involucrado", "id_colaborador")],
+        "productos": [(name, name) for name in ("id_producto", "id_cliente", "tipo_producto", "monto_investigado", "id_reclamo")],
+        "riesgos": [(name, name) for name in ("id_riesgo", "id_caso", "criticidad")],
+        "reclamos": [(name, name) for name in ("id_reclamo", "id_caso", "id_producto")],
+        "normas": [(name, name) for name in ("id_norma", "id_caso", "descripcion")],
+    }
+    app.summary_tables = {key: SummaryTableStub() for key in app.summary_config}
+    app._summary_refresh_after_id = None
+    app._summary_dirty_sections = set()
+    app._summary_pending_dataset = None
+
+
+@contextmanager
+def silence_dialogs():
+    """Sustituye los cuadros de diálogo por funciones vacías durante la medición."""
+
+    names = ("showinfo", "showwarning", "showerror", "askyesno")
+    originals = {name: getattr(messagebox, name) for name in names}
+    try:
+        for name in names:
+            setattr(messagebox, name, lambda *_args, **_kwargs: True)
+        yield
+    finally:
+        for name, original in originals.items():
+            setattr(messagebox, name, original)
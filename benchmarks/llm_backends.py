@@ -0,0 +1,270 @@
+"""Compara los backends ``fp32`` e ``int8`` del modelo local de resúmenes.
+
+Uso:
+    python -m benchmarks.llm_backends                       # modelo diminuto generado al vuelo
+    python -m benchmarks.llm_backends --model "external drive/mrm8488/bert2bert_shared-spanish-finetuned-summarization"
+    python -m benchmarks.llm_backends --threads 4 --repeat 5 --json
+
+Sin ``--model`` se crea en una carpeta temporal un bert2bert de dos capas con
+un vocabulario armado desde ``SPANISH_CORPUS``, así que corre sin conexión y
+en segundos; sirve para verificar el flujo y la concordancia, no para medir
+la aceleración real, que solo se aprecia con el modelo completo.
+
+Para cada backend se mide la carga en frío y la carga repetida (con ``int8``
+la segunda lee los pesos ya cuantizados), y la mediana de ``--repeat``
+pasadas de generación sobre el corpus. La concordancia compara las salidas
+de ``int8`` con las de ``fp32``: fracción de textos idénticos y fracción de
+tokens coincidentes por posición.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Sequence, TextIO
+
+
+def _ensure_repo_root_on_path() -> None:
+    repo_root = Path(__file__).resolve().parents[1]
+    if str(repo_root) not in sys.path:
+        sys.path.insert(0, str(repo_root))
+
+
+_ensure_repo_root_on_path()
+
+from utils.llm_backend import (BACKEND_FP32, BACKENDS,  # noqa: E402
+                               configure_torch_threads, inference_context,
+                               load_seq2seq_model)
+
+SPANISH_CORPUS = (
+    "El cliente reportó tres transferencias no reconocidas desde su banca por internet durante la madrugada.",
+    "La agencia de Miraflores registró un retiro en ventanilla con un documento de identidad adulterado.",
+    "El colaborador modificó los datos de contacto del titular antes de solicitar la reposición de la tarjeta.",
+    "Se detectaron compras por montos bajos en comercios del extranjero antes de una compra de alto valor.",
+    "El reclamo fue atendido fuera de plazo y el monto perdido se abonó luego de la investigación.",
+    "La falta de doble validación en el cambio de clave permitió el acceso del tercero a la cuenta.",
+    "Se recomienda reforzar el control de biometría en la apertura de productos en canales digitales.",
+    "El analista concluyó que el fraude se originó en una llamada de suplantación al cliente.",
+)
+
+
+@dataclass
+class BackendResult:
+    backend: str
+    load_seconds: list[float] = field(default_factory=list)
+    samples: list[float] = field(default_factory=list)
+    outputs: list[str] = field(default_factory=list)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples) if self.samples else 0.0
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "load_cold_s": round(self.load_seconds[0], 4) if self.load_seconds else None,
+            "load_warm_s": round(self.load_seconds[-1], 4) if self.load_seconds else None,
+            "median_s": round(self.median, 4),
+            "best_s": round(min(self.samples), 4) if self.samples else None,
+        }
+
+
+def build_tiny_model(directory: Path, *, seed: int = 0) -> Path:
+    """Guarda en ``directory`` un bert2bert diminuto con vocabulario del corpus."""
+
+    import torch
+    from transformers import (BertConfig, BertTokenizer, EncoderDecoderConfig,
+                              EncoderDecoderModel)
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    words = sorted({token for text in SPANISH_CORPUS for token in re.findall(r"\w+|[^\w\s]", text.lower())})
+    vocab_path = directory / "vocab.txt"
+    vocab_path.write_text("\n".join(["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", *words]) + "\n", encoding="utf-8")
+    tokenizer = BertTokenizer(str(vocab_path), do_lower_case=True, strip_accents=False)
+
+    torch.manual_seed(seed)
+    sizes = dict(
+        vocab_size=tokenizer.vocab_size,
+        hidden_size=64,
+        num_hidden_layers=2,
+        num_attention_heads=2,
+        intermediate_size=128,
+        max_position_embeddings=128,
+    )
+    config = EncoderDecoderConfig.from_encoder_decoder_configs(BertConfig(**sizes), BertConfig(**sizes))
+    config.decoder_start_token_id = tokenizer.cls_token_id
+    config.pad_token_id = tokenizer.pad_token_id
+    config.eos_token_id = tokenizer.sep_token_id
+    model = EncoderDecoderModel(config=config)
+    generation_config = getattr(model, "generation_config", None)
+    if generation_config is not None:
+        generation_config.decoder_start_token_id = tokenizer.cls_token_id
+        generation_config.pad_token_id = tokenizer.pad_token_id
+        generation_config.eos_token_id = tokenizer.sep_token_id
+    model.save_pretrained(str(directory))
+    tokenizer.save_pretrained(str(directory))
+    return directory
+
+
+def output_agreement(reference: Sequence[str], candidate: Sequence[str]) -> dict[str, float]:
+    """Fracción de salidas idénticas y de tokens coincidentes por posición."""
+
+    if not reference:
+        return {"exact": 1.0, "tokens": 1.0}
+    exact = sum(1 for left, right in zip(reference, candidate) if left == right)
+    token_scores = []
+    for left, right in zip(reference, candidate):
+        left_tokens, right_tokens = left.split(), right.split()
+        longest = max(len(left_tokens), len(right_tokens))
+        if not longest:
+            token_scores.append(1.0)
+            continue
+        same = sum(1 for a, b in zip(left_tokens, right_tokens) if a == b)
+        token_scores.append(same / longest)
+    return {
+        "exact": round(exact / len(reference), 4),
+        "tokens": round(statistics.fmean(token_scores) if token_scores else 0.0, 4),
+    }
+
+
+def _generate_corpus(model, tokenizer, corpus: Sequence[str], *, max_new_tokens: int, num_beams: int) -> list[str]:
+    outputs = []
+    with inference_context():
+        for text in corpus:
+            encoded = tokenizer(text, return_tensors="pt", truncation=True)
+            generated = model.generate(
+                input_ids=encoded["input_ids"],
+                attention_mask=encoded["attention_mask"],
+                max_new_tokens=max_new_tokens,
+                num_beams=num_beams,
+                do_sample=False,
+            )
+            outputs.append(tokenizer.decode(generated[0], skip_special_tokens=True).strip())
+    return outputs
+
+
+def benchmark_backend(
+    model_ref: str | Path,
+    backend: str,
+    *,
+    corpus: Sequence[str] = SPANISH_CORPUS,
+    repeat: int = 3,
+    num_threads: Optional[int] = None,
+    max_new_tokens: int = 32,
+    num_beams: int = 1,
+    cache_dir: Optional[Path] = None,
+) -> BackendResult:
+    result = BackendResult(backend)
+    model = tokenizer = None
+    for _attempt in range(2):
+        start = time.perf_counter()
+        model, tokenizer = load_seq2seq_model(
+            model_ref,
+            backend=backend,
+            num_threads=num_threads,
+            cache_dir=cache_dir,
+            local_files_only=True,
+        )
+        result.load_seconds.append(time.perf_counter() - start)
+    # Pasada de calentamiento: asignación de memoria y selección de kernels.
+    _generate_corpus(model, tokenizer, corpus[:1], max_new_tokens=max_new_tokens, num_beams=num_beams)
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        result.outputs = _generate_corpus(model, tokenizer, corpus, max_new_tokens=max_new_tokens, num_beams=num_beams)
+        result.samples.append(time.perf_counter() - start)
+    return result
+
+
+def run_benchmark(
+    model_ref: str | Path,
+    *,
+    backends: Sequence[str] = BACKENDS,
+    repeat: int = 3,
+    num_threads: Optional[int] = None,
+    max_new_tokens: int = 32,
+    num_beams: int = 1,
+    cache_dir: Optional[Path] = None,
+) -> dict[str, object]:
+    threads = configure_torch_threads(num_threads)
+    results = {
+        backend: benchmark_backend(
+            model_ref,
+            backend,
+            repeat=repeat,
+            num_threads=threads,
+            max_new_tokens=max_new_tokens,
+            num_beams=num_beams,
+            cache_dir=cache_dir,
+        )
+        for backend in backends
+    }
+    report: dict[str, object] = {
+        "model": str(model_ref),
+        "threads": threads,
+        "corpus_size": len(SPANISH_CORPUS),
+        "backends": {name: result.to_dict() for name, result in results.items()},
+    }
+    reference = results.get(BACKEND_FP32)
+    if reference is not None:
+        for name, result in results.items():
+            if name == BACKEND_FP32:
+                continue
+            entry = report["backends"][name]
+            entry["speedup"] = round(reference.median / result.median, 3) if result.median else None
+            entry["agreement"] = output_agreement(reference.outputs, result.outputs)
+    return report
+
+
+def _print_report(report: dict[str, object], stream: TextIO) -> None:
+    print(f"Modelo: {report['model']} · hilos: {report['threads']} · textos: {report['corpus_size']}", file=stream)
+    print(f"{'backend':8} {'carga fría':>10} {'carga':>8} {'mediana':>8} {'x fp32':>7} {'iguales':>8} {'tokens':>7}", file=stream)
+    for name, entry in report["backends"].items():
+        agreement = entry.get("agreement") or {}
+        speedup = entry.get("speedup")
+        print(
+            f"{name:8} {entry['load_cold_s']:>9.3f}s {entry['load_warm_s']:>7.3f}s {entry['median_s']:>7.3f}s"
+            f" {(f'{speedup:.2f}' if speedup else '-'):>7} {agreement.get('exact', 1.0):>8.0%}"
+            f" {agreement.get('tokens', 1.0):>7.0%}",
+            file=stream,
+        )
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Latencia y concordancia de los backends del modelo local.")
+    parser.add_argument("--model", type=Path, default=None, help="Carpeta del modelo (por defecto, uno diminuto).")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--threads", type=int, default=None, help="Hilos de PyTorch (0 o vacío: todos).")
+    parser.add_argument("--max-new-tokens", type=int, default=32)
+    parser.add_argument("--num-beams", type=int, default=1)
+    parser.add_argument("--json", action="store_true", help="Imprime el resultado como JSON.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None, stream: TextIO = sys.stdout) -> int:
+    args = parse_args(argv)
+    with tempfile.TemporaryDirectory(prefix="llm_bench_") as workdir:
+        model_ref = args.model or build_tiny_model(Path(workdir) / "tiny_bert2bert")
+        report = run_benchmark(
+            model_ref,
+            repeat=args.repeat,
+            num_threads=args.threads,
+            max_new_tokens=args.max_new_tokens,
+            num_beams=args.num_beams,
+        )
+    if args.json:
+        json.dump(report, stream, ensure_ascii=False, indent=2)
+        stream.write("\n")
+    else:
+        _print_report(report, stream)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,209 @@
+"""Ejecuta los escenarios de rendimiento y los compara con la línea base.
+
+Uso:
+    python -m benchmarks.run                      # perfil "default"
+    python -m benchmarks.run --profile full       # incluye la importación de 100k filas
+    python -m benchmarks.run --only gather_data --only build_md
+    python -m benchmarks.run --update-baseline    # guarda los tiempos como nueva línea base
+
+Cada escenario se ejecuta una vez para calentar y luego ``--repeat`` veces;
+se compara la mediana con ``benchmarks/baselines/<perfil>.json`` y se marca
+como regresión si supera la línea base en más de ``--tolerance`` (por
+defecto 25 %) y por al menos ``MIN_REGRESSION_SECONDS``. El proceso termina
+con código 1 si hay regresiones.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional, Sequence, TextIO
+
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+DEFAULT_TOLERANCE = 0.25
+DEFAULT_REPEAT = 5
+# Diferencias menores que esto son ruido de medición aunque superen el margen relativo.
+MIN_REGRESSION_SECONDS = 0.002
+
+
+def _ensure_repo_root_on_path() -> None:
+    repo_root = Path(__file__).resolve().parents[1]
+    if str(repo_root) not in sys.path:
+        sys.path.insert(0, str(repo_root))
+
+
+_ensure_repo_root_on_path()
+
+from benchmarks.headless import silence_dialogs  # noqa: E402
+from benchmarks.scenarios import PROFILES, build_scenarios  # noqa: E402
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    samples: list[float] = field(default_factory=list)
+    skipped: bool = False
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples) if self.samples else 0.0
+
+    @property
+    def best(self) -> float:
+        return min(self.samples) if self.samples else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "median": round(self.median, 6),
+            "min": round(self.best, 6),
+            "repeat": len(self.samples),
+        }
+
+
+@dataclass
+class Comparison:
+    name: str
+    current: float
+    baseline: Optional[float]
+    tolerance: float
+
+    @property
+    def ratio(self) -> Optional[float]:
+        if not self.baseline:
+            return None
+        return self.current / self.baseline
+
+    @property
+    def regressed(self) -> bool:
+        ratio = self.ratio
+        if ratio is None or self.current - self.baseline < MIN_REGRESSION_SECONDS:
+            return False
+        return ratio > 1 + self.tolerance
+
+
+def run_scenarios(
+    profile_name: str = "default",
+    *,
+    repeat: int = DEFAULT_REPEAT,
+    only: Optional[Iterable[str]] = None,
+    workdir: Optional[Path] = None,
+) -> list[ScenarioResult]:
+    """Ejecuta los escenarios del perfil y devuelve sus tiempos en segundos."""
+
+    profile = PROFILES[profile_name]
+    selected = set(only or ())
+    results = []
+    with tempfile.TemporaryDirectory(prefix="benchmarks_") as tmp, silence_dialogs():
+        root = Path(workdir or tmp)
+        for name, factory in build_scenarios(profile).items():
+            if selected and name not in selected:
+                continue
+            scenario_dir = root / name
+            scenario_dir.mkdir(parents=True, exist_ok=True)
+            thunk = factory(profile, scenario_dir)
+            result = ScenarioResult(name)
+            if thunk is None:
+                result.skipped = True
+                results.append(result)
+                continue
+            thunk()
+            for _ in range(max(repeat, 1)):
+                started = time.perf_counter()
+                thunk()
+                result.samples.append(time.perf_counter() - started)
+            results.append(result)
+    return results
+
+
+def baseline_path(profile_name: str, directory: Path = BASELINE_DIR) -> Path:
+    return Path(directory) / f"{profile_name}.json"
+
+
+def load_baseline(path: Path) -> dict[str, dict]:
+    if not path.exists():
+        return {}
+    with path.open("r", encoding="utf-8") as handle:
+        payload = json.load(handle)
+    return payload.get("results", {})
+
+
+def save_baseline(path: Path, profile_name: str, results: Sequence[ScenarioResult]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "profile": profile_name,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": {result.name: result.as_dict() for result in results if not result.skipped},
+    }
+    with path.open("w", encoding="utf-8") as handle:
+        json.dump(payload, handle, ensure_ascii=False, indent=2, sort_keys=True)
+        handle.write("\n")
+
+
+def compare(
+    results: Sequence[ScenarioResult], baseline: dict[str, dict], tolerance: float = DEFAULT_TOLERANCE
+) -> list[Comparison]:
+    comparisons = []
+    for result in results:
+        if result.skipped:
+            continue
+        reference = baseline.get(result.name) or {}
+        comparisons.append(Comparison(result.name, result.median, reference.get("median"), tolerance))
+    return comparisons
+
+
+def render_report(
+    results: Sequence[ScenarioResult], comparisons: Sequence[Comparison], stream: TextIO
+) -> None:
+    by_name = {comparison.name: comparison for comparison in comparisons}
+    print(f"{'escenario':<28} {'mediana':>10} {'mínimo':>10} {'base':>10} {'cambio':>8}", file=stream)
+    for result in results:
+        if result.skipped:
+            print(f"{result.name:<28} {'omitido (dependencia opcional ausente)':>40}", file=stream)
+            continue
+        comparison = by_name.get(result.name)
+        baseline = f"{comparison.baseline * 1000:.1f}" if comparison and comparison.baseline else "-"
+        change = f"{(comparison.ratio - 1) * 100:+.0f}%" if comparison and comparison.ratio else "nuevo"
+        flag = "  REGRESIÓN" if comparison and comparison.regressed else ""
+        print(
+            f"{result.name:<28} {result.median * 1000:>8.1f}ms {result.best * 1000:>8.1f}ms "
+            f"{baseline:>8}ms {change:>8}{flag}",
+            file=stream,
+        )
+
+
+def main(argv: list[str] | None = None, stream: TextIO | None = None) -> int:
+    stream = stream or sys.stdout
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="default")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--only", action="append", help="Ejecuta solo este escenario; puede repetirse.")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Margen de regresión (0.25 = 25 %%).")
+    parser.add_argument("--baseline-dir", type=Path, default=BASELINE_DIR)
+    parser.add_argument("--update-baseline", action="store_true", help="Guarda los tiempos como línea base.")
+    args = parser.parse_args(argv)
+
+    results = run_scenarios(args.profile, repeat=args.repeat, only=args.only)
+    path = baseline_path(args.profile, args.baseline_dir)
+    comparisons = compare(results, load_baseline(path), args.tolerance)
+    render_report(results, comparisons, stream)
+    if args.update_baseline:
+        save_baseline(path, args.profile, results)
+        print(f"Línea base actualizada en {path}", file=stream)
+        return 0
+    regressions = [comparison.name for comparison in comparisons if comparison.regressed]
+    if regressions:
+        print(f"Regresiones por encima del {args.tolerance:.0%}: {', '.join(regressions)}", file=stream)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
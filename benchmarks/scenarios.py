@@ -0,0 +1,183 @@
+"""Escenarios de rendimiento sobre las rutas críticas.
+
+Cada escenario recibe el perfil de tamaños y una carpeta temporal, prepara
+sus datos fuera de la medición y devuelve la función que se cronometra.
+Los escenarios que dependen de un módulo opcional devuelven ``None`` cuando
+no está instalado y el ejecutor los informa como omitidos.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Callable, Optional
+
+from benchmarks.headless import attach_summary_tables, build_case_app
+from benchmarks.synthetic_case import (CaseSize, combined_rows,
+                                       generate_case, write_combined_csv,
+                                       write_detail_catalogs)
+from report.case_data import CaseData
+from utils.lazy_loader import module_available
+
+
+@dataclass(frozen=True)
+class Profile:
+    """Tamaños de datos de una ejecución."""
+
+    name: str
+    case: CaseSize
+    combined_rows: tuple[int, ...]
+    catalog_rows: int
+
+
+PROFILES = {
+    # Perfil mínimo para comprobar que los escenarios siguen funcionando.
+    "smoke": Profile("smoke", CaseSize(clients=10, collaborators=5, products=20, risks=3, norms=3, analysis_paragraphs=3), (200,), 500),
+    "default": Profile("default", CaseSize(), (10_000,), 20_000),
+    "full": Profile("full", replace(CaseSize(), clients=1000, collaborators=400, products=2000), (10_000, 100_000), 100_000),
+}
+
+Thunk = Callable[[], object]
+ScenarioFactory = Callable[[Profile, Path], Optional[Thunk]]
+
+
+def _case(profile: Profile) -> dict:
+    return generate_case(profile.case)
+
+
+def _case_data(profile: Profile) -> CaseData:
+    return CaseData.from_mapping(_case(profile))
+
+
+def gather_data(profile: Profile, _workdir: Path) -> Thunk:
+    return build_case_app(_case(profile)).gather_data
+
+
+def validate_data(profile: Profile, _workdir: Path) -> Thunk:
+    return build_case_app(_case(profile)).validate_data
+
+
+def compute_temp_signature(profile: Profile, _workdir: Path) -> Thunk:
+    app = build_case_app(_case(profile))
+    data = app.gather_data()
+    return lambda: app._compute_temp_signature(data)
+
+
+def summary_refresh(profile: Profile, _workdir: Path) -> Thunk:
+    app = build_case_app(_case(profile))
+    attach_summary_tables(app)
+    return app.refresh_summary_tables
+
+
+def build_event_rows(profile: Profile, _workdir: Path) -> Thunk:
+    import report_builder
+
+    data = _case_data(profile)
+    return lambda: report_builder.build_event_rows(data)
+
+
+def build_llave_tecnica_rows(profile: Profile, _workdir: Path) -> Thunk:
+    import report_builder
+
+    data = _case_data(profile)
+    return lambda: report_builder.build_llave_tecnica_rows(data)
+
+
+def build_md(profile: Profile, _workdir: Path) -> Thunk:
+    import report_builder
+
+    data = _case_data(profile)
+    return lambda: report_builder.build_md(data)
+
+
+def build_docx(profile: Profile, workdir: Path) -> Optional[Thunk]:
+    if not module_available("docx"):
+        return None
+    import report_builder
+
+    data = _case_data(profile)
+    target = workdir / "benchmark.docx"
+    return lambda: report_builder.build_docx(data, target)
+
+
+def _text_cells(profile: Profile) -> list[str]:
+    """Celdas de importación y párrafos del análisis, como llegan a los validadores."""
+
+    cells = [str(value) for row in combined_rows(profile.catalog_rows) for value in row.values()]
+    analysis = _case(profile)["analisis"]
+    cells.extend(str(section.get("text", "")) for section in analysis.values() if isinstance(section, dict))
+    return cells
+
+
+def text_sanitize(profile: Profile, _workdir: Path) -> Thunk:
+    from validators import sanitize_rich_text
+
+    cells = _text_cells(profile)
+    return lambda: [sanitize_rich_text(cell, max_chars=None) for cell in cells]
+
+
+def text_normalize(profile: Profile, _workdir: Path) -> Thunk:
+    from validators import normalize_without_accents
+
+    cells = _text_cells(profile)
+    return lambda: [normalize_without_accents(cell) for cell in cells]
+
+
+def _combined_import(row_count: int) -> ScenarioFactory:
+    def factory(_profile: Profile, workdir: Path) -> Thunk:
+        from tests.app_factory import build_import_app
+        from utils.mass_import_manager import MassImportManager
+
+        csv_path = write_combined_csv(workdir / f"combinado_{row_count}.csv", row_count)
+
+        def run():
+            # Cada repetición parte de un formulario vacío, como una importación real.
+            app = build_import_app(None)
+            app.mass_import_manager = MassImportManager(workdir / "logs")
+            app._import_feedback_log_path = workdir / "logs" / "log_errores_carga.csv"
+            app.import_combined(filename=str(csv_path))
+            return app
+
+        return run
+
+    return factory
+
+
+def _catalog_refresh(warm: bool) -> ScenarioFactory:
+    def factory(profile: Profile, workdir: Path) -> Thunk:
+        from models import CatalogService
+
+        rows = profile.catalog_rows
+        folder = write_detail_catalogs(
+            workdir / "catalogos", clients=rows, collaborators=max(rows // 4, 1), products=rows
+        )
+        if warm:
+            service = CatalogService(folder, use_cache=False)
+            service.refresh()
+            return service.refresh
+        return lambda: CatalogService(folder, use_cache=False).refresh()
+
+    return factory
+
+
+def build_scenarios(profile: Profile) -> dict[str, ScenarioFactory]:
+    """Devuelve los escenarios del perfil en el orden en que se ejecutan."""
+
+    scenarios: dict[str, ScenarioFactory] = {
+        "gather_data": gather_data,
+        "validate_data": validate_data,
+        "compute_temp_signature": compute_temp_signature,
+        "summary_refresh": summary_refresh,
+        "build_event_rows": build_event_rows,
+        "build_llave_tecnica_rows": build_llave_tecnica_rows,
+        "build_md": build_md,
+        "build_docx": build_docx,
+        "catalog_refresh_cold": _catalog_refresh(warm=False),
+        "catalog_refresh_warm": _catalog_refresh(warm=True),
+        "text_sanitize": text_sanitize,
+        "text_normalize": text_normalize,
+    }
+    for row_count in profile.combined_rows:
+        label = f"{row_count // 1000}k" if row_count >= 1000 else str(row_count)
+        scenarios[f"import_combined_{label}"] = _combined_import(row_count)
+    return scenarios
@@ -0,0 +1,339 @@
+"""Generador de casos sintéticos grandes para las pruebas de rendimiento.
+
+Los valores respetan los catálogos de ``settings`` y los formatos de
+``validators`` para que las validaciones recorran las mismas ramas que con
+un caso real. La semilla fija hace que dos ejecuciones generen exactamente
+el mismo caso y los tiempos sean comparables con la línea base.
+"""
+
+from __future__ import annotations
+
+import csv
+import random
+from dataclasses import dataclass
+from pathlib import Path
+
+from settings import (ACCIONADO_OPTIONS, CANAL_LIST, CRITICIDAD_LIST,
+                      FLAG_CLIENTE_LIST, FLAG_COLABORADOR_LIST, PROCESO_LIST,
+                      TAXONOMIA, TIPO_FALTA_LIST, TIPO_ID_LIST,
+                      TIPO_INFORME_LIST, TIPO_MONEDA_LIST, TIPO_SANCION_LIST)
+
+CASE_ID = "2025-0001"
+PRODUCT_TYPE = "Crédito personal"
+ANALYSIS_SECTIONS = (
+    "antecedentes",
+    "modus_operandi",
+    "hallazgos",
+    "descargos",
+    "conclusiones",
+    "recomendaciones",
+)
+COMBINED_HEADER = (
+    "id_producto",
+    "id_cliente",
+    "tipo_producto",
+    "categoria1",
+    "categoria2",
+    "modalidad",
+    "canal",
+    "proceso",
+    "fecha_ocurrencia",
+    "fecha_descubrimiento",
+    "monto_investigado",
+    "tipo_moneda",
+    "monto_perdida_fraude",
+    "monto_falla_procesos",
+    "monto_contingencia",
+    "monto_recuperado",
+    "monto_pago_deuda",
+    "id_reclamo",
+    "nombre_analitica",
+    "codigo_analitica",
+    "tipo_involucrado",
+    "id_colaborador",
+    "id_cliente_involucrado",
+    "monto_asignado",
+)
+_WORDS = (
+    "cliente operación transferencia reclamo tarjeta agencia monto validación "
+    "colaborador producto canal proceso evidencia registro cuenta fraude "
+    "análisis revisión control incidente seguimiento sistema autorización"
+).split()
+
+
+@dataclass(frozen=True)
+class CaseSize:
+    """Dimensiones de un caso sintético."""
+
+    clients: int = 200
+    collaborators: int = 100
+    products: int = 500
+    claims_per_product: int = 2
+    involvements_per_product: int = 3
+    risks: int = 30
+    norms: int = 30
+    analysis_paragraphs: int = 40
+
+
+def _taxonomy() -> tuple[str, str, str]:
+    cat1 = next(iter(TAXONOMIA))
+    cat2 = next(iter(TAXONOMIA[cat1]))
+    return cat1, cat2, TAXONOMIA[cat1][cat2][0]
+
+
+def client_id(index: int) -> str:
+    return f"{10000000 + index}"
+
+
+def collaborator_id(index: int) -> str:
+    return f"T{index:05d}"
+
+
+def product_id(index: int) -> str:
+    return f"{1000000000000 + index}"
+
+
+def _paragraphs(rng: random.Random, count: int) -> str:
+    paragraphs = []
+    for _ in range(count):
+        words = [rng.choice(_WORDS) for _ in range(rng.randint(40, 90))]
+        paragraphs.append(" ".join(words).capitalize() + ".")
+    return "\n\n".join(paragraphs)
+
+
+def _amounts(rng: random.Random) -> dict[str, str]:
+    # En créditos y tarjetas la contingencia debe igualar al monto investigado.
+    investigated = f"{rng.randint(100, 99999)}.{rng.randint(0, 99):02d}"
+    return {
+        "monto_investigado": investigated,
+        "monto_perdida_fraude": "0.00",
+        "monto_falla_procesos": "0.00",
+        "monto_contingencia": investigated,
+        "monto_recuperado": "0.00",
+        "monto_pago_deuda": "0.00",
+    }
+
+
+def generate_case(size: CaseSize = CaseSize(), *, seed: int = 2025) -> dict:
+    """Devuelve un caso completo con la forma de ``CaseData.as_dict()``."""
+
+    rng = random.Random(seed)
+    cat1, cat2, modalidad = _taxonomy()
+    case = {
+        "id_caso": CASE_ID,
+        "id_proceso": "BPID-000001",
+        "tipo_informe": TIPO_INFORME_LIST[0],
+        "categoria1": cat1,
+        "categoria2": cat2,
+        "modalidad": modalidad,
+        "canal": CANAL_LIST[0],
+        "proceso": PROCESO_LIST[0],
+        "fecha_de_ocurrencia": "2024-01-01",
+        "fecha_de_descubrimiento": "2024-01-02",
+        "centro_costo": "12345",
+        "matricula_investigador": "T99999",
+        "investigador": {"matricula": "T99999", "nombre": "Investigador Sintético", "cargo": "Investigador Principal"},
+    }
+    clients = [
+        {
+            "id_cliente": client_id(index),
+            "id_caso": CASE_ID,
+            "tipo_id": TIPO_ID_LIST[0],
+            "nombres": f"Nombre{index}",
+            "apellidos": f"Apellido{index}",
+            "flag": FLAG_CLIENTE_LIST[index % 2],
+            "telefonos": f"9{index:08d}",
+            "correos": f"cliente{index}@example.com",
+            "direcciones": f"Av. Sintética {index}",
+            "accionado": ACCIONADO_OPTIONS[index % len(ACCIONADO_OPTIONS)],
+        }
+        for index in range(size.clients)
+    ]
+    collaborators = [
+        {
+            "id_colaborador": collaborator_id(index),
+            "id_caso": CASE_ID,
+            "nombres": f"Colaborador{index}",
+            "apellidos": f"Apellido{index}",
+            "flag": FLAG_COLABORADOR_LIST[index % 2],
+            "division": "Division sintética",
+            "area": f"Area {index % 7}",
+            "servicio": "Servicio",
+            "puesto": "Asesor",
+            "nombre_agencia": "",
+            "codigo_agencia": "",
+            "tipo_falta": TIPO_FALTA_LIST[0],
+            "tipo_sancion": TIPO_SANCION_LIST[0],
+        }
+        for index in range(size.collaborators)
+    ]
+    products, claims, involvements = [], [], []
+    claim_index = 0
+    for index in range(size.products):
+        amounts = _amounts(rng)
+        product = {
+            "id_producto": product_id(index),
+            "id_caso": CASE_ID,
+            "id_cliente": client_id(index % max(size.clients, 1)),
+            "tipo_producto": PRODUCT_TYPE,
+            "categoria1": cat1,
+            "categoria2": cat2,
+            "modalidad": modalidad,
+            "canal": CANAL_LIST[0],
+            "proceso": PROCESO_LIST[0],
+            "fecha_ocurrencia": "2024-01-01",
+            "fecha_descubrimiento": "2024-01-02",
+            "tipo_moneda": TIPO_MONEDA_LIST[index % 2],
+            **amounts,
+        }
+        products.append(product)
+        for _ in range(size.claims_per_product):
+            claim_index += 1
+            claims.append(
+                {
+                    "id_reclamo": f"C{claim_index:08d}",
+                    "id_caso": CASE_ID,
+                    "id_producto": product["id_producto"],
+                    "nombre_analitica": f"Analítica {claim_index % 13}",
+                    "codigo_analitica": f"43{claim_index:08d}",
+                }
+            )
+        share = int(amounts["monto_investigado"].split(".")[0]) // max(size.involvements_per_product, 1)
+        for slot in range(size.involvements_per_product):
+            if slot % 2 == 0 and size.collaborators:
+                involvements.append(
+                    {
+                        "id_producto": product["id_producto"],
+                        "id_caso": CASE_ID,
+                        "tipo_involucrado": "colaborador",
+                        "id_colaborador": collaborator_id((index + slot) % size.collaborators),
+                        "id_cliente_involucrado": "",
+                        "monto_asignado": f"{share}.00",
+                    }
+                )
+            else:
+                involvements.append(
+                    {
+                        "id_producto": product["id_producto"],
+                        "id_caso": CASE_ID,
+                        "tipo_involucrado": "cliente",
+                        "id_colaborador": "",
+                        "id_cliente_involucrado": client_id((index + slot) % max(size.clients, 1)),
+                        "monto_asignado": f"{share}.00",
+                    }
+                )
+    risks = [
+        {
+            "id_riesgo": f"RSK-{index + 1:06d}",
+            "id_caso": CASE_ID,
+            "lider": "Líder del riesgo",
+            "descripcion": _paragraphs(rng, 1),
+            "criticidad": CRITICIDAD_LIST[index % len(CRITICIDAD_LIST)],
+            "exposicion_residual": f"{rng.randint(0, 9999)}.00",
+            "planes_accion": f"Plan-{index}",
+        }
+        for index in range(size.risks)
+    ]
+    norms = [
+        {
+            "id_norma": f"2024.{index % 1000:03d}.{index // 1000 % 100:02d}.01",
+            "id_caso": CASE_ID,
+            "descripcion": f"Norma sintética {index}",
+            "fecha_vigencia": "2023-01-01",
+            "acapite_inciso": f"Inciso {index}",
+            "detalle_norma": _paragraphs(rng, 1),
+        }
+        for index in range(size.norms)
+    ]
+    analysis = {
+        name: {
+            "text": _paragraphs(rng, size.analysis_paragraphs),
+            "tags": [{"tag": "bold", "start": "1.0", "end": "1.20"}],
+        }
+        for name in ANALYSIS_SECTIONS
+    }
+    analysis["comentario_breve"] = {"text": _paragraphs(rng, 1)[:140], "tags": []}
+    analysis["comentario_amplio"] = {"text": _paragraphs(rng, 2)[:700], "tags": []}
+    return {
+        "caso": case,
+        "clientes": clients,
+        "colaboradores": collaborators,
+        "productos": products,
+        "reclamos": claims,
+        "involucramientos": involvements,
+        "riesgos": risks,
+        "normas": norms,
+        "analisis": analysis,
+        "encabezado": {},
+        "operaciones": [],
+        "anexos": [],
+        "firmas": [],
+        "recomendaciones_categorias": {},
+    }
+
+
+def combined_rows(row_count: int, *, clients: int = 500, collaborators: int = 300, products: int = 1000):
+    """Genera filas para ``import_combined`` repitiendo un universo acotado de IDs."""
+
+    cat1, cat2, modalidad = _taxonomy()
+    for index in range(row_count):
+        product_index = index % products
+        yield {
+            "id_producto": product_id(product_index),
+            "id_cliente": client_id(product_index % clients),
+            "tipo_producto": PRODUCT_TYPE,
+            "categoria1": cat1,
+            "categoria2": cat2,
+            "modalidad": modalidad,
+            "canal": CANAL_LIST[0],
+            "proceso": PROCESO_LIST[0],
+            "fecha_ocurrencia": "2024-01-01",
+            "fecha_descubrimiento": "2024-01-02",
+            "monto_investigado": "1000.00",
+            "tipo_moneda": TIPO_MONEDA_LIST[0],
+            "monto_perdida_fraude": "1000.00",
+            "monto_falla_procesos": "0.00",
+            "monto_contingencia": "0.00",
+            "monto_recuperado": "0.00",
+            "monto_pago_deuda": "0.00",
+            "id_reclamo": f"C{product_index + 1:08d}",
+            "nombre_analitica": "Analítica sintética",
+            "codigo_analitica": f"43{product_index + 1:08d}",
+            "tipo_involucrado": "colaborador",
+            "id_colaborador": collaborator_id(index % collaborators),
+            "id_cliente_involucrado": "",
+            "monto_asignado": f"{10 + index % 90}.00",
+        }
+
+
+def write_combined_csv(path: Path, row_count: int, **universe) -> Path:
+    path = Path(path)
+    with path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.DictWriter(handle, fieldnames=COMBINED_HEADER)
+        writer.writeheader()
+        writer.writerows(combined_rows(row_count, **universe))
+    return path
+
+
+def write_detail_catalogs(folder: Path, *, clients: int, collaborators: int, products: int) -> Path:
+    """Escribe ``*_details.csv`` sintéticos para ``CatalogService.refresh``."""
+
+    folder = Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
+    case = generate_case(CaseSize(clients=clients, collaborators=collaborators, products=0, risks=0, norms=0, analysis_paragraphs=0))
+    tables = {
+        "client_details.csv": case["clientes"],
+        "team_details.csv": case["colaboradores"],
+        "product_details.csv": [
+            {"id_producto": product_id(index), "id_cliente": client_id(index % max(clients, 1)), "tipo_producto": PRODUCT_TYPE, **_amounts(random.Random(index))}
+            for index in range(products)
+        ],
+    }
+    for name, rows in tables.items():
+        if not rows:
+            continue
+        with (folder / name).open("w", newline="", encoding="utf-8") as handle:
+            writer = csv.DictWriter(handle, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+    return folder
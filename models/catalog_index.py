@@ -0,0 +1,150 @@
+"""Índices y caché persistente para los catálogos de detalle.
+
+``CatalogService`` volvía a leer todos los ``*_details.csv`` en cada
+``request_catalog_loading`` y resolvía cada autopoblado de colaboradores
+filtrando la lista completa de instantáneas. Este módulo concentra:
+
+* ``catalog_source_signature``: firma (nombre, tamaño, ``mtime``) de los CSV
+  de detalle; si no cambia, no hace falta volver a parsearlos.
+* ``CatalogCache``: caché binaria en disco con las filas ya parseadas, de
+  modo que un arranque en caliente no toca el parser CSV.
+* ``TeamSnapshotIndex``: instantáneas por colaborador ordenadas por
+  ``fecha`` para responder con ``bisect`` en lugar de recorrerlas.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+from bisect import bisect_left, bisect_right
+from datetime import date
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Sequence, Tuple
+
+CATALOG_CACHE_VERSION = 1
+CATALOG_CACHE_FILENAME = "catalogos.pickle"
+
+SourceSignature = Tuple[Tuple[str, int, int], ...]
+
+
+def catalog_source_signature(base_dir: str | os.PathLike) -> SourceSignature:
+    """Devuelve la firma de los ``*details.csv`` presentes en ``base_dir``."""
+
+    entries = []
+    try:
+        with os.scandir(base_dir) as iterator:
+            for entry in iterator:
+                if not entry.name.lower().endswith("details.csv"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((entry.name, stat.st_size, stat.st_mtime_ns))
+    except OSError:
+        return ()
+    return tuple(sorted(entries))
+
+
+class CatalogCache:
+    """Persistencia binaria de los catálogos parseados, invalidada por firma."""
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = Path(path)
+
+    def load(self, signature: SourceSignature) -> Optional[dict]:
+        if not signature:
+            return None
+        try:
+            with self.path.open("rb") as handle:
+                payload = pickle.load(handle)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError, TypeError):
+            return None
+        if not isinstance(payload, dict):
+            return None
+        if payload.get("version") != CATALOG_CACHE_VERSION or payload.get("signature") != signature:
+            return None
+        data = payload.get("data")
+        return data if isinstance(data, dict) else None
+
+    def store(self, signature: SourceSignature, data: dict) -> bool:
+        if not signature:
+            return False
+        payload = {"version": CATALOG_CACHE_VERSION, "signature": signature, "data": data}
+        temp_path = self.path.with_name(f"{self.path.name}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with temp_path.open("wb") as handle:
+                pickle.dump(payload, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self.path)
+        except (OSError, pickle.PicklingError):
+            try:
+                temp_path.unlink()
+            except OSError:
+                pass
+            return False
+        return True
+
+
+class _MemberSnapshots:
+    __slots__ = ("fechas", "dated", "last_undated")
+
+    def __init__(self, snapshots: Sequence[dict]):
+        dated = [
+            (snap["fecha"], position, snap)
+            for position, snap in enumerate(snapshots)
+            if snap.get("fecha") is not None
+        ]
+        dated.sort(key=lambda item: (item[0], item[1]))
+        self.fechas = [item[0] for item in dated]
+        self.dated = [item[2] for item in dated]
+        self.last_undated = snapshots[-1] if snapshots and not dated else None
+
+    def first_of(self, fecha: date) -> dict:
+        # ``max``/``min`` devolvían la primera instantánea con la fecha
+        # elegida; el orden estable conserva ese desempate.
+        return self.dated[bisect_left(self.fechas, fecha)]
+
+
+class TeamSnapshotIndex:
+    """Resuelve la instantánea vigente de un colaborador en O(log n)."""
+
+    def __init__(self, snapshots: Mapping[str, Sequence[dict]]):
+        self._members: Dict[str, _MemberSnapshots] = {
+            member_id: _MemberSnapshots(list(items))
+            for member_id, items in (snapshots or {}).items()
+            if items
+        }
+
+    def __contains__(self, member_id: str) -> bool:
+        return member_id in self._members
+
+    def select(self, member_id: str, case_date: date | None) -> Tuple[Optional[dict], Optional[str]]:
+        """Devuelve ``(instantánea, motivo_de_respaldo)`` para ``member_id``.
+
+        Con fecha de caso se elige la instantánea más reciente no posterior a
+        ella; si todas son posteriores se usa la más antigua. Sin fecha se
+        toma la más reciente disponible.
+        """
+
+        member = self._members.get(member_id)
+        if member is None:
+            return None, None
+        fechas = member.fechas
+        if case_date and fechas:
+            position = bisect_right(fechas, case_date)
+            if position:
+                return member.first_of(fechas[position - 1]), None
+            return member.dated[0], "no_past_snapshot"
+        if fechas:
+            return member.first_of(fechas[-1]), "case_date_missing_or_invalid"
+        return member.last_undated, "case_date_missing_or_invalid"
+
+
+__all__ = [
+    "CATALOG_CACHE_FILENAME",
+    "CATALOG_CACHE_VERSION",
+    "CatalogCache",
+    "TeamSnapshotIndex",
+    "catalog_source_signature",
+]
@@ -4,41 +4,105 @@ from __future__ import annotations
 
 import os
 from datetime import datetime, date
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, Tuple
+from typing import Dict, Iterable, Optional, Tuple
 
-try:  # pragma: no cover - dependencia opcional
-    import pandas as pd
-except Exception:  # pragma: no cover - evita fallar si no está instalado
-    pd = None
+from utils.lazy_loader import module_available
 
 from settings import BASE_DIR, DETAIL_LOOKUP_ALIASES
 from validators import normalize_team_member_identifier, normalize_without_accents
 
+from .catalog_index import (CATALOG_CACHE_FILENAME, CatalogCache,
+                            TeamSnapshotIndex, catalog_source_signature)
 from .catalogs import (CSV_IMPORT_ENCODINGS, build_detail_catalog_id_index,
                        load_detail_catalogs, normalize_detail_catalog_key,
                        read_csv_rows_with_fallback)
 from .static_team_catalog import TEAM_HIERARCHY_CATALOG, build_team_catalog_rows
 
 
+def _load_pandas():
+    """Importa ``pandas`` solo cuando se leen catálogos (dependencia opcional)."""
+
+    if not module_available("pandas"):
+        return None
+    try:  # pragma: no cover - dependencia opcional
+        import pandas as pd
+    except Exception:  # pragma: no cover - evita fallar si la instalación está rota
+        return None
+    return pd
+
+
 class CatalogService:
-    """Encapsula la carga de catálogos y consultas temporales."""
+    """Encapsula la carga de catálogos y consultas temporales.
+
+    ``refresh`` solo parsea los CSV cuando cambia su firma (tamaño y
+    ``mtime``); en caso contrario reutiliza las filas en memoria o la caché
+    binaria persistida en ``cache_dir`` (por defecto ``<base_dir>/cache``).
+    """
 
-    def __init__(self, base_dir: str | os.PathLike = BASE_DIR):
+    def __init__(
+        self,
+        base_dir: str | os.PathLike = BASE_DIR,
+        *,
+        cache_dir: str | os.PathLike | None = None,
+        use_cache: bool = True,
+    ):
         self.base_dir = Path(base_dir)
         self.detail_catalogs: Dict[str, Dict[str, Dict[str, str]]] = {}
         self.detail_lookup_by_id: Dict[str, Dict[str, Dict[str, str]]] = {}
-        self.team_snapshots: Dict[str, list[dict]] = {}
+        self.team_snapshots = {}
         self.team_hierarchy: TeamHierarchyCatalog = TeamHierarchyCatalog(
             build_team_catalog_rows()
         )
+        cache_root = Path(cache_dir) if cache_dir is not None else self.base_dir / "cache"
+        self.catalog_cache: Optional[CatalogCache] = (
+            CatalogCache(cache_root / CATALOG_CACHE_FILENAME) if use_cache else None
+        )
+        self.last_refresh_source: Optional[str] = None
+        self._loaded_signature = None
+        self._raw_catalogs: Dict[str, Dict[str, Dict[str, str]]] = {}
+
+    @property
+    def team_snapshots(self) -> Dict[str, list[dict]]:
+        return self._team_snapshots
+
+    @team_snapshots.setter
+    def team_snapshots(self, snapshots: Dict[str, list[dict]]) -> None:
+        self._team_snapshots = snapshots
+        self._snapshot_index: Optional[TeamSnapshotIndex] = None
+
+    def _get_snapshot_index(self) -> TeamSnapshotIndex:
+        if self._snapshot_index is None:
+            self._snapshot_index = TeamSnapshotIndex(self._team_snapshots)
+        return self._snapshot_index
 
     def refresh(self) -> Tuple[Dict[str, Dict[str, Dict[str, str]]], Dict[str, Dict[str, Dict[str, str]]]]:
-        raw_catalogs = load_detail_catalogs(self.base_dir)
-        normalized, lookup_by_id = self._normalize_catalogs(raw_catalogs)
+        signature = catalog_source_signature(self.base_dir)
+        if signature and signature == self._loaded_signature:
+            # Los CSV no cambiaron: se reconstruyen los diccionarios a partir
+            # de las filas ya parseadas para descartar altas hechas en sesión.
+            self.last_refresh_source = "memoria"
+        else:
+            payload = self.catalog_cache.load(signature) if self.catalog_cache else None
+            if payload is not None:
+                self.last_refresh_source = "cache"
+                raw_catalogs = payload.get("detail_catalogs") or {}
+                team_rows = payload.get("team_rows") or []
+            else:
+                self.last_refresh_source = "csv"
+                raw_catalogs = load_detail_catalogs(self.base_dir)
+                team_rows = self._read_team_rows()
+                if self.catalog_cache is not None:
+                    self.catalog_cache.store(
+                        signature, {"detail_catalogs": raw_catalogs, "team_rows": team_rows}
+                    )
+            self._raw_catalogs = raw_catalogs
+            self.team_snapshots, self.team_hierarchy = self._build_team_resources(team_rows)
+            self._loaded_signature = signature
+        normalized, lookup_by_id = self._normalize_catalogs(self._raw_catalogs)
         self.detail_catalogs = normalized
         self.detail_lookup_by_id = lookup_by_id
-        self.team_snapshots, self.team_hierarchy = self._build_team_resources()
         return self.detail_catalogs, self.detail_lookup_by_id
 
     def _normalize_catalogs(
@@ -71,30 +135,36 @@ class CatalogService:
                 lookup_by_id[alias_key] = lookup
         return normalized, lookup_by_id
 
-    def _build_team_resources(self) -> tuple[Dict[str, list[dict]], "TeamHierarchyCatalog"]:
+    def _read_team_rows(self) -> list[dict]:
         path = self.base_dir / "team_details.csv"
+        if not path.exists():
+            return []
+        return list(self._iter_rows(path))
+
+    def _build_team_resources(
+        self, csv_rows: Optional[list[dict]] = None
+    ) -> tuple[Dict[str, list[dict]], "TeamHierarchyCatalog"]:
+        if csv_rows is None:
+            csv_rows = self._read_team_rows()
         static_rows = build_team_catalog_rows()
         snapshots: Dict[str, list[dict]] = {}
-
-        csv_rows: list[dict] = []
-        if path.exists():
-            csv_rows = list(self._iter_rows(path))
-            for row in csv_rows:
-                normalized_id = normalize_team_member_identifier(row.get("id_colaborador", ""))
-                if not normalized_id:
-                    continue
-                parsed_date = self._parse_date(row.get("fecha_actualizacion"))
-                snapshots.setdefault(normalized_id, []).append(
-                    {
-                        "data": row,
-                        "fecha": parsed_date,
-                    }
-                )
+        for row in csv_rows:
+            normalized_id = normalize_team_member_identifier(row.get("id_colaborador", ""))
+            if not normalized_id:
+                continue
+            parsed_date = self._parse_date(row.get("fecha_actualizacion"))
+            snapshots.setdefault(normalized_id, []).append(
+                {
+                    "data": row,
+                    "fecha": parsed_date,
+                }
+            )
 
         merged_rows = static_rows + csv_rows
         return snapshots, TeamHierarchyCatalog(merged_rows)
 
     def _iter_rows(self, path: Path) -> Iterable[Dict[str, str]]:
+        pd = _load_pandas()
         if pd is not None:
             for encoding in CSV_IMPORT_ENCODINGS:
                 try:
@@ -141,36 +211,25 @@ class CatalogService:
         normalized_id = normalize_team_member_identifier(identifier)
         if not normalized_id:
             return None, meta
-        snapshots = self.team_snapshots.get(normalized_id)
-        if not snapshots:
-            return None, meta
         case_date = self._parse_date(occurrence_date)
-        valid = [snap for snap in snapshots if snap.get("fecha") is not None]
-        chosen = None
-        if case_date and valid:
-            history = [snap for snap in valid if snap["fecha"] <= case_date]
-            if history:
-                chosen = max(history, key=lambda snap: snap["fecha"])
-            else:
-                chosen = min(valid, key=lambda snap: snap["fecha"])
-                meta["fallback_used"] = True
-                meta["reason"] = "no_past_snapshot"
-        else:
-            if valid:
-                chosen = max(valid, key=lambda snap: snap["fecha"])
-            else:
-                chosen = snapshots[-1]
-            meta["fallback_used"] = True
-            meta["reason"] = "case_date_missing_or_invalid"
+        chosen, fallback_reason = self._get_snapshot_index().select(normalized_id, case_date)
         if chosen is None:
-            chosen = max(valid, key=lambda snap: snap["fecha"]) if valid else snapshots[-1]
-        meta["selected_date"] = chosen.get("fecha") if chosen else None
+            return None, meta
+        if fallback_reason:
+            meta["fallback_used"] = True
+            meta["reason"] = fallback_reason
+        meta["selected_date"] = chosen.get("fecha")
         return dict(chosen.get("data", {})), meta
 
 
 __all__ = ["CatalogService", "TeamHierarchyCatalog"]
 
 
+@lru_cache(maxsize=4096)
+def _normalize_catalog_text(value: str) -> str:
+    return normalize_without_accents(value.strip()).lower()
+
+
 class TeamHierarchyCatalog:
     """Catálogo en memoria derivado de ``team_details.csv``.
 
@@ -193,12 +252,13 @@ class TeamHierarchyCatalog:
         self._agencies_by_scope: dict[tuple[str, str], dict[str, dict[str, str]]] = {}
         self._agencies_by_code: dict[tuple[str, str], dict[str, dict[str, str]]] = {}
         self._hierarchy_dict: dict = hierarchy or TEAM_HIERARCHY_CATALOG
+        self._match_indexes: dict[int, tuple[dict, dict[str, tuple[str, dict, str]]]] = {}
         for row in rows or ():
             self._ingest_row(row)
 
     @staticmethod
     def _normalize(value: str) -> str:
-        return normalize_without_accents((value or "").strip()).lower()
+        return _normalize_catalog_text(value or "")
 
     @property
     def has_data(self) -> bool:
@@ -220,13 +280,33 @@ class TeamHierarchyCatalog:
             key=lambda item: item[1].casefold(),
         )
 
-    def _match_entry(self, mapping: dict[str, dict], value: str) -> tuple[str, dict, str] | tuple[None, None, None]:
-        normalized_value = self._normalize(value)
-        for key, data in (mapping or {}).items():
+    def _match_index(self, mapping: dict[str, dict]) -> dict[str, tuple[str, dict, str]]:
+        """Índice precalculado ``clave/etiqueta normalizada → entrada``.
+
+        Se conserva la primera entrada que coincide, igual que el recorrido
+        lineal original. La jerarquía es estática, por lo que el índice se
+        construye una sola vez por diccionario.
+        """
+
+        cached = self._match_indexes.get(id(mapping))
+        if cached is not None and cached[0] is mapping:
+            return cached[1]
+        index: dict[str, tuple[str, dict, str]] = {}
+        for key, data in mapping.items():
             label = self._label_for(data or {}, key)
-            if normalized_value in {self._normalize(key), self._normalize(label)}:
-                return key, data or {}, label
-        return None, None, None
+            entry = (key, data or {}, label)
+            index.setdefault(self._normalize(key), entry)
+            index.setdefault(self._normalize(label), entry)
+        self._match_indexes[id(mapping)] = (mapping, index)
+        return index
+
+    def _match_entry(self, mapping: dict[str, dict], value: str) -> tuple[str, dict, str] | tuple[None, None, None]:
+        if not mapping:
+            return None, None, None
+        match = self._match_index(mapping).get(self._normalize(value))
+        if match is None:
+            return None, None, None
+        return match
 
     def list_hierarchy_divisions(self) -> list[tuple[str, str]]:
         return self._sorted_option_pairs(self._hierarchy_dict)
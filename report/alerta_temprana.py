@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+from concurrent.futures import CancelledError, Executor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass, field
+from functools import lru_cache
 import json
 import logging
 import math
 import importlib.util
 from pathlib import Path
 import re
-from typing import Mapping
+import threading
+import time
+from typing import Callable, Mapping, Optional, Sequence
+import unicodedata
 
 from report.alerta_temprana_content import (
     ExecutiveSummary,
@@ -15,7 +21,10 @@ from report.alerta_temprana_content import (
     build_executive_summary,
 )
 from validators import sanitize_rich_text
-from report_builder import CaseData
+from report.case_data import CaseData
+from utils.background_worker import get_background_executor
+from utils.llm_backend import BACKEND_FP32, inference_context, load_seq2seq_model, normalize_backend
+from utils.summary_cache import SummaryCache, get_summary_cache
 
 logger = logging.getLogger(__name__)
 
@@ -71,6 +80,14 @@ SECTION_MAX_NEW_TOKENS: dict[str, int] = {
 }
 
 TRANSFORMERS_AVAILABLE = importlib.util.find_spec("transformers") is not None
+# Parámetros fijos de la generación; forman parte de la clave de la caché
+# persistente junto con el modelo, el prompt y ``max_new_tokens``.
+GENERATION_PARAMS: dict[str, object] = {"num_beams": 4, "do_sample": False, "seed": 0}
+# Paneles de la diapositiva principal, en el orden en que se generan.
+ALERTA_SECTIONS = ("Resumen", "Cronología", "Análisis", "Riesgos", "Recomendaciones", "Responsables")
+# Tiempo máximo de espera por el modelo antes de usar el texto determinístico.
+DEFAULT_LLM_TIME_BUDGET_S = 90.0
+_LLM_WAIT_SLICE_S = 0.1
 
 SLIDE_WIDTH_16_9 = Inches(13.33) if Inches else 0
 SLIDE_HEIGHT_16_9 = Inches(7.5) if Inches else 0
@@ -82,8 +99,33 @@ PANEL_PADDING = Inches(0.18) if Inches else 0
 BULLET_PREFIX = re.compile(r"^\s*(?:[-*•]|\d+[.)])\s+")
 DEFAULT_BODY_FONT_PT = 11
 MIN_BODY_FONT_PT = 9
-AVG_CHAR_WIDTH_FACTOR = 0.52
 DEFAULT_LINE_SPACING = 1.15
+# Márgenes internos por defecto de un cuadro de texto de PowerPoint (pulgadas).
+TEXTBOX_INSET_X_IN = 0.1
+TEXTBOX_INSET_Y_IN = 0.05
+# Ancho de avance de Calibri, la fuente del cuerpo en la plantilla por defecto
+# de python-pptx, en milésimas de em. Las letras acentuadas usan el ancho de su
+# letra base y los demás caracteres, ``DEFAULT_GLYPH_WIDTH``.
+BODY_FONT_GLYPH_WIDTHS: dict[str, int] = {
+    " ": 226, "!": 326, '"': 401, "#": 498, "$": 507, "%": 715, "&": 682, "'": 221,
+    "(": 303, ")": 303, "*": 498, "+": 498, ",": 250, "-": 306, ".": 252, "/": 386,
+    **{digit: 507 for digit in "0123456789"},
+    ":": 268, ";": 268, "<": 498, "=": 498, ">": 498, "?": 463, "@": 894,
+    "A": 579, "B": 544, "C": 533, "D": 615, "E": 488, "F": 459, "G": 631, "H": 623,
+    "I": 252, "J": 319, "K": 520, "L": 420, "M": 855, "N": 646, "O": 662, "P": 517,
+    "Q": 673, "R": 543, "S": 459, "T": 487, "U": 642, "V": 567, "W": 890, "X": 519,
+    "Y": 487, "Z": 468, "[": 307, "]": 307, "_": 498,
+    "a": 479, "b": 525, "c": 423, "d": 525, "e": 498, "f": 305, "g": 471, "h": 525,
+    "i": 229, "j": 239, "k": 455, "l": 229, "m": 799, "n": 525, "o": 527, "p": 525,
+    "q": 525, "r": 349, "s": 391, "t": 335, "u": 525, "v": 452, "w": 715, "x": 433,
+    "y": 453, "z": 395,
+    "¡": 326, "¿": 463, "«": 418, "»": 418, "°": 347, "•": 498, "–": 498, "—": 905,
+    "“": 418, "”": 418, "‘": 250, "’": 250, "…": 690, "€": 507,
+}
+DEFAULT_GLYPH_WIDTH = 500
+# Resultados de ``_fit_text_to_box`` memorizados por texto y tamaño de panel.
+FIT_CACHE_SIZE = 256
+_WORD_PATTERN = re.compile(r"\S+")
 
 
 @dataclass(frozen=True)
@@ -99,13 +141,18 @@ def _emu_to_inches(value: float | int) -> float:
     return float(value) / float(Inches(1))
 
 
-def _estimate_chars_per_line(width_in: float, font_pt: int) -> int:
-    if width_in <= 0 or font_pt <= 0:
-        return 1
-    width_pt = width_in * 72
-    char_width = font_pt * AVG_CHAR_WIDTH_FACTOR
-    estimated = int(width_pt / max(char_width, 1))
-    return max(estimated, 15)
+@lru_cache(maxsize=1024)
+def _glyph_width_em(char: str) -> float:
+    width = BODY_FONT_GLYPH_WIDTHS.get(char)
+    if width is None:
+        base = unicodedata.normalize("NFD", char)[:1]
+        width = BODY_FONT_GLYPH_WIDTHS.get(base, DEFAULT_GLYPH_WIDTH)
+    return width / 1000
+
+
+@lru_cache(maxsize=8192)
+def _text_width_em(text: str) -> float:
+    return sum(_glyph_width_em(char) for char in text)
 
 
 def _estimate_line_capacity(height_in: float, font_pt: int, line_spacing: float) -> int:
@@ -115,22 +162,61 @@ def _estimate_line_capacity(height_in: float, font_pt: int, line_spacing: float)
     return max(int(height_in / max(line_height_in, 0.01)), 1)
 
 
-def _estimate_text_lines(text: str, chars_per_line: int) -> int:
-    if not text:
-        return 1
-    normalized = text.splitlines() or [text]
-    total = 0
-    for line in normalized:
-        length = max(len(line), 1)
-        total += max(1, math.ceil(length / max(chars_per_line, 1)))
-    return total
+def _measure_paragraphs(text: str) -> tuple[tuple[tuple[float, int], ...], ...]:
+    """Ancho en em y posición de cada palabra, por párrafo no vacío.
+
+    Se mide una sola vez por texto; el ajuste a distintos tamaños de fuente
+    solo vuelve a repartir estas palabras en líneas.
+    """
+
+    paragraphs = []
+    offset = 0
+    for line in text.split("\n"):
+        words = tuple((_text_width_em(match.group()), offset + match.start()) for match in _WORD_PATTERN.finditer(line))
+        if words:
+            paragraphs.append(words)
+        offset += len(line) + 1
+    return tuple(paragraphs)
+
+
+def _wrap_lines(
+    paragraphs: Sequence[Sequence[tuple[float, int]]],
+    line_width_em: float,
+    max_lines: Optional[int] = None,
+) -> tuple[int, Optional[int]]:
+    """Líneas que ocupan ``paragraphs`` con ajuste por palabra.
+
+    Si se indica ``max_lines``, se detiene al superarlo y devuelve también la
+    posición de la primera palabra que ya no entra.
+    """
+
+    line_width_em = max(line_width_em, 1.0)
+    space_em = _glyph_width_em(" ")
+    lines = 0
+    for words in paragraphs:
+        lines += 1
+        used = 0.0
+        for width, start in words:
+            if used and used + space_em + width > line_width_em:
+                lines += 1
+                used = 0.0
+            used = used + space_em + width if used else width
+            if used > line_width_em:
+                # Palabra más ancha que el panel: PowerPoint la parte por caracteres.
+                extra = math.ceil(used / line_width_em) - 1
+                lines += extra
+                used -= extra * line_width_em
+            if max_lines is not None and lines > max_lines:
+                return lines, start
+    return max(lines, 1), None
 
 
 def _truncate_text_to_fit(text: str, max_chars: int) -> str:
-    cleaned = sanitize_rich_text(text, max_chars=None).strip()
-    if max_chars <= 0 or len(cleaned) <= max_chars:
-        return cleaned
-    truncated = cleaned[: max_chars - 1].rstrip()
+    """Recorta ``text`` (ya saneado) a ``max_chars`` en un límite de palabra."""
+
+    if max_chars <= 0 or len(text) <= max_chars:
+        return text
+    truncated = text[: max_chars - 1].rstrip()
     last_space = truncated.rfind(" ")
     min_space_index = int(max_chars * 0.6)
     if last_space >= min_space_index:
@@ -138,6 +224,48 @@ def _truncate_text_to_fit(text: str, max_chars: int) -> str:
     return truncated + "…"
 
 
+@lru_cache(maxsize=FIT_CACHE_SIZE)
+def _fit_layout(
+    text: str,
+    width_in: float,
+    height_in: float,
+    base_font_pt: int,
+    min_font_pt: int,
+    line_spacing: float,
+) -> tuple[FitTextResult, int]:
+    """Ajuste memorizado de ``_fit_text_to_box``; devuelve además el largo original."""
+
+    cleaned = sanitize_rich_text(text, max_chars=None).strip()
+    if not cleaned:
+        return FitTextResult(text=PLACEHOLDER, font_pt=base_font_pt, truncated=False), 0
+    paragraphs = _measure_paragraphs(cleaned)
+    width_pt = max(width_in - 2 * TEXTBOX_INSET_X_IN, 0.0) * 72
+    height_in = max(height_in - 2 * TEXTBOX_INSET_Y_IN, 0.0)
+
+    def _fits(font_pt: int) -> bool:
+        max_lines = _estimate_line_capacity(height_in, font_pt, line_spacing)
+        _lines, overflow = _wrap_lines(paragraphs, width_pt / font_pt, max_lines)
+        return overflow is None
+
+    # Con fuente menor caben más palabras por línea y más líneas: el ajuste es
+    # monótono, así que se busca el mayor tamaño que entra por bisección.
+    low, high, best = min_font_pt, base_font_pt, None
+    while low <= high:
+        font_pt = (low + high) // 2
+        if _fits(font_pt):
+            best, low = font_pt, font_pt + 1
+        else:
+            high = font_pt - 1
+    if best is not None:
+        return FitTextResult(text=cleaned, font_pt=best, truncated=False), len(cleaned)
+
+    # Se reserva en cada línea el ancho de la elipsis que cierra el texto recortado.
+    max_lines = _estimate_line_capacity(height_in, min_font_pt, line_spacing)
+    _lines, overflow = _wrap_lines(paragraphs, width_pt / min_font_pt - _glyph_width_em("…"), max_lines)
+    truncated = _truncate_text_to_fit(cleaned, overflow if overflow is not None else len(cleaned))
+    return FitTextResult(text=truncated, font_pt=min_font_pt, truncated=truncated != cleaned), len(cleaned)
+
+
 def _fit_text_to_box(
     text: str,
     width_in: float,
@@ -148,27 +276,22 @@ def _fit_text_to_box(
     min_font_pt: int = MIN_BODY_FONT_PT,
     line_spacing: float = DEFAULT_LINE_SPACING,
 ) -> FitTextResult:
-    cleaned = sanitize_rich_text(text, max_chars=None).strip()
-    if not cleaned:
-        return FitTextResult(text=PLACEHOLDER, font_pt=base_font_pt, truncated=False)
-    for font_pt in range(base_font_pt, min_font_pt - 1, -1):
-        max_lines = _estimate_line_capacity(height_in, font_pt, line_spacing)
-        chars_per_line = _estimate_chars_per_line(width_in, font_pt)
-        total_lines = _estimate_text_lines(cleaned, chars_per_line)
-        if total_lines <= max_lines:
-            return FitTextResult(text=cleaned, font_pt=font_pt, truncated=False)
-    max_lines = _estimate_line_capacity(height_in, min_font_pt, line_spacing)
-    chars_per_line = _estimate_chars_per_line(width_in, min_font_pt)
-    max_chars = max_lines * chars_per_line
-    truncated = _truncate_text_to_fit(cleaned, max_chars)
-    if truncated != cleaned:
+    result, original_length = _fit_layout(
+        str(text or ""),
+        round(float(width_in), 4),
+        round(float(height_in), 4),
+        int(base_font_pt),
+        int(min_font_pt),
+        float(line_spacing),
+    )
+    if result.truncated:
         logger.warning(
             "Se truncó la sección '%s' para ajustarse al panel (%s → %s caracteres).",
             section_title,
-            len(cleaned),
-            len(truncated),
+            original_length,
+            len(result.text),
         )
-    return FitTextResult(text=truncated, font_pt=min_font_pt, truncated=truncated != cleaned)
+    return result
 
 
 def _set_paragraph_bullet(paragraph, enabled: bool) -> None:
@@ -304,74 +427,215 @@ def _build_prompt(section: str, contexto: str, caso: Mapping[str, object]) -> st
 
 @dataclass
 class SpanishSummaryHelper:
+    """Genera resúmenes con el modelo local y los reutiliza entre sesiones.
+
+    Los resultados se guardan en memoria y en ``persistent_cache`` (por
+    defecto, la caché compartida de ``utils.summary_cache``); con
+    ``use_persistent_cache=False`` solo se usa la memoria. ``backend`` y
+    ``num_threads`` toman por defecto ``LLM_INFERENCE_BACKEND`` y
+    ``LLM_NUM_THREADS`` de ``settings`` (ver ``utils.llm_backend``).
+    """
+
     model_name: str = DEFAULT_MODEL
     max_new_tokens: int = 144
+    persistent_cache: SummaryCache | None = field(default=None, repr=False)
+    use_persistent_cache: bool = True
+    backend: str | None = None
+    num_threads: int | None = None
     _pipeline: object = field(default=None, init=False, repr=False)
     _load_error: Exception | None = field(default=None, init=False, repr=False)
-    _cache: dict[tuple[str, str, int], str] = field(default_factory=dict, init=False, repr=False)
+    _cache: dict[tuple[str, int], str] = field(default_factory=dict, init=False, repr=False)
+    # El pipeline no admite llamadas concurrentes: la precarga en segundo
+    # plano y las generaciones se serializan con este candado.
+    _lock: threading.RLock = field(default_factory=threading.RLock, init=False, repr=False)
 
     def _load_pipeline(self):
-        if self._pipeline or self._load_error:
-            return
-        if not TRANSFORMERS_AVAILABLE:
-            self._load_error = RuntimeError("transformers no disponible")
-            return
-        from transformers import AutoModelForSeq2SeqLM, AutoTokenizer, pipeline
-
-        tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-        model = AutoModelForSeq2SeqLM.from_pretrained(self.model_name)
-        self._pipeline = pipeline(
-            task="text2text-generation",
-            model=model,
-            tokenizer=tokenizer,
-        )
+        with self._lock:
+            if self._pipeline or self._load_error:
+                return
+            if not TRANSFORMERS_AVAILABLE:
+                self._load_error = RuntimeError("transformers no disponible")
+                return
+            from transformers import pipeline
+
+            import settings
+
+            model, tokenizer = load_seq2seq_model(
+                self.model_name,
+                backend=self._resolved_backend(),
+                num_threads=self.num_threads if self.num_threads is not None else settings.LLM_NUM_THREADS,
+                cache_dir=settings.LLM_QUANTIZED_CACHE_DIR,
+            )
+            self._pipeline = pipeline(
+                task="text2text-generation",
+                model=model,
+                tokenizer=tokenizer,
+            )
 
-    def summarize(self, section: str, prompt: str, *, max_new_tokens: int | None = None) -> str | None:
-        key = (section, prompt, max_new_tokens or self.max_new_tokens)
-        if key in self._cache:
-            return self._cache[key]
+    def _resolved_backend(self) -> str:
+        if self.backend is None:
+            import settings
 
-        self._load_pipeline()
-        if not self._pipeline:
-            return None
+            self.backend = normalize_backend(settings.LLM_INFERENCE_BACKEND)
+        return self.backend
 
-        from transformers import set_seed
+    @property
+    def is_ready(self) -> bool:
+        return self._pipeline is not None
+
+    def warm_up(self) -> bool:
+        """Carga el tokenizador y el modelo; pensado para un hilo de fondo."""
 
         try:
-            set_seed(0)
-            outputs = self._pipeline(
-                prompt,
-                max_new_tokens=max_new_tokens or self.max_new_tokens,
-                num_beams=4,
-                do_sample=False,
-            )
-        except Exception as exc:  # pragma: no cover - defensivo frente a errores del modelo
+            self._load_pipeline()
+        except Exception as exc:  # pragma: no cover - defensivo frente a errores de descarga
             self._load_error = exc
+        return self.is_ready
+
+    def _get_persistent_cache(self) -> SummaryCache | None:
+        if not self.use_persistent_cache:
             return None
+        if self.persistent_cache is None:
+            self.persistent_cache = get_summary_cache()
+        return self.persistent_cache
+
+    def _generation_params(self, max_new_tokens: int) -> dict[str, object]:
+        params = {**GENERATION_PARAMS, "max_new_tokens": max_new_tokens, "max_chars": MAX_SECTION_CHARS}
+        backend = self._resolved_backend()
+        if backend != BACKEND_FP32:
+            # El modelo cuantizado puede redactar distinto: no comparte entradas con fp32.
+            params["backend"] = backend
+        return params
+
+    def _generate(self, prompt: str, max_new_tokens: int) -> str | None:
+        return self._generate_batch([prompt], max_new_tokens)[0]
+
+    def _generate_batch(self, prompts: Sequence[str], max_new_tokens: int) -> list[str | None]:
+        """Genera todos los ``prompts`` en una sola llamada al pipeline.
+
+        Con ``batch_size`` igual al número de prompts el pipeline rellena
+        (padding) las entradas al largo de la mayor y las procesa juntas.
+        """
+
+        empty: list[str | None] = [None] * len(prompts)
+        self._load_pipeline()
+        if not self._pipeline:
+            return empty
+
+        from transformers import set_seed
+
+        with self._lock, inference_context():
+            try:
+                set_seed(GENERATION_PARAMS["seed"])
+                outputs = self._pipeline(
+                    list(prompts),
+                    max_new_tokens=max_new_tokens,
+                    num_beams=GENERATION_PARAMS["num_beams"],
+                    do_sample=GENERATION_PARAMS["do_sample"],
+                    batch_size=len(prompts),
+                )
+            except Exception as exc:  # pragma: no cover - defensivo frente a errores del modelo
+                self._load_error = exc
+                return empty
+
+        texts: list[str | None] = []
+        for item in outputs or []:
+            if isinstance(item, list):
+                item = item[0] if item else {}
+            texts.append(item.get("generated_text") if isinstance(item, Mapping) else None)
+        return (texts + empty)[: len(prompts)]
+
+    def summarize(self, section: str, prompt: str, *, max_new_tokens: int | None = None) -> str | None:
+        tokens = max_new_tokens or self.max_new_tokens
+        # El texto generado no depende de la sección, solo del prompt.
+        key = (prompt, tokens)
+        if key in self._cache:
+            return self._cache[key]
 
-        if not outputs:
+        params = self._generation_params(tokens)
+        persistent = self._get_persistent_cache()
+        if persistent is not None:
+            cached = persistent.get(self.model_name, prompt, params)
+            if cached:
+                self._cache[key] = cached
+                return cached
+
+        generated = self._generate(prompt, tokens)
+        if generated is None:
             return None
-        text = sanitize_rich_text(outputs[0].get("generated_text"), max_chars=MAX_SECTION_CHARS).strip()
+        text = sanitize_rich_text(generated, max_chars=MAX_SECTION_CHARS).strip()
         if not text:
             return None
         self._cache[key] = text
+        if persistent is not None:
+            persistent.put(self.model_name, prompt, params, text, section=section)
         return text
 
+    def summarize_batch(self, requests: Sequence[tuple[str, str, int | None]]) -> list[str | None]:
+        """Resume varias secciones ``(sección, prompt, max_new_tokens)`` a la vez.
+
+        Las que ya están en caché no se regeneran; el resto se agrupa por
+        ``max_new_tokens`` y cada grupo va en una sola llamada al pipeline,
+        de modo que ninguna sección pasa su tope y cada texto se guarda con
+        los parámetros con que se generó.
+        """
+
+        results: list[str | None] = [None] * len(requests)
+        persistent = self._get_persistent_cache()
+        missing: list[tuple[int, int, dict[str, object]]] = []
+        for index, (_section, prompt, max_new_tokens) in enumerate(requests):
+            tokens = max_new_tokens or self.max_new_tokens
+            cached = self._cache.get((prompt, tokens))
+            params = self._generation_params(tokens)
+            if not cached and persistent is not None:
+                cached = persistent.get(self.model_name, prompt, params)
+                if cached:
+                    self._cache[(prompt, tokens)] = cached
+            if cached:
+                results[index] = cached
+            else:
+                missing.append((index, tokens, params))
+        if not missing:
+            return results
+
+        groups: dict[int, list[tuple[int, dict[str, object]]]] = {}
+        for index, tokens, params in missing:
+            groups.setdefault(tokens, []).append((index, params))
+        for tokens, group in groups.items():
+            prompts = [requests[index][1] for index, _params in group]
+            generated = self._generate_batch(prompts, tokens)
+            for (index, params), raw in zip(group, generated):
+                if raw is None:
+                    continue
+                text = sanitize_rich_text(raw, max_chars=MAX_SECTION_CHARS).strip()
+                if not text:
+                    continue
+                section, prompt, _max_new_tokens = requests[index]
+                results[index] = text
+                self._cache[(prompt, tokens)] = text
+                if persistent is not None:
+                    persistent.put(self.model_name, prompt, params, text, section=section)
+        return results
+
+
+def _section_fallback(section: str, sections: Mapping[str, str]) -> str:
+    """Texto determinístico del panel; ``PLACEHOLDER`` si no hay contenido."""
 
-def _synthesize_section_text(
-    section: str,
-    sections: Mapping[str, str],
-    caso: Mapping[str, object],
-    llm_helper: SpanishSummaryHelper | None,
-) -> str:
     section_key = _section_to_schema_key(section).replace("_identificados", "")
     fallback_source = sections.get(section_key, PLACEHOLDER)
     if _is_placeholder_text(fallback_source):
         return PLACEHOLDER
     if not _has_source_content(sections):
         return PLACEHOLDER
-    if not llm_helper:
-        return fallback_source
+    return fallback_source
+
+
+def _section_request(
+    section: str,
+    sections: Mapping[str, str],
+    caso: Mapping[str, object],
+    llm_helper: SpanishSummaryHelper,
+) -> tuple[str, str, int]:
     context_lines = [
         f"Caso: {sections.get('codigo', PLACEHOLDER)} | Tipo: {caso.get('tipo_informe', PLACEHOLDER)}",
         f"Resumen: {sections.get('resumen', PLACEHOLDER)}",
@@ -383,17 +647,97 @@ def _synthesize_section_text(
     ]
     prompt = _build_prompt(section, "\n".join(context_lines), caso)
     default_tokens = getattr(llm_helper, "max_new_tokens", 144)
-    llm_summary = llm_helper.summarize(
-        section,
-        prompt,
-        max_new_tokens=SECTION_MAX_NEW_TOKENS.get(section, default_tokens),
-    )
+    return section, prompt, SECTION_MAX_NEW_TOKENS.get(section, default_tokens)
+
+
+def _apply_llm_summary(section: str, llm_summary: str | None, fallback: str) -> str:
     if not llm_summary:
-        return fallback_source
+        return fallback
     parsed_text = _extract_text_from_llm_json(section, llm_summary)
     return parsed_text or llm_summary
 
 
+def _synthesize_section_text(
+    section: str,
+    sections: Mapping[str, str],
+    caso: Mapping[str, object],
+    llm_helper: SpanishSummaryHelper | None,
+) -> str:
+    fallback_source = _section_fallback(section, sections)
+    if fallback_source == PLACEHOLDER or not llm_helper:
+        return fallback_source
+    _section, prompt, max_new_tokens = _section_request(section, sections, caso, llm_helper)
+    llm_summary = llm_helper.summarize(section, prompt, max_new_tokens=max_new_tokens)
+    return _apply_llm_summary(section, llm_summary, fallback_source)
+
+
+def synthesize_alerta_sections(
+    sections: Mapping[str, str],
+    caso: Mapping[str, object],
+    llm_helper: SpanishSummaryHelper | None,
+    *,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    cancel_event: Optional[threading.Event] = None,
+    time_budget_s: Optional[float] = DEFAULT_LLM_TIME_BUDGET_S,
+    executor: Optional[Executor] = None,
+) -> dict[str, str]:
+    """Devuelve el texto de cada panel de ``ALERTA_SECTIONS``.
+
+    Las secciones con contenido se generan en una sola tarea del ejecutor
+    ``llm`` (un lote por tope de tokens) mientras este hilo espera en tramos
+    cortos, de modo que ``cancel_event`` interrumpe la espera
+    (``CancelledError``). Si la tarea no termina dentro de ``time_budget_s``
+    se devuelven los textos determinísticos; la tarea sigue en segundo plano
+    y deja sus resultados en la caché para la próxima generación.
+    """
+
+    texts = {section: _section_fallback(section, sections) for section in ALERTA_SECTIONS}
+    total = len(ALERTA_SECTIONS)
+    requests = []
+    if llm_helper:
+        requests = [
+            _section_request(section, sections, caso, llm_helper)
+            for section in ALERTA_SECTIONS
+            if texts[section] != PLACEHOLDER
+        ]
+    if progress_callback:
+        progress_callback(total - len(requests), total)
+    if not requests:
+        return texts
+
+    batch = getattr(llm_helper, "summarize_batch", None)
+    if batch is None:
+        def batch(items):
+            return [llm_helper.summarize(section, prompt, max_new_tokens=tokens) for section, prompt, tokens in items]
+
+    future = (executor or get_background_executor("llm")).submit(batch, requests)
+    deadline = time.monotonic() + time_budget_s if time_budget_s else None
+    summaries = None
+    while summaries is None:
+        if cancel_event is not None and cancel_event.is_set():
+            raise CancelledError()
+        wait = _LLM_WAIT_SLICE_S
+        if deadline is not None:
+            wait = min(wait, max(0.0, deadline - time.monotonic()))
+        try:
+            summaries = future.result(timeout=wait)
+        except FutureTimeoutError:
+            if deadline is not None and time.monotonic() >= deadline:
+                logger.warning(
+                    "La generación de la alerta temprana superó %.0f s; se usa el texto determinístico.",
+                    time_budget_s,
+                )
+                break
+        except Exception as exc:  # pragma: no cover - defensivo frente a errores del modelo
+            logger.warning("No se pudo generar la alerta temprana con el modelo: %s", exc)
+            break
+    for (section, _prompt, _tokens), summary in zip(requests, summaries or []):
+        texts[section] = _apply_llm_summary(section, summary, texts[section])
+    if progress_callback:
+        progress_callback(total, total)
+    return texts
+
+
 def _add_section_panel(slide, left, top, width, height, title: str, body: str, *, accent: RGBColor | None = None):
     if not PPTX_AVAILABLE:
         return None
@@ -540,8 +884,17 @@ def build_alerta_temprana_ppt(
     data: CaseData | Mapping[str, object],
     output_path: Path,
     llm_helper: SpanishSummaryHelper | None = None,
+    *,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    cancel_event: Optional[threading.Event] = None,
+    time_budget_s: Optional[float] = DEFAULT_LLM_TIME_BUDGET_S,
 ) -> Path:
-    """Genera una presentación PPTX con la alerta temprana."""
+    """Genera una presentación PPTX con la alerta temprana.
+
+    Los textos de los paneles se calculan antes de maquetar con
+    ``synthesize_alerta_sections``; ``progress_callback``, ``cancel_event`` y
+    ``time_budget_s`` se le pasan tal cual.
+    """
 
     if not PPTX_AVAILABLE:
         raise RuntimeError("python-pptx no está disponible para generar la alerta temprana.")
@@ -553,7 +906,14 @@ def build_alerta_temprana_ppt(
     caso = dataset.get("caso", {}) if isinstance(dataset, Mapping) else {}
     sections = build_alerta_temprana_sections(dataset)
     resumen_ejecutivo = build_executive_summary(dataset)
-    llm = llm_helper
+    texts = synthesize_alerta_sections(
+        sections,
+        caso,
+        llm_helper,
+        progress_callback=progress_callback,
+        cancel_event=cancel_event,
+        time_budget_s=time_budget_s,
+    )
 
     presentation = Presentation()
     presentation.slide_width = SLIDE_WIDTH_16_9
@@ -592,7 +952,7 @@ def build_alerta_temprana_ppt(
     acciones_height = int(right_usable_height * 0.26)
     responsables_height = max(right_usable_height - riesgos_height - acciones_height, int(Inches(1)))
 
-    resumen_text = _synthesize_section_text("Resumen", sections, caso, llm)
+    resumen_text = texts["Resumen"]
     _add_section_panel(
         slide,
         left_x,
@@ -604,7 +964,7 @@ def build_alerta_temprana_ppt(
         accent=RGBColor(219, 223, 232),
     )
 
-    cronologia_text = _synthesize_section_text("Cronología", sections, caso, llm)
+    cronologia_text = texts["Cronología"]
     _add_section_panel(
         slide,
         left_x,
@@ -616,7 +976,7 @@ def build_alerta_temprana_ppt(
         accent=RGBColor(219, 223, 232),
     )
 
-    analisis_text = _synthesize_section_text("Análisis", sections, caso, llm)
+    analisis_text = texts["Análisis"]
     _add_section_panel(
         slide,
         left_x,
@@ -628,7 +988,7 @@ def build_alerta_temprana_ppt(
         accent=RGBColor(219, 223, 232),
     )
 
-    riesgos_text = _synthesize_section_text("Riesgos", sections, caso, llm)
+    riesgos_text = texts["Riesgos"]
     _add_section_panel(
         slide,
         right_x,
@@ -640,7 +1000,7 @@ def build_alerta_temprana_ppt(
         accent=RGBColor(214, 226, 240),
     )
 
-    recomendaciones_text = _synthesize_section_text("Recomendaciones", sections, caso, llm)
+    recomendaciones_text = texts["Recomendaciones"]
     _add_section_panel(
         slide,
         right_x,
@@ -652,7 +1012,7 @@ def build_alerta_temprana_ppt(
         accent=RGBColor(214, 226, 240),
     )
 
-    responsables_text = _synthesize_section_text("Responsables", sections, caso, llm)
+    responsables_text = texts["Responsables"]
     _add_section_panel(
         slide,
         right_x,
@@ -673,12 +1033,17 @@ def build_alerta_temprana_ppt(
         " análisis desde antecedentes/conclusiones y riesgos desde catálogo."
     )
 
+    if cancel_event is not None and cancel_event.is_set():
+        raise CancelledError()
     presentation.save(output_path)
     return output_path
 
 
 __all__ = [
+    "ALERTA_SECTIONS",
+    "DEFAULT_LLM_TIME_BUDGET_S",
     "build_alerta_temprana_ppt",
+    "synthesize_alerta_sections",
     "SpanishSummaryHelper",
     "PPTX_AVAILABLE",
     "PPTX_MISSING_MESSAGE",
@@ -8,7 +8,7 @@ from decimal import Decimal
 from typing import Mapping, Sequence
 
 from report.common_amounts import aggregate_product_amounts
-from report_builder import CaseData
+from report.case_data import CaseData
 from validators import sanitize_rich_text
 
 logger = logging.getLogger(__name__)
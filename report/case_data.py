@@ -0,0 +1,86 @@
+"""Estructura normalizada del caso compartida por la UI y los reportes.
+
+Vive en un módulo propio, sin dependencias opcionales, para que la
+aplicación pueda construir ``CaseData`` sin importar ``python-docx``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+
+@dataclass
+class CaseData(Mapping):
+    """Estructura normalizada del caso y sus entidades relacionadas."""
+
+    caso: Dict[str, Any]
+    clientes: List[Dict[str, Any]]
+    colaboradores: List[Dict[str, Any]]
+    productos: List[Dict[str, Any]]
+    reclamos: List[Dict[str, Any]]
+    involucramientos: List[Dict[str, Any]]
+    riesgos: List[Dict[str, Any]]
+    normas: List[Dict[str, Any]]
+    analisis: Dict[str, Any]
+    encabezado: Dict[str, Any]
+    operaciones: List[Dict[str, Any]]
+    anexos: List[Dict[str, Any]]
+    firmas: List[Dict[str, Any]]
+    recomendaciones_categorias: Dict[str, Any]
+    responsables: List[Dict[str, Any]]
+    _dict_cache: Dict[str, Any] = field(default=None, init=False, repr=False)
+
+    def as_dict(self) -> Dict[str, Any]:
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "caso": self.caso,
+                "clientes": self.clientes,
+                "colaboradores": self.colaboradores,
+                "productos": self.productos,
+                "reclamos": self.reclamos,
+                "involucramientos": self.involucramientos,
+                "riesgos": self.riesgos,
+                "normas": self.normas,
+                "analisis": self.analisis,
+                "encabezado": self.encabezado,
+                "operaciones": self.operaciones,
+                "anexos": self.anexos,
+                "firmas": self.firmas,
+                "recomendaciones_categorias": self.recomendaciones_categorias,
+                "responsables": self.responsables,
+            }
+        return self._dict_cache
+
+    def __getitem__(self, key: str) -> Any:  # type: ignore[override]
+        return self.as_dict()[key]
+
+    def __iter__(self):  # type: ignore[override]
+        return iter(self.as_dict())
+
+    def __len__(self):  # type: ignore[override]
+        return len(self.as_dict())
+
+    def get(self, key: str, default: Any = None) -> Any:  # type: ignore[override]
+        return self.as_dict().get(key, default)
+
+    @classmethod
+    def from_mapping(cls, payload: Mapping[str, Any]) -> "CaseData":
+        return cls(
+            caso=dict(payload.get("caso") or {}),
+            clientes=list(payload.get("clientes") or []),
+            colaboradores=list(payload.get("colaboradores") or []),
+            productos=list(payload.get("productos") or []),
+            reclamos=list(payload.get("reclamos") or []),
+            involucramientos=list(payload.get("involucramientos") or []),
+            riesgos=list(payload.get("riesgos") or []),
+            normas=list(payload.get("normas") or []),
+            analisis=dict(payload.get("analisis") or {}),
+            encabezado=dict(payload.get("encabezado") or {}),
+            operaciones=list(payload.get("operaciones") or []),
+            anexos=list(payload.get("anexos") or []),
+            firmas=list(payload.get("firmas") or []),
+            recomendaciones_categorias=dict(payload.get("recomendaciones_categorias") or {}),
+            responsables=list(payload.get("responsables") or []),
+        )
@@ -1,9 +1,21 @@
+"""Agregación de montos de productos en una sola pasada.
+
+Autoguardado, refresco del resumen y exportaciones suman los mismos montos
+de productos. ``aggregate_amounts`` recorre la lista una sola vez y obtiene
+los totales por campo, por moneda y por categoría, además de la comparación
+entre el monto investigado y la suma de sus componentes. El texto de cada
+monto se interpreta con ``parse_decimal_amount``, que memoriza el resultado
+por texto crudo.
+"""
+
 from __future__ import annotations
 
+from collections import defaultdict
+from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import Iterable, Mapping
 
-from validators import parse_decimal_amount
+from validators import parse_decimal_amount, sum_investigation_components
 
 AMOUNT_FIELD_MAP: tuple[tuple[str, str], ...] = (
     ("investigado", "monto_investigado"),
@@ -13,17 +25,81 @@ AMOUNT_FIELD_MAP: tuple[tuple[str, str], ...] = (
     ("recuperado", "monto_recuperado"),
     ("pago_deuda", "monto_pago_deuda"),
 )
+COMPONENT_KEYS: tuple[str, ...] = ("perdida_fraude", "falla_procesos", "contingencia", "recuperado")
 
+_ZERO = Decimal("0")
 
-def aggregate_product_amounts(products: Iterable[Mapping[str, object]] | None) -> dict[str, Decimal]:
-    """Suma los montos de productos con salida normalizada por clave de negocio."""
-    totals = {key: Decimal("0") for key, _ in AMOUNT_FIELD_MAP}
+
+def _empty_totals() -> dict[str, Decimal]:
+    return {key: _ZERO for key, _ in AMOUNT_FIELD_MAP}
+
+
+@dataclass
+class AmountTotals:
+    """Totales de montos calculados en una pasada sobre los productos."""
+
+    totals: dict[str, Decimal] = field(default_factory=_empty_totals)
+    by_currency: dict[str, dict[str, Decimal]] = field(default_factory=dict)
+    by_category: dict[str, dict[str, Decimal]] = field(default_factory=dict)
+    components: Decimal = _ZERO
+    # IDs de productos cuyo monto investigado no coincide con sus componentes.
+    component_mismatches: list[str] = field(default_factory=list)
+    products: int = 0
+
+    @property
+    def investigated_gap(self) -> Decimal:
+        return self.totals["investigado"] - self.components
+
+
+def aggregate_amounts(products: Iterable[Mapping[str, object]] | None) -> AmountTotals:
+    """Calcula todos los totales de montos recorriendo ``products`` una vez."""
+
+    result = AmountTotals()
+    totals = result.totals
+    by_currency: dict[str, dict[str, Decimal]] = defaultdict(_empty_totals)
+    by_category: dict[str, dict[str, Decimal]] = defaultdict(_empty_totals)
     for product in products or []:
         if not isinstance(product, Mapping):
             continue
+        result.products += 1
+        currency_totals = by_currency[str(product.get("tipo_moneda") or "").strip()]
+        category_totals = by_category[str(product.get("categoria1") or "").strip()]
+        parsed: dict[str, Decimal | None] = {}
         for total_key, field_name in AMOUNT_FIELD_MAP:
             amount = parse_decimal_amount(product.get(field_name))
-            if amount is not None:
-                totals[total_key] += amount
-    return totals
+            parsed[total_key] = amount
+            if amount is None:
+                continue
+            totals[total_key] += amount
+            currency_totals[total_key] += amount
+            category_totals[total_key] += amount
+        if all(parsed[key] is not None for key in COMPONENT_KEYS):
+            component_sum = sum_investigation_components(
+                perdida=parsed["perdida_fraude"],
+                falla=parsed["falla_procesos"],
+                contingencia=parsed["contingencia"],
+                recuperado=parsed["recuperado"],
+            )
+            result.components += component_sum
+            investigated = parsed["investigado"]
+            if investigated is not None and investigated != component_sum:
+                result.component_mismatches.append(str(product.get("id_producto") or "").strip())
+    result.by_currency = dict(by_currency)
+    result.by_category = dict(by_category)
+    return result
+
+
+def sum_amount_field(items: Iterable[Mapping[str, object]] | None, field_name: str) -> Decimal:
+    """Suma un campo de monto arbitrario con el mismo criterio de interpretación."""
 
+    total = _ZERO
+    for item in items or []:
+        amount = parse_decimal_amount(item.get(field_name)) if isinstance(item, Mapping) else None
+        if amount is not None:
+            total += amount
+    return total
+
+
+def aggregate_product_amounts(products: Iterable[Mapping[str, object]] | None) -> dict[str, Decimal]:
+    """Suma los montos de productos con salida normalizada por clave de negocio."""
+    return dict(aggregate_amounts(products).totals)
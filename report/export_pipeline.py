@@ -0,0 +1,496 @@
+"""Canal de exportación de un caso sin dependencias de la interfaz.
+
+``FraudCaseApp._perform_save_exports`` genera los CSV, los históricos
+``h_*.csv``, el JSON de versión, el Markdown, el resumen ejecutivo y el DOCX
+de un caso. La lógica vive aquí para que la aplicación y los procesos por
+lotes (``tools.batch_export``) escriban exactamente los mismos archivos; la
+aplicación solo añade el diagrama de arquitectura y la copia a la unidad
+externa.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional, Sequence
+
+from report.case_data import CaseData
+from report.common_amounts import AMOUNT_FIELD_MAP
+from settings import (EVENTOS_HEADER_CANONICO, EVENTOS_PLACEHOLDER,
+                      RICH_TEXT_MAX_CHARS)
+from utils.historical_consolidator import append_historical_records
+from utils.lazy_loader import LazyModule, module_available
+from utils.perf_profiler import get_profiler
+from validators import LOG_FIELDNAMES, normalize_log_row, sanitize_rich_text
+
+# Los generadores arrastran python-docx; se importan al exportar el primer caso.
+_report_builder_module = LazyModule("report_builder")
+_resumen_ejecutivo_module = LazyModule("report.resumen_ejecutivo")
+
+COMENTARIO_BREVE_MAX_CHARS = 150
+COMENTARIO_AMPLIO_MAX_CHARS = 750
+
+EXPORT_HEADERS = {
+    "casos.csv": [
+        "id_caso",
+        "tipo_informe",
+        "categoria1",
+        "categoria2",
+        "modalidad",
+        "canal",
+        "proceso",
+        "fecha_de_ocurrencia",
+        "fecha_de_descubrimiento",
+        "centro_costos",
+        "matricula_investigador",
+        "investigador_nombre",
+        "investigador_cargo",
+    ],
+    "clientes.csv": [
+        "id_cliente",
+        "id_caso",
+        "nombres",
+        "apellidos",
+        "tipo_id",
+        "flag",
+        "telefonos",
+        "correos",
+        "direcciones",
+        "accionado",
+    ],
+    "colaboradores.csv": [
+        "id_colaborador",
+        "id_caso",
+        "flag",
+        "nombres",
+        "apellidos",
+        "division",
+        "area",
+        "servicio",
+        "puesto",
+        "fecha_carta_inmediatez",
+        "fecha_carta_renuncia",
+        "motivo_cese",
+        "nombre_agencia",
+        "codigo_agencia",
+        "tipo_falta",
+        "tipo_sancion",
+    ],
+    "productos.csv": [
+        "id_producto",
+        "id_caso",
+        "id_cliente",
+        "categoria1",
+        "categoria2",
+        "modalidad",
+        "canal",
+        "proceso",
+        "fecha_ocurrencia",
+        "fecha_descubrimiento",
+        "monto_investigado",
+        "tipo_moneda",
+        "monto_perdida_fraude",
+        "monto_falla_procesos",
+        "monto_contingencia",
+        "monto_recuperado",
+        "monto_pago_deuda",
+        "tipo_producto",
+    ],
+    "producto_reclamo.csv": [
+        "id_reclamo",
+        "id_caso",
+        "id_producto",
+        "nombre_analitica",
+        "codigo_analitica",
+    ],
+    "involucramiento.csv": [
+        "id_producto",
+        "id_caso",
+        "tipo_involucrado",
+        "id_colaborador",
+        "id_cliente_involucrado",
+        "monto_asignado",
+    ],
+    "detalles_riesgo.csv": [
+        "id_riesgo",
+        "id_caso",
+        "lider",
+        "descripcion",
+        "criticidad",
+        "exposicion_residual",
+        "planes_accion",
+    ],
+    "detalles_norma.csv": [
+        "id_norma",
+        "id_caso",
+        "descripcion",
+        "fecha_vigencia",
+        "acapite_inciso",
+        "detalle_norma",
+    ],
+    "analisis.csv": [
+        "id_caso",
+        "antecedentes",
+        "modus_operandi",
+        "hallazgos",
+        "descargos",
+        "conclusiones",
+        "recomendaciones",
+        "comentario_breve",
+        "comentario_amplio",
+    ],
+}
+
+# Montos que en eventos_lhcl.csv solo se informan en la primera fila de cada producto.
+EVENTOS_AMOUNT_FIELDS = frozenset(
+    {
+        "monto_investigado",
+        "monto_perdida_fraude",
+        "monto_falla_procesos",
+        "monto_contingencia",
+        "monto_recuperado",
+        "monto_pago_deuda",
+        "monto_fraude_interno_soles",
+        "monto_fraude_interno_dolares",
+        "monto_fraude_externo_soles",
+        "monto_fraude_externo_dolares",
+        "monto_falla_en_proceso_soles",
+        "monto_falla_en_proceso_dolares",
+        "monto_contingencia_soles",
+        "monto_contingencia_dolares",
+        "monto_recuperado_soles",
+        "monto_recuperado_dolares",
+        "monto_pagado_soles",
+        "monto_pagado_dolares",
+    }
+)
+ANALYSIS_SECTIONS = (
+    "antecedentes",
+    "modus_operandi",
+    "hallazgos",
+    "descargos",
+    "conclusiones",
+    "recomendaciones",
+    "comentario_breve",
+    "comentario_amplio",
+)
+# Montos de producto que admiten vacío y se exportan como "0.00".
+OPTIONAL_AMOUNT_FIELDS = tuple(name for key, name in AMOUNT_FIELD_MAP if key != "investigado")
+CASE_COLLECTIONS = (
+    "clientes",
+    "colaboradores",
+    "productos",
+    "reclamos",
+    "involucramientos",
+    "riesgos",
+    "normas",
+)
+
+
+@dataclass
+class CaseExportResult:
+    """Archivos y avisos producidos al exportar un caso."""
+
+    data: CaseData
+    report_prefix: str
+    created_files: list[Path] = field(default_factory=list)
+    md_path: Optional[Path] = None
+    resumen_path: Optional[Path] = None
+    docx_path: Optional[Path] = None
+    warnings: list[str] = field(default_factory=list)
+
+
+def sanitize_csv_value(value):
+    sanitized = sanitize_rich_text("" if value is None else value, max_chars=None)
+    if sanitized == EVENTOS_PLACEHOLDER:
+        return sanitized
+    if sanitized == "-":
+        return sanitized
+    if sanitized.startswith(("=", "+", "-", "@")):
+        return f"'{sanitized}"
+    return sanitized
+
+
+def normalize_export_encoding(value: object) -> str:
+    normalized = str(value or "").strip().lower()
+    if normalized in {"utf8", "utf-8"}:
+        return "utf-8"
+    if normalized in {"latin1", "latin-1", "latin_1", "iso-8859-1"}:
+        return "latin-1"
+    return "utf-8"
+
+
+def build_export_encoding_error(file_name: str, encoding: str, exc: UnicodeEncodeError) -> str:
+    if encoding == "latin-1":
+        return (
+            f"No se pudo exportar {file_name} en Latin-1 porque el texto contiene caracteres "
+            "que no existen en esa codificación. Cambia la codificación a UTF-8 o reemplaza "
+            "los caracteres especiales antes de exportar."
+        )
+    return f"No se pudo exportar {file_name} usando {encoding}: {exc}"
+
+
+def deserialize_rich_text_payload(payload) -> tuple[str, list, list]:
+    if isinstance(payload, Mapping):
+        text = payload.get("text", "")
+        tags = payload.get("tags") or []
+        images = payload.get("images") or []
+        return str(text), list(tags), list(images)
+    return str(payload or ""), [], []
+
+
+def normalize_analysis_texts(analysis_payload) -> dict[str, dict]:
+    """Normaliza las secciones de análisis con los límites de cada campo."""
+
+    def _build_entry(value, *, max_chars=RICH_TEXT_MAX_CHARS, allow_newlines=True):
+        text, tags, images = deserialize_rich_text_payload(value)
+        sanitized = sanitize_rich_text(text, max_chars=None)
+        if not allow_newlines and "\n" in sanitized:
+            sanitized = " ".join(sanitized.splitlines())
+        sanitized = sanitize_rich_text(sanitized, max_chars)
+        entry = {"text": sanitized, "tags": tags}
+        if images:
+            entry["images"] = images
+        return entry
+
+    comment_limits = {
+        "comentario_breve": (COMENTARIO_BREVE_MAX_CHARS, False),
+        "comentario_amplio": (COMENTARIO_AMPLIO_MAX_CHARS, False),
+    }
+    payload = analysis_payload or {}
+    normalized = {}
+    for name in ANALYSIS_SECTIONS:
+        max_chars, allow_newlines = comment_limits.get(name, (RICH_TEXT_MAX_CHARS, True))
+        normalized[name] = _build_entry(
+            payload.get(name),
+            max_chars=max_chars,
+            allow_newlines=allow_newlines,
+        )
+    for name, value in payload.items():
+        if name in normalized:
+            continue
+        normalized[name] = _build_entry(value)
+    return normalized
+
+
+def build_report_path(data: CaseData, folder: Path, extension: str) -> Path:
+    case = data.get("caso", {}) if isinstance(data, Mapping) else {}
+    report_name = _report_builder_module.build_report_filename(
+        case.get("tipo_informe"), case.get("id_caso"), extension
+    )
+    return Path(folder) / report_name
+
+
+def build_resumen_ejecutivo_path(data: CaseData, folder: Path) -> Path:
+    case = data.get("caso", {}) if isinstance(data, Mapping) else {}
+    report_name = _resumen_ejecutivo_module.build_resumen_ejecutivo_filename(
+        case.get("tipo_informe"), case.get("id_caso"), "md"
+    )
+    return Path(folder) / report_name
+
+
+def build_report_prefix(data: CaseData) -> str:
+    """Devuelve el prefijo normalizado para los reportes y exportaciones.
+
+    Se apoya en ``build_report_filename`` para reutilizar la misma lógica
+    de limpieza aplicada a los informes DOCX/MD, eliminando la extensión
+    para poder reutilizar el prefijo en los CSV y en el JSON.
+    """
+
+    return build_report_path(data, Path("."), "csv").stem
+
+
+def build_eventos_lhcl_rows(event_rows: Sequence[Mapping], event_header: Sequence[str]) -> list[dict]:
+    """Conserva los montos solo en la primera fila de cada producto."""
+
+    amount_fields = [name for name in event_header if name in EVENTOS_AMOUNT_FIELDS]
+    rows = []
+    seen_products: set[str] = set()
+    for row in event_rows:
+        product_key = str(row.get("product_id") or row.get("id_producto") or "")
+        if product_key not in seen_products:
+            seen_products.add(product_key)
+            rows.append(row)
+            continue
+        sanitized_row = dict(row)
+        for name in amount_fields:
+            if name in sanitized_row:
+                sanitized_row[name] = EVENTOS_PLACEHOLDER
+        rows.append(sanitized_row)
+    return rows
+
+
+def prepare_case_data(payload: Mapping) -> CaseData:
+    """Construye ``CaseData`` desde un ``version.json`` o un autoguardado.
+
+    Los autoguardados envuelven el caso en ``dataset``; los JSON de versión
+    exportados lo contienen directamente. Completa los montos opcionales en
+    blanco y propaga el ID del caso como lo hace la aplicación al exportar.
+    """
+
+    dataset = payload.get("dataset") if isinstance(payload.get("dataset"), Mapping) else payload
+    data = dataset if isinstance(dataset, CaseData) else CaseData.from_mapping(dataset or {})
+    for product in data.get("productos") or []:
+        if not isinstance(product, dict):
+            continue
+        for name in OPTIONAL_AMOUNT_FIELDS:
+            value = product.get(name)
+            if not str("" if value is None else value).strip():
+                product[name] = "0.00"
+    case_id = data.get("caso", {}).get("id_caso", "")
+    for collection in CASE_COLLECTIONS:
+        for row in data.get(collection, []):
+            if isinstance(row, dict):
+                row["id_caso"] = case_id
+    return data
+
+
+def write_case_exports(
+    data: CaseData,
+    folder: Path | str,
+    case_id: str,
+    *,
+    logs: Optional[Sequence[Mapping]] = None,
+    encoding: str = "utf-8",
+    timestamp: Optional[datetime] = None,
+    docx_available: Optional[bool] = None,
+    on_warning: Optional[Callable[[str], None]] = None,
+    analysis_normalizer: Optional[Callable[[Mapping], Mapping]] = None,
+) -> CaseExportResult:
+    """Escribe todos los archivos de exportación de ``data`` en ``folder``.
+
+    Los históricos ``h_*.csv`` se acumulan en ``folder`` con ``timestamp``
+    como marca de actualización. ``on_warning`` recibe los avisos no
+    bloqueantes (por ejemplo, un DOCX que no pudo generarse) y
+    ``analysis_normalizer`` reemplaza a ``normalize_analysis_texts``. Con el
+    perfilador activo cada artefacto queda medido bajo la categoría
+    ``export``.
+    """
+
+    folder = Path(folder)
+    profiler = get_profiler()
+    report_builder = _report_builder_module
+    report_prefix = build_report_prefix(data)
+    result = CaseExportResult(data=data, report_prefix=report_prefix)
+    created_files = result.created_files
+    llave_rows, llave_header = report_builder.build_llave_tecnica_rows(data)
+    event_rows, _event_header = report_builder.build_event_rows(data)
+    event_header = list(EVENTOS_HEADER_CANONICO)
+    # Nota: las reglas de validación siguen el Design document CM.pdf; este bloque sólo ajusta exportaciones.
+    eventos_lhcl_rows = build_eventos_lhcl_rows(event_rows, event_header)
+    history_targets: list[tuple[str, list, list[str]]] = []
+    normalized_case_id = (case_id or "").strip().upper()
+    history_timestamp = timestamp or datetime.now()
+    export_encoding = normalize_export_encoding(encoding)
+
+    def write_csv(file_name, rows, header, *, historical_name: Optional[str] = None):
+        path = folder / f"{report_prefix}_{file_name}"
+        try:
+            with profiler.span("csv", "export", file=file_name, rows=len(rows)), path.open(
+                "w", newline="", encoding=export_encoding
+            ) as f:
+                writer = csv.DictWriter(f, fieldnames=header)
+                writer.writeheader()
+                for row in rows:
+                    sanitized_row = {
+                        name: sanitize_csv_value(row.get(name, "")) for name in header
+                    }
+                    writer.writerow(sanitized_row)
+        except UnicodeEncodeError as exc:
+            raise ValueError(build_export_encoding_error(file_name, export_encoding, exc)) from exc
+        created_files.append(path)
+        if historical_name:
+            history_targets.append((historical_name, rows, header))
+
+    write_csv("casos.csv", [data["caso"]], EXPORT_HEADERS["casos.csv"])
+    write_csv("llave_tecnica.csv", llave_rows, llave_header, historical_name="llave_tecnica")
+    write_csv("eventos.csv", event_rows, event_header, historical_name="eventos")
+    write_csv("eventos_lhcl.csv", eventos_lhcl_rows, event_header, historical_name="eventos_lhcl")
+    for file_name, collection, historical_name in (
+        ("clientes.csv", "clientes", "clientes"),
+        ("colaboradores.csv", "colaboradores", "colaboradores"),
+        ("productos.csv", "productos", "productos"),
+        ("producto_reclamo.csv", "reclamos", "producto_reclamo"),
+        ("involucramiento.csv", "involucramientos", "involucramiento"),
+        ("detalles_riesgo.csv", "riesgos", "detalles_riesgo"),
+        ("detalles_norma.csv", "normas", "detalles_norma"),
+    ):
+        write_csv(file_name, data[collection], EXPORT_HEADERS[file_name], historical_name=historical_name)
+    analysis_texts = (analysis_normalizer or normalize_analysis_texts)(data["analisis"])
+    analysis_row = {
+        "id_caso": data["caso"]["id_caso"],
+        **{
+            key: (value.get("text") if isinstance(value, Mapping) else "")
+            for key, value in analysis_texts.items()
+        },
+    }
+    write_csv("analisis.csv", [analysis_row], EXPORT_HEADERS["analisis.csv"], historical_name="analisis")
+    if logs:
+        write_csv("logs.csv", [normalize_log_row(row) for row in logs], LOG_FIELDNAMES, historical_name="logs")
+    json_path = folder / f"{report_prefix}_version.json"
+    with profiler.span("version_json", "export"), json_path.open("w", encoding="utf-8") as f:
+        json.dump(data.as_dict(), f, ensure_ascii=False, indent=2)
+    created_files.append(json_path)
+    result.md_path = build_report_path(data, folder, "md")
+    with profiler.span("md", "export"):
+        created_files.append(report_builder.save_md(data, result.md_path))
+    result.resumen_path = build_resumen_ejecutivo_path(data, folder)
+    with profiler.span("resumen_ejecutivo", "export"):
+        created_files.append(_resumen_ejecutivo_module.build_resumen_ejecutivo_md(data, result.resumen_path))
+    if docx_available is None:
+        docx_available = module_available("docx")
+    if not docx_available:
+        result.warnings.append(report_builder.DOCX_MISSING_MESSAGE)
+    else:
+        try:
+            with profiler.span("docx", "export"):
+                result.docx_path = report_builder.build_docx(data, build_report_path(data, folder, "docx"))
+        except Exception as exc:  # pragma: no cover - protección frente a fallos externos
+            warning = f"Error al generar DOCX: {exc}"
+            if on_warning:
+                on_warning(warning)
+            result.warnings.append(warning)
+            result.docx_path = None
+        else:
+            if result.docx_path:
+                created_files.append(result.docx_path)
+    for table_name, rows, header in history_targets:
+        try:
+            with profiler.span("history", "export", table=table_name, rows=len(rows)):
+                history_path = append_historical_records(
+                    table_name,
+                    rows,
+                    header,
+                    folder,
+                    normalized_case_id,
+                    timestamp=history_timestamp,
+                    encoding=export_encoding,
+                )
+        except UnicodeEncodeError as exc:
+            raise ValueError(
+                build_export_encoding_error(f"h_{table_name}.csv", export_encoding, exc)
+            ) from exc
+        if history_path:
+            created_files.append(history_path)
+    return result
+
+
+__all__ = [
+    "CaseExportResult",
+    "COMENTARIO_AMPLIO_MAX_CHARS",
+    "COMENTARIO_BREVE_MAX_CHARS",
+    "EXPORT_HEADERS",
+    "build_export_encoding_error",
+    "build_report_path",
+    "build_report_prefix",
+    "build_resumen_ejecutivo_path",
+    "normalize_analysis_texts",
+    "normalize_export_encoding",
+    "prepare_case_data",
+    "sanitize_csv_value",
+    "write_case_exports",
+]
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 from collections import defaultdict
 from collections.abc import Mapping
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from decimal import Decimal
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Set
@@ -26,6 +26,9 @@ DOCX_MISSING_MESSAGE = (
 
 import settings
 from validators import parse_decimal_amount, sanitize_rich_text
+from report.case_data import CaseData
+from report.common_amounts import (AMOUNT_FIELD_MAP, aggregate_amounts,
+                                   sum_amount_field)
 from report.styling_enhancer import apply_cell_shading, apply_header_band, style_section_heading, style_table, style_title
 
 
@@ -505,81 +508,6 @@ def build_event_rows(case_data: Mapping[str, Any] | CaseData) -> tuple[list[dict
     return rows, header
 
 
-@dataclass
-class CaseData(Mapping):
-    """Estructura normalizada del caso y sus entidades relacionadas."""
-
-    caso: Dict[str, Any]
-    clientes: List[Dict[str, Any]]
-    colaboradores: List[Dict[str, Any]]
-    productos: List[Dict[str, Any]]
-    reclamos: List[Dict[str, Any]]
-    involucramientos: List[Dict[str, Any]]
-    riesgos: List[Dict[str, Any]]
-    normas: List[Dict[str, Any]]
-    analisis: Dict[str, Any]
-    encabezado: Dict[str, Any]
-    operaciones: List[Dict[str, Any]]
-    anexos: List[Dict[str, Any]]
-    firmas: List[Dict[str, Any]]
-    recomendaciones_categorias: Dict[str, Any]
-    responsables: List[Dict[str, Any]]
-    _dict_cache: Dict[str, Any] = field(default=None, init=False, repr=False)
-
-    def as_dict(self) -> Dict[str, Any]:
-        if self._dict_cache is None:
-            self._dict_cache = {
-                "caso": self.caso,
-                "clientes": self.clientes,
-                "colaboradores": self.colaboradores,
-                "productos": self.productos,
-                "reclamos": self.reclamos,
-                "involucramientos": self.involucramientos,
-                "riesgos": self.riesgos,
-                "normas": self.normas,
-                "analisis": self.analisis,
-                "encabezado": self.encabezado,
-                "operaciones": self.operaciones,
-                "anexos": self.anexos,
-                "firmas": self.firmas,
-                "recomendaciones_categorias": self.recomendaciones_categorias,
-                "responsables": self.responsables,
-            }
-        return self._dict_cache
-
-    def __getitem__(self, key: str) -> Any:  # type: ignore[override]
-        return self.as_dict()[key]
-
-    def __iter__(self):  # type: ignore[override]
-        return iter(self.as_dict())
-
-    def __len__(self):  # type: ignore[override]
-        return len(self.as_dict())
-
-    def get(self, key: str, default: Any = None) -> Any:  # type: ignore[override]
-        return self.as_dict().get(key, default)
-
-    @classmethod
-    def from_mapping(cls, payload: Mapping[str, Any]) -> "CaseData":
-        return cls(
-            caso=dict(payload.get("caso") or {}),
-            clientes=list(payload.get("clientes") or []),
-            colaboradores=list(payload.get("colaboradores") or []),
-            productos=list(payload.get("productos") or []),
-            reclamos=list(payload.get("reclamos") or []),
-            involucramientos=list(payload.get("involucramientos") or []),
-            riesgos=list(payload.get("riesgos") or []),
-            normas=list(payload.get("normas") or []),
-            analisis=dict(payload.get("analisis") or {}),
-            encabezado=dict(payload.get("encabezado") or {}),
-            operaciones=list(payload.get("operaciones") or []),
-            anexos=list(payload.get("anexos") or []),
-            firmas=list(payload.get("firmas") or []),
-            recomendaciones_categorias=dict(payload.get("recomendaciones_categorias") or {}),
-            responsables=list(payload.get("responsables") or []),
-        )
-
-
 def _normalize_report_segment(value: str | None, placeholder: str) -> str:
     text = (value or "").strip() or placeholder
     for ch in '\\/:*?"<>|':
@@ -842,18 +770,25 @@ def _format_decimal_value(value: Optional[Decimal]) -> str:
 
 
 def _sum_amounts(items: Iterable[Mapping[str, Any]], key: str) -> Decimal:
-    total = Decimal("0")
-    for item in items:
-        amount = parse_decimal_amount(item.get(key)) if isinstance(item, Mapping) else None
-        if amount is not None:
-            total += amount
-    return total
+    return sum_amount_field(items, key)
 
 
 def _aggregate_amounts(
     products: List[Dict[str, Any]],
     encabezado: Mapping[str, Any],
 ) -> Dict[str, Optional[Decimal]]:
+    totals_by_field: Dict[str, Decimal] = {}
+
+    def product_total(field_name: str) -> Decimal:
+        # Los productos se agregan una sola vez aunque varios campos del
+        # encabezado necesiten el total de respaldo.
+        if not totals_by_field:
+            totals = aggregate_amounts(products).totals
+            totals_by_field.update({field: totals[key] for key, field in AMOUNT_FIELD_MAP})
+        if field_name in totals_by_field:
+            return totals_by_field[field_name]
+        return _sum_amounts(products, field_name)
+
     def get_amount(key: str, fallback_key: Optional[str] = None) -> Optional[Decimal]:
         raw_value = encabezado.get(key) if isinstance(encabezado, Mapping) else None
         if raw_value not in (None, ""):
@@ -861,12 +796,12 @@ def _aggregate_amounts(
             if parsed is not None:
                 return parsed
         if fallback_key:
-            return _sum_amounts(products, fallback_key)
+            return product_total(fallback_key)
         return None
 
     perdida_total = get_amount("perdida_total")
     if perdida_total is None:
-        perdida_total = _sum_amounts(products, "monto_perdida_fraude")
+        perdida_total = product_total("monto_perdida_fraude")
 
     return {
         "investigado": get_amount("importe_investigado", "monto_investigado"),
@@ -297,6 +297,9 @@ EXPORTS_DIR = os.path.join(BASE_DIR, "exports")
 EXTERNAL_DRIVE_DIR = os.path.join(BASE_DIR, "external drive")
 EXTERNAL_LOGS_FILE = os.path.join(EXTERNAL_DRIVE_DIR, "logs.csv")
 PENDING_CONSOLIDATION_FILE = os.path.join(BASE_DIR, "pending_consolidation.txt")
+# Archivos h_*.csv que se reponen a la vez al vaciar el manifiesto de
+# consolidaciones pendientes (cada hilo escribe un archivo distinto).
+PENDING_CONSOLIDATION_WORKERS = 4
 REPORT_TEMPLATE_PATH = Path(
     os.getenv("REPORT_TEMPLATE_PATH", os.path.join(BASE_DIR, "templates", "report_template.dotx"))
 )
@@ -308,6 +311,61 @@ TEMP_AUTOSAVE_MAX_AGE_DAYS = 7
 TEMP_AUTOSAVE_COMPRESS_OLD = True
 RICH_TEXT_MAX_CHARS = 5000
 CONFETTI_ENABLED = False
+# "detallado" escribe una fila por evento de foco/clic. "compacto" (opcional)
+# los registra en un anillo en memoria y solo escribe filas resumidas al volcar
+# la bitácora: coordenadas del centro de cada zona y el número de eventos en
+# ``new_value``, sin marcas de tiempo por evento.
+NAVIGATION_TELEMETRY_MODE = "detallado"
+# Fracción de eventos de navegación registrados en modo compacto (0-1).
+NAVIGATION_TELEMETRY_SAMPLE_RATE = 1.0
+# Perfilado de tareas de fondo, callbacks de Tk, importaciones, autoguardado y
+# exportaciones. Se activa con la variable de entorno PERF_PROFILING=1; al
+# cerrar la aplicación se escribe la traza (formato Chrome trace-event) en
+# PERF_TRACE_PATH.
+PERF_PROFILING_ENABLED = os.getenv("PERF_PROFILING", "0").strip().lower() in {"1", "true", "si", "sí"}
+PERF_TRACE_PATH = os.getenv("PERF_TRACE_PATH", os.path.join(BASE_DIR, "logs", "perf_trace.json"))
+# Fracción de tramos cronometrados (0-1); en producción basta con 0.1.
+PERF_SAMPLE_RATE = 1.0
+# Callbacks del hilo de Tk que superan este umbral aparecen en el panel.
+PERF_SLOW_CALLBACK_MS = 50
+# Abre el panel de rendimiento al iniciar (también con Ctrl+Alt+P).
+PERF_HUD_ENABLED = False
+# Caché persistente de los resúmenes del modelo local (alerta temprana y
+# auto-redacción), compartida entre sesiones en la unidad externa.
+LLM_SUMMARY_CACHE_PATH = os.getenv(
+    "LLM_SUMMARY_CACHE_PATH", os.path.join(EXTERNAL_DRIVE_DIR, "cache", "llm_summaries.sqlite3")
+)
+LLM_SUMMARY_CACHE_MAX_BYTES = 64 * 1024 * 1024
+# Redacción de la alerta temprana con el modelo local. Al activarse, el modelo
+# se precarga en segundo plano al abrir la pestaña de análisis; si la
+# generación supera el presupuesto (segundos) se usa el texto determinístico.
+ALERTA_TEMPRANA_LLM_ENABLED = os.getenv("ALERTA_TEMPRANA_LLM", "0").strip().lower() in {"1", "true", "si", "sí"}
+ALERTA_TEMPRANA_LLM_TIME_BUDGET_SECONDS = 90
+# Backend del modelo local en CPU: "fp32" (original) o "int8" (cuantización
+# dinámica de las capas lineales; los pesos cuantizados se guardan una vez en
+# LLM_QUANTIZED_CACHE_DIR o junto al modelo si es una carpeta local).
+LLM_INFERENCE_BACKEND = os.getenv("LLM_INFERENCE_BACKEND", "fp32").strip().lower()
+# Hilos de PyTorch para la generación; 0 usa todos los núcleos.
+LLM_NUM_THREADS = int(os.getenv("LLM_NUM_THREADS", "0") or 0)
+LLM_QUANTIZED_CACHE_DIR = os.getenv(
+    "LLM_QUANTIZED_CACHE_DIR", os.path.join(EXTERNAL_DRIVE_DIR, "models", "quantized")
+)
+# Cubo de uso (analytics.usage_cube) de cada logs.csv: tras volcar la
+# bitácora se compactan en segundo plano las filas nuevas, como máximo una vez
+# por intervalo (segundos). Los cubos viven en una carpeta local del equipo,
+# nunca en la unidad compartida, para que varias estaciones no escriban el
+# mismo SQLite por red.
+USAGE_CUBE_ENABLED = True
+USAGE_CUBE_COMPACT_INTERVAL_SECONDS = 300
+USAGE_CUBE_DIR = os.getenv("USAGE_CUBE_DIR", os.path.join(BASE_DIR, "logs", "usage_cube"))
+# Cargas y borrados masivos del formulario: a partir de este número de frames
+# se construyen por tramos de ``BULK_LOAD_SLICE_MS`` con diálogo de progreso.
+BULK_LOAD_SLICED_THRESHOLD = 60
+BULK_LOAD_SLICE_MS = 40
+# Vista previa de importaciones masivas: clasifica las filas en segundo plano
+# y pide confirmación antes de aplicarlas (filas por página del resumen).
+IMPORT_PREVIEW_ENABLED = True
+IMPORT_PREVIEW_PAGE_SIZE = 50
 
 
 def ensure_external_drive_dir() -> Path:
@@ -374,10 +432,17 @@ __all__ = [
     "EVENTOS_PLACEHOLDER",
     "EXTERNAL_DRIVE_DIR",
     "EXTERNAL_LOGS_FILE",
+    "ALERTA_TEMPRANA_LLM_ENABLED",
+    "ALERTA_TEMPRANA_LLM_TIME_BUDGET_SECONDS",
     "CONFETTI_ENABLED",
     "ENABLE_EXTENDED_ANALYSIS_SECTIONS",
     "FLAG_CLIENTE_LIST",
     "FLAG_COLABORADOR_LIST",
+    "LLM_INFERENCE_BACKEND",
+    "LLM_NUM_THREADS",
+    "LLM_QUANTIZED_CACHE_DIR",
+    "LLM_SUMMARY_CACHE_MAX_BYTES",
+    "LLM_SUMMARY_CACHE_PATH",
     "LOGS_FILE",
     "STORE_LOGS_LOCALLY",
     "MASSIVE_SAMPLE_FILES",
@@ -387,6 +452,13 @@ __all__ = [
     "PROCESO_LIST",
     "RISK_ID_ALIASES",
     "TEAM_DETAILS_FILE",
+    "USAGE_CUBE_COMPACT_INTERVAL_SECONDS",
+    "USAGE_CUBE_DIR",
+    "USAGE_CUBE_ENABLED",
+    "BULK_LOAD_SLICED_THRESHOLD",
+    "BULK_LOAD_SLICE_MS",
+    "IMPORT_PREVIEW_ENABLED",
+    "IMPORT_PREVIEW_PAGE_SIZE",
     "TEAM_ID_ALIASES",
     "TAXONOMIA",
     "TIPO_FALTA_LIST",
@@ -400,4 +472,10 @@ __all__ = [
     "TEMP_AUTOSAVE_MAX_PER_CASE",
     "ensure_external_drive_dir",
     "PENDING_CONSOLIDATION_FILE",
+    "PENDING_CONSOLIDATION_WORKERS",
+    "PERF_HUD_ENABLED",
+    "PERF_PROFILING_ENABLED",
+    "PERF_SAMPLE_RATE",
+    "PERF_SLOW_CALLBACK_MS",
+    "PERF_TRACE_PATH",
 ]
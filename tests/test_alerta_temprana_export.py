@@ -642,6 +642,38 @@ def test_fit_text_to_box_truncates_long_narrative(caplog):
     assert "Cronología" in caplog.text
 
 
+def test_fit_text_to_box_picks_largest_font_and_memoizes(monkeypatch):
+    text = ("Transferencias no reconocidas en banca por internet. " * 12).strip()
+    alerta_temprana._fit_layout.cache_clear()
+
+    result = _fit_text_to_box(text, width_in=3.5, height_in=1.9, section_title="Resumen")
+
+    paragraphs = alerta_temprana._measure_paragraphs(text)
+    fitting = [
+        font_pt
+        for font_pt in range(alerta_temprana.MIN_BODY_FONT_PT, alerta_temprana.DEFAULT_BODY_FONT_PT + 1)
+        if alerta_temprana._wrap_lines(
+            paragraphs,
+            (3.5 - 2 * alerta_temprana.TEXTBOX_INSET_X_IN) * 72 / font_pt,
+            alerta_temprana._estimate_line_capacity(1.8, font_pt, alerta_temprana.DEFAULT_LINE_SPACING),
+        )[1]
+        is None
+    ]
+    assert result.truncated is False
+    assert result.font_pt == max(fitting)
+
+    monkeypatch.setattr(alerta_temprana, "sanitize_rich_text", lambda *_a, **_k: pytest.fail("re-sanitized"))
+    assert _fit_text_to_box(text, width_in=3.5, height_in=1.9, section_title="Resumen") is result
+
+
+def test_glyph_widths_make_narrow_text_fit_more_characters():
+    narrow = alerta_temprana._text_width_em("illi" * 10)
+    wide = alerta_temprana._text_width_em("MWMW" * 10)
+
+    assert narrow < wide / 3
+    assert alerta_temprana._text_width_em("acción") == alerta_temprana._text_width_em("accion")
+
+
 @pytest.mark.skipif(not alerta_temprana.PPTX_AVAILABLE, reason="python-pptx no disponible")
 def test_add_section_panel_supports_bullet_paragraphs():
     from pptx import Presentation
@@ -0,0 +1,114 @@
+"""Generación por lotes, presupuesto de tiempo y precarga del modelo de la alerta temprana."""
+
+import sys
+import threading
+import types
+from concurrent.futures import CancelledError
+
+import pytest
+
+from report import alerta_temprana
+from report.alerta_temprana import (ALERTA_SECTIONS, SpanishSummaryHelper,
+                                    _section_fallback,
+                                    synthesize_alerta_sections)
+
+SECTIONS = {
+    "codigo": "2025-0042",
+    "resumen": "Resumen con datos factuales.",
+    "cronologia": "Cronología base.",
+    "analisis": "Análisis con hallazgo principal y control fallido.",
+    "riesgos": "Riesgo operacional alto.",
+    "recomendaciones": "Reforzar controles de onboarding digital.",
+    "responsables": "Dueño de proceso digital.",
+}
+CASO = {"tipo_informe": "Fraude", "modalidad": "Digital"}
+
+
+class BatchHelper(SpanishSummaryHelper):
+    """Helper cuyo pipeline devuelve un texto por prompt y registra los lotes."""
+
+    def __init__(self, *, release: threading.Event | None = None):
+        super().__init__(use_persistent_cache=False)
+        self.batches = []
+        self.release = release
+
+    def _generate_batch(self, prompts, max_new_tokens):
+        self.batches.append((len(prompts), max_new_tokens))
+        if self.release is not None:
+            self.release.wait(timeout=5)
+        return [f"Síntesis {max_new_tokens}-{index}" for index, _prompt in enumerate(prompts)]
+
+
+def test_sections_are_generated_in_one_batch_per_token_cap():
+    helper = BatchHelper()
+    progress = []
+
+    texts = synthesize_alerta_sections(SECTIONS, CASO, helper, progress_callback=lambda *args: progress.append(args))
+
+    caps = [alerta_temprana.SECTION_MAX_NEW_TOKENS[section] for section in ALERTA_SECTIONS]
+    assert helper.batches == [(caps.count(cap), cap) for cap in dict.fromkeys(caps)]
+    # Cada sección se genera con su propio tope, nunca con el mayor del lote.
+    assert [texts[section] for section in ALERTA_SECTIONS] == [
+        f"Síntesis {cap}-{caps[:position].count(cap)}" for position, cap in enumerate(caps)
+    ]
+    assert progress == [(0, len(ALERTA_SECTIONS)), (len(ALERTA_SECTIONS), len(ALERTA_SECTIONS))]
+
+    # La segunda alerta del mismo caso sale de la caché sin tocar el modelo.
+    synthesize_alerta_sections(SECTIONS, CASO, helper)
+    assert len(helper.batches) == len(set(caps))
+
+
+def test_sections_without_content_skip_the_model():
+    helper = BatchHelper()
+    sections = {**SECTIONS, "riesgos": alerta_temprana.PLACEHOLDER}
+
+    texts = synthesize_alerta_sections(sections, CASO, helper)
+
+    assert sum(count for count, _tokens in helper.batches) == len(ALERTA_SECTIONS) - 1
+    assert texts["Riesgos"] == alerta_temprana.PLACEHOLDER
+
+
+def test_time_budget_falls_back_to_deterministic_text():
+    release = threading.Event()
+    helper = BatchHelper(release=release)
+
+    texts = synthesize_alerta_sections(SECTIONS, CASO, helper, time_budget_s=0.05)
+    release.set()
+
+    assert texts == {section: _section_fallback(section, SECTIONS) for section in ALERTA_SECTIONS}
+
+
+def test_cancel_event_interrupts_the_wait():
+    release = threading.Event()
+    cancel = threading.Event()
+    helper = BatchHelper(release=release)
+    cancel.set()
+
+    with pytest.raises(CancelledError):
+        synthesize_alerta_sections(SECTIONS, CASO, helper, cancel_event=cancel)
+    release.set()
+
+
+def test_batch_outputs_accept_nested_pipeline_lists(monkeypatch):
+    monkeypatch.setitem(sys.modules, "transformers", types.SimpleNamespace(set_seed=lambda _seed: None))
+    helper = SpanishSummaryHelper(use_persistent_cache=False)
+    calls = []
+
+    def fake_pipeline(prompts, **kwargs):
+        calls.append(kwargs)
+        return [[{"generated_text": f"texto {prompt}"}] for prompt in prompts]
+
+    helper._pipeline = fake_pipeline
+
+    assert helper.warm_up() and helper.is_ready
+    assert helper._generate_batch(["a", "b"], 32) == ["texto a", "texto b"]
+    assert calls[0]["batch_size"] == 2 and calls[0]["max_new_tokens"] == 32
+
+
+def test_warm_up_reports_missing_backend(monkeypatch):
+    monkeypatch.setattr(alerta_temprana, "TRANSFORMERS_AVAILABLE", False)
+    helper = SpanishSummaryHelper(use_persistent_cache=False)
+
+    assert helper.warm_up() is False
+    assert not helper.is_ready
+    assert helper.summarize_batch([("Resumen", "prompt", 32)]) == [None]
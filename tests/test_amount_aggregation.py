@@ -0,0 +1,147 @@
+"""La agregación en una pasada debe reproducir los totales de los cálculos anteriores."""
+
+import random
+import time
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP, localcontext
+
+import report_builder
+import validators
+from app import FraudCaseApp
+from report.common_amounts import (AMOUNT_FIELD_MAP, aggregate_amounts,
+                                   aggregate_product_amounts)
+
+
+def _legacy_money_bounds(value, label, allow_blank=True):
+    """Réplica de ``validate_money_bounds`` sin memoria intermedia."""
+
+    text = (value or "").strip()
+    if not text:
+        return (None, None, "") if allow_blank else (f"Debe ingresar {label}.", None, "")
+    try:
+        with localcontext() as ctx:
+            ctx.prec = 20
+            amount = Decimal(text)
+    except InvalidOperation:
+        return (f"{label} debe ser un número válido.", None, "")
+    if amount.as_tuple().exponent < -2:
+        return (f"{label} solo puede tener dos decimales como máximo.", None, "")
+    quantized = amount.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    if quantized < 0:
+        return (f"{label} no puede ser negativo.", None, "")
+    normalized_text = f"{quantized:.2f}"
+    if len(normalized_text.split(".")[0].lstrip("-")) > 12:
+        return (f"{label} no puede tener más de 12 dígitos en la parte entera.", None, "")
+    return (None, quantized, normalized_text)
+
+
+def _legacy_parse(value):
+    message, amount, _ = _legacy_money_bounds(value or "", "monto")
+    if message:
+        return None
+    return amount or Decimal("0")
+
+
+def _legacy_sum(items, key):
+    total = Decimal("0")
+    for item in items:
+        amount = _legacy_parse(item.get(key)) if isinstance(item, dict) else None
+        if amount is not None:
+            total += amount
+    return total
+
+
+AMOUNT_SAMPLES = [
+    "", "  ", "0", "0.00", "10", "10.5", " 1234.56 ", "1.005", "-3.00", "abc",
+    "999999999999.99", "1000000000000", "1e3", "7.10", None,
+]
+
+
+def _products(count, seed=7):
+    rng = random.Random(seed)
+    products = []
+    for index in range(count):
+        product = {
+            "id_producto": f"P{index:05d}",
+            "tipo_moneda": rng.choice(["Soles", "Dólares", ""]),
+            "categoria1": rng.choice(["Fraude externo", "Fraude interno"]),
+        }
+        for _key, field_name in AMOUNT_FIELD_MAP:
+            if rng.random() < 0.5:
+                product[field_name] = f"{rng.randint(0, 5000)}.{rng.randint(0, 99):02d}"
+            else:
+                product[field_name] = rng.choice(AMOUNT_SAMPLES)
+        products.append(product)
+    products.append("no es un producto")
+    return products
+
+
+def test_money_bounds_matches_uncached_parser():
+    for text in AMOUNT_SAMPLES + ["12.345", "0.1", "5.5e-1"]:
+        for allow_blank in (True, False):
+            for label in ("el monto", "la pérdida"):
+                expected = _legacy_money_bounds(text, label, allow_blank)
+                assert validators.validate_money_bounds(text, label, allow_blank) == expected
+                assert validators.validate_money_bounds(text, label, allow_blank) == expected
+
+
+def test_aggregation_matches_previous_call_sites():
+    products = _products(500)
+    legacy_totals = {key: _legacy_sum(products, field_name) for key, field_name in AMOUNT_FIELD_MAP}
+
+    assert aggregate_product_amounts(products) == legacy_totals
+    assert FraudCaseApp._sum_investigated_amounts(None, products) == legacy_totals["investigado"]
+    for _key, field_name in AMOUNT_FIELD_MAP:
+        assert report_builder._sum_amounts(products, field_name) == _legacy_sum(products, field_name)
+    assert report_builder._aggregate_amounts(products, {}) == {
+        "investigado": legacy_totals["investigado"],
+        "contingencia": legacy_totals["contingencia"],
+        "perdida_total": legacy_totals["perdida_fraude"],
+        "normal": None,
+        "vencido": None,
+        "judicial": None,
+        "castigo": None,
+    }
+    header = {"importe_investigado": "15.00", "perdida_total": "x", "normal": "3"}
+    aggregated = report_builder._aggregate_amounts(products, header)
+    assert aggregated["investigado"] == Decimal("15.00")
+    assert aggregated["perdida_total"] == legacy_totals["perdida_fraude"]
+    assert aggregated["normal"] == Decimal("3.00")
+
+
+def test_breakdowns_add_up_to_totals():
+    products = _products(300, seed=11)
+    result = aggregate_amounts(products)
+
+    assert result.products == 300
+    for key, _field in AMOUNT_FIELD_MAP:
+        assert sum((bucket[key] for bucket in result.by_currency.values()), Decimal("0")) == result.totals[key]
+        assert sum((bucket[key] for bucket in result.by_category.values()), Decimal("0")) == result.totals[key]
+    mismatched = [
+        product["id_producto"]
+        for product in products[:-1]
+        if all(_legacy_parse(product.get(f"monto_{name}")) is not None for name in ("perdida_fraude", "falla_procesos", "contingencia", "recuperado"))
+        and _legacy_parse(product.get("monto_investigado")) is not None
+        and _legacy_parse(product.get("monto_investigado"))
+        != sum(_legacy_parse(product.get(f"monto_{name}")) for name in ("perdida_fraude", "falla_procesos", "contingencia", "recuperado"))
+    ]
+    assert result.component_mismatches == mismatched
+    assert result.investigated_gap == result.totals["investigado"] - result.components
+
+
+def test_benchmark_repeated_aggregation():
+    products = _products(2000, seed=3)
+    rounds = 5
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        legacy = {key: _legacy_sum(products, field_name) for key, field_name in AMOUNT_FIELD_MAP}
+    legacy_seconds = time.perf_counter() - start
+
+    aggregate_amounts(products)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        current = aggregate_amounts(products).totals
+    cached_seconds = time.perf_counter() - start
+
+    print(f"\n{rounds}x2000 productos: por campo {legacy_seconds * 1000:.1f} ms; una pasada con caché {cached_seconds * 1000:.1f} ms")
+    assert current == legacy
@@ -1,9 +1,20 @@
 from __future__ import annotations
 
 import threading
+import time
+from concurrent.futures import CancelledError
 
+import pytest
+
+from utils import background_worker
 from utils.background_worker import (
+    TASK_PRIORITY_BACKGROUND,
+    TASK_PRIORITY_INTERACTIVE,
+    BackgroundTaskScheduler,
+    CancellationToken,
+    executor_queue_depths,
     run_guarded_task,
+    set_category_concurrency,
     shutdown_background_workers,
 )
 
@@ -93,3 +104,147 @@ def test_background_tasks_do_not_block_ui_callbacks():
 
     shutdown_background_workers(cancel_futures=True)
     root.destroy()
+
+
+class ManualRoot:
+    """Raíz cuyos ``after`` solo corren al llamar ``run_pending``."""
+
+    def __init__(self):
+        self.callbacks = []
+        self.scheduled = 0
+
+    def after(self, _delay_ms, callback):
+        self.scheduled += 1
+        self.callbacks.append(callback)
+        return f"after#{self.scheduled}"
+
+    def winfo_exists(self):
+        return True
+
+    def run_pending(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback()
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("La condición no se cumplió a tiempo")
+        time.sleep(0.002)
+
+
+@pytest.fixture
+def serial_category(monkeypatch):
+    monkeypatch.setitem(background_worker._EXECUTOR_CONFIG, "pruebas", 1)
+    yield "pruebas"
+    shutdown_background_workers(cancel_futures=True)
+
+
+def _block(scheduler, category, gate):
+    started = threading.Event()
+
+    def _task():
+        started.set()
+        gate.wait(timeout=2)
+        return "bloqueo"
+
+    handle = scheduler.submit(_task, category=category)
+    assert started.wait(timeout=1)
+    return handle
+
+
+def test_completions_share_a_single_drain_timer():
+    root = ManualRoot()
+    scheduler = BackgroundTaskScheduler(root)
+    results = []
+
+    for index in range(5):
+        scheduler.submit(lambda value=index: value, results.append, None, category="default")
+    _wait_for(lambda: not scheduler.running_counts() and not scheduler.pending_counts())
+
+    assert root.scheduled == 1
+    root.run_pending()
+    assert sorted(results) == [0, 1, 2, 3, 4]
+    assert root.callbacks == []  # sin tareas en curso no queda temporizador armado
+    shutdown_background_workers()
+
+
+def test_newer_task_with_same_key_replaces_pending_one(serial_category):
+    root = ManualRoot()
+    scheduler = BackgroundTaskScheduler(root)
+    gate = threading.Event()
+    blocker = _block(scheduler, serial_category, gate)
+    delivered = []
+
+    first = scheduler.submit(lambda: "viejo", delivered.append, delivered.append, category=serial_category, key="autosave")
+    second = scheduler.submit(lambda: "nuevo", delivered.append, delivered.append, category=serial_category, key="autosave")
+    gate.set()
+    _wait_for(second.future.done)
+    _wait_for(lambda: blocker.future.done() and not scheduler.running_counts())
+    root.run_pending()
+
+    assert delivered == ["nuevo"]
+    assert first.future.cancelled() and first.token.cancelled
+    assert scheduler.stats["coalesced"] == 1
+
+
+def test_priority_orders_waiting_tasks(serial_category):
+    root = ManualRoot()
+    scheduler = BackgroundTaskScheduler(root)
+    gate = threading.Event()
+    _block(scheduler, serial_category, gate)
+    order = []
+
+    scheduler.submit(lambda: order.append("fondo"), category=serial_category, priority=TASK_PRIORITY_BACKGROUND)
+    last = scheduler.submit(lambda: order.append("usuario"), category=serial_category, priority=TASK_PRIORITY_INTERACTIVE)
+    assert executor_queue_depths()[serial_category] == 2
+    gate.set()
+    _wait_for(lambda: len(order) == 2)
+
+    assert order == ["usuario", "fondo"]
+    assert last.future.done()
+
+
+def test_cancelled_tasks_report_cancelled_error(serial_category):
+    root = ManualRoot()
+    scheduler = BackgroundTaskScheduler(root)
+    gate = threading.Event()
+    _block(scheduler, serial_category, gate)
+    errors = []
+    token = CancellationToken()
+    observed = threading.Event()
+
+    def _cooperative():
+        while not token.cancelled:
+            time.sleep(0.001)
+        observed.set()
+        token.raise_if_cancelled()
+
+    pending = scheduler.submit(lambda: "nunca", None, errors.append, category=serial_category)
+    assert pending.cancel()
+    gate.set()
+    running = scheduler.submit(_cooperative, None, errors.append, category=serial_category, token=token)
+    _wait_for(lambda: running.state == "running")
+    running.cancel()
+    assert observed.wait(timeout=1)
+    _wait_for(running.future.done)
+    root.run_pending()
+
+    assert [type(error) for error in errors] == [CancelledError, CancelledError]
+
+
+def test_concurrency_limit_can_change_at_runtime(serial_category):
+    root = ManualRoot()
+    scheduler = BackgroundTaskScheduler(root)
+    gate = threading.Event()
+    _block(scheduler, serial_category, gate)
+    second_started = threading.Event()
+
+    scheduler.submit(second_started.set, category=serial_category)
+    assert not second_started.wait(timeout=0.05)
+    set_category_concurrency(serial_category, 2)
+
+    assert second_started.wait(timeout=1)
+    gate.set()
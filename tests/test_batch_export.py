@@ -0,0 +1,166 @@
+"""Exportación por lotes sin interfaz sobre JSON de versión y autoguardados."""
+
+import csv
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from report.export_pipeline import prepare_case_data, write_case_exports
+from tests.test_historical_consolidator import (_build_case_payload,
+                                                _build_consolidation_app)
+from tools import batch_export
+
+
+def _write_case(folder: Path, case_id: str, *, autosave: bool = False) -> Path:
+    data = _build_case_payload(case_id).as_dict()
+    data["productos"][0]["monto_pago_deuda"] = ""
+    if autosave:
+        path = folder / f"{case_id}_autosave.json"
+        payload = {"schema_version": "1", "dataset": data, "form_state": {}}
+    else:
+        path = folder / f"{case_id}_version.json"
+        payload = data
+    path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def _csv_names(folder: Path) -> set[str]:
+    return {path.name for path in folder.glob("*.csv") if not path.name.startswith("h_")}
+
+
+def test_pipeline_writes_same_files_as_app_export(tmp_path):
+    app_dir = tmp_path / "app"
+    batch_dir = tmp_path / "batch"
+    app_dir.mkdir()
+    batch_dir.mkdir()
+    app = _build_consolidation_app(tmp_path, external_dir=None)
+    app._normalize_analysis_texts = app.__class__._normalize_analysis_texts.__get__(app)
+    data = prepare_case_data(_build_case_payload("2024-0101"))
+
+    app_result = app._perform_save_exports(data, app_dir, "2024-0101")
+    result = write_case_exports(prepare_case_data(data.as_dict()), batch_dir, "2024-0101", docx_available=False)
+
+    assert _csv_names(app_dir) == _csv_names(batch_dir)
+    for name in _csv_names(app_dir):
+        assert (app_dir / name).read_bytes() == (batch_dir / name).read_bytes(), name
+    assert result.report_prefix == app_result["report_prefix"]
+    assert result.md_path.name == app_result["md_path"].name
+    assert result.warnings == app_result["warnings"]
+    assert {path.name for path in result.created_files} == {path.name for path in app_result["created_files"]}
+
+
+def test_prepare_case_data_unwraps_autosave_and_fills_optional_amounts(tmp_path):
+    path = _write_case(tmp_path, "2024-0102", autosave=True)
+    data = prepare_case_data(json.loads(path.read_text(encoding="utf-8")))
+
+    assert data.productos[0]["monto_pago_deuda"] == "0.00"
+    assert data.productos[0]["id_caso"] == "2024-0102"
+    assert data.clientes[0]["id_caso"] == "2024-0102"
+
+
+def test_batch_exports_cases_and_resumes_after_failure(tmp_path):
+    cases = tmp_path / "casos"
+    cases.mkdir()
+    for index in range(3):
+        _write_case(cases, f"2024-02{index:02d}")
+    _write_case(cases, "2024-0200", autosave=True)
+    broken = cases / "roto_version.json"
+    broken.write_text("{no es json", encoding="utf-8")
+    output = tmp_path / "salida"
+    stream = io.StringIO()
+
+    summary = batch_export.run_batch(cases, output, jobs=1, docx=False, stream=stream)
+
+    assert (summary.total, summary.exported, summary.failed, summary.skipped) == (5, 4, 1, 0)
+    assert "[5/5]" in stream.getvalue()
+    history = list(csv.DictReader((output / "2024-0200" / "h_clientes.csv").open(encoding="utf-8")))
+    assert len(history) == 2  # versión y autoguardado del mismo caso, en secuencia
+    assert summary.files > 0 and "casos/s" in summary.render()
+
+    broken.unlink()
+    _write_case(cases, "2024-0299")
+    resumed = batch_export.run_batch(cases, output, jobs=1, docx=False, stream=io.StringIO())
+
+    assert (resumed.total, resumed.exported, resumed.failed, resumed.skipped) == (5, 1, 0, 4)
+    state = batch_export.load_state(output / batch_export.STATE_FILE_NAME)
+    assert state[str(broken)]["status"] == "error"
+    assert state[str(cases / "2024-0299_version.json")]["status"] == "ok"
+
+
+def test_rerunning_batch_export_rewrites_case_history(tmp_path):
+    cases = tmp_path / "casos"
+    cases.mkdir()
+    _write_case(cases, "2024-0400")
+    _write_case(cases, "2024-0400", autosave=True)
+    output = tmp_path / "salida"
+
+    def history_files():
+        return {path.name: path.read_bytes() for path in (output / "2024-0400").glob("h_*.csv")}
+
+    batch_export.run_batch(cases, output, jobs=1, docx=False, stream=io.StringIO())
+    first = history_files()
+    forced = batch_export.run_batch(cases, output, jobs=1, docx=False, force=True, stream=io.StringIO())
+
+    assert forced.exported == 2
+    assert first and history_files() == first
+    history = list(csv.DictReader((output / "2024-0400" / "h_clientes.csv").open(encoding="utf-8")))
+    assert len(history) == 2
+
+    # Un archivo nuevo del caso vuelve a exportar también los ya exportados.
+    (cases / "2024-0400_copia_version.json").write_text(
+        (cases / "2024-0400_version.json").read_text(encoding="utf-8"), encoding="utf-8"
+    )
+    resumed = batch_export.run_batch(cases, output, jobs=1, docx=False, stream=io.StringIO())
+
+    assert (resumed.exported, resumed.skipped) == (3, 0)
+    history = list(csv.DictReader((output / "2024-0400" / "h_clientes.csv").open(encoding="utf-8")))
+    assert len(history) == 3
+
+
+def test_parallel_jobs_group_sources_by_case(tmp_path):
+    cases = tmp_path / "casos"
+    cases.mkdir()
+    for index in range(4):
+        _write_case(cases, f"2024-03{index:02d}")
+        _write_case(cases, f"2024-03{index:02d}", autosave=True)
+    submitted = []
+
+    class RecordingExecutor(ThreadPoolExecutor):
+        def submit(self, fn, *args, **kwargs):
+            submitted.append(args[0])
+            return super().submit(fn, *args, **kwargs)
+
+    summary = batch_export.run_batch(
+        cases,
+        tmp_path / "salida",
+        jobs=3,
+        docx=False,
+        stream=io.StringIO(),
+        executor_factory=lambda workers: RecordingExecutor(max_workers=workers),
+    )
+
+    assert summary.exported == 8 and summary.failed == 0
+    assert sorted(len(sources) for sources in submitted) == [2, 2, 2, 2]
+
+
+def test_cli_reports_throughput_and_exit_code(tmp_path, capsys):
+    cases = tmp_path / "casos"
+    cases.mkdir()
+    _write_case(cases, "2024-0400")
+
+    assert batch_export.main(["--input", str(cases), "--jobs", "1", "--no-docx"]) == 0
+    output = capsys.readouterr().out
+    assert "1 de 1 archivos exportados" in output
+    assert (cases / "exportes_lote" / "2024-0400").is_dir()
+
+    # La carpeta de salida dentro de la entrada no se vuelve a procesar.
+    assert batch_export.main(["--input", str(cases), "--jobs", "1", "--no-docx"]) == 0
+    assert "1 omitidos" in capsys.readouterr().out
+
+    (cases / "malo_version.json").write_text("[]", encoding="utf-8")
+    assert batch_export.main(["--input", str(cases), "--jobs", "1", "--no-docx"]) == 1
+    with pytest.raises(SystemExit):
+        batch_export.main(["--input", str(tmp_path / "no_existe")])
@@ -0,0 +1,73 @@
+"""Suite de rendimiento: caso sintético, escenarios sin interfaz y líneas base."""
+
+import io
+import json
+
+from benchmarks import run
+from benchmarks.headless import build_case_app
+from benchmarks.synthetic_case import CaseSize, combined_rows, generate_case
+
+SMALL = CaseSize(clients=4, collaborators=3, products=6, claims_per_product=2, involvements_per_product=3, risks=2, norms=2, analysis_paragraphs=2)
+
+
+def test_synthetic_case_is_valid_and_deterministic():
+    case = generate_case(SMALL)
+    assert case == generate_case(SMALL)
+    app = build_case_app(case)
+
+    errors, warnings = app.validate_data()
+    gathered = app.gather_data()
+
+    assert errors == [] and warnings == []
+    assert len(gathered.productos) == 6
+    assert len(gathered.reclamos) == 12
+    assert len(gathered.involucramientos) == 18
+    assert gathered.analisis["hallazgos"]["text"] == case["analisis"]["hallazgos"]["text"]
+    assert len(list(combined_rows(50, clients=5, collaborators=4, products=10))) == 50
+
+
+def test_smoke_profile_runs_every_scenario(tmp_path):
+    results = run.run_scenarios("smoke", repeat=1, workdir=tmp_path)
+
+    names = {result.name for result in results}
+    assert {
+        "gather_data",
+        "validate_data",
+        "compute_temp_signature",
+        "summary_refresh",
+        "build_event_rows",
+        "build_llave_tecnica_rows",
+        "build_md",
+        "build_docx",
+        "catalog_refresh_cold",
+        "catalog_refresh_warm",
+        "text_sanitize",
+        "text_normalize",
+        "import_combined_200",
+    } == names
+    assert all(result.skipped or len(result.samples) == 1 for result in results)
+
+
+def test_regressions_beyond_tolerance_fail_the_run(tmp_path):
+    fast = run.ScenarioResult("escenario", samples=[0.010])
+    slow = run.ScenarioResult("escenario", samples=[0.020])
+    noise = run.ScenarioResult("escenario", samples=[0.0015])
+    path = run.baseline_path("smoke", tmp_path)
+    run.save_baseline(path, "smoke", [fast])
+
+    baseline = run.load_baseline(path)
+    assert baseline["escenario"]["median"] == 0.01
+    assert not run.compare([fast], baseline)[0].regressed
+    assert run.compare([slow], baseline, tolerance=0.25)[0].regressed
+    assert not run.compare([slow], baseline, tolerance=1.5)[0].regressed
+    assert not run.compare([noise], {"escenario": {"median": 0.0005}})[0].regressed
+    assert run.compare([fast], {})[0].ratio is None
+
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload["results"]["build_md"] = {"median": 1e-9}
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    stream = io.StringIO()
+    exit_code = run.main(["--profile", "smoke", "--repeat", "1", "--only", "build_md", "--baseline-dir", str(tmp_path)], stream=stream)
+
+    assert exit_code == 1
+    assert "REGRESIÓN" in stream.getvalue()
@@ -0,0 +1,167 @@
+"""Modo de carga masiva y construcción por tramos del formulario."""
+
+import types
+
+import pytest
+
+import app as app_module
+from app import FraudCaseApp
+from validators import FieldValidator
+
+
+class RootStub:
+    def __init__(self):
+        self.pending = []
+
+    def after(self, _delay, callback, *args):
+        self.pending.append((callback, args))
+        return f"after_{len(self.pending)}"
+
+    def run_pending(self):
+        slices = 0
+        while self.pending:
+            callback, args = self.pending.pop(0)
+            callback(*args)
+            slices += 1
+        return slices
+
+
+class DialogStub:
+    instances = []
+
+    def __init__(self, _parent, title, *, on_cancel=None, cancellable=True):
+        self.title = title
+        self.on_cancel = on_cancel
+        self.cancellable = cancellable
+        self.progress = []
+        self.closed = False
+        DialogStub.instances.append(self)
+
+    def update_progress(self, current, total):
+        self.progress.append((current, total))
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def bulk_app(monkeypatch):
+    app = FraudCaseApp.__new__(FraudCaseApp)
+    app.logs = []
+    app.root = RootStub()
+    app.summary_tables = {}
+    app.product_frames = []
+    app.refreshes = []
+    app._refresh_inline_section_tables = lambda sections=None, data=None: app.refreshes.append((sections, data))
+    app._update_completion_progress = lambda: None
+    DialogStub.instances = []
+    monkeypatch.setattr(app_module, "ProgressDialog", DialogStub)
+    monkeypatch.setattr(app_module, "BULK_LOAD_SLICE_MS", 0)
+    return app
+
+
+def test_bulk_load_defers_summary_and_option_broadcasts(bulk_app):
+    app = bulk_app
+    published = []
+    app._get_client_option_source = lambda: types.SimpleNamespace(
+        invalidate=lambda: None, pop_removed=lambda: published.append("clientes") or set()
+    )
+
+    with app._bulk_load():
+        with app._bulk_load():
+            app._schedule_summary_refresh(sections="clientes")
+            app.update_client_options_global()
+        app._schedule_summary_refresh(sections=["productos"], data={"productos": []})
+        app.update_client_options_global()
+        assert app.refreshes == [] and published == []
+        assert FieldValidator._global_suspend_count == 1
+
+    assert FieldValidator._global_suspend_count == 0
+    assert published == ["clientes"]
+    assert app.refreshes == [({"clientes", "productos"}, {"productos": []})]
+
+
+def test_sliced_steps_yield_to_tk_between_slices(bulk_app):
+    app = bulk_app
+    outcome = []
+
+    def _steps():
+        for _ in range(4):
+            yield 2
+
+    app._run_sliced_steps(_steps(), total=8, title="Cargando caso", on_done=lambda *args: outcome.append(args))
+
+    assert app.root.run_pending() == 4
+    assert outcome == [(False, None)]
+    dialog = DialogStub.instances[0]
+    assert dialog.progress[-1] == (8, 8) and dialog.closed
+
+
+def test_cancelled_load_runs_cleanup_and_clears_form(bulk_app):
+    app = bulk_app
+    events = []
+
+    def _steps(data, *, slice_clear=False):
+        app._begin_bulk_load()
+        try:
+            for _ in data["clientes"]:
+                events.append("cliente")
+                yield 1
+        finally:
+            app._end_bulk_load()
+            events.append("cleanup")
+
+    app._iter_populate_steps = _steps
+    app._ensure_case_data = lambda data: types.SimpleNamespace(as_dict=lambda: data)
+    app._clear_case_state = lambda save_autosave=True: events.append("cleared")
+    app.client_frames = app.team_frames = app.risk_frames = app.norm_frames = []
+    completed = []
+
+    app._populate_in_slices({"clientes": [1, 2, 3]}, on_complete=lambda: completed.append(True))
+    DialogStub.instances[0].on_cancel()
+    app.root.run_pending()
+
+    assert events == ["cliente", "cleanup", "cleared"]
+    assert completed == []
+    assert not app._bulk_load_active()
+    assert FieldValidator._global_suspend_count == 0
+
+
+def test_sliced_load_revalidates_suspended_fields_in_slices(bulk_app):
+    app = bulk_app
+    checked = []
+
+    class _Validator:
+        def __init__(self, alive=True):
+            self.widget = types.SimpleNamespace(winfo_exists=lambda: alive)
+
+        def revalidate_if_changed(self):
+            checked.append(self)
+            return True
+
+    app._field_validators = [_Validator() for _ in range(3)] + [_Validator(alive=False)]
+    outcome = []
+
+    def _steps():
+        with app._bulk_load():
+            yield 1
+        assert checked == []
+
+    app._run_sliced_steps(_steps(), total=1, title="Cargando caso", on_done=lambda *args: outcome.append(args))
+
+    assert app.root.run_pending() == 5
+    assert len(checked) == 3
+    assert len(app._field_validators) == 3
+    assert outcome == [(False, None)]
+    assert not app._bulk_revalidation_pending and not app._bulk_revalidation_sliced
+
+
+def test_unsliced_bulk_load_still_revalidates_on_exit(bulk_app):
+    app = bulk_app
+    calls = []
+    app._field_validators = [types.SimpleNamespace(widget=None, revalidate_if_changed=lambda: calls.append(1) or True)]
+
+    with app._bulk_load():
+        pass
+
+    assert calls == [1]
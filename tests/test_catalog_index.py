@@ -0,0 +1,117 @@
+import os
+import random
+from datetime import date, timedelta
+
+import models.catalog_service as catalog_service_module
+from models import CatalogService, TeamHierarchyCatalog
+from models.catalog_index import (CatalogCache, TeamSnapshotIndex,
+                                  catalog_source_signature)
+from tests.test_catalog_autofill_service import _write_team_details
+
+
+def _legacy_select(snapshots, case_date):
+    """Réplica del recorrido lineal anterior para comparar resultados."""
+
+    valid = [snap for snap in snapshots if snap.get("fecha") is not None]
+    if case_date and valid:
+        history = [snap for snap in valid if snap["fecha"] <= case_date]
+        if history:
+            return max(history, key=lambda snap: snap["fecha"]), None
+        return min(valid, key=lambda snap: snap["fecha"]), "no_past_snapshot"
+    if valid:
+        return max(valid, key=lambda snap: snap["fecha"]), "case_date_missing_or_invalid"
+    return snapshots[-1], "case_date_missing_or_invalid"
+
+
+def test_snapshot_index_matches_linear_selection():
+    rng = random.Random(7)
+    base = date(2023, 1, 1)
+    snapshots = {}
+    for member in range(60):
+        items = []
+        for position in range(rng.randint(1, 8)):
+            fecha = None if rng.random() < 0.2 else base + timedelta(days=rng.randint(0, 40))
+            items.append({"data": {"pos": position}, "fecha": fecha})
+        snapshots[f"T{member:05d}"] = items
+    index = TeamSnapshotIndex(snapshots)
+
+    for member_id, items in snapshots.items():
+        for case_date in (None, base - timedelta(days=1), base + timedelta(days=20), base + timedelta(days=90)):
+            assert index.select(member_id, case_date) == _legacy_select(items, case_date)
+    assert index.select("T99999", base) == (None, None)
+
+
+def test_refresh_uses_binary_cache_on_warm_start(tmp_path, monkeypatch):
+    _write_team_details(tmp_path, [["T00001", "Ana", "Pérez", "", "DIV", "AREA", "", "", "", "", "", "", "", "", "", "", "2024-01-01"]])
+    cache_dir = tmp_path / "cache"
+    cold = CatalogService(tmp_path, cache_dir=cache_dir)
+    cold_catalogs, _ = cold.refresh()
+    assert cold.last_refresh_source == "csv"
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("no debería parsear CSV en un arranque en caliente")
+
+    monkeypatch.setattr(catalog_service_module, "load_detail_catalogs", fail)
+    monkeypatch.setattr(CatalogService, "_iter_rows", fail)
+    warm = CatalogService(tmp_path, cache_dir=cache_dir)
+    warm_catalogs, _ = warm.refresh()
+
+    assert warm.last_refresh_source == "cache"
+    assert warm_catalogs == cold_catalogs
+    data, meta = warm.lookup_team_member("T00001", "2024-02-01")
+    assert data["nombres"] == "Ana"
+    assert meta["selected_date"] == date(2024, 1, 1)
+    warm.refresh()
+    assert warm.last_refresh_source == "memoria"
+
+
+def test_refresh_reparses_when_source_file_changes(tmp_path):
+    path = _write_team_details(tmp_path, [["T00001", "Ana"]])
+    service = CatalogService(tmp_path, cache_dir=tmp_path / "cache")
+    service.refresh()
+    signature = catalog_source_signature(tmp_path)
+
+    _write_team_details(tmp_path, [["T00001", "Ana María"]])
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert catalog_source_signature(tmp_path) != signature
+    catalogs, _ = service.refresh()
+
+    assert service.last_refresh_source == "csv"
+    assert catalogs["team"]["T00001"]["nombres"] == "Ana María"
+
+
+def test_refresh_discards_in_session_additions_without_reparsing(tmp_path):
+    _write_team_details(tmp_path, [["T00001", "Ana"]])
+    service = CatalogService(tmp_path, use_cache=False)
+    catalogs, _ = service.refresh()
+    catalogs["team"]["T99999"] = {"id_colaborador": "T99999"}
+
+    catalogs, _ = service.refresh()
+
+    assert service.last_refresh_source == "memoria"
+    assert "T99999" not in catalogs["team"]
+
+
+def test_catalog_cache_ignores_corrupt_or_stale_files(tmp_path):
+    cache = CatalogCache(tmp_path / "catalogos.pickle")
+    signature = (("team_details.csv", 10, 1),)
+    assert cache.load(signature) is None
+    (tmp_path / "catalogos.pickle").write_bytes(b"no es pickle")
+    assert cache.load(signature) is None
+
+    assert cache.store(signature, {"detail_catalogs": {}})
+    assert cache.load(signature) == {"detail_catalogs": {}}
+    assert cache.load((("team_details.csv", 11, 1),)) is None
+
+
+def test_hierarchy_match_index_is_accent_insensitive_and_keeps_first_match():
+    hierarchy = {
+        "D1": {"nbr": "División Canales", "areas": {"A1": {"nbr": "Área Norte"}}},
+        "D2": {"nbr": "DIVISION CANALES", "areas": {}},
+    }
+    catalog = TeamHierarchyCatalog(hierarchy=hierarchy)
+
+    assert catalog.list_hierarchy_areas("division canales") == [("A1", "Área Norte")]
+    assert catalog.hierarchy_contains_area("d1", "AREA NORTE")
+    assert not catalog.hierarchy_contains_division("Otra")
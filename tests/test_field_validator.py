@@ -239,3 +239,26 @@ def test_focusout_logs_value_transitions(monkeypatch):
     assert last["new_value"] == ("updated",)
     assert last["action_result"] == "ok"
     assert last.get("event_subtipo") == "focus_out"
+
+
+def test_suspend_all_defers_validation_until_revalidate(monkeypatch):
+    monkeypatch.setattr(validators, "ValidationTooltip", DummyTooltip)
+    widget = DummyWidget()
+    variable = DummyVar("initial")
+    calls = []
+
+    validators.FieldValidator.suspend_all()
+    try:
+        validator = validators.FieldValidator(
+            widget, lambda: calls.append(variable.get()), [], "id_field", variables=[variable]
+        )
+        variable.set("one")
+        variable.set("two")
+        assert validator.revalidate_if_changed() is False
+    finally:
+        validators.FieldValidator.resume_all()
+
+    assert calls == []
+    assert validator.revalidate_if_changed() is True
+    assert validator.revalidate_if_changed() is False
+    assert calls == ["two"]
@@ -1,5 +1,6 @@
 import csv
 import json
+import threading
 import types
 from datetime import datetime
 from pathlib import Path
@@ -254,3 +255,147 @@ def test_manifest_write_failure_sets_pending_flag(tmp_path, monkeypatch):
     assert history_path.exists()
     assert app.pending_consolidation_flag
     assert not manifest_path.exists()
+
+
+def _queue_pending_exports(app, export_dir: Path, case_ids, saves_per_case: int = 1) -> None:
+    export_dir.mkdir(exist_ok=True)
+    for case_id in case_ids:
+        for table in ("clientes", "productos"):
+            (export_dir / f"{case_id}_{table}.csv").write_text(
+                f"id_caso,id_{table}\n{case_id},{table[:3].upper()}-{case_id}\n", encoding="utf-8"
+            )
+        for save in range(saves_per_case):
+            app._append_pending_consolidation(
+                case_id,
+                ["h_clientes.csv", "h_productos.csv"],
+                timestamp=datetime(2024, 3, 1, 9, save),
+                base_dir=export_dir,
+            )
+
+
+def _history_rows(path: Path) -> list[dict[str, str]]:
+    with path.open(newline="", encoding="utf-8") as handle:
+        return list(csv.DictReader(handle))
+
+
+def test_pending_replay_opens_each_history_file_once(tmp_path, monkeypatch):
+    external_dir = tmp_path / "external drive"
+    app = _build_consolidation_app(tmp_path, external_dir=external_dir)
+    _queue_pending_exports(app, tmp_path / "exports", ["2024-0101", "2024-0102"], saves_per_case=3)
+    opened = []
+    original = app_module.append_historical_batches
+
+    def tracking(table_name, batches, base_dir, **kwargs):
+        opened.append((Path(base_dir).name, table_name))
+        return original(table_name, batches, base_dir, **kwargs)
+
+    monkeypatch.setattr(app_module, "append_historical_batches", tracking)
+    progress = []
+
+    summary = app._replay_pending_consolidations(progress_callback=lambda current, total: progress.append((current, total)))
+
+    assert summary == {"status": "done", "remaining": 0}
+    assert sorted(opened) == sorted(
+        (case_id, table) for case_id in ("2024-0101", "2024-0102") for table in ("clientes", "productos")
+    )
+    rows = _history_rows(external_dir / "2024-0101" / "h_clientes.csv")
+    assert [row["fecactualizacion"] for row in rows] == [f"2024-03-01T09:0{save}:00" for save in range(3)]
+    assert progress[0] == (0, 12) and progress[-1] == (12, 12)
+    assert not app._pending_manifest_path.exists()
+    assert not app._get_pending_checkpoint().path.exists()
+
+
+def test_entries_queued_during_replay_are_kept(tmp_path, monkeypatch):
+    external_dir = tmp_path / "external drive"
+    app = _build_consolidation_app(tmp_path, external_dir=external_dir)
+    _queue_pending_exports(app, tmp_path / "exports", ["2024-0501"])
+    original = app_module.append_historical_batches
+    queued = []
+
+    def queue_while_writing(table_name, batches, base_dir, **kwargs):
+        if not queued:
+            # "Guardar y enviar" registra otra copia pendiente mientras se repone.
+            queued.append(True)
+            app._append_pending_consolidation("2024-0599", ["h_clientes.csv"], base_dir=tmp_path / "exports")
+        return original(table_name, batches, base_dir, **kwargs)
+
+    monkeypatch.setattr(app_module, "append_historical_batches", queue_while_writing)
+
+    app._process_pending_consolidations()
+
+    remaining = [json.loads(line) for line in app._pending_manifest_path.read_text(encoding="utf-8").splitlines()]
+    assert [entry["case_id"] for entry in remaining] == ["2024-0599"]
+    assert app.pending_consolidation_flag
+    assert len(_history_rows(external_dir / "2024-0501" / "h_clientes.csv")) == 1
+
+
+def test_replay_groups_write_different_histories_in_parallel(tmp_path, monkeypatch):
+    external_dir = tmp_path / "external drive"
+    app = _build_consolidation_app(tmp_path, external_dir=external_dir)
+    _queue_pending_exports(app, tmp_path / "exports", ["2024-0501"])
+    monkeypatch.setattr(app_module, "PENDING_CONSOLIDATION_WORKERS", 4)
+    original = app_module.append_historical_batches
+    # Solo se cruza si los dos históricos se escriben a la vez.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def append_together(table_name, batches, base_dir, **kwargs):
+        barrier.wait()
+        return original(table_name, batches, base_dir, **kwargs)
+
+    monkeypatch.setattr(app_module, "append_historical_batches", append_together)
+
+    app._process_pending_consolidations()
+
+    for table in ("clientes", "productos"):
+        assert len(_history_rows(external_dir / "2024-0501" / f"h_{table}.csv")) == 1
+    same = app._history_file_lock(external_dir / "2024-0501" / "h_clientes.csv")
+    assert same is app._history_file_lock(external_dir / "2024-0501" / ".." / "2024-0501" / "h_clientes.csv")
+    assert same is not app._history_file_lock(external_dir / "2024-0501" / "h_productos.csv")
+
+
+def test_cancelled_replay_resumes_without_duplicates(tmp_path):
+    external_dir = tmp_path / "external drive"
+    app = _build_consolidation_app(tmp_path, external_dir=external_dir)
+    case_ids = [f"2024-02{index:02d}" for index in range(6)]
+    _queue_pending_exports(app, tmp_path / "exports", case_ids)
+    manifest_before = app._pending_manifest_path.read_text(encoding="utf-8")
+    token = app_module.CancellationToken()
+
+    def cancel_after_first(current, total):
+        if current >= 1:
+            token.cancel()
+
+    first = app._replay_pending_consolidations(progress_callback=cancel_after_first, cancel_event=token)
+
+    assert first["status"] == "cancelled" and first["remaining"] >= 1
+    assert app._pending_manifest_path.read_text(encoding="utf-8") == manifest_before
+    assert app._get_pending_checkpoint().load()
+
+    app._process_pending_consolidations()
+
+    for case_id in case_ids:
+        for table in ("clientes", "productos"):
+            assert len(_history_rows(external_dir / case_id / f"h_{table}.csv")) == 1
+    assert not app.pending_consolidation_flag
+    assert not app._pending_manifest_path.exists()
+
+
+def test_failed_history_files_stay_pending_alone(tmp_path, monkeypatch):
+    external_dir = tmp_path / "external drive"
+    app = _build_consolidation_app(tmp_path, external_dir=external_dir)
+    _queue_pending_exports(app, tmp_path / "exports", ["2024-0301"])
+    original = app_module.append_historical_batches
+
+    def failing(table_name, batches, base_dir, **kwargs):
+        if table_name == "productos":
+            raise OSError("unidad llena")
+        return original(table_name, batches, base_dir, **kwargs)
+
+    monkeypatch.setattr(app_module, "append_historical_batches", failing)
+
+    app._process_pending_consolidations()
+
+    remaining = [json.loads(line) for line in app._pending_manifest_path.read_text(encoding="utf-8").splitlines()]
+    assert [entry["history_files"] for entry in remaining] == [["h_productos.csv"]]
+    assert app.pending_consolidation_flag
+    assert len(_history_rows(external_dir / "2024-0301" / "h_clientes.csv")) == 1
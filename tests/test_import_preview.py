@@ -0,0 +1,219 @@
+"""Vista previa de importaciones masivas calculada en el trabajador."""
+
+import types
+
+import pytest
+
+import app as app_module
+from app import FraudCaseApp
+from utils.mass_import_manager import (PREVIEW_DUPLICATE, PREVIEW_ERROR,
+                                       PREVIEW_NEW, PREVIEW_UPDATED,
+                                       ImportPreviewSpec, MassImportManager,
+                                       build_import_preview)
+
+
+class Var:
+    def __init__(self, value=""):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+def _entries(*ids):
+    return [{'row': {'id_cliente': client_id}, 'found': True} for client_id in ids]
+
+
+def test_preview_classifies_rows_and_pages_them():
+    spec = ImportPreviewSpec(
+        key_for=lambda entry: entry['row']['id_cliente'],
+        is_existing=lambda _entry, key: key == "EXISTE",
+        existing_status=PREVIEW_UPDATED,
+    )
+    payload = _entries("A", "B", "A", "", "EXISTE", *[f"N{i}" for i in range(5)])
+
+    preview = build_import_preview("clientes", "clientes.csv", payload, spec)
+
+    assert preview.payload == payload
+    assert preview.counts == {PREVIEW_NEW: 7, PREVIEW_DUPLICATE: 1, PREVIEW_ERROR: 1, PREVIEW_UPDATED: 1}
+    assert [row.row_number for row in preview.samples(PREVIEW_DUPLICATE)] == [3]
+    assert preview.page_count(page_size=4) == 3
+    assert [row.key for row in preview.page(9, page_size=4)] == ["N3", "N4"]
+    assert preview.page_count(PREVIEW_ERROR, page_size=4) == 1
+    assert "1 filas con errores" in preview.summary_text
+
+
+def test_commit_reuses_the_payload_parsed_by_the_worker(tmp_path):
+    manager = MassImportManager(tmp_path / "logs")
+    parsed = []
+    applied = []
+    shown = []
+
+    class DummyApp:
+        logs = []
+
+        def _validate_import_headers(self, filename, key):
+            return True
+
+        def _import_preview_enabled(self):
+            return True
+
+        def _start_background_import(self, task_label, button, worker, ui_callback, error_prefix, ui_error_prefix=None):
+            ui_callback(worker(lambda *_: None, None))
+
+        def _show_import_preview(self, preview, *, task_label, on_commit, error_prefix, button=None):
+            shown.append(preview)
+            on_commit()
+
+    def worker_factory(_file_path):
+        def worker(_progress, _cancel):
+            parsed.append(True)
+            return _entries("A", "A")
+
+        return worker
+
+    manager.orchestrate_csv_import(
+        app=DummyApp(),
+        sample_key="clientes",
+        task_label="clientes",
+        button=None,
+        worker_factory=worker_factory,
+        ui_callback=lambda payload, file_path: applied.append((payload, file_path)),
+        error_prefix="No se pudo importar clientes",
+        filename="clientes.csv",
+        preview_spec_factory=lambda: ImportPreviewSpec(key_for=lambda entry: entry['row']['id_cliente']),
+    )
+
+    assert parsed == [True]
+    assert shown[0].counts == {PREVIEW_NEW: 1, PREVIEW_DUPLICATE: 1}
+    assert applied == [(shown[0].payload, "clientes.csv")]
+
+
+def test_app_specs_follow_the_apply_rules():
+    app = FraudCaseApp.__new__(FraudCaseApp)
+    app.detail_catalogs = {'id_cliente': {}}
+    app.client_frames = [types.SimpleNamespace(id_var=Var("EXISTE"))]
+    app.norm_frames = []
+
+    clients = build_import_preview(
+        "clientes",
+        "c.csv",
+        [{'row': {'id_cliente': "EXISTE"}, 'found': True}, {'row': {'id_cliente': "NUEVO"}, 'found': False}],
+        app._build_import_preview_spec("clientes"),
+    )
+    norms = build_import_preview(
+        "normas",
+        "n.csv",
+        [{'id_norma': "sin formato", 'descripcion': "x"}],
+        app._build_import_preview_spec("normas"),
+    )
+
+    assert [row.status for row in clients.rows] == [PREVIEW_DUPLICATE, PREVIEW_NEW]
+    assert clients.observations == 1
+    assert norms.rows[0].status == PREVIEW_ERROR
+    assert norms.rows[0].messages == app._norm_import_errors({'id_norma': "sin formato", 'descripcion': "x"}, set())
+
+
+def test_combined_preview_classifies_each_involvement_like_the_apply():
+    app = FraudCaseApp.__new__(FraudCaseApp)
+    app.detail_catalogs = {}
+    app.id_caso_var = Var("2024-0001")
+    app.product_frames = [
+        types.SimpleNamespace(
+            id_var=Var("P1"),
+            client_involvements=[types.SimpleNamespace(client_var=Var("C1"))],
+            involvements=[],
+            claims=[],
+        )
+    ]
+
+    def _entry(product_id, *involvements):
+        return {
+            'raw_row': {},
+            'product_row': {'id_producto': product_id},
+            'client_row': {},
+            'team_row': {},
+            'involvements': list(involvements),
+            'claims': [],
+        }
+
+    def _client(client_id, amount=""):
+        return {'tipo_involucrado': 'cliente', 'id_cliente_involucrado': client_id, 'monto_asignado': amount}
+
+    def _collaborator(collaborator_id, amount=""):
+        return {'tipo_involucrado': 'colaborador', 'id_colaborador': collaborator_id, 'monto_asignado': amount}
+
+    payload = [
+        _entry("P1", _client("C1"), _collaborator("T12345")),
+        # La misma fila repetida: sin monto se omite, con monto se sobrescribe.
+        _entry("P1", _client("C1"), _collaborator("T12345", "100.00")),
+        _entry("P2", _client("C2", "no es monto")),
+        _entry("P1"),
+        _entry("P3"),
+    ]
+
+    preview = build_import_preview("datos combinados", "c.csv", payload, app._build_import_preview_spec("combinado"))
+
+    assert [(row.row_number, row.status) for row in preview.rows] == [
+        (1, PREVIEW_UPDATED),
+        (1, PREVIEW_NEW),
+        (2, PREVIEW_DUPLICATE),
+        (2, PREVIEW_UPDATED),
+        (3, PREVIEW_ERROR),
+        (4, PREVIEW_UPDATED),
+        (5, PREVIEW_NEW),
+    ]
+    assert "se detendrá" in preview.rows[4].messages[0]
+
+
+class ButtonStub:
+    def __init__(self):
+        self.states = []
+
+    def state(self, flags):
+        self.states.append(flags[0])
+
+
+@pytest.mark.parametrize("confirm", [True, False])
+def test_import_stays_active_until_the_preview_is_answered(monkeypatch, confirm):
+    dialogs = []
+    monkeypatch.setattr(
+        app_module,
+        "ImportPreviewDialog",
+        lambda _root, _preview, *, on_commit, on_discard, page_size: dialogs.append((on_commit, on_discard)),
+    )
+    app = FraudCaseApp.__new__(FraudCaseApp)
+    app.logs = []
+    app.root = None
+    app.import_status_var = Var()
+    app.import_status_var.set = lambda value: setattr(app.import_status_var, "value", value)
+    button = ButtonStub()
+    applied = []
+    preview = build_import_preview("clientes", "c.csv", _entries("A"), ImportPreviewSpec(key_for=lambda entry: "A"))
+
+    app._start_background_import(
+        "clientes",
+        button,
+        lambda _progress, _cancel: preview,
+        lambda payload: app._show_import_preview(
+            payload,
+            task_label="clientes",
+            on_commit=lambda: applied.append(payload.payload),
+            error_prefix="No se pudo importar clientes",
+            button=button,
+        ),
+        "No se pudo importar clientes",
+    )
+
+    assert app._active_import_jobs == 1
+    assert button.states == ['disabled']
+    assert app.import_status_var.get() == "Importación de clientes pendiente de confirmación."
+
+    on_commit, on_discard = dialogs[0]
+    (on_commit if confirm else on_discard)()
+
+    assert app._active_import_jobs == 0
+    assert button.states == ['disabled', '!disabled']
+    assert applied == ([preview.payload] if confirm else [])
+    expected = "finalizada" if confirm else "descartada"
+    assert app.import_status_var.get() == f"Importación de clientes {expected}."
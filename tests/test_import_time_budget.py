@@ -0,0 +1,87 @@
+"""Presupuesto de tiempo de importación en frío para ``app``."""
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+from utils.lazy_loader import LazyModule, lazy_callable, module_available
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+APP_IMPORT_BUDGET_MS = float(os.environ.get("APP_IMPORT_BUDGET_MS", "500"))
+HEAVY_MODULES = (
+    "docx",
+    "pptx",
+    "pandas",
+    "transformers",
+    "torch",
+    "report_builder",
+    "report.alerta_temprana",
+    "report.carta_inmediatez",
+    "report.resumen_ejecutivo",
+)
+
+
+def _run_python(*args):
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=ROOT_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _cumulative_import_us(stderr: str, module: str) -> int:
+    pattern = re.compile(r"import time:\s+\d+\s+\|\s+(\d+)\s+\|\s+" + re.escape(module) + r"\s*$")
+    for line in stderr.splitlines():
+        match = pattern.search(line)
+        if match:
+            return int(match.group(1))
+    raise AssertionError(f"No se encontró '{module}' en la salida de -X importtime")
+
+
+def test_app_import_does_not_load_heavy_optional_modules():
+    script = (
+        "import sys, app\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    result = _run_python("-c", script)
+
+    assert result.stdout.strip() == ""
+
+
+def test_app_cold_import_stays_within_budget():
+    _run_python("-c", "import app")  # Genera los .pyc para medir solo la importación.
+    samples = [
+        _cumulative_import_us(_run_python("-X", "importtime", "-c", "import app").stderr, "app")
+        for _ in range(3)
+    ]
+
+    best_ms = min(samples) / 1000
+    assert best_ms <= APP_IMPORT_BUDGET_MS, (
+        f"Importar app tomó {best_ms:.0f} ms (presupuesto {APP_IMPORT_BUDGET_MS:.0f} ms)"
+    )
+
+
+def test_lazy_module_defers_import_until_first_attribute_access():
+    sys.modules.pop("json.tool", None)
+    proxy = LazyModule("json.tool")
+
+    assert not proxy.loaded
+    assert "json.tool" not in sys.modules
+    assert callable(proxy.main)
+    assert proxy.loaded
+
+
+def test_lazy_callable_resolves_target_on_call():
+    dumps = lazy_callable(LazyModule("json"), "dumps")
+
+    assert dumps.__name__ == "dumps"
+    assert dumps({"a": 1}) == '{"a": 1}'
+    assert module_available("json")
+    assert not module_available("modulo_que_no_existe_123")
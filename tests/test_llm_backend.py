@@ -0,0 +1,96 @@
+"""Backend optimizado para CPU del modelo local y su benchmark."""
+
+import io
+import json
+
+import pytest
+
+from benchmarks import llm_backends
+from report.alerta_temprana import SpanishSummaryHelper
+from utils import llm_backend
+from utils.llm_backend import (BACKEND_FP32, BACKEND_INT8, normalize_backend,
+                               quantized_cache_path, resolve_num_threads)
+
+
+def test_backend_names_are_normalized():
+    assert normalize_backend(" INT8 ") == BACKEND_INT8
+    assert normalize_backend(None) == BACKEND_FP32
+    assert normalize_backend("gpu") == BACKEND_FP32
+
+
+def test_thread_count_defaults_to_all_cores(monkeypatch):
+    monkeypatch.setattr(llm_backend.os, "cpu_count", lambda: 6)
+
+    assert resolve_num_threads(None) == 6
+    assert resolve_num_threads(0) == 6
+    assert resolve_num_threads(2) == 2
+
+
+def test_quantized_weights_live_next_to_local_models(tmp_path):
+    model_dir = tmp_path / "external drive" / "modelo"
+    model_dir.mkdir(parents=True)
+    cache_dir = tmp_path / "cache"
+
+    local = quantized_cache_path(model_dir, cache_dir, "2.3.1+cpu")
+    hub = quantized_cache_path("mrm8488/bert2bert", cache_dir, "2.3.1+cpu")
+
+    assert local == model_dir / "quantized" / "int8-torch2.3.1_cpu.pt"
+    assert hub == cache_dir / "mrm8488__bert2bert" / "int8-torch2.3.1_cpu.pt"
+
+
+def test_int8_summaries_do_not_share_cache_entries_with_fp32():
+    fp32 = SpanishSummaryHelper(use_persistent_cache=False, backend=BACKEND_FP32)
+    int8 = SpanishSummaryHelper(use_persistent_cache=False, backend=BACKEND_INT8)
+
+    assert "backend" not in fp32._generation_params(64)
+    assert int8._generation_params(64)["backend"] == BACKEND_INT8
+
+
+def test_helper_reads_backend_from_settings(monkeypatch):
+    import settings
+
+    monkeypatch.setattr(settings, "LLM_INFERENCE_BACKEND", "int8")
+
+    assert SpanishSummaryHelper(use_persistent_cache=False)._resolved_backend() == BACKEND_INT8
+
+
+def test_output_agreement_counts_exact_and_positional_tokens():
+    agreement = llm_backends.output_agreement(["a b c", "x y"], ["a b d", "x y"])
+
+    assert agreement == {"exact": 0.5, "tokens": round((2 / 3 + 1) / 2, 4)}
+
+
+def test_benchmark_runs_offline_with_tiny_model(tmp_path):
+    pytest.importorskip("torch")
+    pytest.importorskip("transformers")
+    model_dir = llm_backends.build_tiny_model(tmp_path / "tiny")
+
+    report = llm_backends.run_benchmark(model_dir, repeat=1, num_threads=1, max_new_tokens=8)
+
+    assert set(report["backends"]) == {BACKEND_FP32, BACKEND_INT8}
+    int8 = report["backends"][BACKEND_INT8]
+    assert 0.0 <= int8["agreement"]["exact"] <= 1.0 and int8["speedup"]
+    assert list((model_dir / "quantized").glob("int8-torch*.pt"))
+
+
+def test_cached_int8_model_keeps_generation_config(tmp_path):
+    pytest.importorskip("torch")
+    pytest.importorskip("transformers")
+    model_dir = llm_backends.build_tiny_model(tmp_path / "tiny")
+
+    fresh, _tokenizer = llm_backend.load_seq2seq_model(model_dir, backend=BACKEND_INT8, local_files_only=True)
+    cached, _tokenizer = llm_backend.load_seq2seq_model(model_dir, backend=BACKEND_INT8, local_files_only=True)
+
+    assert list((model_dir / "quantized").glob("int8-torch*.pt"))
+    assert cached.generation_config.to_dict() == fresh.generation_config.to_dict()
+    assert cached.generation_config.decoder_start_token_id is not None
+
+
+def test_benchmark_cli_prints_json():
+    pytest.importorskip("torch")
+    pytest.importorskip("transformers")
+    stream = io.StringIO()
+
+    assert llm_backends.main(["--repeat", "1", "--threads", "1", "--max-new-tokens", "4", "--json"], stream) == 0
+
+    assert json.loads(stream.getvalue())["threads"] == 1
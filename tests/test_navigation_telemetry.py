@@ -0,0 +1,143 @@
+"""Telemetría compacta de navegación: anillo, muestreo y filas resumidas."""
+
+import time
+import types
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import app as app_module
+import validators
+from utils.navigation_telemetry import NavigationTelemetry
+from utils.widget_registry import WidgetIdRegistry
+
+
+class Widget:
+    def __init__(self, path):
+        self._w = path
+
+    def winfo_class(self):
+        return "Entry"
+
+
+def test_ring_rotates_into_background_aggregation():
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        telemetry = NavigationTelemetry(capacity=8, bucket_size=100, executor=executor)
+        first = telemetry.intern_widget("tab.caso.field.id")
+        second = telemetry.intern_widget("tab.caso.field.fecha")
+        for index in range(20):
+            telemetry.record("focus_in", first, 150 + index, 40)
+            telemetry.record("focus_out", second, None, None)
+        summary = telemetry.flush()
+
+    assert summary.recorded == 40
+    assert summary.widget_counts == Counter({"tab.caso.field.id": 20, "tab.caso.field.fecha": 20})
+    assert summary.event_counts == Counter({"focus_in": 20, "focus_out": 20})
+    assert summary.heatmap_counts == Counter({(100, 0): 20})
+    assert summary.first_ts <= summary.last_ts
+    assert telemetry.flush().is_empty()
+
+
+def test_negative_coordinates_are_bucketed_like_detailed_mode():
+    telemetry = NavigationTelemetry(capacity=4, bucket_size=100)
+    telemetry.record("click", telemetry.intern_widget("w"), -150, 250)
+
+    assert telemetry.flush().heatmap_counts == Counter({(-200, 200): 1})
+
+
+def test_sampling_rate_keeps_one_of_every_stride_events():
+    telemetry = NavigationTelemetry(sample_rate=0.25)
+    kept = sum(1 for _ in range(100) if telemetry.should_sample())
+
+    assert kept == 25
+    assert telemetry.flush().sampled_out == 75
+    telemetry.sample_rate = 0
+    assert not any(telemetry.should_sample() for _ in range(10))
+
+
+def _build_compact_app(monkeypatch, **telemetry_options):
+    app = app_module.FraudCaseApp.__new__(app_module.FraudCaseApp)
+    app.logs = []
+    app._widget_registry = WidgetIdRegistry()
+    app._navigation_telemetry = NavigationTelemetry(bucket_size=app.HEATMAP_BUCKET_SIZE, **telemetry_options)
+    app._reset_navigation_metrics()
+    logged = []
+
+    def capture(event_type, message, logs, widget_id=None, coords=None, event_subtipo=None, **kwargs):
+        logged.append({"widget_id": widget_id, "mensaje": message, "subtipo": event_subtipo, "coords": coords})
+
+    monkeypatch.setattr(app_module, "log_event", capture)
+
+    def fail_focus():
+        raise AssertionError("el modo compacto no consulta el foco")
+
+    app.root = types.SimpleNamespace(focus_get=fail_focus)
+    return app, logged
+
+
+def test_compact_mode_defers_log_rows_until_flush(monkeypatch):
+    app, logged = _build_compact_app(monkeypatch)
+    widget = Widget(".!frame.!entry")
+    logical_id = app._widget_registry.register(widget, "tab.caso.field.case_id")
+    resolutions = []
+    original_resolve = app_module.FraudCaseApp._resolve_widget_id
+
+    def counting_resolve(self, target, fallback=None):
+        resolutions.append(target)
+        return original_resolve(self, target, fallback)
+
+    monkeypatch.setattr(app_module.FraudCaseApp, "_resolve_widget_id", counting_resolve)
+
+    for _ in range(50):
+        app._handle_global_navigation_event(types.SimpleNamespace(widget=widget, x_root=5, y_root=10), "focus_in")
+        app._handle_global_navigation_event(types.SimpleNamespace(widget=widget, x_root=5, y_root=10), "focus_out")
+
+    assert logged == []
+    assert len(resolutions) == 1
+
+    app._emit_navigation_metrics()
+
+    subtypes = Counter(row["subtipo"] for row in logged)
+    assert subtypes == Counter({"navigation_summary": 1, "focus_metrics": 1, "click_heatmap": 1})
+    metrics = next(row for row in logged if row["subtipo"] == "focus_metrics")
+    assert metrics["widget_id"] == logical_id
+    assert metrics["mensaje"].endswith(": 100")
+    summary = next(row for row in logged if row["subtipo"] == "navigation_summary")
+    assert "focus_in=50" in summary["mensaje"] and "focus_out=50" in summary["mensaje"]
+
+
+def test_clearing_case_discards_pending_records(monkeypatch):
+    app, logged = _build_compact_app(monkeypatch)
+    widget = Widget(".!entry")
+    app._handle_global_navigation_event(types.SimpleNamespace(widget=widget, x_root=1, y_root=1), "click")
+
+    app._reset_navigation_metrics()
+    app._emit_navigation_metrics()
+
+    assert logged == []
+
+
+def test_benchmark_compact_vs_detailed_event_cost(monkeypatch):
+    events = 20000
+    widget = Widget(".!frame.!entry")
+
+    app, _logged = _build_compact_app(monkeypatch)
+    app._widget_registry.register(widget, "tab.caso.field.case_id")
+    event = types.SimpleNamespace(widget=widget, x_root=5, y_root=10)
+    start = time.perf_counter()
+    for _ in range(events):
+        app._handle_global_navigation_event(event, "focus_in")
+    compact = time.perf_counter() - start
+
+    detailed_app, _ = _build_compact_app(monkeypatch)
+    detailed_app._navigation_telemetry = None
+    detailed_app._widget_registry.register(widget, "tab.caso.field.case_id")
+    detailed_app.root = types.SimpleNamespace(focus_get=lambda: widget)
+    monkeypatch.setattr(app_module, "log_event", validators.log_event)
+    start = time.perf_counter()
+    for _ in range(events):
+        detailed_app._handle_global_navigation_event(event, "focus_in")
+    detailed = time.perf_counter() - start
+    validators.drain_log_queue()
+
+    print(f"\n{events} eventos: compacto {compact * 1e6 / events:.2f} µs/evento; detallado {detailed * 1e6 / events:.2f} µs/evento")
+    assert app._navigation_telemetry.flush().recorded == events
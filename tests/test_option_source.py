@@ -0,0 +1,105 @@
+import types
+
+from app import FraudCaseApp
+from tests.stubs import DummyVar
+from utils.option_source import SharedOptionSource
+
+
+class ComboboxStub:
+    def __init__(self):
+        self.options = {"values": (), "postcommand": ""}
+        self.configure_calls = 0
+
+    def cget(self, key):
+        return self.options.get(key, "")
+
+    def configure(self, **kwargs):
+        self.configure_calls += 1
+        self.options.update(kwargs)
+
+    def post(self):
+        self.options["postcommand"]()
+
+
+class ProductSpy:
+    def __init__(self, client_id=""):
+        self.client_var = DummyVar(client_id)
+        self.released = []
+        self.full_updates = 0
+
+    def release_stale_client_selection(self, known_ids):
+        self.released.append(known_ids)
+        if self.client_var.get() not in known_ids:
+            self.client_var.set("")
+
+    def update_client_options(self):
+        self.full_updates += 1
+
+
+def _build_app(client_ids, product_count):
+    app = FraudCaseApp.__new__(FraudCaseApp)
+    app.logs = []
+    app.client_frames = [types.SimpleNamespace(id_var=DummyVar(cid)) for cid in client_ids]
+    app.product_frames = [ProductSpy() for _ in range(product_count)]
+    return app
+
+
+def test_source_recomputes_once_per_version_and_syncs_combobox_lazily():
+    ids = ["C1"]
+    source = SharedOptionSource(lambda: list(ids))
+    combobox = ComboboxStub()
+    combobox.configure(values=source())
+    source.attach(combobox)
+    calls_after_attach = combobox.configure_calls
+
+    ids.append("C2")
+    for _ in range(5):
+        source.invalidate()
+
+    assert combobox.configure_calls == calls_after_attach
+    assert source.is_stale(combobox)
+    combobox.post()
+    combobox.post()
+
+    assert combobox.options["values"] == ["C1", "C2"]
+    assert combobox.configure_calls == calls_after_attach + 1
+    assert source.stats["recomputes"] == 2
+    assert source.known() == frozenset({"C1", "C2"})
+
+
+def test_pop_removed_reports_only_disappeared_ids():
+    ids = ["C1", "C2"]
+    source = SharedOptionSource(lambda: list(ids))
+
+    assert source.pop_removed() == frozenset()
+    ids.append("C3")
+    source.invalidate()
+    assert source.pop_removed() == frozenset()
+    ids.remove("C1")
+    source.invalidate()
+    assert source.pop_removed() == frozenset({"C1"})
+
+
+def test_adding_client_does_not_touch_product_frames():
+    app = _build_app(["C1"], product_count=500)
+    app.update_client_options_global()
+
+    app.client_frames.append(types.SimpleNamespace(id_var=DummyVar("C2")))
+    app.update_client_options_global()
+
+    assert all(not prod.released and not prod.full_updates for prod in app.product_frames)
+    assert app._get_client_option_source().known() == frozenset({"C1", "C2"})
+
+
+def test_removing_client_releases_stale_product_selections():
+    app = _build_app(["C1", "C2"], product_count=3)
+    app.product_frames[0].client_var.set("C1")
+    app.product_frames[1].client_var.set("C2")
+    app.update_client_options_global()
+
+    app.client_frames.pop(0)
+    app.update_client_options_global()
+
+    assert app.product_frames[0].client_var.get() == ""
+    assert app.product_frames[1].client_var.get() == "C2"
+    assert all(prod.full_updates == 0 for prod in app.product_frames)
@@ -0,0 +1,163 @@
+"""Pruebas del perfilador opcional, sus ganchos y el panel de rendimiento."""
+
+import json
+import threading
+import time
+
+import pytest
+
+from report.export_pipeline import prepare_case_data, write_case_exports
+from tests.test_background_worker import TimerRoot
+from tests.test_historical_consolidator import _build_case_payload
+from tests.test_ui_scheduler import FakeClock, FakeRoot
+from utils.background_worker import run_guarded_task
+from utils.perf_hud import format_hud_lines
+from utils.perf_profiler import (DEFAULT_SLOW_CALLBACK_MS, LoopLagMonitor,
+                                 PerfProfiler, configure_profiler,
+                                 instrument_after)
+from utils.ui_scheduler import CoalescingScheduler
+
+
+@pytest.fixture
+def shared_profiler():
+    profiler = configure_profiler(enabled=True, sample_rate=1.0)
+    profiler.reset()
+    yield profiler
+    configure_profiler(enabled=False, sample_rate=1.0, slow_callback_ms=DEFAULT_SLOW_CALLBACK_MS)
+    profiler.reset()
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = PerfProfiler()
+
+    with profiler.span("tramo", "app"):
+        pass
+    profiler.record_counter("lag", {"lag": 1})
+
+    assert profiler.event_count() == 0
+    assert profiler.stats() == {}
+
+
+def test_sample_rate_keeps_one_span_per_stride():
+    profiler = PerfProfiler(enabled=True, sample_rate=0.25)
+
+    for _ in range(8):
+        with profiler.span("tramo", "app"):
+            pass
+
+    assert profiler.stats()["app"]["tramo"]["count"] == 2
+
+
+def test_chrome_trace_export_uses_microseconds_and_names_threads(tmp_path):
+    clock = FakeClock()
+    profiler = PerfProfiler(enabled=True, clock=clock)
+    clock.advance(10)
+    with profiler.span("csv", "export", file="casos.csv"):
+        clock.advance(3)
+    profiler.record_loop_lag(12.5)
+
+    path = profiler.export_chrome_trace(tmp_path / "trazas" / "perf.json")
+    payload = json.loads(path.read_text(encoding="utf-8"))
+
+    events = payload["traceEvents"]
+    complete = next(event for event in events if event["ph"] == "X")
+    assert complete["name"] == "csv" and complete["cat"] == "export"
+    assert complete["ts"] == pytest.approx(10_000) and complete["dur"] == pytest.approx(3_000)
+    assert complete["args"] == {"file": "casos.csv"}
+    counter = next(event for event in events if event["ph"] == "C")
+    assert counter["args"] == {"lag": 12.5}
+    thread_names = [event["args"]["name"] for event in events if event["ph"] == "M"]
+    assert threading.current_thread().name in thread_names
+    assert profiler.max_loop_lag_ms == 12.5
+
+
+def test_slow_callbacks_and_after_instrumentation():
+    clock = FakeClock()
+    profiler = PerfProfiler(enabled=True, clock=clock, slow_callback_ms=20)
+    root = FakeRoot(clock)
+    calls = []
+
+    def lento():
+        clock.advance(35)
+        calls.append("lento")
+
+    def rapido():
+        calls.append("rapido")
+
+    assert instrument_after(root, profiler)
+    assert not instrument_after(root, profiler)
+    root.after(0, lento)
+    root.after_idle(rapido)
+    root.run_due()
+
+    assert calls == ["lento", "rapido"]
+    assert [entry.name for entry in profiler.slow_callbacks] == ["test_slow_callbacks_and_after_instrumentation.<locals>.lento"]
+    assert profiler.slow_callbacks[0].duration_ms == pytest.approx(35)
+    stats = profiler.stats()
+    assert set(stats) == {"after", "after_idle"}
+
+
+def test_loop_lag_monitor_measures_delay():
+    clock = FakeClock()
+    profiler = PerfProfiler(enabled=True, clock=clock)
+    root = FakeRoot(clock)
+    monitor = LoopLagMonitor(root, profiler, interval_ms=100)
+
+    monitor.start()
+    clock.advance(160)
+    root.run_due()
+
+    assert profiler.loop_lag_ms == pytest.approx(60)
+    monitor.stop()
+    assert root.jobs == {}
+
+
+def test_guarded_tasks_record_queue_wait_run_and_callback(shared_profiler):
+    root = TimerRoot()
+    done = threading.Event()
+
+    run_guarded_task(lambda: "ok", lambda _result: done.set(), None, root, poll_interval_ms=5, category="reports")
+
+    assert done.wait(timeout=2)
+    # El tramo del callback se cierra justo después de que este retorna.
+    deadline = time.monotonic() + 2
+    while "callback.reports" not in shared_profiler.stats() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    stats = shared_profiler.stats()
+    assert set(stats["task.reports"]) == {"queue_wait", "run"}
+    assert stats["callback.reports"]
+    root.destroy()
+
+
+def test_scheduler_jobs_are_timed(shared_profiler):
+    clock = FakeClock()
+    scheduler = CoalescingScheduler(FakeRoot(clock), clock=clock)
+
+    scheduler.schedule("resumen", lambda: None)
+    scheduler.flush()
+
+    assert shared_profiler.stats()["ui_scheduler"]["resumen"]["count"] == 1
+
+
+def test_export_pipeline_records_each_artifact(shared_profiler, tmp_path):
+    data = prepare_case_data(_build_case_payload("2024-0501"))
+
+    write_case_exports(data, tmp_path, "2024-0501", docx_available=False)
+
+    export_stats = shared_profiler.stats()["export"]
+    assert {"csv", "version_json", "md", "resumen_ejecutivo", "history"} <= set(export_stats)
+    assert export_stats["csv"]["count"] >= 11
+
+
+def test_hud_lines_show_lag_queues_and_slow_callbacks():
+    clock = FakeClock()
+    profiler = PerfProfiler(enabled=True, clock=clock, slow_callback_ms=10)
+    profiler.record_loop_lag(42.0)
+    with profiler.callback_span("refrescar", "after"):
+        clock.advance(15)
+
+    lines = format_hud_lines(profiler, {"imports": 3, "default": 0})
+
+    assert lines[0].startswith("Retraso del bucle: 42.0 ms")
+    assert "Colas de fondo: default=0, imports=3" in lines
+    assert lines[-1].strip().endswith("after: refrescar")
@@ -509,6 +509,44 @@ def test_flush_log_queue_skips_local_when_disabled(
     assert messagebox_spy.warnings == []
 
 
+def test_flush_log_queue_compacts_usage_cube_in_background(
+    tmp_path,
+    monkeypatch,
+    external_drive_dir,
+    messagebox_spy,
+):
+    from analytics.usage_cube import UsageCube, usage_cube_path
+
+    local_log_path = tmp_path / 'logs.csv'
+    monkeypatch.setattr(app_module, 'LOGS_FILE', str(local_log_path))
+    monkeypatch.setattr(app_module, 'EXTERNAL_LOGS_FILE', str(external_drive_dir / 'logs.csv'))
+    monkeypatch.setattr(app_module, 'STORE_LOGS_LOCALLY', True)
+    cube_dir = tmp_path / 'cubos'
+    monkeypatch.setattr(app_module, 'USAGE_CUBE_DIR', str(cube_dir))
+    rows = [
+        {'timestamp': '2024-06-03 09:00:00', 'tipo': 'navegacion', 'widget_id': 'tab_clientes', 'mensaje': 'Clientes'},
+        {'timestamp': '2024-06-03 09:01:00', 'tipo': 'validacion', 'widget_id': 'entry_cliente', 'mensaje': 'Cliente'},
+    ]
+
+    def fake_drain():
+        nonlocal rows
+        payload, rows = rows, []
+        return payload
+
+    monkeypatch.setattr(app_module, 'drain_log_queue', fake_drain)
+    app = _make_minimal_app()
+    app._flush_log_queue_to_disk()
+    app._usage_compaction_future.result(timeout=10)
+
+    with UsageCube(usage_cube_path(local_log_path, cube_dir)) as cube:
+        aggregate = cube.query('2024-06-03', '2024-06-03')
+    assert aggregate.total_events == 2
+    assert not usage_cube_path(external_drive_dir / 'logs.csv').exists()
+    assert len(list(cube_dir.glob('*.sqlite3'))) == 2
+    assert aggregate.validation_events == 1
+    assert app._schedule_usage_compaction([str(local_log_path)]) is None
+
+
 def test_save_temp_version_writes_external_when_primary_unwritable(
     tmp_path,
     monkeypatch,
@@ -0,0 +1,105 @@
+"""Caché persistente de resúmenes del modelo local."""
+
+from report.alerta_temprana import SpanishSummaryHelper
+from utils import auto_redaccion
+from utils.summary_cache import SummaryCache, build_cache_key
+
+PARAMS = {"max_new_tokens": 64, "num_beams": 4}
+
+
+class CountingHelper(SpanishSummaryHelper):
+    """Helper cuyo modelo devuelve un texto fijo y cuenta las generaciones."""
+
+    generated = 0
+
+    def _generate(self, prompt, max_new_tokens):
+        self.generated += 1
+        return f"Resumen generado ({max_new_tokens})"
+
+
+class StepClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += 1.0
+        return self.now
+
+
+def test_key_covers_model_prompt_and_params():
+    base = build_cache_key("modelo", "prompt", PARAMS)
+
+    assert base == build_cache_key("modelo", "prompt", dict(reversed(PARAMS.items())))
+    assert base != build_cache_key("otro", "prompt", PARAMS)
+    assert base != build_cache_key("modelo", "prompt 2", PARAMS)
+    assert base != build_cache_key("modelo", "prompt", {**PARAMS, "max_new_tokens": 65})
+
+
+def test_entries_survive_reopening_and_metrics_count_lookups(tmp_path):
+    path = tmp_path / "cache" / "resumenes.sqlite3"
+    cache = SummaryCache(path)
+    assert cache.get("modelo", "prompt", PARAMS) is None
+    assert cache.put("modelo", "prompt", PARAMS, "Texto ñandú", section="Resumen")
+    cache.close()
+
+    reopened = SummaryCache(path)
+    assert reopened.get("modelo", "prompt", PARAMS) == "Texto ñandú"
+    stats = reopened.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 0, 1)
+    assert stats["bytes"] == len("Texto ñandú".encode("utf-8"))
+    assert cache.stats()["misses"] == 1 and cache.stats()["writes"] == 1
+
+
+def test_lru_eviction_keeps_total_size_under_limit(tmp_path):
+    cache = SummaryCache(tmp_path / "c.sqlite3", max_bytes=25, clock=StepClock())
+    cache.put("m", "a", PARAMS, "x" * 10)
+    cache.put("m", "b", PARAMS, "y" * 10)
+    assert cache.get("m", "a", PARAMS)  # "a" pasa a ser el más reciente
+    cache.put("m", "c", PARAMS, "z" * 10)
+
+    assert cache.get("m", "b", PARAMS) is None
+    assert cache.get("m", "a", PARAMS) and cache.get("m", "c", PARAMS)
+    assert cache.stats()["evictions"] == 1 and cache.stats()["bytes"] == 20
+
+
+def test_unwritable_location_disables_cache(tmp_path):
+    blocker = tmp_path / "archivo"
+    blocker.write_text("no es carpeta", encoding="utf-8")
+    cache = SummaryCache(blocker / "c.sqlite3")
+
+    assert cache.get("m", "p", PARAMS) is None
+    assert not cache.put("m", "p", PARAMS, "texto")
+    assert cache.stats()["errors"] == 1
+
+
+def test_helpers_share_generated_summaries_across_sessions(tmp_path, monkeypatch):
+    path = tmp_path / "resumenes.sqlite3"
+    first = CountingHelper(persistent_cache=SummaryCache(path))
+    assert first.summarize("Resumen", "prompt del caso", max_new_tokens=80) == "Resumen generado (80)"
+    assert first.summarize("Resumen", "prompt del caso", max_new_tokens=80) == "Resumen generado (80)"
+    assert first.generated == 1
+
+    # Una nueva sesión (otra instancia y otra conexión) no vuelve a generar.
+    second = CountingHelper(persistent_cache=SummaryCache(path))
+    assert second.summarize("Otra sección", "prompt del caso", max_new_tokens=80) == "Resumen generado (80)"
+    assert second.generated == 0
+    assert second.summarize("Resumen", "prompt del caso", max_new_tokens=96) == "Resumen generado (96)"
+    assert second.generated == 1
+
+    monkeypatch.setattr(auto_redaccion, "TRANSFORMERS_AVAILABLE", True)
+    third = CountingHelper(persistent_cache=SummaryCache(path))
+    kwargs = dict(target_chars=150, max_new_tokens=80, helper=third, label="breve")
+    auto_redaccion.auto_redact_comment({"caso": {}}, "Narrativa", **kwargs)
+    result = auto_redaccion.auto_redact_comment({"caso": {}}, "Narrativa", **kwargs)
+    fresh = CountingHelper(persistent_cache=SummaryCache(path))
+    again = auto_redaccion.auto_redact_comment({"caso": {}}, "Narrativa", **{**kwargs, "helper": fresh})
+
+    assert result.text == again.text == "Resumen generado (80)"
+    assert third.generated == 1 and fresh.generated == 0
+
+
+def test_persistent_cache_can_be_disabled():
+    helper = CountingHelper(use_persistent_cache=False)
+
+    assert helper.summarize("Resumen", "p", max_new_tokens=10) == "Resumen generado (10)"
+    assert helper.persistent_cache is None
@@ -0,0 +1,178 @@
+"""Pegados extensos del resumen con hidratación en segundo plano y aplicación por tramos."""
+
+import pytest
+
+import app as app_module
+from tests.app_factory import SummaryTableStub, build_summary_app
+from tests.summary_cases import SUMMARY_CASES
+from utils.mass_import_manager import MassImportManager
+
+
+class FakeRoot:
+    def __init__(self):
+        self.jobs = []
+
+    def after(self, _delay, callback):
+        self.jobs.append(callback)
+        return f"after#{len(self.jobs)}"
+
+    def run_next(self):
+        self.jobs.pop(0)()
+
+    def run_all(self):
+        while self.jobs:
+            self.run_next()
+
+
+class FakeDialog:
+    instances = []
+
+    def __init__(self, _parent, title, on_cancel=None):
+        self.title = title
+        self.on_cancel = on_cancel
+        self.progress = []
+        self.closed = False
+        FakeDialog.instances.append(self)
+
+    def track_future(self, _future, _queue):
+        return None
+
+    def update_progress(self, current, total):
+        self.progress.append((current, total))
+
+    def close(self):
+        self.closed = True
+
+
+class StatusVar:
+    def __init__(self):
+        self.history = []
+
+    def set(self, value):
+        self.history.append(value)
+
+
+@pytest.fixture
+def pipeline_app(monkeypatch, messagebox_spy, tmp_path):
+    app = build_summary_app(monkeypatch)
+    app.root = FakeRoot()
+    app.mass_import_manager = MassImportManager(tmp_path)
+    app.import_status_var = StatusVar()
+    app._set_catalog_dependent_state = lambda *_args, **_kwargs: None
+    app._import_feedback_active = False
+    app._run_duplicate_check_post_load = lambda *_args, **_kwargs: None
+    FakeDialog.instances = []
+    monkeypatch.setattr(app_module, "ProgressDialog", FakeDialog)
+
+    def run_inline(task, on_success, on_error, _root, **_kwargs):
+        try:
+            result = task()
+        except BaseException as exc:  # noqa: BLE001 - se reenvía como en run_guarded_task
+            on_error(exc)
+        else:
+            on_success(result)
+        return None
+
+    monkeypatch.setattr(app_module, "run_guarded_task", run_inline)
+    summaries = []
+    original_run_import = app.mass_import_manager.run_import
+
+    def capture(*args, **kwargs):
+        summary = original_run_import(*args, **kwargs)
+        summaries.append(summary)
+        return summary
+
+    app.mass_import_manager.run_import = capture
+    return app, summaries, messagebox_spy
+
+
+def _client_rows(count):
+    base = SUMMARY_CASES[0].valid_row
+    return [[str(10000000 + index), *base[1:]] for index in range(count)]
+
+
+def _paste(app, key, rows):
+    case = next(case for case in SUMMARY_CASES if case.key == key)
+    app.summary_tables[key] = SummaryTableStub()
+    app.summary_config[key] = case.columns
+    app.clipboard_get = lambda: "\n".join("\t".join(row) for row in rows)
+    return app._handle_summary_paste(key)
+
+
+def test_large_paste_hydrates_in_worker_and_applies_in_slices(pipeline_app):
+    app, summaries, spy = pipeline_app
+    hydrations = []
+    original = app_module.FraudCaseApp._hydrate_row_from_details
+
+    def counting(self, row, id_column, aliases):
+        hydrations.append(id_column)
+        return original(self, row, id_column, aliases)
+
+    app._hydrate_row_from_details = counting.__get__(app)
+
+    assert _paste(app, "clientes", _client_rows(120)) == "break"
+
+    assert len(hydrations) == 120
+    assert len(app.client_frames) == app.SUMMARY_PASTE_BATCH_SIZE
+    app.root.run_all()
+
+    assert len(hydrations) == 120  # la aplicación reutiliza lo hidratado en el worker
+    assert len(app.client_frames) == 120
+    assert len(summaries) == 1
+    summary = summaries[0]
+    assert (summary.successes, summary.updates, summary.errors) == (120, 0, 0)
+    assert spy.infos == [("Pegado desde resumen", summary.summary_text)]
+    dialog = FakeDialog.instances[-1]
+    assert dialog.closed and dialog.progress[-1] == (120, 120)
+    assert "Importando pegado de clientes (50/120)..." in app.import_status_var.history
+    assert app.import_status_var.history[-1] == "Pegado de clientes: 120 de 120 filas aplicadas."
+
+
+def test_cancel_stops_between_slices_and_reports_partial_summary(pipeline_app):
+    app, summaries, spy = pipeline_app
+
+    _paste(app, "clientes", _client_rows(100))
+    FakeDialog.instances[-1].on_cancel()
+    app.root.run_all()
+
+    assert len(app.client_frames) == app.SUMMARY_PASTE_BATCH_SIZE
+    assert len(summaries) == 1
+    assert summaries[0].successes == app.SUMMARY_PASTE_BATCH_SIZE
+    assert any("Pegado cancelado: se aplicaron 25 de 100 filas." in message for _title, message in spy.warnings)
+
+
+def test_duplicates_and_updates_are_counted_in_single_summary(pipeline_app):
+    app, summaries, spy = pipeline_app
+    risk = SUMMARY_CASES[[case.key for case in SUMMARY_CASES].index("riesgos")].valid_row
+    rows = [[f"RSK-{index % 40:06d}", *risk[1:]] for index in range(60)]
+
+    _paste(app, "riesgos", rows)
+    app.root.run_all()
+
+    assert len(app.risk_frames) == 40
+    assert len(summaries) == 1
+    assert (summaries[0].successes, summaries[0].duplicates) == (40, 20)
+    assert not any(title == "Riesgos duplicados" for title, _message in spy.warnings)
+
+
+def test_invalid_rows_fail_in_worker_without_touching_form(pipeline_app):
+    app, summaries, spy = pipeline_app
+    rows = _client_rows(60)
+    rows[30][4] = "no-es-correo"
+
+    _paste(app, "clientes", rows)
+    app.root.run_all()
+
+    assert app.client_frames == []
+    assert summaries == []
+    assert any("Cliente fila 31" in message for _title, message in spy.errors)
+
+
+def test_short_paste_keeps_synchronous_ingestion(pipeline_app):
+    app, summaries, _spy = pipeline_app
+
+    _paste(app, "clientes", _client_rows(3))
+
+    assert len(app.client_frames) == 3
+    assert summaries == []
+    assert app.root.jobs == []
@@ -0,0 +1,80 @@
+"""Equivalencia de los núcleos de texto de ``validators`` con su versión original."""
+
+import random
+import unicodedata
+
+import pytest
+
+import validators
+from validators import normalize_without_accents, sanitize_rich_text
+
+ALPHABET = (
+    "abcxyzABC019 .,;-_/@=+\n\t\r"
+    "áéíóúñÑüÁÉ¿¡«»ßæøœ€°ºª"
+    "\x00\x07\x0b\x1b\x7f\x80\x85\x9f"
+    "\xa0­͏̧̀́̃⃝️"
+    "​‍  　﻿͸\ud800"
+    "ﬁ½²Ａｶ㎏Ωẛ̈́"
+    "🙂👍🏽"
+)
+
+
+def _reference_sanitize(text, max_chars=None):
+    normalized = "" if text is None else str(text).replace("\r\n", "\n").replace("\r", "\n")
+    sanitized = "".join(ch for ch in normalized if ch in {"\n", "\t"} or ch.isprintable())
+    if max_chars is not None and max_chars > 0:
+        return sanitized[:max_chars]
+    return sanitized
+
+
+def _reference_normalize(value):
+    if not isinstance(value, str):
+        return ""
+    normalized = unicodedata.normalize("NFKD", value)
+    return "".join(ch for ch in normalized if not unicodedata.combining(ch))
+
+
+def _reference_scrub(text):
+    return "".join(ch for ch in text if ch == "\n" or unicodedata.category(ch) != "Cc")
+
+
+def _random_texts(seed, count=500):
+    rng = random.Random(seed)
+    for _ in range(count):
+        length = rng.choice((0, 1, 3, 12, 40, 300))
+        yield "".join(rng.choice(ALPHABET) for _ in range(length))
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_sanitize_rich_text_matches_reference(seed):
+    for text in _random_texts(seed):
+        assert sanitize_rich_text(text, max_chars=None) == _reference_sanitize(text)
+        assert sanitize_rich_text(text, max_chars=25) == _reference_sanitize(text, 25)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_normalize_without_accents_matches_reference(seed):
+    for text in _random_texts(seed):
+        assert normalize_without_accents(text) == _reference_normalize(text)
+        assert normalize_without_accents(text * 8) == _reference_normalize(text * 8)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_log_control_scrub_matches_reference(seed):
+    for text in _random_texts(seed):
+        assert validators._scrub_control_characters(text) == _reference_scrub(text)
+
+
+def test_every_code_point_is_handled_like_the_reference():
+    for code in range(0x3000):
+        char = chr(code)
+        assert sanitize_rich_text(char, max_chars=None) == _reference_sanitize(char)
+        assert normalize_without_accents(char) == _reference_normalize(char)
+        assert validators._scrub_control_characters(char) == _reference_scrub(char)
+
+
+def test_non_text_values_keep_their_behaviour():
+    assert sanitize_rich_text(None) == ""
+    assert sanitize_rich_text(12.5, max_chars=None) == "12.5"
+    assert normalize_without_accents(None) == ""
+    assert normalize_without_accents(123) == ""
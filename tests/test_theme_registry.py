@@ -0,0 +1,202 @@
+"""Registro de widgets por rol y cambio de tema incremental."""
+
+from __future__ import annotations
+
+import os
+import time
+import tkinter as tk
+import weakref
+from tkinter import ttk
+
+import pytest
+
+import theme_manager
+from theme_manager import (DARK_THEME, LIGHT_THEME, ROLE_CLASSIC, ROLE_STYLE,
+                           ThemeManager)
+
+
+class FakeWidget:
+    def __init__(self, role, parent=None):
+        self.role = role
+        self.children = []
+        self.alive = True
+        if parent is not None:
+            parent.children.append(self)
+
+    def winfo_exists(self):
+        return self.alive
+
+    def winfo_children(self):
+        return list(self.children)
+
+
+class FakeRoot(FakeWidget):
+    def __init__(self):
+        super().__init__(ROLE_CLASSIC)
+        self.idle = []
+
+    def after_idle(self, callback):
+        self.idle.append(callback)
+        return f"idle#{len(self.idle)}"
+
+    def after_cancel(self, _job):
+        self.idle.clear()
+
+    def run_idle(self):
+        while self.idle:
+            self.idle.pop(0)()
+
+
+@pytest.fixture
+def registry_env(monkeypatch):
+    applied = []
+    monkeypatch.setattr(ThemeManager, "_widget_registry", {role: weakref.WeakSet() for role in theme_manager.THEMED_ROLES})
+    monkeypatch.setattr(ThemeManager, "_primed_windows", weakref.WeakSet())
+    monkeypatch.setattr(ThemeManager, "_tracked_toplevels", set())
+    monkeypatch.setattr(ThemeManager, "_tracked_menus", set())
+    monkeypatch.setattr(ThemeManager, "_discovery_job", None)
+    monkeypatch.setattr(ThemeManager, "_discovery_iter", None)
+    monkeypatch.setattr(ThemeManager, "_current", LIGHT_THEME)
+    monkeypatch.setattr(ThemeManager, "_ensure_style", classmethod(lambda cls: None))
+    monkeypatch.setattr(ThemeManager, "_theme_role", classmethod(lambda cls, widget: widget.role))
+    monkeypatch.setattr(
+        ThemeManager,
+        "_apply_widget_attributes",
+        classmethod(lambda cls, widget, theme: applied.append((widget, theme["name"]))),
+    )
+    monkeypatch.setattr(theme_manager, "reapply_all_badges", lambda: None)
+    root = FakeRoot()
+    monkeypatch.setattr(ThemeManager, "_root", root)
+    return root, applied
+
+
+def _build_tree(root, count, classic_every=10):
+    widgets = []
+    parent = root
+    for index in range(count):
+        role = ROLE_CLASSIC if index % classic_every == 0 else ROLE_STYLE
+        widget = FakeWidget(role, parent)
+        widgets.append(widget)
+        if index % 25 == 0:
+            parent = widget
+    return widgets
+
+
+def test_walk_skips_widgets_already_themed(registry_env):
+    root, applied = registry_env
+    widgets = _build_tree(root, 50)
+
+    ThemeManager.apply_to_widget_tree(root)
+    first_pass = len(applied)
+    ThemeManager.apply_to_widget_tree(root)
+
+    assert first_pass == len(widgets) + 1
+    assert len(applied) == first_pass
+
+
+def test_toggle_only_reconfigures_classic_widgets(registry_env):
+    root, applied = registry_env
+    widgets = _build_tree(root, 200)
+    ThemeManager.refresh_all_widgets()
+    root.run_idle()
+    applied.clear()
+
+    ThemeManager._current = DARK_THEME
+    ThemeManager.refresh_all_widgets()
+
+    classic = [widget for widget in widgets if widget.role == ROLE_CLASSIC] + [root]
+    assert len(applied) == len(classic)
+    assert {id(widget) for widget, _name in applied} == {id(widget) for widget in classic}
+    assert all(name == "dark" for _widget, name in applied)
+
+
+def test_new_widgets_are_discovered_in_idle_batches(registry_env, monkeypatch):
+    root, applied = registry_env
+    monkeypatch.setattr(ThemeManager, "DISCOVERY_BATCH_SIZE", 10)
+    ThemeManager.refresh_all_widgets()
+    root.run_idle()
+    late = [FakeWidget(ROLE_CLASSIC, root) for _ in range(35)]
+    applied.clear()
+
+    ThemeManager._current = DARK_THEME
+    ThemeManager.refresh_all_widgets()
+    assert len(applied) == 1  # solo la raíz registrada
+    batches = 0
+    while root.idle:
+        root.idle.pop(0)()
+        batches += 1
+
+    assert batches == 4
+    assert set(ThemeManager.registered_widgets(ROLE_CLASSIC)) >= set(late)
+
+
+def test_destroyed_widgets_drop_out_of_registry(registry_env):
+    root, applied = registry_env
+    widgets = _build_tree(root, 20, classic_every=1)
+    ThemeManager.refresh_all_widgets()
+    for widget in widgets:
+        widget.alive = False
+    root.children.clear()
+    del widgets, widget
+    applied.clear()
+
+    ThemeManager._current = DARK_THEME
+    ThemeManager.refresh_all_widgets()
+
+    assert [widget for widget, _name in applied] == [root]
+    assert len(ThemeManager.registered_widgets(ROLE_CLASSIC)) == 1
+
+
+def test_benchmark_toggle_scales_with_classic_widgets(registry_env):
+    root, applied = registry_env
+    timings = []
+    for count in (500, 2000, 8000):
+        root.children.clear()
+        ThemeManager._primed_windows = weakref.WeakSet()
+        _build_tree(root, count, classic_every=20)
+        ThemeManager.refresh_all_widgets()
+        root.run_idle()
+        applied.clear()
+        ThemeManager._current = DARK_THEME if ThemeManager._current is LIGHT_THEME else LIGHT_THEME
+        start = time.perf_counter()
+        ThemeManager.refresh_all_widgets()
+        timings.append((count, time.perf_counter() - start, len(applied)))
+
+    print("\n" + "; ".join(f"{count} widgets: {seconds * 1000:.2f} ms / {calls} configure" for count, seconds, calls in timings))
+    for count, _seconds, calls in timings:
+        assert calls <= count // 20 + 2
+
+
+@pytest.mark.skipif(
+    os.name != "nt" and not os.environ.get("DISPLAY"),
+    reason="Tkinter no disponible en el entorno de pruebas",
+)
+def test_benchmark_real_toggle_time_by_widget_count(monkeypatch, tmp_path):
+    try:
+        root = tk.Tk()
+        root.withdraw()
+    except tk.TclError:
+        pytest.skip("Tkinter no disponible en el entorno de pruebas")
+    monkeypatch.setattr(ThemeManager, "PREFERENCE_FILE", tmp_path / "theme_pref.txt")
+    previous = (ThemeManager._style, ThemeManager._root, ThemeManager._current, ThemeManager._base_style_configured)
+    try:
+        style = ThemeManager.build_style(root)
+        ThemeManager.apply("light", root=root, style=style)
+        results = []
+        for count in (200, 1000):
+            frame = ttk.Frame(root)
+            for index in range(count):
+                if index % 10 == 0:
+                    tk.Label(frame, text=str(index))
+                else:
+                    ttk.Entry(frame)
+            ThemeManager.apply_to_widget_tree(root)
+            start = time.perf_counter()
+            ThemeManager.toggle()
+            results.append((count, time.perf_counter() - start))
+            frame.destroy()
+        print("\n" + "; ".join(f"{count}: {seconds * 1000:.1f} ms" for count, seconds in results))
+        assert ThemeManager.current()["name"] in {"light", "dark"}
+    finally:
+        root.destroy()
+        (ThemeManager._style, ThemeManager._root, ThemeManager._current, ThemeManager._base_style_configured) = previous
@@ -0,0 +1,239 @@
+import os
+import time
+import tkinter as tk
+from tkinter import ttk
+
+import pytest
+
+from ui.tree_diff import KeyedTreeRenderer, build_unique_keys, get_tree_renderer
+
+
+class FakeTreeview:
+    """``Treeview`` en memoria que cuenta las operaciones aplicadas."""
+
+    def __init__(self):
+        self.order = []
+        self.items = {}
+        self.selected = ()
+        self.scroll = 0.0
+        self.calls = {"insert": 0, "delete": 0, "item": 0, "move": 0}
+
+    def get_children(self, _item=""):
+        return tuple(self.order)
+
+    def insert(self, _parent, index, iid=None, values=(), tags=()):
+        self.calls["insert"] += 1
+        position = len(self.order) if index == "end" else int(index)
+        self.order.insert(position, iid)
+        self.items[iid] = {"values": tuple(values), "tags": tuple(tags)}
+        return iid
+
+    def delete(self, *items):
+        self.calls["delete"] += len(items)
+        for iid in items:
+            self.order.remove(iid)
+            self.items.pop(iid, None)
+        self.selected = tuple(iid for iid in self.selected if iid in self.items)
+
+    def item(self, iid, option=None, **kwargs):
+        self.calls["item"] += 1
+        if option is not None:
+            return self.items[iid][option]
+        self.items[iid].update({key: tuple(value) for key, value in kwargs.items()})
+        return None
+
+    def move(self, iid, _parent, index):
+        self.calls["move"] += 1
+        self.order.remove(iid)
+        self.order.insert(index, iid)
+
+    def selection(self):
+        return self.selected
+
+    def yview(self):
+        return (self.scroll, 1.0)
+
+    def yview_moveto(self, fraction):
+        self.scroll = fraction
+
+
+def _rows(count, *, changed=None):
+    rows = [(f"C{idx:05d}", f"Nombre {idx}", "DNI") for idx in range(count)]
+    if changed is not None:
+        rows[changed] = (rows[changed][0], "Editado", "DNI")
+    return rows
+
+
+def _values(tree):
+    return [tree.items[iid]["values"] for iid in tree.order]
+
+
+def test_build_unique_keys_suffixes_duplicates_and_empty_keys():
+    keys, duplicates = build_unique_keys(["A", "A", "", "", "B"], fallback="cliente")
+
+    assert keys == ["A", "A-1", "cliente", "cliente-1", "B"]
+    assert duplicates == ["A", "cliente"]
+
+
+def test_render_only_touches_changed_inserted_and_removed_rows():
+    tree = FakeTreeview()
+    renderer = KeyedTreeRenderer(tree)
+    renderer.render(_rows(4))
+    tree.calls = dict.fromkeys(tree.calls, 0)
+
+    rows = _rows(4, changed=1)
+    del rows[2]
+    rows.append(("C99999", "Nuevo", "RUC"))
+    stats = renderer.render(rows)
+
+    assert _values(tree) == rows
+    assert (stats.inserted, stats.removed) == (1, 1)
+    assert tree.calls["insert"] == 1
+    assert tree.calls["delete"] == 1
+    # Se actualiza la fila editada y la que cambió de franja tras el borrado.
+    assert tree.calls["item"] == stats.updated == 2
+    assert [tree.items[iid]["tags"][-1] for iid in tree.order] == ["even", "odd", "even", "odd"]
+
+
+def test_render_preserves_selection_and_scroll_position():
+    tree = FakeTreeview()
+    renderer = KeyedTreeRenderer(tree)
+    renderer.render(_rows(10))
+    tree.selected = ("C00005",)
+    tree.scroll = 0.4
+
+    renderer.render([("C00000", "Nuevo", "DNI")] + _rows(10)[1:] + [("C00010", "x", "DNI")])
+
+    assert tree.selection() == ("C00005",)
+    assert tree.scroll == 0.4
+
+
+def test_render_restores_order_after_external_sort():
+    tree = FakeTreeview()
+    renderer = KeyedTreeRenderer(tree)
+    renderer.render(_rows(5))
+    tree.order.reverse()
+
+    stats = renderer.render(_rows(5))
+
+    assert tree.order == [row[0] for row in _rows(5)]
+    assert stats.moved > 0
+    assert stats.inserted == 0
+
+
+def test_render_falls_back_to_rebuild_for_minimal_trees():
+    class MinimalTree:
+        def __init__(self):
+            self.rows = [("viejo",)]
+
+        def get_children(self):
+            return list(range(len(self.rows)))
+
+        def delete(self, *_items):
+            self.rows.clear()
+
+        def insert(self, _parent, _index, values=None, **_kwargs):
+            self.rows.append(values)
+
+    tree = MinimalTree()
+    stats = KeyedTreeRenderer(tree).render(_rows(2))
+
+    assert stats.rebuilt
+    assert tree.rows == _rows(2)
+
+
+def test_schedule_coalesces_requests_into_one_idle_render():
+    tree = FakeTreeview()
+    idle_jobs = []
+    tree.after_idle = lambda callback: idle_jobs.append(callback) or f"after#{len(idle_jobs)}"
+    tree.after_cancel = lambda _job: None
+    renderer = get_tree_renderer(tree)
+    applied = []
+    factory_calls = []
+
+    def factory(count):
+        def build():
+            factory_calls.append(count)
+            return _rows(count)
+
+        return build
+
+    renderer.schedule(factory(1), applied.append)
+    assert len(tree.order) == 1  # El primer pintado es inmediato.
+    for count in (2, 3, 4):
+        renderer.schedule(factory(count), applied.append)
+
+    assert len(idle_jobs) == 1
+    assert len(tree.order) == 1
+    idle_jobs[0]()
+
+    assert factory_calls == [1, 4]
+    assert len(tree.order) == 4
+    assert len(applied) == 4
+    assert get_tree_renderer(tree) is renderer
+
+
+def test_microbenchmark_diff_beats_full_rebuild_on_5k_rows():
+    rows = _rows(5000)
+    edited = _rows(5000, changed=2500)
+
+    rebuild_tree = FakeTreeview()
+    start = time.perf_counter()
+    for payload in (rows, edited):
+        rebuild_tree.delete(*rebuild_tree.get_children())
+        for idx, row in enumerate(payload):
+            rebuild_tree.insert("", "end", iid=row[0], values=row, tags=("even" if idx % 2 == 0 else "odd",))
+    rebuild_seconds = time.perf_counter() - start
+    rebuild_ops = sum(rebuild_tree.calls.values())
+
+    diff_tree = FakeTreeview()
+    renderer = KeyedTreeRenderer(diff_tree)
+    renderer.render(rows)
+    diff_tree.calls = dict.fromkeys(diff_tree.calls, 0)
+    start = time.perf_counter()
+    stats = renderer.render(edited)
+    diff_seconds = time.perf_counter() - start
+
+    print(
+        f"\n5k filas: reconstrucción {rebuild_seconds * 1000:.1f} ms / {rebuild_ops} ops; "
+        f"diff {diff_seconds * 1000:.1f} ms / {sum(diff_tree.calls.values())} ops"
+    )
+    assert stats.updated == 1
+    assert sum(diff_tree.calls.values()) == 1
+    assert rebuild_ops >= 15000
+
+
+@pytest.mark.skipif(
+    os.name != "nt" and not os.environ.get("DISPLAY"),
+    reason="Tkinter no disponible en el entorno de pruebas",
+)
+def test_microbenchmark_real_treeview_diff_vs_rebuild():
+    try:
+        root = tk.Tk()
+        root.withdraw()
+    except tk.TclError:
+        pytest.skip("Tkinter no disponible en el entorno de pruebas")
+    try:
+        columns = ("id", "nombre", "tipo")
+        rows = _rows(5000)
+        edited = _rows(5000, changed=2500)
+
+        rebuild_tree = ttk.Treeview(root, columns=columns, show="headings")
+        for payload in (rows, edited):
+            rebuild_tree.delete(*rebuild_tree.get_children())
+            start = time.perf_counter()
+            for row in payload:
+                rebuild_tree.insert("", "end", values=row)
+            rebuild_seconds = time.perf_counter() - start
+
+        diff_tree = ttk.Treeview(root, columns=columns, show="headings")
+        renderer = KeyedTreeRenderer(diff_tree)
+        renderer.render(rows)
+        start = time.perf_counter()
+        renderer.render(edited)
+        diff_seconds = time.perf_counter() - start
+
+        assert diff_tree.item("C02500", "values")[1] == "Editado"
+        assert diff_seconds < rebuild_seconds
+    finally:
+        root.destroy()
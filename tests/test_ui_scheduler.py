@@ -0,0 +1,317 @@
+"""Pruebas del planificador central de trabajos diferidos."""
+
+import pytest
+
+import validators
+from utils import ui_scheduler
+from utils.perf_profiler import PerfProfiler
+from utils.ui_scheduler import (PRIORITY_LAYOUT, PRIORITY_PERSISTENCE,
+                                PRIORITY_SUMMARY, PRIORITY_VALIDATION,
+                                CoalescingScheduler, get_ui_scheduler,
+                                install_ui_scheduler)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, ms):
+        self.now += ms / 1000.0
+
+
+class FakeRoot:
+    """Raíz mínima con ``after``/``after_idle`` manuales."""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.jobs = {}
+        self._next_id = 0
+        self.scheduled = 0
+
+    def _register(self, delay_ms, callback):
+        self._next_id += 1
+        job_id = f"after#{self._next_id}"
+        self.jobs[job_id] = (self.clock.now + delay_ms / 1000.0, callback)
+        self.scheduled += 1
+        return job_id
+
+    def after(self, delay_ms, callback):
+        return self._register(delay_ms, callback)
+
+    def after_idle(self, callback):
+        return self._register(0, callback)
+
+    def after_cancel(self, job_id):
+        self.jobs.pop(job_id, None)
+
+    def run_due(self):
+        due = sorted(
+            (item for item in self.jobs.items() if item[1][0] <= self.clock.now),
+            key=lambda item: item[1][0],
+        )
+        for job_id, (_when, callback) in due:
+            if self.jobs.pop(job_id, None) is not None:
+                callback()
+
+    def _root(self):
+        return self
+
+
+def _build(budget_ms=8.0):
+    clock = FakeClock()
+    root = FakeRoot(clock)
+    scheduler = CoalescingScheduler(root, frame_budget_ms=budget_ms, clock=clock)
+    return clock, root, scheduler
+
+
+def test_repeated_keys_coalesce_into_single_execution():
+    clock, root, scheduler = _build()
+    calls = []
+
+    for value in range(50):
+        scheduler.schedule("resumen", lambda value=value: calls.append(value))
+    clock.advance(1)
+    root.run_due()
+
+    assert calls == [49]
+    assert scheduler.stats["enqueued"] == 50
+    assert scheduler.stats["coalesced"] == 49
+    assert scheduler.stats["executed"] == 1
+    assert len(root.jobs) == 0
+
+
+def test_tick_drains_jobs_by_priority_class():
+    clock, root, scheduler = _build()
+    order = []
+
+    scheduler.schedule("autosave", lambda: order.append("autosave"), priority=PRIORITY_PERSISTENCE)
+    scheduler.schedule("titulo", lambda: order.append("titulo"), priority=PRIORITY_LAYOUT)
+    scheduler.schedule("resumen", lambda: order.append("resumen"), priority=PRIORITY_SUMMARY)
+    scheduler.schedule("validacion", lambda: order.append("validacion"), priority=PRIORITY_VALIDATION)
+    root.run_due()
+
+    assert order == ["validacion", "resumen", "titulo", "autosave"]
+    assert scheduler.stats["ticks"] == 1
+
+
+def test_debounce_restarts_delay_while_throttle_keeps_first_deadline():
+    clock, root, scheduler = _build()
+    calls = []
+
+    scheduler.schedule("debounce", lambda: calls.append("debounce"), delay_ms=120)
+    scheduler.schedule("throttle", lambda: calls.append("throttle"), delay_ms=120, debounce=False)
+    clock.advance(100)
+    scheduler.schedule("debounce", lambda: calls.append("debounce"), delay_ms=120)
+    scheduler.schedule("throttle", lambda: calls.append("throttle"), delay_ms=120, debounce=False)
+    clock.advance(30)
+    root.run_due()
+
+    assert calls == ["throttle"]
+    clock.advance(100)
+    root.run_due()
+    assert calls == ["throttle", "debounce"]
+
+
+def test_validator_bursts_arm_one_timer_and_keep_the_deadline_index_bounded():
+    clock, root, scheduler = _build(budget_ms=0)
+    calls = []
+
+    for widget_id in range(300):
+        scheduler.schedule(("validacion", widget_id), lambda: calls.append(1), delay_ms=50)
+    for _ in range(500):
+        clock.advance(0.01)
+        scheduler.schedule(("validacion", 0), lambda: calls.append(0), delay_ms=50)
+
+    assert root.scheduled == 1
+    assert len(scheduler._due_heap) <= 2 * scheduler.pending_count() + 65
+    clock.advance(46)
+    root.run_due()
+    assert len(calls) == 299
+    clock.advance(10)
+    root.run_due()
+    assert calls[-1] == 0 and scheduler.pending_count() == 0
+
+
+def test_frame_budget_defers_remaining_jobs_to_next_tick():
+    clock, root, scheduler = _build(budget_ms=5)
+    calls = []
+
+    def slow(name):
+        def run():
+            calls.append(name)
+            clock.advance(3)
+
+        return run
+
+    for name in ("a", "b", "c", "d"):
+        scheduler.schedule(name, slow(name))
+    root.run_due()
+
+    assert calls == ["a", "b"]
+    assert scheduler.stats["deferred"] == 2
+    root.run_due()
+    assert calls == ["a", "b", "c", "d"]
+    assert scheduler.pending_count() == 0
+
+
+def test_jobs_scheduled_during_drain_run_in_following_tick():
+    clock, root, scheduler = _build()
+    calls = []
+
+    def chain():
+        calls.append("validacion")
+        scheduler.schedule("resumen", lambda: calls.append("resumen"))
+
+    scheduler.schedule("validacion", chain, priority=PRIORITY_VALIDATION)
+    root.run_due()
+    assert calls == ["validacion"]
+    root.run_due()
+    assert calls == ["validacion", "resumen"]
+
+
+def test_cancel_and_failures_are_counted():
+    clock, root, scheduler = _build()
+    calls = []
+
+    def boom():
+        raise RuntimeError("fallo")
+
+    scheduler.schedule("cancelado", lambda: calls.append("cancelado"))
+    scheduler.schedule("error", boom)
+    scheduler.schedule("ok", lambda: calls.append("ok"))
+    assert scheduler.cancel("cancelado")
+    assert not scheduler.cancel("cancelado")
+    root.run_due()
+
+    assert calls == ["ok"]
+    assert scheduler.stats["cancelled"] == 1
+    assert scheduler.stats["errors"] == 1
+    assert scheduler.stats["executed"] == 2
+
+
+def test_profiler_spans_group_tuple_keys_by_job_kind(monkeypatch):
+    profiler = PerfProfiler(enabled=True)
+    monkeypatch.setattr(ui_scheduler, "get_profiler", lambda: profiler)
+    _clock, _root, scheduler = _build()
+    for widget_id in range(5):
+        scheduler.schedule(("validacion", widget_id), lambda: None)
+    scheduler.schedule("resumen", lambda: None)
+
+    scheduler.flush()
+
+    stats = profiler.stats()["ui_scheduler"]
+    assert set(stats) == {"validacion", "resumen"}
+    assert stats["validacion"]["count"] == 5
+
+
+def test_span_name_is_built_only_when_sampled():
+    built = []
+    profiler = PerfProfiler(enabled=False)
+
+    with profiler.callback_span(lambda: built.append(True) or "nombre", "ui_scheduler"):
+        pass
+
+    assert built == []
+
+
+def test_widgets_without_event_loop_run_jobs_inline():
+    scheduler = CoalescingScheduler(object())
+    calls = []
+
+    scheduler.schedule("inline", lambda: calls.append("inline"), delay_ms=100)
+
+    assert calls == ["inline"]
+    assert scheduler.pending_count() == 0
+
+
+def test_install_is_idempotent_and_resolves_from_child_widgets():
+    root = FakeRoot(FakeClock())
+    scheduler = install_ui_scheduler(root)
+
+    class Child:
+        def _root(self):
+            return root
+
+    assert install_ui_scheduler(root) is scheduler
+    assert get_ui_scheduler(Child()) is scheduler
+    assert get_ui_scheduler(object()) is None
+
+
+class ValidatedWidget:
+    def __init__(self, root):
+        self.root = root
+
+    def bind(self, *_args, **_kwargs):
+        return None
+
+    def _root(self):
+        return self.root
+
+
+class TraceVar:
+    def __init__(self, value=""):
+        self.value = value
+        self.callbacks = []
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+        for callback in self.callbacks:
+            callback("PY_VAR0", "", "write")
+
+    def trace_add(self, _mode, callback):
+        self.callbacks.append(callback)
+        return f"trace{len(self.callbacks)}"
+
+
+class DummyTooltip:
+    def __init__(self, widget):
+        self.widget = widget
+
+    def show(self, _text):
+        return None
+
+    def hide(self):
+        return None
+
+
+@pytest.fixture
+def quiet_validators(monkeypatch):
+    monkeypatch.setattr(validators, "ValidationTooltip", DummyTooltip)
+    validators.FieldValidator.set_status_consumer(None)
+    yield
+    validators.FieldValidator.set_status_consumer(None)
+
+
+def test_field_validators_share_one_tick_for_trace_bursts(quiet_validators):
+    clock = FakeClock()
+    root = FakeRoot(clock)
+    scheduler = install_ui_scheduler(root, clock=clock)
+    validations = []
+    variables = []
+    for index in range(20):
+        var = TraceVar()
+        variables.append(var)
+        validators.FieldValidator(
+            ValidatedWidget(root),
+            lambda index=index: validations.append(index),
+            [],
+            f"campo_{index}",
+            variables=[var],
+        )
+
+    for keystroke in range(10):
+        for var in variables:
+            var.set("x" * (keystroke + 1))
+    clock.advance(120)
+    root.run_due()
+
+    assert sorted(validations) == list(range(20))
+    assert scheduler.stats["enqueued"] == 200
+    assert scheduler.stats["executed"] == 20
+    assert root.scheduled <= 2
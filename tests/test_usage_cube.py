@@ -0,0 +1,144 @@
+import io
+import json
+
+import pytest
+
+from analytics.usage_cube import (UsageCube, compact_usage_log, drill_down,
+                                  main, usage_cube_path)
+from analytics.usage_visualizer import (DEFAULT_SCREEN_DIMENSIONS,
+                                        DEFAULT_SCREEN_HINTS, UsageAggregator,
+                                        iter_log_rows)
+
+HEADER = "timestamp,tipo,subtipo,widget_id,coords,mensaje,old_value,new_value,action_result\n"
+ROWS = (
+    "2024-01-01 10:00:00,navegacion,click,tab_clientes,100,200,Abrio pestaña Clientes,,,\n",
+    "2024-01-01 10:02:00,validacion,error,entry_cliente,150,250,Error cliente duplicado,prev,now,error\n",
+    "2024-01-01 10:10:00,navegacion,click,tab_productos,300,120,Abrio pestaña Productos,,,\n",
+    "2024-01-02 09:00:00,navegacion,click,btn_resumen,220,180,Visita pestaña Resumen,,,\n",
+    "2024-01-02 09:05:00,validacion,warning,btn_guardar,,Advertencia de guardado,,,warning\n",
+    "2024-01-03 11:00:00,navegacion,click,tab_clientes,80,90,Volvió a Clientes,,,\n",
+)
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    path = tmp_path / "analista" / "logs.csv"
+    path.parent.mkdir()
+    path.write_text(HEADER + "".join(ROWS[:3]), encoding="utf-8")
+    return path
+
+
+def _append(path, rows):
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write("".join(rows))
+
+
+def test_incremental_compaction_matches_full_scan(log_file):
+    assert compact_usage_log(log_file) == 3
+    _append(log_file, ROWS[3:])
+    assert compact_usage_log(log_file, chunk_bytes=64) == 3
+    assert compact_usage_log(log_file) == 0
+
+    expected = UsageAggregator(DEFAULT_SCREEN_HINTS, DEFAULT_SCREEN_DIMENSIONS)
+    expected.add_rows(iter_log_rows(log_file))
+    expected = expected.result()
+    with UsageCube(usage_cube_path(log_file)) as cube:
+        aggregate = cube.query()
+        assert cube.users() == ["analista"]
+
+    assert aggregate.total_events == expected.total_events
+    assert aggregate.screen_counts == expected.screen_counts
+    assert aggregate.widget_counts == expected.widget_counts
+    assert aggregate.validation_events == expected.validation_events
+    assert aggregate.time_spent_seconds == pytest.approx(expected.time_spent_seconds)
+    assert {item.screen: item.grid for item in aggregate.heatmaps} == {
+        item.screen: item.grid for item in expected.heatmaps
+    }
+
+
+@pytest.mark.parametrize("chunk_bytes", [1, 17, 40, 64, 97, 150, 4096])
+def test_compaction_cuts_only_at_csv_record_boundaries(tmp_path, chunk_bytes):
+    path = tmp_path / "analista" / "logs.csv"
+    path.parent.mkdir()
+    rows = [
+        f'2024-01-01 10:{minute:02d}:00,validacion,error,entry_{minute},,Valor,"antes\ncon, coma","linea 1\nlinea ""2""\nlinea 3",error\n'
+        for minute in range(20)
+    ]
+    # Fila a medio escribir con el salto de línea dentro de las comillas.
+    path.write_text(HEADER + "".join(rows) + '2024-01-01 11:00:00,validacion,error,x,,Valor,"a\n', encoding="utf-8")
+
+    assert compact_usage_log(path, chunk_bytes=chunk_bytes) == 20
+    with UsageCube(usage_cube_path(path)) as cube:
+        assert cube.query().total_events == 20
+
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write('b",,error\n')
+    assert compact_usage_log(path, chunk_bytes=chunk_bytes) == 1
+    with UsageCube(usage_cube_path(path)) as cube:
+        assert cube.query().total_events == 21
+
+
+def test_date_range_queries_only_sum_selected_days(log_file):
+    _append(log_file, ROWS[3:])
+    compact_usage_log(log_file)
+
+    with UsageCube(usage_cube_path(log_file)) as cube:
+        assert cube.days() == ["2024-01-01", "2024-01-02", "2024-01-03"]
+        first_day = cube.query("2024-01-01", "2024-01-01")
+        later = cube.query("2024-01-02")
+
+    assert first_day.total_events == 3
+    assert first_day.screen_counts["clientes"] == 2
+    assert later.total_events == 3
+    assert later.screen_counts["clientes"] == 1
+
+
+def test_truncated_log_is_read_again(log_file):
+    compact_usage_log(log_file)
+    log_file.write_text(HEADER + ROWS[5], encoding="utf-8")
+
+    assert compact_usage_log(log_file) == 1
+
+
+def test_rotated_log_larger_than_offset_is_read_again(log_file):
+    compact_usage_log(log_file)
+    log_file.write_text(HEADER + "".join(ROWS[3:]) + "".join(ROWS[:3]), encoding="utf-8")
+
+    assert compact_usage_log(log_file) == 6
+    assert compact_usage_log(log_file) == 0
+
+
+def test_local_cube_dir_keeps_one_cube_per_log(tmp_path, log_file):
+    other = tmp_path / "otro" / "logs.csv"
+    other.parent.mkdir()
+    other.write_text(HEADER + ROWS[5], encoding="utf-8")
+    cube_dir = tmp_path / "cubos"
+
+    assert compact_usage_log(log_file, cube_dir=cube_dir) == 3
+    assert compact_usage_log(other, cube_dir=cube_dir) == 1
+
+    assert not usage_cube_path(log_file).exists()
+    assert usage_cube_path(log_file, cube_dir) != usage_cube_path(other, cube_dir)
+    assert usage_cube_path(log_file, cube_dir).name.startswith("analista-")
+    with UsageCube(usage_cube_path(other, cube_dir)) as cube:
+        assert cube.query().total_events == 1
+
+
+def test_drill_down_rereads_only_matching_rows(log_file):
+    rows = list(drill_down([log_file], day="2024-01-01", user="analista", screen="clientes"))
+
+    assert [row["widget_id"] for row in rows] == ["tab_clientes", "entry_cliente"]
+    assert not list(drill_down([log_file], user="otro"))
+
+
+def test_cli_reports_range_as_json(log_file):
+    _append(log_file, ROWS[3:])
+    stream = io.StringIO()
+
+    assert main(["compact", str(log_file)], stream) == 0
+    stream = io.StringIO()
+    assert main(["report", str(log_file), "--desde", "2024-01-02"], stream) == 0
+
+    summary = json.loads(stream.getvalue())
+    assert summary["events"] == 3
+    assert summary["screens"]["resumen"] == 1
@@ -1,10 +1,18 @@
+import io
+import json
+import os
+
 import pytest
 
+from analytics import dashboard
 from analytics.usage_visualizer import (
     DEFAULT_SCREEN_DIMENSIONS,
     DEFAULT_SCREEN_HINTS,
     AnalyticsReport,
+    UsageAggregator,
     _accumulate_time_by_screen,
+    _ScreenTimer,
+    _TimelineRuns,
     infer_screen,
     visualize_usage,
 )
@@ -73,3 +81,135 @@ def test_time_accumulation_counts_last_screen_without_switch():
     time_spent = _accumulate_time_by_screen(rows, DEFAULT_SCREEN_HINTS)
 
     assert time_spent["clientes"] == pytest.approx(5 * 60)
+
+
+def test_time_accumulation_merges_out_of_order_segments():
+    rows = [
+        {"timestamp": "2024-01-01 10:10:00", "widget_id": "tab_productos", "mensaje": ""},
+        {"timestamp": "2024-01-01 10:20:00", "widget_id": "tab_clientes", "mensaje": ""},
+        {"timestamp": "2024-01-01 10:00:00", "widget_id": "tab_clientes", "mensaje": ""},
+        {"timestamp": "sin fecha", "widget_id": "tab_riesgos", "mensaje": ""},
+        {"timestamp": "2024-01-01 10:05:00", "widget_id": "tab_clientes", "mensaje": ""},
+    ]
+
+    time_spent = _accumulate_time_by_screen(iter(rows), DEFAULT_SCREEN_HINTS)
+
+    assert time_spent == {"clientes": 600.0, "productos": 600.0}
+
+
+def _sorted_time_by_screen(events):
+    timer = _ScreenTimer()
+    for ts, screen in sorted(events, key=lambda event: event[0]):
+        timer.add(ts, screen)
+    return timer.result()
+
+
+def test_timeline_keeps_monotonic_rows_in_one_run():
+    timeline = _TimelineRuns()
+    for minute, screen in ((10, "productos"), (20, "clientes"), (25, "clientes")):
+        timeline.add(minute * 60.0, screen)
+
+    assert len(timeline.runs) == 1
+    assert timeline.time_by_screen() == {"productos": 600.0, "clientes": 300.0}
+
+
+def test_timeline_merges_interleaved_runs_like_a_full_sort():
+    # Dos sesiones del log compartido escritas por tramos que se solapan.
+    events = [
+        (0, "clientes"), (5, "productos"), (10, "clientes"), (15, "productos"), (20, "clientes"),
+        (2, "riesgos"), (7, "normas"), (12, "riesgos"), (17, "normas"), (22, "riesgos"),
+        (1, "clientes"), (30, "normas"),
+    ]
+    events = [(minute * 60.0, screen) for minute, screen in events]
+    timeline = _TimelineRuns()
+    for ts, screen in events:
+        timeline.add(ts, screen)
+
+    assert len(timeline.runs) == 3
+    assert timeline.time_by_screen() == _sorted_time_by_screen(events)
+    assert set(timeline.time_by_screen()) == {"clientes", "productos", "riesgos", "normas"}
+
+
+def test_aggregator_streams_rows_and_keeps_a_bounded_sample():
+    rows = (
+        {
+            "timestamp": f"2024-01-01 10:{index // 60:02d}:{index % 60:02d}",
+            "widget_id": "tab_clientes" if index % 2 else "btn_resumen",
+            "mensaje": "",
+            "coords": f"{index % 400},{index % 300}",
+            "tipo": "validacion" if index % 10 == 0 else "navegacion",
+        }
+        for index in range(500)
+    )
+
+    aggregate = UsageAggregator(DEFAULT_SCREEN_HINTS, (400, 300), coord_sample_size=50).add_rows(rows).result()
+
+    assert aggregate.total_events == 500
+    assert aggregate.validation_share == pytest.approx(0.1)
+    assert aggregate.screen_counts == {"clientes": 250, "resumen": 250}
+    heatmaps = {heatmap.screen: heatmap for heatmap in aggregate.heatmaps}
+    assert heatmaps["clientes"].count == 250 and len(heatmaps["clientes"].coords) == 50
+    assert sum(map(sum, heatmaps["clientes"].grid)) == 250
+    assert sum(aggregate.time_spent_seconds.values()) == pytest.approx(499)
+
+
+def test_aggregator_weights_compact_summaries_and_skips_detailed_ones():
+    rows = [
+        {"timestamp": "2024-01-01 10:00:00", "subtipo": "click", "widget_id": "tab_clientes", "coords": "120,80"},
+        {"timestamp": "2024-01-01 10:05:00", "subtipo": "click", "widget_id": "tab_productos", "coords": "10,10"},
+        # Modo detallado: resumen sin conteo de eventos ya registrados arriba.
+        {"timestamp": "2024-01-01 10:30:00", "subtipo": "click_heatmap", "widget_id": "heatmap", "coords": "150.0,50.0"},
+        # Modo compacto: centro de la zona y conteo en ``new_value``.
+        {"timestamp": "2024-01-01 11:00:00", "subtipo": "click_heatmap", "widget_id": "tab_clientes",
+         "coords": "150.0,50.0", "new_value": "7"},
+        {"timestamp": "2024-01-01 11:00:00", "subtipo": "navigation_summary", "widget_id": "telemetria"},
+    ]
+
+    aggregate = UsageAggregator(DEFAULT_SCREEN_HINTS, (400, 300)).add_rows(rows).result()
+
+    assert aggregate.total_events == 9
+    assert aggregate.screen_counts == {"clientes": 8, "productos": 1}
+    heatmaps = {heatmap.screen: heatmap for heatmap in aggregate.heatmaps}
+    assert heatmaps["clientes"].count == 8
+    assert sum(map(sum, heatmaps["clientes"].grid)) == 8
+    assert aggregate.time_spent_seconds == {"clientes": 300.0, "productos": 0.0}
+
+
+def test_dashboard_groups_rotated_files_by_user(tmp_path, sample_log_file):
+    ana = tmp_path / "ana"
+    ana.mkdir()
+    (ana / "logs.csv").write_text(sample_log_file.read_text(encoding="utf-8"), encoding="utf-8")
+    (ana / "logs.csv.1").write_text(sample_log_file.read_text(encoding="utf-8"), encoding="utf-8")
+    luis = tmp_path / "luis.csv"
+    luis.write_text(
+        "timestamp,tipo,subtipo,widget_id,coords,mensaje,old_value,new_value,action_result,usuario\n"
+        "2024-01-02 09:00:00,navegacion,click,tab_riesgos,,Riesgos,,,,lrojas\n"
+        "2024-01-02 09:03:00,navegacion,click,tab_normas,,Normas,,,,lrojas\n",
+        encoding="utf-8",
+    )
+    json_path = tmp_path / "tablero.json"
+    stream = io.StringIO()
+
+    assert dashboard.main([str(ana / "logs.csv"), str(ana / "logs.csv.1"), str(luis), "--json", str(json_path)], stream) == 0
+
+    summary = json.loads(json_path.read_text(encoding="utf-8"))
+    assert set(summary["users"]) == {"ana", "lrojas"}
+    assert summary["users"]["ana"]["events"] == 12
+    assert summary["users"]["lrojas"]["time_by_screen_seconds"] == {"riesgos": 180.0, "normas": 0.0}
+    assert summary["total"]["events"] == 14
+    assert "Archivos: 3 · usuarios: 2" in stream.getvalue()
+    assert dashboard.source_label("x/logs.csv.2024-01-01") == "x"
+
+
+def test_dashboard_folders_only_expand_log_files(tmp_path, sample_log_file):
+    folder = tmp_path / "ana"
+    folder.mkdir()
+    for name in ("logs.csv.1", "logs.csv", "bitacora.csv", "casos.csv", "h_clientes.csv", "logs.csv.bak"):
+        (folder / name).write_text(sample_log_file.read_text(encoding="utf-8"), encoding="utf-8")
+    os_times = {"logs.csv.1": 100, "bitacora.csv": 200, "logs.csv": 300}
+    for name, mtime in os_times.items():
+        os.utime(folder / name, (mtime, mtime))
+
+    assert [path.name for path in dashboard._expand([str(folder)])] == ["logs.csv.1", "bitacora.csv", "logs.csv"]
+    assert dashboard.is_log_file("x/logs.csv.2024-01-01")
+    assert not dashboard.is_log_file("x/productos.csv")
@@ -2655,6 +2655,54 @@ def test_transform_summary_involucramientos_rejects_invalid_amount():
     assert "dos decimales" in str(excinfo.value)
 
 
+def test_transform_summary_involucramientos_uses_type_snapshot_off_tk_thread():
+    app = FraudCaseApp.__new__(FraudCaseApp)
+
+    class _Var:
+        def __init__(self, value):
+            self.value = value
+
+        def get(self):
+            if self.value is None:
+                raise AssertionError("el trabajador no debe leer variables de Tk")
+            return self.value
+
+    product_var = _Var("Crédito personal")
+    client_var = _Var("DNI")
+    app._product_frames_by_id = {"PRD-001": SimpleNamespace(tipo_prod_var=product_var)}
+    app._client_frames_by_id = {"12345678": SimpleNamespace(tipo_id_var=client_var)}
+    snapshot = app._snapshot_involvement_types()
+    product_var.value = client_var.value = None
+
+    assert snapshot == {"productos": {"PRD-001": "Crédito personal"}, "clientes": {"12345678": "DNI"}}
+    assert app._resolve_product_type_for_involvement("prd-001", snapshot) == "Crédito personal"
+    assert app._resolve_client_type_for_involvement("12345678", snapshot) == "DNI"
+    sanitized = app._transform_summary_clipboard_rows(
+        "involucramientos",
+        [["PRD-002", "cliente", "", "12345678", "10"]],
+        type_snapshot=snapshot,
+    )
+    assert sanitized == [("PRD-002", "cliente", "", "12345678", "10.00")]
+
+
+def test_transform_summary_uses_case_snapshot_off_tk_thread():
+    app = FraudCaseApp.__new__(FraudCaseApp)
+
+    class _Var:
+        def get(self):
+            raise AssertionError("el trabajador no debe leer variables de Tk")
+
+    app.id_caso_var = _Var()
+
+    sanitized = app._transform_summary_clipboard_rows(
+        "reclamos",
+        [["C12345678", "", "PRD-001", "Analítica contable", "4300000001"]],
+        case_id="2024-0001",
+    )
+
+    assert sanitized == [("C12345678", "2024-0001", "PRD-001", "Analítica contable", "4300000001")]
+
+
 def test_populate_from_data_restores_rich_text_tags():
     app = build_headless_app("Crédito personal")
     app._rich_text_images = defaultdict(list)
@@ -0,0 +1,205 @@
+"""Bookkeeping de altas y bajas de ValidationBadge sin recorridos globales."""
+
+import gc
+import time
+import weakref
+from types import SimpleNamespace
+
+import validation_badge.validation_badge as badge_module
+from validation_badge import (ValidationBadgeRegistry, destroy_badge_subtrees,
+                              iter_active_badges)
+
+
+class PathWidget:
+    """Widget mínimo con ruta Tk, hijos y eventos ``<Destroy>``."""
+
+    def __init__(self, parent=None, name="w"):
+        self.parent = parent
+        self.children = []
+        self._destroy_handlers = []
+        self.alive = True
+        self.destroy_calls = 0
+        if parent is None:
+            self._w = f".{name}"
+        else:
+            self._w = f"{parent._w}.{name}{len(parent.children)}"
+            parent.children.append(self)
+
+    def bind(self, sequence, callback, add=None):  # noqa: ARG002
+        if sequence == "<Destroy>":
+            self._destroy_handlers.append(callback)
+
+    def destroy(self):
+        self.destroy_calls += 1
+        for child in list(self.children):
+            child.destroy()
+        if self.alive:
+            self.alive = False
+            for handler in self._destroy_handlers:
+                handler(None)
+
+    def winfo_exists(self):
+        return self.alive
+
+    def winfo_manager(self):
+        return "grid"
+
+    def grid(self, *_args, **_kwargs):
+        return None
+
+    def grid_info(self):
+        return {}
+
+    def configure(self, **_kwargs):
+        return None
+
+
+class PathTtk:
+    class Label(PathWidget):
+        def __init__(self, parent, **_kwargs):
+            super().__init__(parent, name="label")
+
+    class Style:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def lookup(self, *_args, **_kwargs):
+            return ""
+
+        def configure(self, *_args, **_kwargs):
+            return None
+
+
+class PathTk:
+    @staticmethod
+    def StringVar():
+        return SimpleNamespace(get=lambda: "", set=lambda _value: None)
+
+
+def _registry():
+    return ValidationBadgeRegistry(tk_module=PathTk(), ttk_module=PathTtk)
+
+
+def _build_product(registry, root, index, *, claims=2):
+    frame = PathWidget(root, name="producto")
+    for key in ("producto_id", "producto_cliente", "producto_canal"):
+        registry.claim(key, frame, row=0, column=4)
+    for claim in range(claims):
+        registry.claim(f"product{index}_claim{claim}_id", frame, row=1, column=0)
+    return frame
+
+
+def test_back_references_release_only_owned_keys():
+    registry = _registry()
+    root = PathWidget(name="root")
+    first = _build_product(registry, root, 0)
+    second = _build_product(registry, root, 1)
+
+    first.destroy()
+
+    # Las claves compartidas pertenecen al último producto; solo se liberan
+    # las claves propias del primero.
+    assert "producto_id" in registry._registry
+    assert "product0_claim0_id" not in registry._registry
+    assert "product1_claim0_id" in registry._registry
+    second.destroy()
+    assert registry._registry == {}
+    assert registry._labels == {}
+
+
+def test_unregister_does_not_scan_other_registries(monkeypatch):
+    registry = _registry()
+    root = PathWidget(name="root")
+    frame = _build_product(registry, root, 0)
+    others = [_registry() for _ in range(20)]
+
+    def fail(_self, _badge):
+        raise AssertionError("no debería recorrer registros ajenos")
+
+    monkeypatch.setattr(ValidationBadgeRegistry, "_purge_badge", fail)
+    frame.destroy()
+
+    assert registry._registry == {}
+    assert all(not other._registry for other in others)
+
+
+def test_destroy_subtrees_releases_badges_once_and_destroys_frames():
+    registry = _registry()
+    root = PathWidget(name="root")
+    frames = [_build_product(registry, root, index) for index in range(5)]
+    before = sum(1 for _badge in iter_active_badges())
+
+    released = destroy_badge_subtrees(frames)
+
+    assert released == 5 * 5
+    assert all(frame.destroy_calls == 1 and not frame.alive for frame in frames)
+    assert registry._registry == {}
+    assert sum(1 for _badge in iter_active_badges()) == before - released
+
+
+def test_destroying_one_container_only_touches_its_badges(monkeypatch):
+    registry = _registry()
+    root = PathWidget(name="root")
+    frames = [_build_product(registry, root, index) for index in range(5)]
+    unregistered = []
+    original = badge_module._unregister_badge
+    monkeypatch.setattr(
+        badge_module, "_unregister_badge", lambda badge: unregistered.append(badge) or original(badge)
+    )
+
+    released = destroy_badge_subtrees(frames[:1])
+
+    assert released == len(unregistered) == 5
+    assert not any(path.startswith(frames[0]._w) for path in badge_module._BADGES_BY_CONTAINER)
+    assert len(badge_module._BADGES_BY_CONTAINER[frames[1]._w]) == 5
+
+
+def test_released_badges_are_garbage_collected():
+    registry = _registry()
+    root = PathWidget(name="root")
+    frame = _build_product(registry, root, 0)
+    refs = [weakref.ref(badge) for badge in registry._registry.values()]
+    destroy_badge_subtrees([frame])
+    del frame, root
+    gc.collect()
+
+    assert refs and all(ref() is None for ref in refs)
+    assert weakref.ref(registry)() is registry
+
+
+def _legacy_unregister(registry, badge):
+    """Réplica del recorrido anterior: cada baja revisaba el registro completo."""
+
+    stale = [key for key, registered in registry._registry.items() if registered is badge]
+    for key in stale:
+        registry._registry.pop(key, None)
+        registry._labels.pop(key, None)
+        registry._updaters.pop(key, None)
+
+
+def test_benchmark_clear_case_with_thousand_products():
+    def build():
+        registry = _registry()
+        root = PathWidget(name="root")
+        frames = [_build_product(registry, root, index, claims=5) for index in range(1000)]
+        badges = [badge for badge in badge_module._ACTIVE_BADGES if getattr(badge._label, "parent", None) in frames]
+        return registry, frames, badges
+
+    registry, _frames, badges = build()
+    start = time.perf_counter()
+    for badge in badges:
+        _legacy_unregister(registry, badge)
+    legacy = time.perf_counter() - start
+    assert registry._registry == {}
+    for badge in badges:
+        badge_module._unregister_badge(badge)
+
+    registry, frames, badges = build()
+    start = time.perf_counter()
+    released = destroy_badge_subtrees(frames)
+    batched = time.perf_counter() - start
+
+    print(f"\n1000 productos ({released} badges): recorrido anterior {legacy * 1000:.1f} ms; en bloque {batched * 1000:.1f} ms")
+    assert released == len(badges) == 8000
+    assert registry._registry == {}
+    assert batched < legacy
@@ -0,0 +1,205 @@
+"""Transacciones y ventana de renderizado del panel de validación."""
+
+import time
+
+import pytest
+
+from app import ValidationPanel
+
+
+class FakeTree:
+    def __init__(self):
+        self.items = {}
+        self.order = []
+        self.calls = {"insert": 0, "item": 0, "delete": 0}
+        self._selection = ()
+        self._next = 0
+
+    def insert(self, parent, index, text="", values=()):
+        self.calls["insert"] += 1
+        self._next += 1
+        item_id = f"I{self._next:05d}"
+        self.items[item_id] = {"text": text, "values": tuple(values)}
+        position = len(self.order) if index == "end" else int(index)
+        self.order.insert(position, item_id)
+        return item_id
+
+    def item(self, item_id, text=None, values=None):
+        self.calls["item"] += 1
+        if text is not None:
+            self.items[item_id]["text"] = text
+        if values is not None:
+            self.items[item_id]["values"] = tuple(values)
+
+    def delete(self, *item_ids):
+        self.calls["delete"] += 1
+        for item_id in item_ids:
+            self.items.pop(item_id, None)
+            self.order.remove(item_id)
+        self._selection = tuple(item for item in self._selection if item in self.items)
+
+    def get_children(self, _parent=""):
+        return tuple(self.order)
+
+    def selection(self):
+        return self._selection
+
+    def selection_set(self, item_id):
+        self._selection = (item_id,)
+
+    def selection_remove(self, _items):
+        self._selection = ()
+
+    def focus(self, _item_id):
+        return None
+
+
+class CountingVar:
+    def __init__(self):
+        self.value = ""
+        self.sets = 0
+
+    def set(self, value):
+        self.value = value
+        self.sets += 1
+
+
+class FakeButton:
+    def __init__(self):
+        self.states = []
+
+    def state(self, flags):
+        self.states.append(tuple(flags))
+
+
+def _panel(page_size=None):
+    panel = ValidationPanel.__new__(ValidationPanel)
+    if page_size is not None:
+        panel.RENDER_PAGE_SIZE = page_size
+    panel._init_state()
+    panel.tree = FakeTree()
+    panel._issue_count_var = CountingVar()
+    panel._focus_button = FakeButton()
+    panel.on_focus_request = None
+    panel._ensure_placeholder()
+    return panel
+
+
+def _messages(panel):
+    return [panel.tree.items[item]["values"][0] for item in panel.tree.order]
+
+
+def test_single_update_inserts_row_and_selects_it():
+    panel = _panel()
+
+    panel.update_entry("field:id", "ID obligatorio", origin="ID")
+
+    assert _messages(panel) == ["ID obligatorio"]
+    assert panel._issue_count_var.value == "⚠️ 1"
+    assert panel.tree.selection() == (panel._entries["field:id"],)
+    panel.update_entry("field:id", None, origin="ID")
+    assert panel._issue_count_var.value == "✅ 0"
+    assert panel.severity_counts() == {"ok": 1}
+
+
+def test_batch_applies_one_diff_and_counts_once():
+    panel = _panel()
+    panel._issue_count_var.sets = 0
+
+    with panel.batch():
+        for index in range(200):
+            panel.update_entry(f"field:{index}", f"Error {index}", origin="Campo")
+        for index in range(0, 200, 2):
+            panel.update_entry(f"field:{index}", None, origin="Campo")
+        panel.remove_entries([f"field:{index}" for index in range(150, 200)])
+        assert panel.tree.calls["insert"] == 1  # solo el marcador inicial
+
+    assert panel._issue_count_var.sets == 1
+    assert panel.tree.calls["insert"] == 1 + 150
+    assert panel.tree.calls["item"] == 0
+    assert panel.severity_counts() == {"ok": 75, "error": 75}
+    assert panel._issue_count_var.value == "⚠️ 75"
+
+
+def test_nested_batches_apply_at_outermost_exit():
+    panel = _panel()
+    with panel.batch():
+        with panel.batch():
+            panel.update_entry("a", "Falta A")
+        assert panel._records and not panel._entries
+    assert list(panel._entries) == ["a"]
+
+
+def test_only_a_window_of_rows_is_rendered():
+    panel = _panel(page_size=50)
+    with panel.batch():
+        for index in range(1000):
+            panel.update_entry(f"k{index}", f"Error {index}")
+
+    assert len(panel.tree.order) == 51
+    assert "950 validaciones más" in _messages(panel)[-1]
+    assert panel._issue_count_var.value == "⚠️ 1000"
+
+    panel.remove_entries(["k0", "k1"])
+    assert _messages(panel)[:2] == ["Error 2", "Error 3"]
+    assert _messages(panel)[49] == "Error 51"
+    assert "948 validaciones más" in _messages(panel)[-1]
+
+    panel.tree.selection_set(panel._overflow_id)
+    panel.focus_selected()
+    assert len(panel.tree.order) == 101
+
+
+def test_show_batch_results_updates_existing_rows_in_place():
+    panel = _panel()
+    focus_target = object()
+    requested = []
+    panel.on_focus_request = lambda widget, origin: requested.append((widget, origin))
+    panel.update_entry("field:id", "ID obligatorio")
+    panel.show_batch_results(["Falta el número de caso", "Error B"], ["Aviso"], {"número de caso": focus_target})
+    inserts = panel.tree.calls["insert"]
+
+    panel.show_batch_results(["Falta el número de caso"], ["Aviso nuevo"], {"número de caso": focus_target})
+
+    assert panel.tree.calls["insert"] == inserts
+    assert _messages(panel) == ["ID obligatorio", "Falta el número de caso", "Aviso nuevo"]
+    assert panel.severity_counts() == {"error": 2, "warning": 1}
+    panel.tree.selection_set(panel._entries["batch:error:0"])
+    panel.focus_selected()
+    assert requested == [(focus_target, "Validación integral")]
+
+    panel.show_batch_results([], [])
+    assert _messages(panel) == ["ID obligatorio"]
+
+
+def test_clearing_every_entry_restores_placeholder():
+    panel = _panel()
+    panel.update_entry("a", "Falta A")
+    panel.remove_entries(["a"])
+
+    assert _messages(panel) == ["Sin validaciones registradas"]
+    assert panel._focus_button.states[-1] == ("disabled",)
+
+
+@pytest.mark.parametrize("count", [5000])
+def test_benchmark_batch_vs_per_entry_updates(count):
+    per_entry = _panel()
+    start = time.perf_counter()
+    for index in range(count):
+        per_entry.update_entry(f"k{index}", f"Error {index}")
+    per_entry_seconds = time.perf_counter() - start
+
+    batched = _panel()
+    start = time.perf_counter()
+    with batched.batch():
+        for index in range(count):
+            batched.update_entry(f"k{index}", f"Error {index}")
+    batched_seconds = time.perf_counter() - start
+
+    print(
+        f"\n{count} entradas: individual {per_entry_seconds * 1000:.1f} ms "
+        f"({per_entry._issue_count_var.sets} contadores); lote {batched_seconds * 1000:.1f} ms "
+        f"({batched._issue_count_var.sets} contadores)"
+    )
+    assert batched._issue_count_var.value == per_entry._issue_count_var.value == f"⚠️ {count}"
+    assert len(batched.tree.order) == batched.RENDER_PAGE_SIZE + 1
@@ -1,8 +1,12 @@
 """Headless theme coordinator for Tkinter/ttk widgets.
 
 El administrador mantiene los temas claro y oscuro, aplica los colores
-mediante ``ttk.Style`` y actualiza de forma recursiva los árboles de widgets
-existentes, incluyendo ventanas ``Toplevel`` registradas. También expone
+mediante ``ttk.Style`` y registra por rol los widgets que necesitan colores
+propios (widgets clásicos de Tk, ``Text``, ``Treeview``, ``DateEntry`` y
+menús). Los widgets ttk toman sus colores de los nombres de estilo, por lo que
+un cambio de tema solo reconfigura los estilos y los widgets registrados; el
+resto del árbol se revisa por lotes en ciclos ociosos, incluyendo ventanas
+``Toplevel`` registradas. También expone
 persistencia simple para recordar la preferencia activa entre sesiones. Si la
 plataforma no soporta la creación de elementos personalizados ``border``, el
 administrador recurre automáticamente a una paleta de respaldo basada en Azure
@@ -17,7 +21,7 @@ import importlib.util
 import logging
 import weakref
 from pathlib import Path
-from typing import Dict, Iterable, Optional, Set
+from typing import Dict, Iterable, Iterator, Optional, Set
 
 import tkinter as tk
 from tkinter import scrolledtext, ttk
@@ -59,6 +63,19 @@ DARK_THEME: Dict[str, str] = {
 
 logger = logging.getLogger(__name__)
 
+# Roles del registro de widgets temáticos. ``style`` agrupa los widgets ttk
+# cuyos colores dependen solo del nombre de estilo y no se retocan al cambiar
+# de tema.
+ROLE_STYLE = "style"
+ROLE_CLASSIC = "classic"
+ROLE_TEXT = "text"
+ROLE_TREEVIEW = "treeview"
+ROLE_DATE_ENTRY = "date_entry"
+THEMED_ROLES = (ROLE_CLASSIC, ROLE_TEXT, ROLE_TREEVIEW, ROLE_DATE_ENTRY)
+
+_THEME_MARKER = "_tm_theme_name"
+_STYLE_ONLY_MARKER = "*"
+
 
 class ThemeManager:
     """Apply and toggle Tkinter ttk styles without coupling to a running UI."""
@@ -87,6 +104,13 @@ class ThemeManager:
     _azure_theme_loaded: bool = False
     _missing_text_child_warned: "weakref.WeakSet[scrolledtext.ScrolledText]" = weakref.WeakSet()
     _combobox_scroll_bound_root: Optional[str] = None
+    _widget_registry: Dict[str, "weakref.WeakSet[tk.Misc]"] = {
+        role: weakref.WeakSet() for role in THEMED_ROLES
+    }
+    _primed_windows: "weakref.WeakSet[tk.Misc]" = weakref.WeakSet()
+    _discovery_job: Optional[str] = None
+    _discovery_iter: Optional[Iterator[tk.Misc]] = None
+    DISCOVERY_BATCH_SIZE = 150
 
     THEMES: Dict[str, Dict[str, str]] = {
         LIGHT_THEME["name"]: LIGHT_THEME,
@@ -136,10 +160,8 @@ class ThemeManager:
         cls._current = theme
         cls._configure_palette(ttk_style, theme)
         cls._refresh_collapsible_styles()
-        cls._refresh_content_widgets()
         cls._persist_theme(theme["name"])
         cls.refresh_all_widgets()
-        reapply_all_badges()
         active_root = root or cls._root or getattr(ttk_style, "master", None)
         if active_root is not None:
             try:
@@ -166,7 +188,12 @@ class ThemeManager:
 
     @classmethod
     def refresh_all_widgets(cls) -> None:
-        """Update themed attributes for the root window and tracked ``Toplevel``s."""
+        """Update themed attributes for the root window and tracked ``Toplevel``s.
+
+        Las ventanas ya recorridas no se vuelven a visitar completas: solo se
+        reconfiguran los widgets registrados por rol y los nuevos se
+        descubren por lotes en ciclos ociosos.
+        """
 
         if cls._root is None and not cls._tracked_toplevels and not cls._tracked_menus:
             return
@@ -174,9 +201,12 @@ class ThemeManager:
             cls._ensure_style()
         except RuntimeError:
             return
-        cls._refresh_content_widgets()
         for window in cls._iter_theme_windows():
-            cls._apply_widget_tree(window, cls._current)
+            if not cls._is_primed(window):
+                cls._apply_widget_tree(window, cls._current)
+                cls._prime(window)
+        cls._refresh_content_widgets()
+        cls._refresh_registered_widgets()
         stale_menus: Set[tk.Menu] = set()
         for menu in cls._tracked_menus:
             try:
@@ -189,6 +219,25 @@ class ThemeManager:
                 stale_menus.add(menu)
         cls._tracked_menus.difference_update(stale_menus)
         reapply_all_badges()
+        cls._schedule_discovery_walk()
+
+    @classmethod
+    def register_widget(cls, widget: Optional[tk.Misc]) -> Optional[str]:
+        """Aplica el tema a ``widget`` y lo registra según su rol.
+
+        Devuelve el rol asignado o ``None`` si el widget no necesita tema.
+        """
+
+        if widget is None or not cls._widget_exists(widget):
+            return None
+        return cls._theme_widget(widget, cls._current)
+
+    @classmethod
+    def registered_widgets(cls, role: str) -> list[tk.Misc]:
+        """Lista los widgets vivos registrados con ``role``."""
+
+        registry = cls._widget_registry.get(role)
+        return list(registry) if registry is not None else []
 
     @classmethod
     def register_toplevel(cls, window: Optional[tk.Toplevel]) -> None:
@@ -350,18 +399,177 @@ class ThemeManager:
             theme["select_background"]
         except KeyError:
             return
-        for window in cls._iter_theme_windows():
-            for widget in cls._iter_window_children(window):
-                if isinstance(widget, ttk.Treeview):
-                    cls._reapply_treeview_tags(widget, theme)
-                elif isinstance(widget, scrolledtext.ScrolledText):
-                    text_area = getattr(widget, "text", None)
-                    if isinstance(text_area, tk.Text):
-                        cls._reapply_text_tags(text_area, theme)
-                    else:
-                        cls._force_text_children_refresh(widget, theme)
-                elif isinstance(widget, tk.Text):
-                    cls._reapply_text_tags(widget, theme)
+        for widget in cls.registered_widgets(ROLE_TREEVIEW):
+            if not cls._widget_exists(widget):
+                continue
+            try:
+                cls._reapply_treeview_tags(widget, theme)
+            except tk.TclError:
+                continue
+        for widget in cls.registered_widgets(ROLE_TEXT):
+            if not cls._widget_exists(widget):
+                continue
+            if isinstance(widget, scrolledtext.ScrolledText):
+                text_area = getattr(widget, "text", None)
+                if isinstance(text_area, tk.Text):
+                    cls._reapply_text_tags(text_area, theme)
+                else:
+                    cls._force_text_children_refresh(widget, theme)
+            else:
+                cls._reapply_text_tags(widget, theme)
+
+    @classmethod
+    def _refresh_registered_widgets(cls) -> None:
+        """Reconfigura solo los widgets cuyos colores no vienen de un estilo ttk."""
+
+        theme = cls._current
+        for role in (ROLE_CLASSIC, ROLE_TEXT, ROLE_DATE_ENTRY):
+            for widget in cls.registered_widgets(role):
+                if not cls._widget_exists(widget):
+                    continue
+                try:
+                    cls._apply_widget_attributes(widget, theme)
+                except Exception as exc:
+                    logger.warning(
+                        "[ThemeManager] Skip styling %s: %s", widget.__class__.__name__, exc
+                    )
+                    continue
+                cls._mark_themed(widget, theme["name"])
+        for widget in cls.registered_widgets(ROLE_TREEVIEW):
+            cls._mark_themed(widget, theme["name"])
+
+    @classmethod
+    def _theme_role(cls, widget: tk.Misc) -> Optional[str]:
+        if cls._is_date_entry(widget):
+            return ROLE_DATE_ENTRY
+        if isinstance(widget, (scrolledtext.ScrolledText, tk.Text)):
+            return ROLE_TEXT
+        if isinstance(widget, ttk.Treeview):
+            return ROLE_TREEVIEW
+        if isinstance(widget, ttk.Widget):
+            return ROLE_STYLE
+        if isinstance(
+            widget,
+            (
+                tk.Entry,
+                tk.Spinbox,
+                tk.Listbox,
+                tk.LabelFrame,
+                tk.Frame,
+                tk.Toplevel,
+                tk.Tk,
+                tk.Canvas,
+                tk.Label,
+                tk.Button,
+                tk.Checkbutton,
+                tk.Radiobutton,
+                tk.Scrollbar,
+                tk.Menu,
+            ),
+        ):
+            return ROLE_CLASSIC
+        return None
+
+    @classmethod
+    def _theme_widget(cls, widget: tk.Misc, theme: Dict[str, str]) -> Optional[str]:
+        cls._apply_widget_attributes(widget, theme)
+        role = cls._theme_role(widget)
+        if role is None:
+            return None
+        if role == ROLE_STYLE:
+            cls._mark_themed(widget, _STYLE_ONLY_MARKER)
+            return role
+        try:
+            cls._widget_registry[role].add(widget)
+        except TypeError:
+            return role
+        cls._mark_themed(widget, theme["name"])
+        return role
+
+    @staticmethod
+    def _mark_themed(widget: tk.Misc, marker: str) -> None:
+        try:
+            setattr(widget, _THEME_MARKER, marker)
+        except AttributeError:
+            pass
+
+    @staticmethod
+    def _is_themed(widget: tk.Misc, theme: Dict[str, str]) -> bool:
+        marker = getattr(widget, _THEME_MARKER, None)
+        return marker == _STYLE_ONLY_MARKER or marker == theme["name"]
+
+    @classmethod
+    def _is_primed(cls, window: tk.Misc) -> bool:
+        try:
+            return window in cls._primed_windows
+        except TypeError:
+            return False
+
+    @classmethod
+    def _prime(cls, window: tk.Misc) -> None:
+        try:
+            cls._primed_windows.add(window)
+        except TypeError:
+            pass
+
+    @classmethod
+    def _schedule_discovery_walk(cls) -> None:
+        """Revisa por lotes, en ciclos ociosos, los widgets aún sin tema."""
+
+        root = cls._root
+        after_idle = getattr(root, "after_idle", None)
+        if not callable(after_idle):
+            return
+        cls._cancel_discovery_walk()
+        windows = list(cls._iter_theme_windows())
+        cls._discovery_iter = (
+            widget for window in windows for widget in cls._iter_window_children(window)
+        )
+        try:
+            cls._discovery_job = after_idle(cls._run_discovery_batch)
+        except tk.TclError:
+            cls._discovery_job = None
+            cls._discovery_iter = None
+
+    @classmethod
+    def _cancel_discovery_walk(cls) -> None:
+        job = cls._discovery_job
+        cls._discovery_job = None
+        cls._discovery_iter = None
+        if job is None or cls._root is None:
+            return
+        try:
+            cls._root.after_cancel(job)
+        except (tk.TclError, AttributeError):
+            pass
+
+    @classmethod
+    def _run_discovery_batch(cls) -> None:
+        cls._discovery_job = None
+        iterator = cls._discovery_iter
+        if iterator is None:
+            return
+        theme = cls._current
+        processed = 0
+        for widget in iterator:
+            if not cls._widget_exists(widget) or cls._is_themed(widget, theme):
+                continue
+            try:
+                cls._theme_widget(widget, theme)
+            except Exception as exc:
+                logger.warning(
+                    "[ThemeManager] Skip styling %s: %s", widget.__class__.__name__, exc
+                )
+            processed += 1
+            if processed >= cls.DISCOVERY_BATCH_SIZE:
+                break
+        else:
+            cls._discovery_iter = None
+            return
+        try:
+            cls._discovery_job = cls._root.after_idle(cls._run_discovery_batch)
+        except (tk.TclError, AttributeError):
+            cls._discovery_iter = None
 
     @classmethod
     def _refresh_collapsible_styles(cls) -> None:
@@ -588,15 +796,19 @@ class ThemeManager:
     def _apply_widget_tree(cls, root: tk.Misc, theme: Dict[str, str]) -> None:
         """Recursively apply ttk style names and tk attributes to a widget tree."""
 
+        # Los widgets ya tematizados con la paleta activa (o ttk que solo
+        # dependen del estilo) se omiten: recorrer de nuevo una pestaña no
+        # repite ``configure`` ni acumula ``bind`` sobre los mismos widgets.
         def _update(widget: tk.Misc) -> None:
             if not cls._widget_exists(widget):
                 return
-            try:
-                cls._apply_widget_attributes(widget, theme)
-            except Exception as exc:
-                logger.warning(
-                    "[ThemeManager] Skip styling %s: %s", widget.__class__.__name__, exc
-                )
+            if not cls._is_themed(widget, theme):
+                try:
+                    cls._theme_widget(widget, theme)
+                except Exception as exc:
+                    logger.warning(
+                        "[ThemeManager] Skip styling %s: %s", widget.__class__.__name__, exc
+                    )
             try:
                 children = widget.winfo_children()
             except tk.TclError:
@@ -605,6 +817,8 @@ class ThemeManager:
                 _update(child)
 
         _update(root)
+        if isinstance(root, (tk.Tk, tk.Toplevel)):
+            cls._prime(root)
 
     @classmethod
     def _apply_widget_attributes(cls, widget: tk.Misc, theme: Dict[str, str]) -> None:
@@ -1878,4 +2092,14 @@ def reapply_all_badges() -> None:
             continue
 
 
-__all__ = ["ThemeManager", "LIGHT_THEME", "DARK_THEME", "reapply_all_badges"]
+__all__ = [
+    "ThemeManager",
+    "LIGHT_THEME",
+    "DARK_THEME",
+    "ROLE_CLASSIC",
+    "ROLE_DATE_ENTRY",
+    "ROLE_STYLE",
+    "ROLE_TEXT",
+    "ROLE_TREEVIEW",
+    "reapply_all_badges",
+]
@@ -0,0 +1,399 @@
+"""Exporta por lotes casos guardados sin abrir la interfaz.
+
+Recorre una carpeta con ``*_version.json`` o autoguardados y genera para
+cada caso los mismos archivos que el botón "Guardar y enviar" (CSV,
+históricos ``h_*.csv``, Markdown, resumen ejecutivo y DOCX) usando
+``report.export_pipeline``. Cada caso se exporta en ``<salida>/<id_caso>/``;
+los archivos de un mismo caso se procesan en orden dentro de un solo
+trabajo para no escribir en paralelo sobre los mismos históricos.
+
+Los históricos de cada carpeta de caso se rehacen completos cada vez que el
+caso se exporta (todos sus archivos, con ``fecactualizacion`` igual a la
+fecha de modificación de cada uno), así que repetir la exportación no
+duplica filas.
+
+El avance se registra en ``batch_export_state.jsonl`` dentro de la carpeta
+de salida. Al relanzar el comando se omiten los casos cuyos archivos ya se
+exportaron y no cambiaron, y se reintentan los que fallaron.
+
+Uso:
+    python -m tools.batch_export --input casos/ --output exportes/ --jobs 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Sequence, TextIO
+
+
+def _ensure_repo_root_on_path() -> Path:
+    """Asegura que el root del repositorio esté disponible en sys.path."""
+
+    repo_root = Path(__file__).resolve().parents[1]
+    if str(repo_root) not in sys.path:
+        sys.path.insert(0, str(repo_root))
+    return repo_root
+
+
+_ensure_repo_root_on_path()
+
+from report.export_pipeline import prepare_case_data, write_case_exports  # noqa: E402
+from utils.lazy_loader import module_available  # noqa: E402
+
+DEFAULT_PATTERNS = ("*_version.json", "*autosave*.json")
+STATE_FILE_NAME = "batch_export_state.jsonl"
+_UNSAFE_FOLDER_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+@dataclass
+class ExportJob:
+    """Archivos de un mismo caso que se exportan en secuencia."""
+
+    case_id: str
+    sources: list[Path] = field(default_factory=list)
+
+
+@dataclass
+class BatchSummary:
+    """Totales de una ejecución por lotes."""
+
+    total: int = 0
+    exported: int = 0
+    failed: int = 0
+    skipped: int = 0
+    files: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def cases_per_second(self) -> float:
+        return self.exported / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def files_per_second(self) -> float:
+        return self.files / self.elapsed if self.elapsed > 0 else 0.0
+
+    def render(self) -> str:
+        return (
+            f"Exportación por lotes: {self.exported} de {self.total} archivos exportados, "
+            f"{self.failed} con error, {self.skipped} omitidos (sin cambios) en {self.elapsed:.2f} s. "
+            f"Rendimiento: {self.cases_per_second:.2f} casos/s, {self.files_per_second:.1f} archivos/s."
+        )
+
+
+def discover_sources(input_dir: Path, patterns: Sequence[str] = DEFAULT_PATTERNS) -> list[Path]:
+    """Devuelve los JSON de ``input_dir`` (recursivo) que cumplen algún patrón."""
+
+    found: set[Path] = set()
+    for pattern in patterns:
+        found.update(path for path in Path(input_dir).rglob(pattern) if path.is_file())
+    return sorted(found)
+
+
+def source_signature(path: Path) -> str:
+    stat = path.stat()
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def load_state(state_path: Path) -> dict[str, dict]:
+    """Lee el último registro de cada archivo fuente del estado de reanudación."""
+
+    state: dict[str, dict] = {}
+    if not state_path.exists():
+        return state
+    with state_path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # Una línea truncada por una interrupción no invalida el resto.
+                continue
+            source = record.get("source")
+            if source:
+                state[source] = record
+    return state
+
+
+def read_case_id(path: Path) -> str:
+    with path.open("r", encoding="utf-8") as handle:
+        payload = json.load(handle)
+    dataset = payload.get("dataset", payload) if isinstance(payload, dict) else {}
+    case = dataset.get("caso", {}) if isinstance(dataset, dict) else {}
+    return str(case.get("id_caso") or "").strip().upper()
+
+
+def case_folder_name(case_id: str) -> str:
+    return _UNSAFE_FOLDER_CHARS.sub("_", case_id).strip("._") or "sin_id"
+
+
+def reset_case_history(folder: Path) -> None:
+    """Elimina los ``h_*.csv`` de la carpeta de un caso antes de rehacerlos."""
+
+    for history_path in Path(folder).glob("h_*.csv"):
+        history_path.unlink()
+
+
+def export_source(
+    source: Path,
+    output_root: Path,
+    *,
+    encoding: str = "utf-8",
+    docx_available: bool = True,
+) -> dict:
+    """Exporta un archivo de caso y devuelve su registro de estado."""
+
+    started = time.perf_counter()
+    record = {
+        "source": str(source),
+        "signature": source_signature(source),
+        "case_id": "",
+        "status": "ok",
+        "files": 0,
+        "warnings": [],
+        "error": "",
+    }
+    try:
+        with source.open("r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+        if not isinstance(payload, dict):
+            raise ValueError("el archivo no contiene un caso")
+        data = prepare_case_data(payload)
+        case_id = str(data.get("caso", {}).get("id_caso") or "").strip().upper()
+        if not case_id:
+            raise ValueError("el caso no tiene id_caso")
+        record["case_id"] = case_id
+        folder = output_root / case_folder_name(case_id)
+        folder.mkdir(parents=True, exist_ok=True)
+        result = write_case_exports(
+            data,
+            folder,
+            case_id,
+            encoding=encoding,
+            timestamp=datetime.fromtimestamp(source.stat().st_mtime),
+            docx_available=docx_available,
+        )
+    except Exception as exc:  # noqa: BLE001 - el lote sigue con los demás casos
+        record["status"] = "error"
+        record["error"] = f"{type(exc).__name__}: {exc}"
+    else:
+        record["files"] = len(result.created_files)
+        record["warnings"] = list(result.warnings)
+    record["seconds"] = round(time.perf_counter() - started, 4)
+    return record
+
+
+def run_job(
+    sources: Sequence[str],
+    output_root: str,
+    encoding: str = "utf-8",
+    docx_available: bool = True,
+    case_id: str = "",
+) -> list[dict]:
+    """Exporta en orden los archivos de un caso; se ejecuta en el proceso hijo.
+
+    ``sources`` son todos los archivos del caso, así que sus históricos se
+    vacían primero y se vuelven a escribir desde cero.
+    """
+
+    root = Path(output_root)
+    if case_id:
+        reset_case_history(root / case_folder_name(case_id))
+    return [
+        export_source(Path(source), root, encoding=encoding, docx_available=docx_available)
+        for source in sources
+    ]
+
+
+def plan_jobs(
+    sources: Iterable[Path],
+    state: dict[str, dict],
+    *,
+    force: bool = False,
+) -> tuple[list[ExportJob], list[Path], list[dict]]:
+    """Agrupa por caso los archivos pendientes.
+
+    Un caso con algún archivo pendiente se exporta con todos sus archivos,
+    porque sus históricos se rehacen completos. Devuelve los trabajos, los
+    archivos omitidos por estar ya exportados y los registros de error de los
+    archivos que no se pudieron leer.
+    """
+
+    jobs: dict[str, ExportJob] = {}
+    up_to_date: list[tuple[Path, str]] = []
+    unreadable: list[dict] = []
+    for source in sources:
+        signature = source_signature(source)
+        previous = state.get(str(source))
+        if (
+            not force
+            and previous
+            and previous.get("status") == "ok"
+            and previous.get("signature") == signature
+        ):
+            up_to_date.append((source, previous.get("case_id") or ""))
+            continue
+        try:
+            case_id = read_case_id(source)
+        except (OSError, ValueError, AttributeError) as exc:
+            unreadable.append(
+                {
+                    "source": str(source),
+                    "signature": signature,
+                    "case_id": "",
+                    "status": "error",
+                    "files": 0,
+                    "warnings": [],
+                    "error": f"{type(exc).__name__}: {exc}",
+                    "seconds": 0.0,
+                }
+            )
+            continue
+        job = jobs.setdefault(case_id, ExportJob(case_id=case_id))
+        job.sources.append(source)
+    skipped: list[Path] = []
+    for source, case_id in up_to_date:
+        if case_id in jobs:
+            jobs[case_id].sources.append(source)
+        else:
+            skipped.append(source)
+    for job in jobs.values():
+        job.sources.sort(key=lambda path: path.stat().st_mtime_ns)
+    return list(jobs.values()), skipped, unreadable
+
+
+def run_batch(
+    input_dir: Path,
+    output_dir: Path,
+    *,
+    jobs: int = 1,
+    patterns: Sequence[str] = DEFAULT_PATTERNS,
+    encoding: str = "utf-8",
+    docx: bool = True,
+    force: bool = False,
+    stream: Optional[TextIO] = None,
+    executor_factory: Optional[Callable[[int], ProcessPoolExecutor]] = None,
+) -> BatchSummary:
+    """Exporta todos los casos de ``input_dir`` y devuelve el resumen."""
+
+    stream = stream or sys.stdout
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    state_path = output_dir / STATE_FILE_NAME
+    started = time.perf_counter()
+    resolved_output = output_dir.resolve()
+    sources = [
+        path
+        for path in discover_sources(Path(input_dir), patterns)
+        if resolved_output not in path.resolve().parents
+    ]
+    planned, skipped, unreadable = plan_jobs(sources, load_state(state_path), force=force)
+    summary = BatchSummary(total=len(sources), skipped=len(skipped))
+    docx_available = docx and module_available("docx")
+    done = len(skipped)
+
+    with state_path.open("a", encoding="utf-8") as state_handle:
+
+        def record_results(records: Iterable[dict]) -> None:
+            nonlocal done
+            for record in records:
+                done += 1
+                state_handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+                state_handle.flush()
+                if record["status"] == "ok":
+                    summary.exported += 1
+                    summary.files += record["files"]
+                    detail = f"{record['files']} archivos, {record['seconds']:.2f} s"
+                else:
+                    summary.failed += 1
+                    detail = record["error"]
+                label = record["case_id"] or Path(record["source"]).name
+                print(
+                    f"[{done}/{summary.total}] {record['status'].upper()} {label} ({detail})",
+                    file=stream,
+                )
+
+        record_results(unreadable)
+        job_args = [
+            ([str(path) for path in job.sources], str(output_dir), encoding, docx_available, job.case_id)
+            for job in planned
+        ]
+        if jobs <= 1 or len(job_args) <= 1:
+            for args in job_args:
+                record_results(run_job(*args))
+        else:
+            factory = executor_factory or (lambda workers: ProcessPoolExecutor(max_workers=workers))
+            with factory(min(jobs, len(job_args))) as executor:
+                futures = [executor.submit(run_job, *args) for args in job_args]
+                try:
+                    for future in as_completed(futures):
+                        record_results(future.result())
+                except KeyboardInterrupt:
+                    for future in futures:
+                        future.cancel()
+                    raise
+    summary.elapsed = time.perf_counter() - started
+    return summary
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--input", required=True, type=Path, help="Carpeta con los JSON de casos.")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="Carpeta de salida (por defecto, <input>/exportes_lote).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=max(1, (os.cpu_count() or 2) - 1),
+        help="Procesos en paralelo (1 ejecuta todo en el proceso actual).",
+    )
+    parser.add_argument(
+        "--pattern",
+        action="append",
+        dest="patterns",
+        help="Patrón glob de archivos a exportar; puede repetirse.",
+    )
+    parser.add_argument(
+        "--encoding",
+        default="utf-8",
+        help="Codificación de los CSV (utf-8 o latin-1).",
+    )
+    parser.add_argument("--no-docx", action="store_true", help="No genera los informes Word.")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Vuelve a exportar también los archivos ya exportados sin cambios.",
+    )
+    args = parser.parse_args(argv)
+    if not args.input.is_dir():
+        parser.error(f"No existe la carpeta de entrada: {args.input}")
+    output_dir = args.output or args.input / "exportes_lote"
+    summary = run_batch(
+        args.input,
+        output_dir,
+        jobs=args.jobs,
+        patterns=tuple(args.patterns or DEFAULT_PATTERNS),
+        encoding=args.encoding,
+        docx=not args.no_docx,
+        force=args.force,
+    )
+    print(summary.render())
+    return 1 if summary.failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,18 +1,34 @@
 """Utilidad CLI para resumir texto en español con un modelo local de Hugging Face.
 
 Este script carga el modelo ``mrm8488/bert2bert_shared-spanish-finetuned-summarization``
-desde el directorio local ``external drive`` sin descargas de Internet.
+desde el directorio local ``external drive`` sin descargas de Internet. Con
+``--backend int8`` usa la cuantización dinámica de ``utils.llm_backend``.
 """
 
 from __future__ import annotations
 
 import argparse
+import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 import torch
 from transformers import AutoModelForSeq2SeqLM, AutoTokenizer, pipeline
 
+
+def _ensure_repo_root_on_path() -> None:
+    """Asegura que el root del repositorio esté disponible en sys.path."""
+
+    repo_root = Path(__file__).resolve().parents[1]
+    if str(repo_root) not in sys.path:
+        sys.path.insert(0, str(repo_root))
+
+
+_ensure_repo_root_on_path()
+
+from utils.llm_backend import (BACKEND_FP32, BACKENDS,  # noqa: E402
+                               configure_torch_threads, load_seq2seq_model)
+
 MODEL_FOLDER_NAME = "mrm8488/bert2bert_shared-spanish-finetuned-summarization"
 SUMMARY_PROMPT_PREFIX = (
     "Resume el siguiente texto en español con precisión factual, "
@@ -28,16 +44,38 @@ class LocalSpanishSummarizer:
         summarizer: Pipeline de Hugging Face para tareas de resumen.
     """
 
-    def __init__(self, model_path: Path) -> None:
+    def __init__(
+        self,
+        model_path: Path,
+        *,
+        backend: str = BACKEND_FP32,
+        num_threads: Optional[int] = None,
+    ) -> None:
         """Inicializa el tokenizador, modelo y pipeline de resumen.
 
         Args:
             model_path: Ruta al directorio local del modelo.
+            backend: ``"fp32"`` o ``"int8"``; los pesos cuantizados se guardan
+                en ``<model_path>/quantized`` la primera vez.
+            num_threads: Hilos de PyTorch; ``None`` deja el valor actual
+                salvo con ``int8``, que usa todos los núcleos.
         """
         self.model_path = model_path
-        tokenizer = AutoTokenizer.from_pretrained(str(model_path), local_files_only=True)
-        model = AutoModelForSeq2SeqLM.from_pretrained(str(model_path), local_files_only=True)
-        device = 0 if torch.cuda.is_available() else -1
+        self.backend = backend
+        if backend == BACKEND_FP32:
+            if num_threads:
+                configure_torch_threads(num_threads)
+            tokenizer = AutoTokenizer.from_pretrained(str(model_path), local_files_only=True)
+            model = AutoModelForSeq2SeqLM.from_pretrained(str(model_path), local_files_only=True)
+        else:
+            model, tokenizer = load_seq2seq_model(
+                model_path,
+                backend=backend,
+                num_threads=num_threads,
+                local_files_only=True,
+            )
+        # Los modelos cuantizados dinámicamente solo corren en CPU.
+        device = 0 if backend == BACKEND_FP32 and torch.cuda.is_available() else -1
         self.summarizer = pipeline(
             task="summarization",
             model=model,
@@ -76,15 +114,16 @@ class LocalSpanishSummarizer:
         prompt_text = f"{SUMMARY_PROMPT_PREFIX}{normalized_text}"
 
         try:
-            result: list[dict[str, Any]] = self.summarizer(
-                prompt_text,
-                max_length=max_length,
-                min_length=min_length,
-                truncation=True,
-                clean_up_tokenization_spaces=True,
-                do_sample=False,
-                num_beams=4,
-            )
+            with torch.inference_mode():
+                result: list[dict[str, Any]] = self.summarizer(
+                    prompt_text,
+                    max_length=max_length,
+                    min_length=min_length,
+                    truncation=True,
+                    clean_up_tokenization_spaces=True,
+                    do_sample=False,
+                    num_beams=4,
+                )
             return str(result[0]["summary_text"]).strip()
         except (RuntimeError, ValueError) as error:
             raise type(error)(f"Error durante la generación del resumen: {error}") from error
@@ -146,6 +185,18 @@ def parse_args() -> argparse.Namespace:
         default=50,
         help="Longitud mínima del resumen.",
     )
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default=BACKEND_FP32,
+        help="fp32 (original) o int8 (cuantización dinámica para CPU).",
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=None,
+        help="Hilos de PyTorch (por defecto todos los núcleos con int8).",
+    )
     return parser.parse_args()
 
 
@@ -156,7 +207,7 @@ def main() -> None:
     text = input_path.read_text(encoding="utf-8")
 
     model_path = resolve_external_drive_model_path()
-    summarizer = LocalSpanishSummarizer(model_path)
+    summarizer = LocalSpanishSummarizer(model_path, backend=args.backend, num_threads=args.threads)
     summary = summarizer.summarize_spanish_text(
         text=text,
         max_length=args.max_len,
@@ -30,6 +30,7 @@ from ui.frames.utils import (
 from ui.config import COL_PADX, ROW_PADY
 from ui.layout import CollapsibleSection
 from theme_manager import ThemeManager
+from ui.tree_diff import get_tree_renderer
 from validation_badge import badge_registry
 
 
@@ -819,9 +820,7 @@ class ClientFrame:
     def remove(self):
         if messagebox.askyesno("Confirmar", f"¿Desea eliminar el cliente {self.idx+1}?"):
             self._log_change(f"Se eliminó cliente {self.idx+1}")
-            self.frame.destroy()
-            if hasattr(self, "section"):
-                self.section.destroy()
+            # ``remove_client`` destruye frame y sección liberando sus badges en bloque.
             self.remove_callback(self)
 
     def clear_values(self):
@@ -905,77 +904,57 @@ class ClientFrame:
         return tree
 
     def refresh_summary(self):
-        tree = self.summary_tree or getattr(self.owner, "clients_summary_tree", None)
-        if not tree or not hasattr(tree, "get_children"):
+        tree = self._summary_renderer_tree()
+        if tree is None:
             return
-        try:
-            children = tree.get_children()
-            if children:
-                tree.delete(*children)
-        except Exception:
+        renderer = get_tree_renderer(tree, fallback_key="cliente", base_tags=())
+        renderer.schedule(self._build_summary_rows, lambda stats: self._after_summary_render(tree, stats))
+        renderer.flush()
+
+    def schedule_summary_refresh(self):
+        """Agrupa los refrescos del resumen disparados por ``trace`` en un ciclo ocioso."""
+
+        tree = self._summary_renderer_tree()
+        if tree is None:
             return
+        renderer = get_tree_renderer(tree, fallback_key="cliente", base_tags=())
+        renderer.schedule(self._build_summary_rows, lambda stats: self._after_summary_render(tree, stats))
+
+    def _summary_renderer_tree(self):
+        tree = self.summary_tree or getattr(self.owner, "clients_summary_tree", None)
+        if not tree or not hasattr(tree, "get_children"):
+            return None
+        return tree
+
+    def _build_summary_rows(self):
         clients = getattr(self.owner, "client_frames", []) if self.owner else []
-        seen_iids: set[str] = set()
-        base_counters: dict[str, int] = {}
-        for idx, client in enumerate(clients):
+        rows = []
+        for client in clients:
             data = client.get_data()
-            values = (
-                data.get("id_cliente", ""),
-                data.get("nombres", ""),
-                data.get("apellidos", ""),
-                data.get("tipo_id", ""),
-                data.get("flag", ""),
-                data.get("telefonos", ""),
-                data.get("correos", ""),
-                data.get("direcciones", ""),
-                data.get("accionado", ""),
-            )
-            tags = ("even",) if idx % 2 == 0 else ("odd",)
-            base_iid = str(data.get("id_cliente") or f"cliente-{idx}")
-            base_counters.setdefault(base_iid, 0)
-            candidate_iid = base_iid
-            if candidate_iid in seen_iids:
-                base_counters[base_iid] += 1
-                candidate_iid = f"{base_iid}-{base_counters[base_iid]}"
-                while candidate_iid in seen_iids:
-                    base_counters[base_iid] += 1
-                    candidate_iid = f"{base_iid}-{base_counters[base_iid]}"
-                log_event(
-                    "validacion",
-                    f"IID de cliente duplicado '{base_iid}' detectado, usando '{candidate_iid}'",
-                    self.logs,
+            rows.append(
+                (
+                    data.get("id_cliente", ""),
+                    data.get("nombres", ""),
+                    data.get("apellidos", ""),
+                    data.get("tipo_id", ""),
+                    data.get("flag", ""),
+                    data.get("telefonos", ""),
+                    data.get("correos", ""),
+                    data.get("direcciones", ""),
+                    data.get("accionado", ""),
                 )
-            try:
-                tree.insert("", "end", iid=candidate_iid, values=values, tags=tags)
-                seen_iids.add(candidate_iid)
-            except Exception:
-                fallback_suffix = base_counters[base_iid] + 1
-                fallback_iid = f"{base_iid}-{fallback_suffix}"
-                while fallback_iid in seen_iids:
-                    fallback_suffix += 1
-                    fallback_iid = f"{base_iid}-{fallback_suffix}"
-                log_event(
-                    "validacion",
-                    (
-                        f"No se pudo insertar el IID '{candidate_iid}'. "
-                        f"Reintentando con '{fallback_iid}'"
-                    ),
-                    self.logs,
-                )
-                try:
-                    tree.insert("", "end", iid=fallback_iid, values=values, tags=tags)
-                    seen_iids.add(fallback_iid)
-                    base_counters[base_iid] = fallback_suffix
-                except Exception:
-                    log_event(
-                        "validacion",
-                        (
-                            f"Se omitió el cliente con IID '{candidate_iid}' al fallar los intentos "
-                            f"de inserción inclusive con '{fallback_iid}'"
-                        ),
-                        self.logs,
-                    )
-        self._apply_summary_theme(tree)
+            )
+        return rows
+
+    def _after_summary_render(self, tree, stats):
+        for duplicate in dict.fromkeys(stats.duplicates):
+            log_event(
+                "validacion",
+                f"IID de cliente duplicado '{duplicate}' detectado, se usó un sufijo correlativo",
+                self.logs,
+            )
+        if stats.changed:
+            self._apply_summary_theme(tree)
         self._on_summary_select()
 
     def _sort_summary(self, column):
@@ -38,6 +38,9 @@ from models.analitica_catalog import (
     get_analitica_codes,
     get_analitica_names,
 )
+from utils.option_source import is_shared_source
+from utils.ui_scheduler import (PRIORITY_SUMMARY, PRIORITY_VALIDATION,
+                                get_ui_scheduler)
 from validators import (FieldValidator, log_event, normalize_without_accents,
                         should_autofill_field, sum_investigation_components,
                         validate_codigo_analitica, validate_date_text,
@@ -126,6 +129,8 @@ class BaseInvolvementRow:
             ),
         )
         selector_container.grid(row=0, column=1, padx=COL_PADX, pady=ROW_PADY, sticky="ew")
+        if is_shared_source(self.options_getter):
+            self.options_getter.attach(self.selector_cb)
         try:
             self.selector_cb.set("")
         except Exception:
@@ -313,6 +318,8 @@ class BaseInvolvementRow:
         return container, widget
 
     def _get_known_ids(self):
+        if is_shared_source(self.options_getter):
+            return self.options_getter.known()
         return {option.strip() for option in self.options_getter() if option and option.strip()}
 
     def _clear_if_completely_blank(self):
@@ -376,13 +383,13 @@ class BaseInvolvementRow:
         self.product_frame._schedule_product_summary_refresh()
 
     def update_options(self):
-        options = self.options_getter()
-        self.selector_cb["values"] = options
+        if not is_shared_source(self.options_getter):
+            # Con una fuente compartida el ``Combobox`` se sincroniza al desplegarse.
+            self.selector_cb["values"] = self.options_getter()
         current_value = self.id_var.get().strip()
         if not current_value:
             return
-        known_ids = {option.strip() for option in options if option and option.strip()}
-        if current_value not in known_ids:
+        if current_value not in self._get_known_ids():
             message = (
                 f"El {self.entity_label_lower} seleccionado ya no está disponible. "
                 f"Selecciona un nuevo {self.entity_label_lower}."
@@ -403,6 +410,13 @@ class BaseInvolvementRow:
                 messagebox.showerror(f"{self.entity_label} eliminado", message)
             self._notify_summary_change()
 
+    def release_stale_selection(self, known_ids):
+        """Libera la selección solo si apunta a un ID que ya no existe."""
+
+        current_value = self.id_var.get().strip()
+        if current_value and current_value not in known_ids:
+            self.update_options()
+
     def remove(self):
         if messagebox.askyesno(
             "Confirmar",
@@ -747,6 +761,15 @@ class ClaimRow:
         if snapshot == getattr(self, "_last_summary_snapshot", None):
             return
         self._last_summary_snapshot = snapshot
+        scheduler = get_ui_scheduler(getattr(self, "frame", None))
+        if scheduler is not None:
+            self._refresh_after_id = scheduler.schedule(
+                ("reclamo_resumen", id(self)),
+                self._run_claim_refresh,
+                priority=PRIORITY_SUMMARY,
+                delay_ms=120,
+            )
+            return
         current_after_id = getattr(self, "_refresh_after_id", None)
         if current_after_id:
             try:
@@ -899,6 +922,15 @@ class ClaimRow:
         trace_add("write", self._schedule_duplicate_check_from_trace)
 
     def _schedule_duplicate_check_from_trace(self, *_args):
+        scheduler = get_ui_scheduler(getattr(self, "frame", None))
+        if scheduler is not None:
+            self._duplicate_trace_after_id = scheduler.schedule(
+                ("reclamo_duplicados", id(self)),
+                self._trigger_duplicate_check_from_trace,
+                priority=PRIORITY_VALIDATION,
+                delay_ms=100,
+            )
+            return
         if self._duplicate_trace_after_id:
             try:
                 self.frame.after_cancel(self._duplicate_trace_after_id)
@@ -1257,6 +1289,8 @@ class ProductFrame:
             width=20,
         )
         self.client_cb.grid(row=1, column=3, padx=COL_PADX, pady=ROW_PADY, sticky="we")
+        if is_shared_source(self.get_client_options):
+            self.get_client_options.attach(self.client_cb)
         self.client_cb.set('')
         self.client_var.trace_add("write", self._handle_internal_state_change)
         self.client_cb.bind(
@@ -3140,9 +3174,13 @@ class ProductFrame:
 
     def update_client_options(self):
         current = self.client_var.get().strip()
-        options = self.get_client_options()
-        self.client_cb['values'] = options
-        if current and current in options:
+        if is_shared_source(self.get_client_options):
+            known_ids = self.get_client_options.known()
+        else:
+            options = self.get_client_options()
+            self.client_cb['values'] = options
+            known_ids = set(options)
+        if current and current in known_ids:
             self.client_cb.set(current)
             self.client_var.set(current)
             return
@@ -3168,6 +3206,22 @@ class ProductFrame:
         for inv in self.involvements:
             inv.update_options()
 
+    def release_stale_client_selection(self, known_ids):
+        """Limpia solo las selecciones de cliente que apuntan a IDs eliminados."""
+
+        current = self.client_var.get().strip()
+        if current and current not in known_ids:
+            self.update_client_options()
+            return
+        for client_inv in self.client_involvements:
+            client_inv.release_stale_selection(known_ids)
+
+    def release_stale_team_selection(self, known_ids):
+        """Limpia solo las selecciones de colaborador que apuntan a IDs eliminados."""
+
+        for inv in self.involvements:
+            inv.release_stale_selection(known_ids)
+
     def _register_lookup_sync(self, widget):
         if widget is None:
             return
@@ -3729,7 +3783,7 @@ class ProductFrame:
     def remove(self):
         if messagebox.askyesno("Confirmar", f"¿Desea eliminar el producto {self.idx+1}?"):
             self.log_change(f"Se eliminó producto {self.idx+1}")
-            self.frame.destroy()
+            # ``remove_product`` destruye el frame liberando sus badges en bloque.
             self.remove_callback(self)
 
     def set_afectacion_interna(self, enabled: bool):
@@ -22,6 +22,7 @@ from ui.frames.utils import (
     record_import_issue,
 )
 from theme_manager import ThemeManager
+from ui.tree_diff import get_tree_renderer
 from ui.config import COL_PADX, ROW_PADY
 from ui.layout import CollapsibleSection
 from validation_badge import ValidationBadge, badge_registry
@@ -1584,51 +1585,38 @@ class TeamMemberFrame:
         return tree
 
     def refresh_summary(self):
-        tree = self.summary_tree or getattr(self.owner, "team_summary_tree", None)
-        if not tree or not hasattr(tree, "get_children"):
+        tree = self._summary_renderer_tree()
+        if tree is None:
             return
-        try:
-            existing_rows = tree.get_children()
-            if existing_rows:
-                tree.delete(*existing_rows)
-        except Exception as exc:
-            log_event("validacion", f"No se pudo limpiar el resumen de colaboradores: {exc}", self.logs)
+        renderer = get_tree_renderer(tree, fallback_key="colaborador", base_tags=())
+        renderer.schedule(self._build_summary_rows, lambda stats: self._after_summary_render(tree, stats))
+        renderer.flush()
+
+    def schedule_summary_refresh(self):
+        """Agrupa los refrescos del resumen disparados por ``trace`` en un ciclo ocioso."""
+
+        tree = self._summary_renderer_tree()
+        if tree is None:
             return
-        team_frames = getattr(self.owner, "team_frames", []) if self.owner else []
+        renderer = get_tree_renderer(tree, fallback_key="colaborador", base_tags=())
+        renderer.schedule(self._build_summary_rows, lambda stats: self._after_summary_render(tree, stats))
+
+    def _summary_renderer_tree(self):
+        tree = self.summary_tree or getattr(self.owner, "team_summary_tree", None)
+        if not tree or not hasattr(tree, "get_children"):
+            return None
+        return tree
 
-        def build_unique_iid(base: str, used: set[str]) -> str:
-            normalized = (base or "").strip() or "colaborador"
-            candidate = normalized
-            suffix = 1
-            while candidate in used:
-                candidate = f"{normalized}-{suffix}"
-                suffix += 1
-            return candidate
-
-        seen_iids: set[str] = set()
-        inserted_count = 0
+    def _build_summary_rows(self):
+        team_frames = getattr(self.owner, "team_frames", []) if self.owner else []
         field_order = [field for field, _ in self.SUMMARY_COLUMNS]
-        for idx, member in enumerate(team_frames):
-            data = member.get_data()
-            values = tuple(data.get(field, "") for field in field_order)
-            base_iid = data.get("id_colaborador", f"colaborador-{idx+1}")
-            iid = build_unique_iid(base_iid, seen_iids)
-            tag = "even" if inserted_count % 2 == 0 else "odd"
-            try:
-                tree.insert("", "end", iid=iid, values=values, tags=(tag,))
-                seen_iids.add(iid)
-                inserted_count += 1
-            except Exception as exc:
-                log_event("validacion", f"IID duplicado o inválido '{iid}' para colaborador: {exc}", self.logs)
-                retry_iid = build_unique_iid(base_iid, seen_iids | {iid})
-                try:
-                    tree.insert("", "end", iid=retry_iid, values=values, tags=(tag,))
-                    seen_iids.add(retry_iid)
-                    inserted_count += 1
-                    log_event("validacion", f"Reintento exitoso con IID '{retry_iid}'", self.logs)
-                except Exception as retry_exc:
-                    log_event("validacion", f"Omitido colaborador con IID '{iid}': {retry_exc}", self.logs)
-        self._apply_summary_theme(tree)
+        return [tuple(member.get_data().get(field, "") for field in field_order) for member in team_frames]
+
+    def _after_summary_render(self, tree, stats):
+        for duplicate in dict.fromkeys(stats.duplicates):
+            log_event("validacion", f"IID duplicado '{duplicate}' para colaborador; se usó un sufijo correlativo", self.logs)
+        if stats.changed:
+            self._apply_summary_theme(tree)
         self._on_summary_select()
 
     def _sort_summary(self, column):
@@ -7,6 +7,7 @@ from tkinter import ttk
 from typing import Callable, Optional
 
 from theme_manager import ThemeManager
+from utils.ui_scheduler import PRIORITY_LAYOUT, get_ui_scheduler
 
 
 _INDICATOR_OPEN = "\u25BE"  # ▼
@@ -32,6 +33,7 @@ class CollapsibleSection(ttk.Frame):
         self._is_open = open
         self._hovering = False
         self._on_toggle = on_toggle
+        self._pending_title: Optional[str] = None
 
         self.header = ttk.Frame(self, style="AccordionHeader.TFrame")
         self.header.pack(fill="x")
@@ -72,9 +74,33 @@ class CollapsibleSection(ttk.Frame):
         return _INDICATOR_OPEN if self._is_open else _INDICATOR_CLOSED
 
     def set_title(self, title: str) -> None:
-        """Update the header title label text."""
+        """Update the header title label text.
 
-        self.title_label.configure(text=title)
+        Title syncs are driven by variable traces that fire on every
+        keystroke, so when the shared UI scheduler is installed the label is
+        reconfigured once per tick with the latest title.
+        """
+
+        self._pending_title = title
+        scheduler = get_ui_scheduler(self)
+        if scheduler is None:
+            self._apply_pending_title()
+            return
+        scheduler.schedule(
+            ("section_title", id(self)), self._apply_pending_title, priority=PRIORITY_LAYOUT
+        )
+
+    def _apply_pending_title(self) -> None:
+        title = self._pending_title
+        self._pending_title = None
+        if title is None:
+            return
+        try:
+            if self.title_label.cget("text") == title:
+                return
+            self.title_label.configure(text=title)
+        except tk.TclError:
+            pass
 
     def toggle(self, _event: tk.Event | None = None) -> None:
         """Toggle the visibility of the content frame."""
@@ -0,0 +1,300 @@
+"""Renderizado incremental de ``ttk.Treeview`` basado en claves.
+
+Las tablas de resumen se reconstruían borrando e insertando todas las filas
+en cada refresco disparado por un ``trace``. ``KeyedTreeRenderer`` compara
+las filas nuevas con las ya pintadas y solo inserta, actualiza, mueve o
+elimina las que cambiaron, conservando la selección y el desplazamiento.
+Los refrescos pueden agruparse con :meth:`KeyedTreeRenderer.schedule`, que
+ejecuta una única pasada por ciclo ``after_idle``.
+"""
+
+from __future__ import annotations
+
+import tkinter as tk
+from dataclasses import dataclass, field
+from typing import Callable, Hashable, Iterable, Optional, Sequence
+
+RowValues = Sequence[object]
+KeyFunc = Callable[[RowValues], object]
+
+_RENDERER_ATTR = "_keyed_tree_renderer"
+_ZEBRA_TAGS = ("even", "odd")
+
+
+@dataclass
+class RenderStats:
+    """Resumen de operaciones aplicadas sobre el ``Treeview``."""
+
+    inserted: int = 0
+    updated: int = 0
+    removed: int = 0
+    moved: int = 0
+    rebuilt: bool = False
+    duplicates: list[str] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.inserted or self.updated or self.removed or self.moved or self.rebuilt)
+
+
+def _first_column_key(values: RowValues) -> object:
+    return values[0] if values else ""
+
+
+def build_unique_keys(
+    base_keys: Iterable[object], fallback: str = "fila"
+) -> tuple[list[str], list[str]]:
+    """Convierte ``base_keys`` en iids únicos y devuelve también los duplicados.
+
+    Las claves vacías usan ``fallback``; las repetidas reciben un sufijo
+    ``-n`` estable según su orden de aparición.
+    """
+
+    unique: list[str] = []
+    duplicates: list[str] = []
+    used: set[str] = set()
+    for raw in base_keys:
+        base = str(raw or "").strip() or fallback
+        candidate = base
+        suffix = 1
+        while candidate in used:
+            candidate = f"{base}-{suffix}"
+            suffix += 1
+        if candidate != base:
+            duplicates.append(base)
+        used.add(candidate)
+        unique.append(candidate)
+    return unique, duplicates
+
+
+class KeyedTreeRenderer:
+    """Aplica a un ``Treeview`` solo las diferencias entre dos renderizados."""
+
+    def __init__(
+        self,
+        tree,
+        *,
+        key_func: Optional[KeyFunc] = None,
+        fallback_key: str = "fila",
+        zebra: bool = True,
+        base_tags: Sequence[str] = ("themed",),
+    ) -> None:
+        self.tree = tree
+        self.key_func = key_func or _first_column_key
+        self.fallback_key = fallback_key
+        self.zebra = zebra
+        self.base_tags = tuple(base_tags)
+        self._rendered: dict[str, tuple[tuple, tuple]] = {}
+        self._pending_factory: Optional[Callable[[], Iterable[RowValues]]] = None
+        self._pending_callbacks: list[Callable[[RenderStats], None]] = []
+        self._idle_job: Optional[str] = None
+        self._has_rendered = False
+
+    # ------------------------------------------------------------------
+    # API pública
+    def supports_diff(self) -> bool:
+        return all(hasattr(self.tree, name) for name in ("item", "move", "get_children"))
+
+    def render(self, rows: Iterable[RowValues], keys: Optional[Sequence[Hashable]] = None) -> RenderStats:
+        """Sincroniza el árbol con ``rows`` aplicando solo los cambios."""
+
+        normalized_rows = [tuple(row) for row in rows]
+        base_keys = keys if keys is not None else [self.key_func(row) for row in normalized_rows]
+        iids, duplicates = build_unique_keys(base_keys, self.fallback_key)
+        if not self.supports_diff():
+            stats = self._rebuild(iids, normalized_rows)
+        else:
+            stats = self._apply_diff(iids, normalized_rows)
+        stats.duplicates = duplicates
+        self._has_rendered = True
+        return stats
+
+    def schedule(
+        self,
+        rows_factory: Callable[[], Iterable[RowValues]],
+        on_applied: Optional[Callable[[RenderStats], None]] = None,
+    ) -> None:
+        """Agrupa los refrescos hasta el siguiente ciclo ocioso de Tk.
+
+        Solo se conserva la última ``rows_factory``; los ``on_applied`` de
+        todas las solicitudes se invocan tras la única pasada de renderizado.
+        El primer pintado y los árboles sin ``after_idle`` se aplican de
+        inmediato para que la tabla nunca se muestre vacía al abrirse.
+        """
+
+        self._pending_factory = rows_factory
+        if on_applied is not None:
+            self._pending_callbacks.append(on_applied)
+        if self._idle_job is not None:
+            return
+        after_idle = getattr(self.tree, "after_idle", None)
+        if after_idle is None or not self._has_rendered:
+            self.flush()
+            return
+        try:
+            self._idle_job = after_idle(self._run_idle_flush)
+        except (tk.TclError, RuntimeError):
+            self._idle_job = None
+            self.flush()
+
+    def flush(self) -> Optional[RenderStats]:
+        """Aplica inmediatamente el refresco pendiente, si existe."""
+
+        self._cancel_idle_job()
+        factory = self._pending_factory
+        callbacks = self._pending_callbacks
+        self._pending_factory = None
+        self._pending_callbacks = []
+        if factory is None:
+            return None
+        stats = self.render(factory())
+        for callback in callbacks:
+            callback(stats)
+        return stats
+
+    def has_pending(self) -> bool:
+        return self._pending_factory is not None
+
+    def forget(self) -> None:
+        """Descarta el estado conocido para forzar una comparación completa."""
+
+        self._rendered.clear()
+
+    # ------------------------------------------------------------------
+    # Implementación
+    def _run_idle_flush(self) -> None:
+        self._idle_job = None
+        self.flush()
+
+    def _cancel_idle_job(self) -> None:
+        if self._idle_job is None:
+            return
+        try:
+            self.tree.after_cancel(self._idle_job)
+        except (tk.TclError, AttributeError):
+            pass
+        self._idle_job = None
+
+    def _row_tags(self, index: int) -> tuple:
+        if not self.zebra:
+            return self.base_tags
+        return (*self.base_tags, _ZEBRA_TAGS[index % 2])
+
+    def _rebuild(self, iids: list[str], rows: list[tuple]) -> RenderStats:
+        stats = RenderStats(rebuilt=True)
+        try:
+            children = tuple(self.tree.get_children())
+            if children:
+                self.tree.delete(*children)
+            stats.removed = len(children)
+        except (tk.TclError, AttributeError):
+            pass
+        self._rendered.clear()
+        for index, (iid, values) in enumerate(zip(iids, rows)):
+            tags = self._row_tags(index)
+            try:
+                self.tree.insert("", "end", iid=iid, values=values, tags=tags)
+            except tk.TclError:
+                continue
+            self._rendered[iid] = (values, tags)
+            stats.inserted += 1
+        return stats
+
+    def _apply_diff(self, iids: list[str], rows: list[tuple]) -> RenderStats:
+        tree = self.tree
+        stats = RenderStats()
+        try:
+            existing = [str(item) for item in tree.get_children("")]
+        except tk.TclError:
+            return self._rebuild(iids, rows)
+        scroll_top = self._current_scroll()
+
+        wanted = set(iids)
+        stale = [iid for iid in existing if iid not in wanted]
+        if stale:
+            try:
+                tree.delete(*stale)
+            except tk.TclError:
+                return self._rebuild(iids, rows)
+            for iid in stale:
+                self._rendered.pop(iid, None)
+            stats.removed = len(stale)
+        survivors = [iid for iid in existing if iid in wanted]
+        survivor_set = set(survivors)
+        desired_order = [iid for iid in iids if iid in survivor_set]
+        if desired_order != survivors:
+            live_order = list(survivors)
+            for index, iid in enumerate(desired_order):
+                if live_order[index] == iid:
+                    continue
+                try:
+                    tree.move(iid, "", index)
+                except tk.TclError:
+                    continue
+                live_order.remove(iid)
+                live_order.insert(index, iid)
+                stats.moved += 1
+
+        for index, (iid, values) in enumerate(zip(iids, rows)):
+            tags = self._row_tags(index)
+            state = (values, tags)
+            if iid in survivor_set:
+                if self._rendered.get(iid) == state:
+                    continue
+                try:
+                    tree.item(iid, values=values, tags=tags)
+                except tk.TclError:
+                    continue
+                stats.updated += 1
+            else:
+                try:
+                    tree.insert("", index, iid=iid, values=values, tags=tags)
+                except tk.TclError:
+                    continue
+                stats.inserted += 1
+            self._rendered[iid] = state
+
+        if scroll_top is not None and (stats.inserted or stats.removed or stats.moved):
+            self._restore_scroll(scroll_top)
+        return stats
+
+    def _current_scroll(self) -> Optional[float]:
+        yview = getattr(self.tree, "yview", None)
+        if yview is None:
+            return None
+        try:
+            return float(yview()[0])
+        except (tk.TclError, TypeError, ValueError, IndexError):
+            return None
+
+    def _restore_scroll(self, fraction: float) -> None:
+        try:
+            self.tree.yview_moveto(fraction)
+        except (tk.TclError, AttributeError):
+            pass
+
+
+def get_tree_renderer(tree, **options) -> KeyedTreeRenderer:
+    """Devuelve el renderizador asociado a ``tree`` creándolo si no existe.
+
+    Las opciones solo se aplican la primera vez; así cada árbol conserva
+    un único estado de diferencias sin importar quién lo refresque.
+    """
+
+    renderer = getattr(tree, _RENDERER_ATTR, None)
+    if isinstance(renderer, KeyedTreeRenderer):
+        return renderer
+    renderer = KeyedTreeRenderer(tree, **options)
+    try:
+        setattr(tree, _RENDERER_ATTR, renderer)
+    except AttributeError:
+        pass
+    return renderer
+
+
+__all__ = [
+    "KeyedTreeRenderer",
+    "RenderStats",
+    "build_unique_keys",
+    "get_tree_renderer",
+]
@@ -3,9 +3,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from importlib import util as importlib_util
 import re
-from typing import Mapping
+from typing import Mapping, TYPE_CHECKING
 
-from report.alerta_temprana import SpanishSummaryHelper
+if TYPE_CHECKING:  # pragma: no cover - solo para anotaciones
+    from report.alerta_temprana import SpanishSummaryHelper
 
 TRANSFORMERS_AVAILABLE = importlib_util.find_spec("transformers") is not None
 PLACEHOLDER = "Auto-redacción no disponible."
@@ -37,12 +38,21 @@ _default_helper: SpanishSummaryHelper | None = None
 
 
 def _get_helper() -> SpanishSummaryHelper:
+    # Comparte con la alerta temprana la caché persistente de resúmenes.
     global _default_helper
     if _default_helper is None:
+        from report.alerta_temprana import SpanishSummaryHelper
+
         _default_helper = SpanishSummaryHelper()
     return _default_helper
 
 
+def get_summary_helper() -> SpanishSummaryHelper:
+    """Instancia compartida del resumidor (para precargarlo o reutilizarlo)."""
+
+    return _get_helper()
+
+
 def _safe_case_value(case_data: Mapping[str, object], key: str) -> str:
     value = case_data.get(key, "") if isinstance(case_data, Mapping) else ""
     return str(value or "").strip()
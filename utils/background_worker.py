@@ -1,13 +1,35 @@
-"""Background task utilities for Tkinter apps."""
+"""Background task utilities for Tkinter apps.
+
+Las tareas se ejecutan en un ``ThreadPoolExecutor`` por categoría y sus
+resultados vuelven al hilo de Tk a través de ``BackgroundTaskScheduler``:
+los hilos de trabajo solo depositan la tarea terminada en una cola segura
+entre hilos y un único ``after`` por ventana raíz la drena, en lugar de un
+temporizador de sondeo por cada ``Future`` en curso. El temporizador solo
+está armado mientras hay tareas pendientes.
+
+El planificador también decide qué tarea entra al ejecutor: respeta un
+límite de concurrencia por categoría que se puede cambiar en caliente,
+elige por prioridad (menor valor primero) y fusiona las tareas con la misma
+clave, de modo que un autoguardado nuevo reemplaza al que aún esperaba turno
+y nunca corren dos a la vez.
+"""
 
 from __future__ import annotations
 
-from concurrent.futures import Future, ThreadPoolExecutor
+import heapq
+import itertools
+import threading
+import weakref
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from queue import Empty, SimpleQueue
 from threading import Lock
-from typing import Callable, Optional
+from typing import Callable, Hashable, Optional
 
 import tkinter as tk
 
+from utils.perf_profiler import PerfProfiler, callback_name, get_profiler
+
 TaskFunc = Callable[[], object]
 Callback = Optional[Callable[[object], None]]
 ErrorCallback = Optional[Callable[[BaseException], None]]
@@ -18,10 +40,22 @@ _EXECUTOR_CONFIG: dict[str, int] = {
     "autosave": 2,
     "persistence": 2,
     "reports": 2,
+    "telemetry": 1,
+    # El modelo local ocupa varios GB: una sola generación a la vez.
+    "llm": 1,
 }
 
+TASK_PRIORITY_INTERACTIVE = 0
+TASK_PRIORITY_NORMAL = 10
+TASK_PRIORITY_BACKGROUND = 20
+
+DEFAULT_DRAIN_INTERVAL_MS = 15
+
+_SCHEDULER_ATTR = "_background_task_scheduler"
+
 _executors: dict[str, ThreadPoolExecutor] = {}
 _executor_lock = Lock()
+_schedulers: "weakref.WeakSet[BackgroundTaskScheduler]" = weakref.WeakSet()
 
 
 def _get_executor(category: str | None) -> ThreadPoolExecutor:
@@ -38,9 +72,75 @@ def _get_executor(category: str | None) -> ThreadPoolExecutor:
     return executor
 
 
+def get_background_executor(category: str | None = None) -> ThreadPoolExecutor:
+    """Devuelve el ejecutor compartido de ``category`` (lo crea si hace falta)."""
+
+    return _get_executor(category)
+
+
+def category_concurrency(category: str | None) -> int:
+    """Número máximo de tareas de ``category`` que corren a la vez."""
+
+    return _EXECUTOR_CONFIG.get(category or "default", _EXECUTOR_CONFIG["default"])
+
+
+def set_category_concurrency(category: str | None, limit: int) -> None:
+    """Cambia en caliente el límite de concurrencia de ``category``.
+
+    Si el ejecutor ya existe y el límite sube, se amplía su número máximo de
+    hilos; si baja, los hilos sobrantes quedan ociosos porque el planificador
+    deja de entregarles trabajo.
+    """
+
+    name = category or "default"
+    limit = max(1, int(limit))
+    with _executor_lock:
+        _EXECUTOR_CONFIG[name] = limit
+        executor = _executors.get(name)
+        if executor is not None and getattr(executor, "_max_workers", limit) < limit:
+            executor._max_workers = limit
+    for scheduler in list(_schedulers):
+        scheduler._dispatch_all()
+
+
+def executor_queue_depths() -> dict[str, int]:
+    """Devuelve cuántas tareas esperan turno en cada categoría activa."""
+
+    with _executor_lock:
+        executors = list(_executors.items())
+    depths = {}
+    for name, executor in executors:
+        work_queue = getattr(executor, "_work_queue", None)
+        depths[name] = work_queue.qsize() if work_queue is not None else 0
+    for scheduler in list(_schedulers):
+        for name, pending in scheduler.pending_counts().items():
+            depths[name] = depths.get(name, 0) + pending
+    return depths
+
+
+def _profile_task(task_func: TaskFunc, label: str, profiler: PerfProfiler) -> TaskFunc:
+    """Envuelve ``task_func`` para medir la espera en cola y la ejecución."""
+
+    submitted = profiler.now()
+    name = callback_name(task_func)
+
+    def _profiled() -> object:
+        started = profiler.now()
+        profiler.record_span("queue_wait", f"task.{label}", submitted, started - submitted, {"task": name})
+        try:
+            return task_func()
+        finally:
+            profiler.record_span("run", f"task.{label}", started, profiler.now() - started, {"task": name})
+
+    return _profiled
+
+
 def shutdown_background_workers(*, wait: bool = False, cancel_futures: bool = False) -> None:
     """Detiene todos los ejecutores activos y libera recursos."""
 
+    if cancel_futures:
+        for scheduler in list(_schedulers):
+            scheduler.cancel_pending()
     with _executor_lock:
         executors = list(_executors.items())
         _executors.clear()
@@ -48,48 +148,336 @@ def shutdown_background_workers(*, wait: bool = False, cancel_futures: bool = Fa
         executor.shutdown(wait=wait, cancel_futures=cancel_futures)
 
 
+class CancellationToken(threading.Event):
+    """Señal de cancelación cooperativa que la tarea consulta mientras corre.
+
+    Es un ``threading.Event``, así que sirve también donde el código ya
+    espera un ``cancel_event`` (por ejemplo, los trabajadores de importación).
+    """
+
+    def cancel(self) -> None:
+        self.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        if self.is_set():
+            raise CancelledError()
+
+
+@dataclass(eq=False)
+class TaskHandle:
+    """Tarea enviada al planificador."""
+
+    func: TaskFunc
+    category: str
+    priority: int
+    key: Optional[Hashable]
+    token: CancellationToken
+    on_success: Callback
+    on_error: ErrorCallback
+    seq: int
+    future: Future = field(default_factory=Future)
+    # pending -> running -> done; o bien cancelled / superseded antes de correr.
+    state: str = "pending"
+
+    def cancel(self) -> bool:
+        """Activa el token y, si aún no empezó, cancela la tarea."""
+
+        self.token.cancel()
+        return self.future.cancel()
+
+
+class BackgroundTaskScheduler:
+    """Reparte tareas entre los ejecutores y entrega sus resultados en Tk.
+
+    ``submit`` y la entrega de callbacks ocurren en el hilo de Tk; el resto
+    del estado se protege con un candado porque los hilos de trabajo liberan
+    su turno y arrancan la siguiente tarea sin esperar al bucle de eventos.
+    """
+
+    def __init__(self, root: tk.Misc, *, drain_interval_ms: int = DEFAULT_DRAIN_INTERVAL_MS) -> None:
+        self.root = root
+        self.drain_interval_ms = max(1, int(drain_interval_ms))
+        self._lock = Lock()
+        self._pending: dict[str, list[tuple[int, int, TaskHandle]]] = {}
+        self._running: dict[str, int] = {}
+        self._pending_keys: dict[Hashable, TaskHandle] = {}
+        self._running_keys: set[Hashable] = set()
+        self._completions: SimpleQueue[TaskHandle] = SimpleQueue()
+        self._outstanding = 0
+        self._drain_job = None
+        self._seq = itertools.count()
+        self.stats = {
+            "submitted": 0,
+            "coalesced": 0,
+            "cancelled": 0,
+            "completed": 0,
+            "failed": 0,
+            "drains": 0,
+        }
+        _schedulers.add(self)
+
+    # ------------------------------------------------------------------
+    # API pública
+    def submit(
+        self,
+        task_func: TaskFunc,
+        on_success: Callback = None,
+        on_error: ErrorCallback = None,
+        *,
+        category: str | None = None,
+        priority: int = TASK_PRIORITY_NORMAL,
+        key: Optional[Hashable] = None,
+        token: Optional[CancellationToken] = None,
+    ) -> TaskHandle:
+        """Encola ``task_func`` y devuelve su ``TaskHandle``.
+
+        Si otra tarea con la misma ``key`` aún no empezó, se descarta sin
+        invocar sus callbacks y su token queda cancelado. Si ya está
+        corriendo, la nueva espera a que termine.
+        """
+
+        name = category or "default"
+        profiler = get_profiler()
+        if profiler.should_sample():
+            task_func = _profile_task(task_func, name, profiler)
+        handle = TaskHandle(
+            func=task_func,
+            category=name,
+            priority=priority,
+            key=key,
+            token=token or CancellationToken(),
+            on_success=on_success,
+            on_error=on_error,
+            seq=next(self._seq),
+        )
+        superseded = None
+        with self._lock:
+            self.stats["submitted"] += 1
+            self._outstanding += 1
+            if key is not None:
+                superseded = self._pending_keys.get(key)
+                if superseded is not None:
+                    superseded.state = "superseded"
+                    self.stats["coalesced"] += 1
+                self._pending_keys[key] = handle
+            heapq.heappush(self._pending.setdefault(name, []), (priority, handle.seq, handle))
+        handle.future.add_done_callback(lambda _future, target=handle: self._on_cancelled(target))
+        if superseded is not None:
+            superseded.cancel()
+        self._dispatch(name)
+        self._arm()
+        return handle
+
+    def cancel(self, key: Hashable) -> bool:
+        """Cancela la tarea pendiente con ``key``; devuelve si había alguna."""
+
+        with self._lock:
+            handle = self._pending_keys.get(key)
+        return handle.cancel() if handle is not None else False
+
+    def cancel_pending(self) -> int:
+        """Cancela todas las tareas que aún esperan turno."""
+
+        with self._lock:
+            handles = [entry[2] for heap in self._pending.values() for entry in heap]
+        return sum(1 for handle in handles if handle.cancel())
+
+    def pending_counts(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                name: sum(1 for entry in heap if entry[2].state == "pending")
+                for name, heap in self._pending.items()
+                if heap
+            }
+
+    def running_counts(self) -> dict[str, int]:
+        with self._lock:
+            return {name: count for name, count in self._running.items() if count}
+
+    # ------------------------------------------------------------------
+    # Reparto (cualquier hilo)
+    def _dispatch_all(self) -> None:
+        with self._lock:
+            names = [name for name, heap in self._pending.items() if heap]
+        for name in names:
+            self._dispatch(name)
+
+    def _dispatch(self, category: str) -> None:
+        to_start: list[TaskHandle] = []
+        with self._lock:
+            heap = self._pending.get(category)
+            limit = category_concurrency(category)
+            waiting_on_key: list[tuple[int, int, TaskHandle]] = []
+            while heap and self._running.get(category, 0) < limit:
+                entry = heapq.heappop(heap)
+                handle = entry[2]
+                if handle.state != "pending":
+                    continue
+                if handle.key is not None and handle.key in self._running_keys:
+                    waiting_on_key.append(entry)
+                    continue
+                handle.state = "running"
+                self._running[category] = self._running.get(category, 0) + 1
+                if handle.key is not None:
+                    self._running_keys.add(handle.key)
+                    if self._pending_keys.get(handle.key) is handle:
+                        del self._pending_keys[handle.key]
+                to_start.append(handle)
+            for entry in waiting_on_key:
+                heapq.heappush(heap, entry)
+        for handle in to_start:
+            try:
+                _get_executor(category).submit(self._run, handle)
+            except RuntimeError as exc:
+                # El ejecutor se cerró (cierre de la aplicación).
+                if handle.future.set_running_or_notify_cancel():
+                    handle.future.set_exception(exc)
+                self._release(handle)
+
+    def _run(self, handle: TaskHandle) -> None:
+        try:
+            if not handle.future.set_running_or_notify_cancel():
+                return
+            if handle.token.cancelled:
+                handle.future.set_exception(CancelledError())
+                return
+            try:
+                result = handle.func()
+            except BaseException as exc:
+                handle.future.set_exception(exc)
+            else:
+                handle.future.set_result(result)
+        finally:
+            self._release(handle)
+
+    def _release(self, handle: TaskHandle) -> None:
+        if not handle.future.cancelled():
+            self._completions.put(handle)
+        with self._lock:
+            self._running[handle.category] -= 1
+            if handle.key is not None:
+                self._running_keys.discard(handle.key)
+        self._dispatch_all()
+
+    def _on_cancelled(self, handle: TaskHandle) -> None:
+        if not handle.future.cancelled():
+            return
+        with self._lock:
+            if handle.state == "pending":
+                handle.state = "cancelled"
+            if handle.key is not None and self._pending_keys.get(handle.key) is handle:
+                del self._pending_keys[handle.key]
+            if handle.state != "superseded":
+                self.stats["cancelled"] += 1
+        self._completions.put(handle)
+
+    # ------------------------------------------------------------------
+    # Entrega (hilo de Tk)
+    def _arm(self) -> None:
+        if self._drain_job is not None or not self._outstanding:
+            return
+        try:
+            self._drain_job = self.root.after(self.drain_interval_ms, self._drain)
+        except (tk.TclError, RuntimeError):
+            self._drain_job = None
+
+    def _drain(self) -> None:
+        self._drain_job = None
+        try:
+            if not self.root or not getattr(self.root, "winfo_exists", lambda: False)():
+                return
+        except tk.TclError:
+            return
+        self.stats["drains"] += 1
+        finished: list[TaskHandle] = []
+        while True:
+            try:
+                finished.append(self._completions.get_nowait())
+            except Empty:
+                break
+        for handle in sorted(finished, key=lambda item: (item.priority, item.seq)):
+            self._deliver(handle)
+        self._arm()
+
+    def _deliver(self, handle: TaskHandle) -> None:
+        with self._lock:
+            self._outstanding -= 1
+        if handle.state == "superseded":
+            return
+        future = handle.future
+        if future.cancelled():
+            callback, value = handle.on_error, CancelledError()
+        else:
+            handle.state = "done"
+            error = future.exception()
+            if error is not None:
+                self.stats["failed"] += 1
+                callback, value = handle.on_error, error
+            else:
+                self.stats["completed"] += 1
+                callback, value = handle.on_success, future.result()
+        if callback:
+            _dispatch_callback(callback, value, handle.category)
+
+
+def _dispatch_callback(callback: Callable[[object], None], value: object, label: str) -> None:
+    try:
+        with get_profiler().callback_span(callback_name(callback), f"callback.{label}"):
+            callback(value)
+    except Exception:
+        # Avoid propagating exceptions into Tk's event loop
+        pass
+
+
+def get_task_scheduler(root: tk.Misc, *, drain_interval_ms: int | None = None) -> BackgroundTaskScheduler:
+    """Devuelve (y crea una sola vez) el planificador de tareas de ``root``."""
+
+    scheduler = getattr(root, _SCHEDULER_ATTR, None)
+    if isinstance(scheduler, BackgroundTaskScheduler):
+        return scheduler
+    scheduler = BackgroundTaskScheduler(root, drain_interval_ms=drain_interval_ms or DEFAULT_DRAIN_INTERVAL_MS)
+    setattr(root, _SCHEDULER_ATTR, scheduler)
+    return scheduler
+
+
 def run_guarded_task(
     task_func: TaskFunc,
     on_success: Callback,
     on_error: ErrorCallback,
     root: tk.Misc,
     *,
-    poll_interval_ms: int = 50,
+    poll_interval_ms: int | None = None,
     category: str | None = None,
+    priority: int = TASK_PRIORITY_NORMAL,
+    key: Optional[Hashable] = None,
+    token: Optional[CancellationToken] = None,
 ) -> Future:
     """Execute ``task_func`` in a background thread and marshal callbacks.
 
-    The background future is polled with ``root.after`` to keep the UI
-    responsive and guarantee that ``on_success``/``on_error`` are always
-    invoked in the Tk main loop thread. The task is dispatched to an
-    executor selected by ``category`` to avoid contention between long-
-    running operations (por ejemplo, importaciones vs. autosaves).
-    """
-
-    executor = _get_executor(category)
-    future = executor.submit(task_func)
-
-    def _dispatch_callback(callback: Callable[[object], None], value: object) -> None:
-        try:
-            callback(value)
-        except Exception:
-            # Avoid propagating exceptions into Tk's event loop
-            pass
+    ``on_success``/``on_error`` are always invoked in the Tk main loop
+    thread through the root's ``BackgroundTaskScheduler``. The task is
+    dispatched to an executor selected by ``category`` to avoid contention
+    between long-running operations (por ejemplo, importaciones vs.
+    autosaves); ``priority``, ``key`` and ``token`` are forwarded to
+    ``BackgroundTaskScheduler.submit``. ``poll_interval_ms`` only sets the
+    drain interval when the root has no scheduler yet.
 
-    def _poll_future() -> None:
-        if not root or not getattr(root, "winfo_exists", lambda: False)():
-            return
-        if not future.done():
-            root.after(poll_interval_ms, _poll_future)
-            return
-        try:
-            result = future.result()
-        except BaseException as exc:  # pragma: no cover - defensive
-            if on_error:
-                _dispatch_callback(on_error, exc)
-            return
-        if on_success:
-            _dispatch_callback(on_success, result)
+    With the shared profiler enabled, sampled tasks record their queue wait,
+    run time and callback duration under ``task.<category>``.
+    """
 
-    root.after(poll_interval_ms, _poll_future)
-    return future
+    scheduler = get_task_scheduler(root, drain_interval_ms=poll_interval_ms)
+    handle = scheduler.submit(
+        task_func,
+        on_success,
+        on_error,
+        category=category,
+        priority=priority,
+        key=key,
+        token=token,
+    )
+    return handle.future
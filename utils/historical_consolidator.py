@@ -10,9 +10,11 @@ persistencia de anexos ``h_*.csv`` con metadatos obligatorios ``case_id`` y
 from __future__ import annotations
 
 import csv
+import threading
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, Mapping, Sequence
+from typing import Callable, Iterable, Mapping, Optional, Sequence
 
 import settings
 from validators import sanitize_rich_text
@@ -29,6 +31,82 @@ def _sanitize_value(value: object) -> str:
     return sanitized
 
 
+@dataclass
+class HistoricalBatch:
+    """Filas de un caso que se adjuntan a ``h_<tabla>.csv`` con una misma hora."""
+
+    rows: Sequence[Mapping[str, object]]
+    header: Sequence[str]
+    case_id: str
+    timestamp: Optional[datetime] = None
+
+
+def _full_header(header: Sequence[str]) -> list[str]:
+    full_header = list(header)
+    for meta_field in ("case_id", "fecactualizacion"):
+        if meta_field not in full_header:
+            full_header.append(meta_field)
+    return full_header
+
+
+def _write_batch(handle, batch: HistoricalBatch, empty_placeholder: str, *, write_header: bool) -> None:
+    writer = csv.DictWriter(handle, fieldnames=_full_header(batch.header))
+    if write_header:
+        writer.writeheader()
+    effective_timestamp = _sanitize_value((batch.timestamp or datetime.now()).isoformat())
+    case_id = _sanitize_value(batch.case_id)
+    for row in batch.rows:
+        sanitized_row = {
+            field: _sanitize_value(row.get(field, empty_placeholder)) for field in batch.header
+        }
+        sanitized_row["case_id"] = case_id
+        sanitized_row["fecactualizacion"] = effective_timestamp
+        writer.writerow(sanitized_row)
+
+
+def append_historical_batches(
+    table_name: str,
+    batches: Iterable[HistoricalBatch],
+    base_dir: Path,
+    *,
+    placeholder: str | None = None,
+    encoding: str = "utf-8",
+    on_batch_written: Optional[Callable[[int], None]] = None,
+):
+    """Adjunta varios lotes a ``h_<tabla>.csv`` abriendo el archivo una sola vez.
+
+    Cada lote conserva su caso y su hora, igual que una llamada a
+    ``append_historical_records``. ``on_batch_written`` recibe el índice de
+    cada lote apenas sus filas quedan volcadas en disco, lo que permite
+    registrar el avance de una reanudación. Devuelve la ruta escrita o
+    ``None`` si ningún lote tenía filas.
+    """
+
+    pending = [(index, batch) for index, batch in enumerate(batches)]
+    if not any(batch.rows for _index, batch in pending):
+        for index, _batch in pending:
+            if on_batch_written:
+                on_batch_written(index)
+        return None
+
+    target_dir = Path(base_dir)
+    target_dir.mkdir(parents=True, exist_ok=True)
+    history_path = target_dir / f"h_{table_name}.csv"
+    should_write_header = not history_path.exists()
+    empty_placeholder = placeholder if placeholder is not None else settings.EVENTOS_PLACEHOLDER
+
+    with history_path.open("a", newline="", encoding=encoding) as handle:
+        for index, batch in pending:
+            if batch.rows:
+                _write_batch(handle, batch, empty_placeholder, write_header=should_write_header)
+                should_write_header = False
+                handle.flush()
+            if on_batch_written:
+                on_batch_written(index)
+
+    return history_path
+
+
 def append_historical_records(
     table_name: str,
     rows: Iterable[Mapping[str, object]],
@@ -51,28 +129,37 @@ def append_historical_records(
     normalized_rows = list(rows or [])
     if not normalized_rows:
         return None
+    return append_historical_batches(
+        table_name,
+        [HistoricalBatch(normalized_rows, header, case_id, timestamp)],
+        base_dir,
+        placeholder=placeholder,
+        encoding=encoding,
+    )
 
-    target_dir = Path(base_dir)
-    target_dir.mkdir(parents=True, exist_ok=True)
-    history_path = target_dir / f"h_{table_name}.csv"
-    effective_timestamp = (timestamp or datetime.now()).isoformat()
-    full_header = list(header)
-    for meta_field in ("case_id", "fecactualizacion"):
-        if meta_field not in full_header:
-            full_header.append(meta_field)
-    should_write_header = not history_path.exists()
-    empty_placeholder = placeholder if placeholder is not None else settings.EVENTOS_PLACEHOLDER
 
-    with history_path.open("a", newline="", encoding=encoding) as handle:
-        writer = csv.DictWriter(handle, fieldnames=full_header)
-        if should_write_header:
-            writer.writeheader()
-        for row in normalized_rows:
-            sanitized_row = {
-                field: _sanitize_value(row.get(field, empty_placeholder)) for field in header
-            }
-            sanitized_row["case_id"] = _sanitize_value(case_id)
-            sanitized_row["fecactualizacion"] = _sanitize_value(effective_timestamp)
-            writer.writerow(sanitized_row)
+class ReplayCheckpoint:
+    """Registro de solo-anexar con las unidades ya consolidadas de un manifiesto.
 
-    return history_path
+    Permite retomar una reposición interrumpida sin duplicar filas: cada
+    unidad se marca justo después de escribirse en ``h_*.csv``.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def load(self) -> set[str]:
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except (FileNotFoundError, UnicodeDecodeError):
+            return set()
+        return {line.strip() for line in lines if line.strip()}
+
+    def mark(self, unit_id: str) -> None:
+        with self._lock, self.path.open("a", encoding="utf-8") as handle:
+            handle.write(unit_id + "\n")
+
+    def clear(self) -> None:
+        with self._lock:
+            self.path.unlink(missing_ok=True)
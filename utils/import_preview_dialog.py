@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from typing import Callable, Optional
+
+import tkinter as tk
+from tkinter import ttk
+
+from utils.mass_import_manager import (PREVIEW_PAGE_SIZE, PREVIEW_STATUSES,
+                                       ImportPreview)
+
+_FILTER_LABELS = {
+    "": "Todas",
+    "nuevo": "Nuevas",
+    "actualizado": "Actualizadas",
+    "duplicado": "Duplicadas",
+    "error": "Con errores",
+}
+
+
+class ImportPreviewDialog:
+    """Resumen paginado de una importación antes de aplicarla al formulario."""
+
+    def __init__(
+        self,
+        parent: tk.Misc,
+        preview: ImportPreview,
+        *,
+        on_commit: Callable[[], None],
+        on_discard: Optional[Callable[[], None]] = None,
+        page_size: int = PREVIEW_PAGE_SIZE,
+    ) -> None:
+        self.preview = preview
+        self._on_commit = on_commit
+        self._on_discard = on_discard
+        self._page_size = max(1, page_size)
+        self._page = 0
+        self._closed = False
+
+        self.top = tk.Toplevel(parent)
+        self.top.title(f"Vista previa de {preview.import_type}")
+        self.top.transient(parent)
+        self.top.grab_set()
+        self.top.protocol("WM_DELETE_WINDOW", self.discard)
+
+        ttk.Label(self.top, text=preview.summary_text, justify="left").grid(
+            row=0, column=0, columnspan=4, padx=10, pady=(10, 5), sticky="w"
+        )
+        self._filter_var = tk.StringVar(value=_FILTER_LABELS[""])
+        filter_box = ttk.Combobox(
+            self.top,
+            textvariable=self._filter_var,
+            values=[_FILTER_LABELS[""], *(_FILTER_LABELS[status] for status in PREVIEW_STATUSES)],
+            state="readonly",
+            width=16,
+        )
+        filter_box.grid(row=1, column=0, padx=10, pady=5, sticky="w")
+        filter_box.bind("<<ComboboxSelected>>", lambda _event: self._show_page(0))
+
+        self._tree = ttk.Treeview(
+            self.top, columns=("fila", "estado", "clave", "detalle"), show="headings", height=12
+        )
+        for column, heading, width in (
+            ("fila", "Fila", 60),
+            ("estado", "Estado", 100),
+            ("clave", "Clave técnica", 220),
+            ("detalle", "Detalle", 360),
+        ):
+            self._tree.heading(column, text=heading)
+            self._tree.column(column, width=width, anchor="w", stretch=column == "detalle")
+        self._tree.grid(row=2, column=0, columnspan=4, padx=10, pady=5, sticky="nsew")
+
+        self._page_var = tk.StringVar()
+        self._prev_button = ttk.Button(self.top, text="Anterior", command=lambda: self._show_page(self._page - 1))
+        self._prev_button.grid(row=3, column=0, padx=10, pady=5, sticky="w")
+        ttk.Label(self.top, textvariable=self._page_var).grid(row=3, column=1, pady=5)
+        self._next_button = ttk.Button(self.top, text="Siguiente", command=lambda: self._show_page(self._page + 1))
+        self._next_button.grid(row=3, column=2, padx=10, pady=5, sticky="e")
+
+        ttk.Button(self.top, text="Descartar", command=self.discard).grid(
+            row=4, column=2, padx=5, pady=(5, 10), sticky="e"
+        )
+        commit_button = ttk.Button(self.top, text="Importar", command=self.commit)
+        commit_button.grid(row=4, column=3, padx=10, pady=(5, 10), sticky="e")
+        if not preview.has_changes:
+            commit_button.state(["disabled"])
+        self.top.columnconfigure(3, weight=1)
+        self.top.rowconfigure(2, weight=1)
+        self._show_page(0)
+
+    def _selected_status(self) -> str:
+        label = self._filter_var.get()
+        return next((status for status, text in _FILTER_LABELS.items() if text == label), "")
+
+    def _show_page(self, index: int) -> None:
+        status = self._selected_status()
+        total_pages = self.preview.page_count(status, self._page_size)
+        self._page = min(max(0, index), total_pages - 1)
+        self._tree.delete(*self._tree.get_children())
+        for row in self.preview.page(self._page, status=status, page_size=self._page_size):
+            self._tree.insert("", "end", values=(row.row_number, row.status, row.key, "; ".join(row.messages)))
+        self._page_var.set(f"Página {self._page + 1} de {total_pages}")
+        self._prev_button.state(["!disabled"] if self._page > 0 else ["disabled"])
+        self._next_button.state(["!disabled"] if self._page < total_pages - 1 else ["disabled"])
+
+    def commit(self) -> None:
+        if self._close():
+            self._on_commit()
+
+    def discard(self) -> None:
+        if self._close() and self._on_discard:
+            self._on_discard()
+
+    def _close(self) -> bool:
+        if self._closed:
+            return False
+        self._closed = True
+        try:
+            self.top.grab_release()
+            self.top.destroy()
+        except tk.TclError:
+            pass
+        return True
@@ -0,0 +1,78 @@
+"""Carga diferida de módulos pesados para acelerar el arranque de la UI.
+
+Los generadores de reportes dependen de ``python-docx``, ``python-pptx`` y
+``transformers``; importarlos al abrir la aplicación cuesta cientos de
+milisegundos aunque la mayoría de sesiones nunca exporte un PPT. Este
+módulo ofrece un proxy que importa el módulo real la primera vez que se
+usa y funciones envoltorio que conservan la firma de llamada original.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+from functools import lru_cache
+from threading import RLock
+from types import ModuleType
+from typing import Any, Callable
+
+
+@lru_cache(maxsize=None)
+def module_available(module_name: str) -> bool:
+    """Indica si ``module_name`` puede importarse sin llegar a importarlo."""
+
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class LazyModule:
+    """Proxy que importa ``module_name`` al primer acceso a un atributo."""
+
+    __slots__ = ("_module_name", "_module", "_lock")
+
+    def __init__(self, module_name: str):
+        self._module_name = module_name
+        self._module: ModuleType | None = None
+        self._lock = RLock()
+
+    @property
+    def module_name(self) -> str:
+        return self._module_name
+
+    @property
+    def loaded(self) -> bool:
+        return self._module is not None
+
+    def load(self) -> ModuleType:
+        module = self._module
+        if module is None:
+            with self._lock:
+                module = self._module
+                if module is None:
+                    module = importlib.import_module(self._module_name)
+                    self._module = module
+        return module
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.load(), name)
+
+    def __repr__(self) -> str:
+        state = "cargado" if self.loaded else "diferido"
+        return f"<LazyModule {self._module_name!r} ({state})>"
+
+
+def lazy_callable(module: LazyModule, attribute: str) -> Callable[..., Any]:
+    """Devuelve un envoltorio que resuelve ``module.attribute`` al invocarse."""
+
+    def _call(*args: Any, **kwargs: Any) -> Any:
+        return getattr(module.load(), attribute)(*args, **kwargs)
+
+    _call.__name__ = attribute
+    _call.__qualname__ = attribute
+    _call.__doc__ = f"Envoltorio diferido de ``{module.module_name}.{attribute}``."
+    return _call
+
+
+__all__ = ["LazyModule", "lazy_callable", "module_available"]
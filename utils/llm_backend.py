@@ -0,0 +1,175 @@
+"""Carga del modelo local de resúmenes optimizada para CPU.
+
+Los equipos no tienen GPU, así que el modelo seq2seq corre en PyTorch sobre
+CPU. Además del modo ``fp32`` original, el backend ``int8`` aplica
+cuantización dinámica a las capas lineales (``torch.quantization.quantize_dynamic``),
+que concentran casi todo el cómputo de la generación. Los pesos cuantizados
+se guardan una sola vez junto al modelo en la unidad externa; las cargas
+siguientes construyen la arquitectura desde la configuración y leen esos
+pesos sin pasar por los de ``fp32``.
+
+``torch`` y ``transformers`` son opcionales: el módulo se importa sin ellos y
+solo falla al intentar cargar un modelo.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+from contextlib import nullcontext
+from importlib import util as importlib_util
+from pathlib import Path
+from typing import ContextManager, Optional
+
+logger = logging.getLogger(__name__)
+
+BACKEND_FP32 = "fp32"
+BACKEND_INT8 = "int8"
+BACKENDS = (BACKEND_FP32, BACKEND_INT8)
+
+TORCH_AVAILABLE = importlib_util.find_spec("torch") is not None
+QUANTIZED_DIRNAME = "quantized"
+
+
+def normalize_backend(backend: Optional[str]) -> str:
+    """Devuelve ``backend`` en minúsculas; valores desconocidos usan ``fp32``."""
+
+    value = (backend or BACKEND_FP32).strip().lower()
+    if value not in BACKENDS:
+        logger.warning("Backend de inferencia desconocido %r; se usa %s.", backend, BACKEND_FP32)
+        return BACKEND_FP32
+    return value
+
+
+def resolve_num_threads(requested: Optional[int] = None) -> int:
+    """Hilos de cómputo a usar: ``requested`` si es positivo, si no todos los núcleos."""
+
+    if requested and requested > 0:
+        return int(requested)
+    return max(1, os.cpu_count() or 1)
+
+
+def configure_torch_threads(num_threads: Optional[int] = None) -> int:
+    """Ajusta ``torch.set_num_threads`` y devuelve el valor aplicado."""
+
+    import torch
+
+    threads = resolve_num_threads(num_threads)
+    if torch.get_num_threads() != threads:
+        torch.set_num_threads(threads)
+    return threads
+
+
+def inference_context() -> ContextManager:
+    """``torch.inference_mode()`` si PyTorch está instalado; si no, un contexto vacío."""
+
+    if not TORCH_AVAILABLE:
+        return nullcontext()
+    import torch
+
+    return torch.inference_mode()
+
+
+def quantized_cache_path(model_ref: str | Path, cache_dir: str | Path, torch_version: str) -> Path:
+    """Ruta de los pesos ``int8`` de ``model_ref``.
+
+    Si ``model_ref`` es una carpeta local, los pesos van en su subcarpeta
+    ``quantized``; para un identificador del Hub se usa ``cache_dir``. La
+    versión de PyTorch forma parte del nombre porque el formato de los
+    parámetros empaquetados puede cambiar entre versiones.
+    """
+
+    version = re.sub(r"[^0-9A-Za-z.]+", "_", torch_version)
+    filename = f"int8-torch{version}.pt"
+    local = Path(model_ref)
+    if local.is_dir():
+        return local / QUANTIZED_DIRNAME / filename
+    safe_name = re.sub(r"[^0-9A-Za-z._-]+", "__", str(model_ref)).strip("_") or "modelo"
+    return Path(cache_dir) / safe_name / filename
+
+
+def quantize_linear_layers(model):
+    """Cuantización dinámica ``qint8`` de las capas ``nn.Linear`` de ``model``."""
+
+    import torch
+
+    return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def _load_generation_config(model_ref: str | Path, config, *, local_files_only: bool = False):
+    """``generation_config.json`` de ``model_ref`` o, si no existe, el derivado de ``config``.
+
+    ``from_config`` no lee ese archivo, así que sin esto el modelo cargado
+    desde la caché ``int8`` generaría con otros tokens especiales y límites.
+    """
+
+    from transformers import GenerationConfig
+
+    try:
+        return GenerationConfig.from_pretrained(str(model_ref), local_files_only=local_files_only)
+    except (OSError, ValueError):
+        return GenerationConfig.from_model_config(config)
+
+
+def load_seq2seq_model(
+    model_ref: str | Path,
+    *,
+    backend: Optional[str] = BACKEND_FP32,
+    num_threads: Optional[int] = None,
+    cache_dir: Optional[str | Path] = None,
+    local_files_only: bool = False,
+):
+    """Carga ``(modelo, tokenizador)`` con el backend indicado, listo para inferencia."""
+
+    import torch
+    from transformers import AutoConfig, AutoModelForSeq2SeqLM, AutoTokenizer
+
+    backend = normalize_backend(backend)
+    configure_torch_threads(num_threads)
+    tokenizer = AutoTokenizer.from_pretrained(str(model_ref), local_files_only=local_files_only)
+    if backend == BACKEND_FP32:
+        model = AutoModelForSeq2SeqLM.from_pretrained(str(model_ref), local_files_only=local_files_only)
+        return model.eval(), tokenizer
+
+    cache_path = None
+    if cache_dir is not None or Path(model_ref).is_dir():
+        cache_path = quantized_cache_path(model_ref, cache_dir or ".", torch.__version__)
+    if cache_path is not None and cache_path.exists():
+        try:
+            config = AutoConfig.from_pretrained(str(model_ref), local_files_only=local_files_only)
+            model = quantize_linear_layers(AutoModelForSeq2SeqLM.from_config(config).eval())
+            model.load_state_dict(torch.load(cache_path, map_location="cpu"))
+            model.generation_config = _load_generation_config(
+                model_ref, config, local_files_only=local_files_only
+            )
+            return model.eval(), tokenizer
+        except Exception as exc:  # pragma: no cover - caché corrupta o de otra versión
+            logger.warning("Se regeneran los pesos int8 de %s (%s).", cache_path, exc)
+
+    model = AutoModelForSeq2SeqLM.from_pretrained(str(model_ref), local_files_only=local_files_only)
+    model = quantize_linear_layers(model.eval())
+    if cache_path is not None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            torch.save(model.state_dict(), tmp_path)
+            os.replace(tmp_path, cache_path)
+        except OSError as exc:
+            logger.warning("No se pudieron guardar los pesos int8 en %s: %s", cache_path, exc)
+    return model, tokenizer
+
+
+__all__ = [
+    "BACKEND_FP32",
+    "BACKEND_INT8",
+    "BACKENDS",
+    "TORCH_AVAILABLE",
+    "configure_torch_threads",
+    "inference_context",
+    "load_seq2seq_model",
+    "normalize_backend",
+    "quantize_linear_layers",
+    "quantized_cache_path",
+    "resolve_num_threads",
+]
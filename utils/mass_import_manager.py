@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import math
+from collections import Counter
+from concurrent.futures import CancelledError
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -8,6 +11,7 @@ from typing import Callable, Iterable
 import tkinter as tk
 from tkinter import messagebox
 
+from utils.technical_key import EMPTY_PART
 from validators import log_event
 
 
@@ -51,6 +55,197 @@ class MassImportSummary:
         return "\n".join(self.summary_lines)
 
 
+@dataclass
+class SummaryIngestSession:
+    """Estado acumulado al incorporar filas pegadas desde las tablas de resumen.
+
+    Permite aplicar las filas en varios tramos y ejecutar una sola vez los
+    avisos finales. ``prepared`` guarda, por fila, el payload hidratado en
+    segundo plano para que el hilo de Tk no vuelva a consultar los catálogos.
+    """
+
+    section: str
+    case_id: str = ""
+    prepared: list | None = None
+    next_index: int = 1
+    processed: int = 0
+    created: int = 0
+    updated: int = 0
+    missing_ids: list[str] = field(default_factory=list)
+    unhydrated_ids: list[str] = field(default_factory=list)
+    duplicate_ids: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+    _known_ids: set[str] | None = field(default=None, repr=False)
+
+    def count(self, *, created: bool) -> None:
+        self.processed += 1
+        if created:
+            self.created += 1
+        else:
+            self.updated += 1
+
+    def known_ids(self, frames) -> set[str]:
+        """Identificadores presentes en ``frames`` al iniciar la sesión."""
+
+        if self._known_ids is None:
+            self._known_ids = {
+                (frame.id_var.get() or "").strip() for frame in frames or []
+            }
+        return self._known_ids
+
+
+PREVIEW_NEW = "nuevo"
+PREVIEW_UPDATED = "actualizado"
+PREVIEW_DUPLICATE = "duplicado"
+PREVIEW_ERROR = "error"
+PREVIEW_STATUSES = (PREVIEW_NEW, PREVIEW_UPDATED, PREVIEW_DUPLICATE, PREVIEW_ERROR)
+PREVIEW_PAGE_SIZE = 50
+
+
+@dataclass
+class ImportPreviewSpec:
+    """Reglas de la vista previa de una importación.
+
+    Se arma en el hilo de Tk (con una foto de los IDs del formulario) y se
+    evalúa en el trabajador. ``key_for`` devuelve la clave técnica de cada
+    entrada: vacía si falta el identificador y ``None`` si la fila no se
+    deduplica. ``is_existing`` indica si la entrada ya está en el formulario
+    (también sin clave) y ``existing_status`` cómo la tratará la importación. ``check`` devuelve
+    ``(errores, observaciones)``: los errores descartan la fila igual que al
+    aplicarla; las observaciones solo se muestran.
+
+    Si la importación deduplica partes de la fila y no la fila completa,
+    ``items_for`` la divide en esas partes y cada una se clasifica por
+    separado con las reglas anteriores. ``keep_repeated`` indica si una
+    parte con clave repetida se aplica igual (se cuenta como actualizada).
+    """
+
+    key_for: Callable[[object], object]
+    is_existing: Callable[[object, object], bool] = lambda _entry, _key: False
+    existing_status: str = PREVIEW_DUPLICATE
+    check: Callable[[object], tuple[list[str], list[str]]] | None = None
+    items_for: Callable[[object], Iterable[object]] | None = None
+    keep_repeated: Callable[[object], bool] = lambda _item: False
+
+
+@dataclass
+class ImportPreviewRow:
+    row_number: int
+    status: str
+    key: str
+    messages: list[str] = field(default_factory=list)
+
+
+@dataclass
+class ImportPreview:
+    """Clasificación de una importación calculada antes de tocar el formulario.
+
+    ``payload`` es el resultado del trabajador tal cual, de modo que
+    confirmar la importación no vuelve a leer ni hidratar el archivo.
+    """
+
+    import_type: str
+    file_path: Path
+    payload: list
+    rows: list[ImportPreviewRow] = field(default_factory=list)
+    counts: Counter = field(default_factory=Counter)
+    observations: int = 0
+
+    @property
+    def has_changes(self) -> bool:
+        return (self.counts[PREVIEW_NEW] + self.counts[PREVIEW_UPDATED]) > 0
+
+    def filtered(self, status: str | None = None) -> list[ImportPreviewRow]:
+        if not status:
+            return self.rows
+        return [row for row in self.rows if row.status == status]
+
+    def page_count(self, status: str | None = None, page_size: int = PREVIEW_PAGE_SIZE) -> int:
+        return max(1, math.ceil(len(self.filtered(status)) / max(1, page_size)))
+
+    def page(self, index: int, *, status: str | None = None, page_size: int = PREVIEW_PAGE_SIZE) -> list[ImportPreviewRow]:
+        page_size = max(1, page_size)
+        index = min(max(0, index), self.page_count(status, page_size) - 1)
+        start = index * page_size
+        return self.filtered(status)[start:start + page_size]
+
+    def samples(self, status: str, limit: int = 3) -> list[ImportPreviewRow]:
+        return self.page(0, status=status, page_size=limit) if self.counts[status] else []
+
+    @property
+    def summary_lines(self) -> list[str]:
+        lines = [
+            f"Vista previa de {self.import_type} ({self.file_path.name}):",
+            f"{self.counts[PREVIEW_NEW]} registros nuevos",
+            f"{self.counts[PREVIEW_UPDATED]} registros actualizados",
+            f"{self.counts[PREVIEW_DUPLICATE]} duplicados omitidos",
+            f"{self.counts[PREVIEW_ERROR]} filas con errores",
+        ]
+        if self.observations:
+            lines.append(f"{self.observations} filas con observaciones")
+        return lines
+
+    @property
+    def summary_text(self) -> str:
+        return "\n".join(self.summary_lines)
+
+
+def _format_preview_key(key) -> str:
+    if isinstance(key, tuple):
+        return " / ".join(str(part) for part in key if part and part != EMPTY_PART)
+    return str(key or "")
+
+
+def build_import_preview(
+    import_type: str,
+    file_path: str | Path,
+    payload,
+    spec: ImportPreviewSpec,
+    *,
+    cancel_event=None,
+) -> ImportPreview:
+    """Clasifica cada entrada del trabajador como nueva, actualizada, duplicada o con error."""
+
+    entries = list(payload or [])
+    preview = ImportPreview(import_type=import_type, file_path=Path(file_path), payload=entries)
+    seen: set = set()
+    for index, entry in enumerate(entries, start=1):
+        if cancel_event is not None and index % 256 == 0 and cancel_event.is_set():
+            raise CancelledError()
+        for item in (spec.items_for(entry) if spec.items_for else (entry,)):
+            key = spec.key_for(item)
+            errors, observations = spec.check(item) if spec.check else ([], [])
+            if key is not None and not key:
+                status = PREVIEW_ERROR
+                errors = ["Fila sin identificador", *errors]
+            elif errors:
+                status = PREVIEW_ERROR
+            elif key is None:
+                status = spec.existing_status if spec.is_existing(item, key) else PREVIEW_NEW
+            elif key in seen:
+                status = PREVIEW_UPDATED if spec.keep_repeated(item) else PREVIEW_DUPLICATE
+            elif spec.is_existing(item, key):
+                seen.add(key)
+                status = spec.existing_status
+            else:
+                seen.add(key)
+                status = PREVIEW_NEW
+            if observations and status in {PREVIEW_NEW, PREVIEW_UPDATED}:
+                preview.observations += 1
+            else:
+                observations = []
+            preview.counts[status] += 1
+            preview.rows.append(
+                ImportPreviewRow(
+                    row_number=index,
+                    status=status,
+                    key=_format_preview_key(key),
+                    messages=[*errors, *observations],
+                )
+            )
+    return preview
+
+
 class MassImportManager:
     """Gestiona el resumen y registro de importaciones masivas."""
 
@@ -74,8 +269,14 @@ class MassImportManager:
         click_log: str | None = None,
         start_log: str | None = None,
         log_handler: Callable[[str, str], None] | None = None,
+        preview_spec_factory: Callable[[], ImportPreviewSpec | None] | None = None,
     ) -> None:
-        """Centraliza la selección, validación y ejecución de importaciones masivas."""
+        """Centraliza la selección, validación y ejecución de importaciones masivas.
+
+        Con ``preview_spec_factory`` (y la vista previa habilitada en la app),
+        el trabajador también clasifica las filas y la app muestra el resumen
+        antes de aplicarlas; confirmar reutiliza el payload ya calculado.
+        """
 
         logger = log_handler or (lambda category, message: log_event(category, message, getattr(app, "logs", None)))
         if click_log:
@@ -116,12 +317,29 @@ class MassImportManager:
             _notify_ui_error(exc)
             return
 
+        apply_payload = lambda payload: ui_callback(payload, file_path)
         try:
+            preview_enabled = getattr(app, "_import_preview_enabled", None)
+            spec = (
+                preview_spec_factory()
+                if preview_spec_factory is not None and callable(preview_enabled) and preview_enabled()
+                else None
+            )
+            if spec is not None:
+                worker = self._wrap_preview_worker(worker, task_label, file_path, spec)
+                commit = apply_payload
+                apply_payload = lambda preview: app._show_import_preview(
+                    preview,
+                    task_label=task_label,
+                    on_commit=lambda: commit(preview.payload),
+                    error_prefix=ui_error_prefix or error_prefix,
+                    button=button,
+                )
             app._start_background_import(
                 task_label,
                 button,
                 worker,
-                lambda payload: ui_callback(payload, file_path),
+                apply_payload,
                 error_prefix,
                 ui_error_prefix,
             )
@@ -132,6 +350,14 @@ class MassImportManager:
             if getattr(app, "_suppress_messagebox", False):
                 raise
 
+    @staticmethod
+    def _wrap_preview_worker(worker, task_label: str, file_path: str, spec: ImportPreviewSpec):
+        def preview_worker(progress_callback, cancel_event):
+            payload = worker(progress_callback, cancel_event)
+            return build_import_preview(task_label, file_path, payload, spec, cancel_event=cancel_event)
+
+        return preview_worker
+
     def run_import(
         self,
         file_path: str | Path,
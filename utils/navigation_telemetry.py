@@ -0,0 +1,260 @@
+"""Telemetría de navegación compacta para los eventos globales de foco y clic.
+
+``_handle_global_navigation_event`` está enlazado con ``bind_all`` a cada
+``<FocusIn>``, ``<FocusOut>`` y ``<Button-1>``. En modo detallado cada evento
+genera una fila saneada de bitácora; al recorrer un formulario con el
+teclado eso son dos filas por salto de campo.
+
+``NavigationTelemetry`` registra cada evento como un registro de tamaño fijo
+(código de evento, identificador de widget internado, coordenadas por zona y
+marca ``monotonic``) dentro de un anillo de ``array`` preasignado. Cuando el
+anillo se llena se entrega a un hilo de fondo que lo agrega, y ``flush``
+devuelve solo los totales para escribir filas resumidas en la bitácora.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from array import array
+from collections import Counter
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+EVENT_CODES = {"focus_in": 0, "focus_out": 1, "click": 2}
+EVENT_NAMES = {code: name for name, code in EVENT_CODES.items()}
+UNKNOWN_EVENT_CODE = len(EVENT_CODES)
+
+DEFAULT_CAPACITY = 4096
+# Valor centinela fuera de rango para eventos sin coordenadas.
+NO_COORD = -(2**31)
+_MAX_COORD = 2**31 - 1
+
+
+@dataclass
+class NavigationSummary:
+    """Totales agregados desde el último ``flush``."""
+
+    widget_counts: Counter = field(default_factory=Counter)
+    event_counts: Counter = field(default_factory=Counter)
+    widget_event_counts: Counter = field(default_factory=Counter)
+    heatmap_counts: Counter = field(default_factory=Counter)
+    recorded: int = 0
+    sampled_out: int = 0
+    first_ts: Optional[float] = None
+    last_ts: Optional[float] = None
+
+    def merge(self, other: "NavigationSummary") -> None:
+        self.widget_counts.update(other.widget_counts)
+        self.event_counts.update(other.event_counts)
+        self.widget_event_counts.update(other.widget_event_counts)
+        self.heatmap_counts.update(other.heatmap_counts)
+        self.recorded += other.recorded
+        self.sampled_out += other.sampled_out
+        if other.first_ts is not None and (self.first_ts is None or other.first_ts < self.first_ts):
+            self.first_ts = other.first_ts
+        if other.last_ts is not None and (self.last_ts is None or other.last_ts > self.last_ts):
+            self.last_ts = other.last_ts
+
+    def is_empty(self) -> bool:
+        return not self.recorded
+
+
+class _Ring:
+    """Columnas preasignadas de un bloque de registros."""
+
+    __slots__ = ("codes", "widgets", "xs", "ys", "stamps", "size")
+
+    def __init__(self, capacity: int):
+        self.codes = array("b", bytes(capacity))
+        self.widgets = array("i", [0]) * capacity
+        self.xs = array("i", [0]) * capacity
+        self.ys = array("i", [0]) * capacity
+        self.stamps = array("d", [0.0]) * capacity
+        self.size = 0
+
+
+class NavigationTelemetry:
+    """Anillo de registros compactos con agregación en segundo plano."""
+
+    def __init__(
+        self,
+        *,
+        capacity: int = DEFAULT_CAPACITY,
+        sample_rate: float = 1.0,
+        bucket_size: int = 100,
+        executor: Optional[Executor] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.capacity = max(1, int(capacity))
+        self.bucket_size = max(1, int(bucket_size))
+        self._executor = executor
+        self._clock = clock
+        self._active = _Ring(self.capacity)
+        self._spare: list[_Ring] = []
+        self._pending: list[Future] = []
+        self._summary = NavigationSummary()
+        self._summary_lock = threading.Lock()
+        self._widget_ids: dict[str, int] = {}
+        self._key_index: dict[object, int] = {}
+        self._widget_names: list[str] = []
+        self._sample_counter = 0
+        self._sampled_out = 0
+        self.sample_rate = sample_rate
+
+    # ------------------------------------------------------------------
+    # Configuración
+    @property
+    def sample_rate(self) -> float:
+        return self._sample_rate
+
+    @sample_rate.setter
+    def sample_rate(self, value: float) -> None:
+        try:
+            rate = float(value)
+        except (TypeError, ValueError):
+            rate = 1.0
+        if math.isnan(rate) or rate <= 0:
+            rate = 0.0
+        self._sample_rate = min(rate, 1.0)
+        # Muestreo determinista: se conserva uno de cada ``stride`` eventos.
+        self._stride = round(1 / self._sample_rate) if self._sample_rate else 0
+
+    # ------------------------------------------------------------------
+    # Registro (hilo de Tk)
+    def should_sample(self) -> bool:
+        """Indica si el próximo evento debe registrarse según la tasa."""
+
+        if self._stride == 1:
+            return True
+        if not self._stride:
+            self._sampled_out += 1
+            return False
+        self._sample_counter += 1
+        if self._sample_counter >= self._stride:
+            self._sample_counter = 0
+            return True
+        self._sampled_out += 1
+        return False
+
+    def intern_widget(self, widget_id: str) -> int:
+        index = self._widget_ids.get(widget_id)
+        if index is None:
+            index = len(self._widget_names)
+            self._widget_ids[widget_id] = index
+            self._widget_names.append(widget_id)
+        return index
+
+    def widget_index(self, key: object, resolve: Callable[[], str]) -> int:
+        """Devuelve el índice internado para ``key`` resolviéndolo una sola vez.
+
+        ``key`` suele ser la ruta Tk del widget, de modo que el identificador
+        lógico (registro de widgets o descripción) solo se calcula la primera
+        vez que el widget recibe un evento.
+        """
+
+        index = self._key_index.get(key)
+        if index is None:
+            index = self.intern_widget(resolve() or "widget")
+            self._key_index[key] = index
+        return index
+
+    def record(self, subtype: str, widget_index: int, x_root=None, y_root=None) -> None:
+        """Agrega un registro al anillo; no asigna memoria salvo al rotar."""
+
+        ring = self._active
+        slot = ring.size
+        ring.codes[slot] = EVENT_CODES.get(subtype, UNKNOWN_EVENT_CODE)
+        ring.widgets[slot] = widget_index
+        ring.xs[slot] = self._bucket(x_root)
+        ring.ys[slot] = self._bucket(y_root)
+        ring.stamps[slot] = self._clock()
+        ring.size = slot + 1
+        if ring.size >= self.capacity:
+            self._rotate()
+
+    def pending_records(self) -> int:
+        return self._active.size
+
+    # ------------------------------------------------------------------
+    # Agregación
+    def flush(self) -> NavigationSummary:
+        """Agrega lo pendiente y devuelve (y reinicia) el resumen acumulado."""
+
+        self._rotate()
+        for future in self._pending:
+            future.result()
+        self._pending.clear()
+        with self._summary_lock:
+            summary = self._summary
+            self._summary = NavigationSummary()
+        summary.sampled_out += self._sampled_out
+        self._sampled_out = 0
+        return summary
+
+    def reset(self) -> None:
+        self.flush()
+        self._sample_counter = 0
+
+    def widget_name(self, index: int) -> str:
+        return self._widget_names[index]
+
+    def _bucket(self, value) -> int:
+        if value is None:
+            return NO_COORD
+        try:
+            coord = float(value)
+        except (TypeError, ValueError):
+            return NO_COORD
+        if math.isnan(coord) or math.isinf(coord) or abs(coord) >= _MAX_COORD:
+            return NO_COORD
+        return int(coord // self.bucket_size * self.bucket_size)
+
+    def _rotate(self) -> None:
+        full = self._active
+        if not full.size:
+            return
+        with self._summary_lock:
+            spare = self._spare.pop() if self._spare else None
+        self._active = spare or _Ring(self.capacity)
+        names = self._widget_names
+        if self._executor is None:
+            self._aggregate(full, names)
+            return
+        self._pending = [future for future in self._pending if not future.done()]
+        try:
+            self._pending.append(self._executor.submit(self._aggregate, full, names))
+        except RuntimeError:
+            self._aggregate(full, names)
+
+    def _aggregate(self, ring: _Ring, names: list[str]) -> None:
+        partial = NavigationSummary()
+        codes, widgets, xs, ys = ring.codes, ring.widgets, ring.xs, ring.ys
+        size = ring.size
+        pairs = Counter(zip(widgets[:size], codes[:size]))
+        for (widget_index, code), count in pairs.items():
+            name = names[widget_index]
+            event_name = EVENT_NAMES.get(code, "otro")
+            partial.widget_counts[name] += count
+            partial.event_counts[event_name] += count
+            partial.widget_event_counts[(name, event_name)] += count
+        partial.heatmap_counts.update(
+            (x, y) for x, y in zip(xs[:size], ys[:size]) if x != NO_COORD and y != NO_COORD
+        )
+        partial.recorded = size
+        partial.first_ts = ring.stamps[0]
+        partial.last_ts = ring.stamps[size - 1]
+        ring.size = 0
+        with self._summary_lock:
+            self._summary.merge(partial)
+            self._spare.append(ring)
+
+
+__all__ = [
+    "DEFAULT_CAPACITY",
+    "EVENT_CODES",
+    "NavigationSummary",
+    "NavigationTelemetry",
+]
@@ -0,0 +1,133 @@
+"""Listas de opciones versionadas compartidas entre muchos ``Combobox``.
+
+Cada alta o baja de clientes/colaboradores recorría todos los productos y
+reconfiguraba cada ``Combobox`` con la lista completa de IDs. Con
+``SharedOptionSource`` los cambios solo incrementan una versión (O(1)); cada
+``Combobox`` adjunto vuelve a leer los valores en su ``postcommand``, es
+decir, únicamente cuando el usuario despliega la lista y su copia quedó
+desactualizada.
+"""
+
+from __future__ import annotations
+
+import tkinter as tk
+from typing import Callable, Iterable, Optional
+
+OptionsProvider = Callable[[], Iterable[str]]
+
+_VERSION_ATTR = "_shared_option_version"
+
+
+class SharedOptionSource:
+    """Fuente de opciones con versión y cálculo diferido.
+
+    La instancia es invocable y devuelve la lista vigente, por lo que puede
+    sustituir a los ``options_getter`` existentes sin cambiar su contrato.
+    """
+
+    def __init__(self, provider: OptionsProvider, *, name: str = "opciones"):
+        self._provider = provider
+        self.name = name
+        self._version = 0
+        self._computed_version = -1
+        self._options: tuple[str, ...] = ()
+        self._known: frozenset[str] = frozenset()
+        self._baseline: Optional[frozenset[str]] = None
+        self.stats = {"invalidations": 0, "recomputes": 0, "widget_syncs": 0}
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def __call__(self) -> list[str]:
+        return self.options()
+
+    def invalidate(self) -> None:
+        """Marca las opciones como desactualizadas sin tocar ningún widget."""
+
+        self._version += 1
+        self.stats["invalidations"] += 1
+
+    def options(self) -> list[str]:
+        self._ensure_current()
+        return list(self._options)
+
+    def known(self) -> frozenset[str]:
+        """Conjunto normalizado de IDs vigentes (útil para validaciones)."""
+
+        self._ensure_current()
+        return self._known
+
+    def pop_removed(self) -> frozenset[str]:
+        """Devuelve los IDs que desaparecieron desde la última consulta.
+
+        Permite liberar solo las selecciones que apuntaban a un ID eliminado
+        o renombrado; en altas el resultado es vacío y no se recorre nada.
+        """
+
+        current = self.known()
+        previous = self._baseline
+        self._baseline = current
+        if previous is None:
+            return frozenset()
+        return previous - current
+
+    def attach(self, combobox) -> None:
+        """Sincroniza ``combobox`` de forma diferida al desplegar su lista."""
+
+        try:
+            previous = combobox.cget("postcommand")
+        except (tk.TclError, AttributeError):
+            previous = ""
+
+        def _on_post():
+            self.sync(combobox)
+            if previous:
+                try:
+                    combobox.tk.eval(previous)
+                except (tk.TclError, AttributeError):
+                    pass
+
+        try:
+            combobox.configure(postcommand=_on_post)
+        except (tk.TclError, AttributeError):
+            return
+        self._mark_synced(combobox)
+
+    def sync(self, combobox) -> bool:
+        """Actualiza ``values`` en ``combobox`` solo si su versión es antigua."""
+
+        if getattr(combobox, _VERSION_ATTR, None) == self._version:
+            return False
+        try:
+            combobox.configure(values=self.options())
+        except (tk.TclError, AttributeError):
+            return False
+        self._mark_synced(combobox)
+        self.stats["widget_syncs"] += 1
+        return True
+
+    def is_stale(self, combobox) -> bool:
+        return getattr(combobox, _VERSION_ATTR, None) != self._version
+
+    def _mark_synced(self, combobox) -> None:
+        try:
+            setattr(combobox, _VERSION_ATTR, self._version)
+        except AttributeError:
+            pass
+
+    def _ensure_current(self) -> None:
+        if self._computed_version == self._version:
+            return
+        options = tuple(self._provider() or ())
+        self._options = options
+        self._known = frozenset(option.strip() for option in options if option and option.strip())
+        self._computed_version = self._version
+        self.stats["recomputes"] += 1
+
+
+def is_shared_source(getter) -> bool:
+    return isinstance(getter, SharedOptionSource)
+
+
+__all__ = ["SharedOptionSource", "is_shared_source"]
@@ -0,0 +1,101 @@
+"""Panel flotante con el estado de rendimiento de la aplicación.
+
+Muestra el retraso del bucle de eventos de Tk que mide ``LoopLagMonitor``,
+la profundidad de la cola de cada ejecutor de ``background_worker`` y los
+últimos callbacks lentos que registró el perfilador. Solo lee contadores ya
+calculados, así que refrescarlo cada medio segundo no añade trabajo real.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Mapping, Optional
+
+import tkinter as tk
+from tkinter import ttk
+
+from utils.background_worker import executor_queue_depths
+from utils.perf_profiler import PerfProfiler, get_profiler
+
+DEFAULT_REFRESH_MS = 500
+
+
+def format_hud_lines(
+    profiler: PerfProfiler,
+    queue_depths: Mapping[str, int],
+) -> list[str]:
+    """Devuelve las líneas de texto del panel (separado para probarlo sin Tk)."""
+
+    lines = [
+        f"Retraso del bucle: {profiler.loop_lag_ms:.1f} ms (máx. {profiler.max_loop_lag_ms:.1f} ms)",
+        f"Muestreo: {profiler.sample_rate:.0%} · eventos en memoria: {profiler.event_count()}",
+    ]
+    if queue_depths:
+        depths = ", ".join(f"{name}={depth}" for name, depth in sorted(queue_depths.items()))
+        lines.append(f"Colas de fondo: {depths}")
+    else:
+        lines.append("Colas de fondo: sin ejecutores activos")
+    slow = list(profiler.slow_callbacks)
+    lines.append(f"Callbacks lentos (≥ {profiler.slow_callback_ms:.0f} ms): {len(slow)}")
+    for entry in reversed(slow):
+        lines.append(f"  {entry.duration_ms:8.1f} ms  {entry.category}: {entry.name}")
+    return lines
+
+
+class PerfHud:
+    """Ventana no modal que se refresca mientras está abierta."""
+
+    def __init__(
+        self,
+        parent: tk.Misc,
+        *,
+        profiler: Optional[PerfProfiler] = None,
+        queue_depths: Callable[[], Mapping[str, int]] = executor_queue_depths,
+        refresh_ms: int = DEFAULT_REFRESH_MS,
+    ) -> None:
+        self.parent = parent
+        self.profiler = profiler or get_profiler()
+        self._queue_depths = queue_depths
+        self._refresh_ms = refresh_ms
+        self._job_id: str | None = None
+
+        self.top = tk.Toplevel(parent)
+        self.top.title("Rendimiento")
+        self.top.transient(parent)
+        self.top.attributes("-topmost", True)
+        self.top.protocol("WM_DELETE_WINDOW", self.close)
+        self._text_var = tk.StringVar(value="")
+        ttk.Label(self.top, textvariable=self._text_var, justify="left", font="TkFixedFont").grid(
+            row=0, column=0, padx=10, pady=10, sticky="nw"
+        )
+        self.refresh()
+
+    def is_open(self) -> bool:
+        return self.top is not None
+
+    def refresh(self) -> None:
+        self._job_id = None
+        if self.top is None:
+            return
+        try:
+            self._text_var.set("\n".join(format_hud_lines(self.profiler, self._queue_depths())))
+            self._job_id = self.top.after(self._refresh_ms, self.refresh)
+        except tk.TclError:
+            self.top = None
+
+    def close(self) -> None:
+        top, self.top = self.top, None
+        if top is None:
+            return
+        if self._job_id is not None:
+            try:
+                top.after_cancel(self._job_id)
+            except tk.TclError:
+                pass
+            self._job_id = None
+        try:
+            top.destroy()
+        except tk.TclError:
+            pass
+
+
+__all__ = ["PerfHud", "format_hud_lines"]
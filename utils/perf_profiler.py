@@ -0,0 +1,437 @@
+"""Perfilado opcional de tareas de fondo, callbacks de Tk y fases de guardado.
+
+``PerfProfiler`` mide tramos (``span``) con ``perf_counter`` y los guarda en
+un ``deque`` acotado como tuplas pequeñas; solo al exportar se convierten al
+formato de eventos de Chrome (``chrome://tracing`` o Perfetto). Además
+acumula por categoría el número de tramos, el tiempo total y el máximo, y
+conserva los últimos callbacks lentos para el panel de rendimiento.
+
+Está desactivado por defecto. Al activarlo se puede fijar una tasa de
+muestreo: igual que ``NavigationTelemetry``, se conserva uno de cada
+``stride`` tramos de forma determinista y los descartados no llegan a
+cronometrarse, de modo que el costo con muestreo bajo es un contador.
+
+``LoopLagMonitor`` programa un latido periódico con ``after`` y registra
+cuánto se retrasa respecto a lo previsto, que es el retraso del bucle de
+eventos de Tk. ``instrument_after`` envuelve ``after``/``after_idle`` de un
+widget para cronometrar los callbacks que se programan a través de él.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Mapping, Optional
+
+DEFAULT_CAPACITY = 50_000
+DEFAULT_SLOW_CALLBACK_MS = 50.0
+DEFAULT_SLOW_HISTORY = 20
+DEFAULT_LAG_INTERVAL_MS = 250
+
+_PHASE_COMPLETE = "X"
+_PHASE_COUNTER = "C"
+
+
+@dataclass
+class SpanStats:
+    """Totales de los tramos de un mismo nombre y categoría."""
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def add(self, duration: float) -> None:
+        self.count += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 3),
+            "mean_ms": round(self.mean * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+@dataclass(frozen=True)
+class SlowCallback:
+    """Callback del hilo de Tk que superó el umbral configurado."""
+
+    name: str
+    category: str
+    duration_ms: float
+    timestamp: float
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("_profiler", "_name", "_category", "_args", "_callback", "_start")
+
+    def __init__(self, profiler: "PerfProfiler", name: str, category: str, args, callback: bool):
+        self._profiler = profiler
+        self._name = name
+        self._category = category
+        self._args = args
+        self._callback = callback
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = self._profiler.now()
+        return self
+
+    def __exit__(self, *_exc):
+        profiler = self._profiler
+        profiler.record_span(
+            self._name,
+            self._category,
+            self._start,
+            profiler.now() - self._start,
+            self._args or None,
+            callback=self._callback,
+        )
+        return False
+
+
+class PerfProfiler:
+    """Registro acotado de tramos con muestreo y agregados por categoría."""
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = False,
+        sample_rate: float = 1.0,
+        capacity: int = DEFAULT_CAPACITY,
+        slow_callback_ms: float = DEFAULT_SLOW_CALLBACK_MS,
+        slow_history: int = DEFAULT_SLOW_HISTORY,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.enabled = bool(enabled)
+        self.slow_callback_ms = float(slow_callback_ms)
+        self._clock = clock
+        self._origin = clock()
+        self._lock = threading.Lock()
+        self._events: deque[tuple] = deque(maxlen=max(1, int(capacity)))
+        self._stats: dict[tuple[str, str], SpanStats] = {}
+        self._thread_names: dict[int, str] = {}
+        self._ticket = itertools.count()
+        self.slow_callbacks: deque[SlowCallback] = deque(maxlen=max(1, int(slow_history)))
+        self.loop_lag_ms = 0.0
+        self.max_loop_lag_ms = 0.0
+        self.sample_rate = sample_rate
+
+    # ------------------------------------------------------------------
+    # Configuración
+    @property
+    def sample_rate(self) -> float:
+        return self._sample_rate
+
+    @sample_rate.setter
+    def sample_rate(self, value: float) -> None:
+        try:
+            rate = float(value)
+        except (TypeError, ValueError):
+            rate = 1.0
+        if math.isnan(rate) or rate <= 0:
+            rate = 0.0
+        self._sample_rate = min(rate, 1.0)
+        self._stride = round(1 / self._sample_rate) if self._sample_rate else 0
+
+    def now(self) -> float:
+        return self._clock()
+
+    def should_sample(self) -> bool:
+        """Indica si el próximo tramo debe cronometrarse."""
+
+        if not self.enabled:
+            return False
+        stride = self._stride
+        if stride == 1:
+            return True
+        if not stride:
+            return False
+        # ``next`` sobre ``itertools.count`` es atómico con el GIL, así que
+        # los hilos de fondo pueden muestrear sin tomar el candado.
+        return next(self._ticket) % stride == 0
+
+    # ------------------------------------------------------------------
+    # Registro
+    def span(self, name: str, category: str = "app", **args) -> _Span | _NullSpan:
+        """Contexto que cronometra el bloque si el tramo queda muestreado."""
+
+        if not self.should_sample():
+            return _NULL_SPAN
+        return _Span(self, name, category, args, False)
+
+    def callback_span(self, name: str | Callable[[], str], category: str = "callback") -> _Span | _NullSpan:
+        """Como ``span`` pero además alimenta la lista de callbacks lentos.
+
+        ``name`` puede ser una función sin argumentos; solo se evalúa si el
+        tramo queda muestreado.
+        """
+
+        if not self.should_sample():
+            return _NULL_SPAN
+        return _Span(self, name() if callable(name) else name, category, None, True)
+
+    def wrap_callback(self, func: Callable, category: str = "after", name: Optional[str] = None) -> Callable:
+        """Devuelve ``func`` envuelto para medirlo como callback del hilo de Tk."""
+
+        label = name or callback_name(func)
+
+        def _profiled(*args):
+            with self.callback_span(label, category):
+                return func(*args)
+
+        return _profiled
+
+    def record_span(
+        self,
+        name: str,
+        category: str,
+        start: float,
+        duration: float,
+        args: Optional[Mapping[str, object]] = None,
+        *,
+        callback: bool = False,
+    ) -> None:
+        """Guarda un tramo ya medido (``start`` en segundos de ``now()``)."""
+
+        thread = threading.current_thread()
+        tid = thread.ident or 0
+        with self._lock:
+            if tid not in self._thread_names:
+                self._thread_names[tid] = thread.name
+            self._events.append((_PHASE_COMPLETE, name, category, start, duration, tid, args))
+            stats = self._stats.get((category, name))
+            if stats is None:
+                stats = self._stats[(category, name)] = SpanStats()
+            stats.add(duration)
+            if callback and duration * 1000 >= self.slow_callback_ms:
+                self.slow_callbacks.append(
+                    SlowCallback(name, category, round(duration * 1000, 3), time.time())
+                )
+
+    def record_counter(self, name: str, values: Mapping[str, float]) -> None:
+        """Guarda una muestra de contador (retraso del bucle, colas, etc.)."""
+
+        if not self.enabled:
+            return
+        tid = threading.get_ident()
+        with self._lock:
+            self._events.append((_PHASE_COUNTER, name, "counter", self.now(), 0.0, tid, dict(values)))
+
+    def record_loop_lag(self, lag_ms: float) -> None:
+        self.loop_lag_ms = lag_ms
+        if lag_ms > self.max_loop_lag_ms:
+            self.max_loop_lag_ms = lag_ms
+        self.record_counter("loop_lag_ms", {"lag": round(lag_ms, 3)})
+
+    # ------------------------------------------------------------------
+    # Consulta y exportación
+    def stats(self) -> dict[str, dict[str, dict[str, float]]]:
+        """Agregados por categoría y nombre de tramo, en milisegundos."""
+
+        with self._lock:
+            items = [(key, stats.as_dict()) for key, stats in self._stats.items()]
+        result: dict[str, dict[str, dict[str, float]]] = {}
+        for (category, name), values in sorted(items):
+            result.setdefault(category, {})[name] = values
+        return result
+
+    def event_count(self) -> int:
+        return len(self._events)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._events.clear()
+            self._stats.clear()
+            self.slow_callbacks.clear()
+        self.loop_lag_ms = 0.0
+        self.max_loop_lag_ms = 0.0
+
+    def to_chrome_trace(self) -> dict:
+        """Convierte los eventos al formato JSON de Chrome trace-event."""
+
+        with self._lock:
+            events = list(self._events)
+            thread_names = dict(self._thread_names)
+        origin = self._origin
+        trace_events = [
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": name}}
+            for tid, name in thread_names.items()
+        ]
+        for phase, name, category, start, duration, tid, args in events:
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": phase,
+                "ts": round((start - origin) * 1_000_000, 1),
+                "pid": 1,
+                "tid": tid,
+            }
+            if phase == _PHASE_COMPLETE:
+                event["dur"] = round(duration * 1_000_000, 1)
+            if args:
+                event["args"] = {key: _json_safe(value) for key, value in args.items()}
+            trace_events.append(event)
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str | Path) -> Path:
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with target.open("w", encoding="utf-8") as handle:
+            json.dump(self.to_chrome_trace(), handle, ensure_ascii=False, separators=(",", ":"))
+        return target
+
+
+def callback_name(func: Callable) -> str:
+    name = getattr(func, "__qualname__", None) or getattr(func, "__name__", None)
+    if name:
+        return name
+    inner = getattr(func, "func", None)
+    if inner is not None:
+        return callback_name(inner)
+    return type(func).__name__
+
+
+def _json_safe(value: object) -> object:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+class LoopLagMonitor:
+    """Mide el retraso del bucle de Tk con un latido periódico."""
+
+    def __init__(
+        self,
+        widget,
+        profiler: "PerfProfiler",
+        *,
+        interval_ms: int = DEFAULT_LAG_INTERVAL_MS,
+    ) -> None:
+        self.widget = widget
+        self.profiler = profiler
+        self.interval_ms = max(1, int(interval_ms))
+        self._job_id = None
+        self._expected: Optional[float] = None
+
+    def start(self) -> None:
+        if self._job_id is not None:
+            return
+        self._schedule()
+
+    def stop(self) -> None:
+        job_id, self._job_id = self._job_id, None
+        if job_id is None:
+            return
+        try:
+            self.widget.after_cancel(job_id)
+        except Exception:
+            pass
+
+    def _schedule(self) -> None:
+        self._expected = self.profiler.now() + self.interval_ms / 1000.0
+        try:
+            self._job_id = self.widget.after(self.interval_ms, self._beat)
+        except Exception:
+            self._job_id = None
+
+    def _beat(self) -> None:
+        self._job_id = None
+        if self._expected is not None:
+            lag_ms = max(0.0, (self.profiler.now() - self._expected) * 1000)
+            self.profiler.record_loop_lag(lag_ms)
+        self._schedule()
+
+
+def instrument_after(widget, profiler: Optional[PerfProfiler] = None) -> bool:
+    """Envuelve ``after``/``after_idle`` de ``widget`` para medir sus callbacks.
+
+    Se sustituyen los atributos de la instancia, no los de la clase, así que
+    solo se miden los callbacks programados a través de ese widget (en la
+    aplicación, la ventana raíz). Devuelve ``False`` si ya estaba envuelto.
+    """
+
+    if getattr(widget, "_perf_after_instrumented", False):
+        return False
+    profiler = profiler or get_profiler()
+    original_after = widget.after
+    original_after_idle = widget.after_idle
+
+    def after(ms, func=None, *args):
+        if func is None or not profiler.enabled:
+            return original_after(ms, func, *args)
+        return original_after(ms, profiler.wrap_callback(func), *args)
+
+    def after_idle(func, *args):
+        if not profiler.enabled:
+            return original_after_idle(func, *args)
+        return original_after_idle(profiler.wrap_callback(func, "after_idle"), *args)
+
+    widget.after = after
+    widget.after_idle = after_idle
+    widget._perf_after_instrumented = True
+    return True
+
+
+_profiler = PerfProfiler()
+
+
+def get_profiler() -> PerfProfiler:
+    """Devuelve el perfilador compartido del proceso."""
+
+    return _profiler
+
+
+def configure_profiler(
+    *,
+    enabled: Optional[bool] = None,
+    sample_rate: Optional[float] = None,
+    slow_callback_ms: Optional[float] = None,
+) -> PerfProfiler:
+    """Ajusta el perfilador compartido y lo devuelve."""
+
+    if enabled is not None:
+        _profiler.enabled = bool(enabled)
+    if sample_rate is not None:
+        _profiler.sample_rate = sample_rate
+    if slow_callback_ms is not None:
+        _profiler.slow_callback_ms = float(slow_callback_ms)
+    return _profiler
+
+
+__all__ = [
+    "LoopLagMonitor",
+    "PerfProfiler",
+    "SlowCallback",
+    "SpanStats",
+    "callback_name",
+    "configure_profiler",
+    "get_profiler",
+    "instrument_after",
+]
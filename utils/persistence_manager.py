@@ -8,7 +8,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable, Iterable, Mapping
 
-from utils.background_worker import run_guarded_task
+from utils.background_worker import (TASK_PRIORITY_BACKGROUND,
+                                     TASK_PRIORITY_NORMAL, run_guarded_task)
 
 
 SchemaValidator = Callable[[Mapping[str, object]], Mapping[str, object]]
@@ -56,12 +57,22 @@ class PersistenceManager:
         on_success: Callable[[PersistenceResult], None] | None = None,
         on_error: Callable[[BaseException], None] | None = None,
     ):
-        """Persiste un ``payload`` JSON usando escritura atómica."""
+        """Persiste un ``payload`` JSON usando escritura atómica.
+
+        Los guardados sobre la misma ruta se fusionan: si el anterior aún no
+        empezó, se descarta (sin callbacks) y solo se escribe el más reciente.
+        """
 
         def _task() -> PersistenceResult:
             return self._write_atomic(path, payload)
 
-        return self._run_in_background(_task, on_success, on_error)
+        return self._run_in_background(
+            _task,
+            on_success,
+            on_error,
+            priority=TASK_PRIORITY_BACKGROUND,
+            key=("save", str(Path(path))),
+        )
 
     def load(
         self,
@@ -111,6 +122,9 @@ class PersistenceManager:
         task_func: Callable[[], PersistenceResult],
         on_success: Callable[[PersistenceResult], None] | None,
         on_error: Callable[[BaseException], None] | None,
+        *,
+        priority: int = TASK_PRIORITY_NORMAL,
+        key=None,
     ):
         if self.root is not None:
             return run_guarded_task(
@@ -119,6 +133,8 @@ class PersistenceManager:
                 on_error,
                 self.root,
                 category=self.task_category,
+                priority=priority,
+                key=key,
             )
         try:
             result = task_func()
@@ -17,6 +17,7 @@ class ProgressDialog:
         *,
         on_cancel: Optional[Callable[[], None]] = None,
         poll_interval_ms: int = 50,
+        cancellable: bool = True,
     ) -> None:
         self.parent = parent
         self._on_cancel = on_cancel
@@ -24,7 +25,7 @@ class ProgressDialog:
         self._queue: SimpleQueue[tuple[int, int]] | None = None
         self._future = None
         self._job_id: str | None = None
-        self._cancelled = False
+        self._cancelled = not cancellable
 
         self.top = tk.Toplevel(parent)
         self.top.title(title)
@@ -47,7 +48,8 @@ class ProgressDialog:
         ttk.Label(self.top, textvariable=self._label_var).grid(row=2, column=0, columnspan=2, padx=10, pady=(0, 10), sticky="w")
 
         self._cancel_button = ttk.Button(self.top, text="Cancelar", command=self._handle_cancel)
-        self._cancel_button.grid(row=3, column=0, columnspan=2, padx=10, pady=(0, 10), sticky="e")
+        if cancellable:
+            self._cancel_button.grid(row=3, column=0, columnspan=2, padx=10, pady=(0, 10), sticky="e")
         self.top.columnconfigure(0, weight=1)
 
     def track_future(self, future, queue: SimpleQueue[tuple[int, int]]):
@@ -88,6 +90,11 @@ class ProgressDialog:
             return
         self._schedule_poll()
 
+    def update_progress(self, current: int, total: int):
+        """Actualiza el avance de tareas que corren en el hilo de Tk."""
+
+        self._update_values(current, total)
+
     def _update_values(self, current: int, total: int):
         total = max(total, 0)
         percent = 0.0
@@ -0,0 +1,244 @@
+"""Caché persistente de los resúmenes generados por el modelo local.
+
+``SpanishSummaryHelper`` solo guardaba los resúmenes en un diccionario en
+memoria, así que cada reinicio de la aplicación volvía a ejecutar la
+generación con búsqueda por haces para las secciones de la alerta temprana
+y para la auto-redacción, aunque la narrativa del caso no hubiera cambiado.
+
+``SummaryCache`` guarda cada resumen en SQLite (por defecto en la unidad
+externa) bajo un hash SHA-256 del modelo, el prompt y los parámetros de
+generación. Cuando el tamaño total de los textos supera ``max_bytes`` se
+eliminan primero los menos usados recientemente. Si la base no se puede
+abrir o escribir, la caché se desactiva y todo se comporta como un fallo de
+caché: el resumen se genera igual.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS summaries (
+        key TEXT PRIMARY KEY,
+        model TEXT NOT NULL,
+        section TEXT NOT NULL DEFAULT '',
+        text TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        created_at REAL NOT NULL,
+        accessed_at REAL NOT NULL,
+        hits INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_summaries_accessed ON summaries(accessed_at)",
+)
+
+
+def build_cache_key(model: str, prompt: str, params: Mapping[str, object]) -> str:
+    """Hash estable del modelo, el prompt y los parámetros de generación."""
+
+    payload = json.dumps(
+        {"model": model, "prompt": prompt, "params": dict(params)},
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SummaryCache:
+    """Almacén LRU en SQLite con métricas de aciertos y fallos."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = Path(path)
+        self.max_bytes = max(0, int(max_bytes))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._disabled = False
+        self.metrics = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0, "errors": 0}
+
+    # ------------------------------------------------------------------
+    # API pública
+    def get(self, model: str, prompt: str, params: Mapping[str, object]) -> Optional[str]:
+        key = build_cache_key(model, prompt, params)
+        with self._lock:
+            connection = self._connect()
+            if connection is None:
+                self.metrics["misses"] += 1
+                return None
+            try:
+                row = connection.execute("SELECT text FROM summaries WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    connection.execute(
+                        "UPDATE summaries SET accessed_at = ?, hits = hits + 1 WHERE key = ?",
+                        (self._clock(), key),
+                    )
+                    connection.commit()
+            except sqlite3.Error as exc:
+                self._fail(exc)
+                self.metrics["misses"] += 1
+                return None
+        if row is None:
+            self.metrics["misses"] += 1
+            return None
+        self.metrics["hits"] += 1
+        return row[0]
+
+    def put(
+        self,
+        model: str,
+        prompt: str,
+        params: Mapping[str, object],
+        text: str,
+        *,
+        section: str = "",
+    ) -> bool:
+        """Guarda ``text`` y aplica la expulsión LRU; devuelve si se escribió."""
+
+        key = build_cache_key(model, prompt, params)
+        size = len(text.encode("utf-8"))
+        now = self._clock()
+        with self._lock:
+            connection = self._connect()
+            if connection is None:
+                return False
+            try:
+                connection.execute(
+                    "INSERT OR REPLACE INTO summaries"
+                    " (key, model, section, text, size, created_at, accessed_at, hits)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, 0)",
+                    (key, model, section, text, size, now, now),
+                )
+                self.metrics["evictions"] += self._evict(connection)
+                connection.commit()
+            except sqlite3.Error as exc:
+                self._fail(exc)
+                return False
+        self.metrics["writes"] += 1
+        return True
+
+    def stats(self) -> dict[str, float]:
+        """Métricas de la sesión más el tamaño actual de la caché."""
+
+        entries = 0
+        total_bytes = 0
+        with self._lock:
+            connection = self._connect()
+            if connection is not None:
+                try:
+                    entries, total_bytes = connection.execute(
+                        "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM summaries"
+                    ).fetchone()
+                except sqlite3.Error as exc:
+                    self._fail(exc)
+        lookups = self.metrics["hits"] + self.metrics["misses"]
+        return {
+            **self.metrics,
+            "entries": entries,
+            "bytes": total_bytes,
+            "hit_rate": round(self.metrics["hits"] / lookups, 4) if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            connection = self._connect()
+            if connection is None:
+                return
+            try:
+                connection.execute("DELETE FROM summaries")
+                connection.commit()
+            except sqlite3.Error as exc:
+                self._fail(exc)
+
+    def close(self) -> None:
+        with self._lock:
+            connection, self._connection = self._connection, None
+        if connection is not None:
+            connection.close()
+
+    # ------------------------------------------------------------------
+    # Implementación
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._disabled:
+            return None
+        if self._connection is not None:
+            return self._connection
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.path), timeout=5, check_same_thread=False)
+            for statement in _SCHEMA:
+                connection.execute(statement)
+            connection.commit()
+        except (OSError, sqlite3.Error) as exc:
+            self._fail(exc)
+            return None
+        self._connection = connection
+        return connection
+
+    def _evict(self, connection: sqlite3.Connection) -> int:
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM summaries").fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+        removed = 0
+        candidates = connection.execute(
+            "SELECT key, size FROM summaries ORDER BY accessed_at ASC, created_at ASC"
+        ).fetchall()
+        for key, size in candidates:
+            if total <= self.max_bytes:
+                break
+            connection.execute("DELETE FROM summaries WHERE key = ?", (key,))
+            total -= size
+            removed += 1
+        return removed
+
+    def _fail(self, exc: BaseException) -> None:
+        self.metrics["errors"] += 1
+        if not self._disabled:
+            logger.warning("Caché de resúmenes desactivada (%s): %s", self.path, exc)
+        self._disabled = True
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            try:
+                connection.close()
+            except sqlite3.Error:
+                pass
+
+
+_shared_cache: Optional[SummaryCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_summary_cache() -> SummaryCache:
+    """Devuelve la caché compartida configurada en ``settings``."""
+
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            import settings
+
+            _shared_cache = SummaryCache(
+                settings.LLM_SUMMARY_CACHE_PATH,
+                max_bytes=settings.LLM_SUMMARY_CACHE_MAX_BYTES,
+            )
+        return _shared_cache
+
+
+__all__ = ["DEFAULT_MAX_BYTES", "SummaryCache", "build_cache_key", "get_summary_cache"]
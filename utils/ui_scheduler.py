@@ -0,0 +1,298 @@
+"""Planificador central que agrupa los trabajos diferidos de la interfaz.
+
+Cada ``trace`` de un ``StringVar`` programaba su propio ``after`` o
+``after_idle``: la validación con retardo de ``FieldValidator``, el refresco
+del resumen, el autoguardado, la comprobación de duplicados o el
+``update_idletasks`` de seguridad. Al teclear o importar, Tk acumulaba
+cientos de temporizadores que se ejecutaban en cualquier orden.
+
+``CoalescingScheduler`` mantiene un único temporizador por ventana raíz.
+Los ``trace`` solo marcan un trabajo como pendiente bajo una clave; las
+solicitudes repetidas con la misma clave se fusionan. Un único ``tick``
+ejecuta los trabajos vencidos por clase de prioridad (validación antes que
+resúmenes, resúmenes antes que el diseño y este antes de la persistencia)
+y se detiene al agotar el presupuesto de tiempo del fotograma, dejando el
+resto para el siguiente ciclo ocioso.
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import math
+import time
+import tkinter as tk
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Hashable, Iterable, Optional
+
+from utils.perf_profiler import get_profiler
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_VALIDATION = 0
+PRIORITY_SUMMARY = 10
+PRIORITY_LAYOUT = 20
+PRIORITY_PERSISTENCE = 30
+
+DEFAULT_FRAME_BUDGET_MS = 8.0
+
+_SCHEDULER_ATTR = "_ui_coalescing_scheduler"
+
+
+@dataclass
+class _Job:
+    key: Hashable
+    callback: Callable[[], object]
+    priority: int
+    due: float
+    seq: int
+
+
+class CoalescingScheduler:
+    """Agrupa trabajos por clave y los drena en un único ``tick`` de Tk."""
+
+    def __init__(
+        self,
+        widget,
+        *,
+        frame_budget_ms: float = DEFAULT_FRAME_BUDGET_MS,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.widget = widget
+        self.frame_budget_ms = frame_budget_ms
+        self._clock = clock
+        self._jobs: dict[Hashable, _Job] = {}
+        # ``(due, seq, key)`` de los trabajos pendientes. Las entradas que
+        # quedan viejas (trabajo ejecutado, cancelado o con nuevo plazo) se
+        # descartan al llegar a la cima, así que armar el tick es O(log n).
+        self._due_heap: list[tuple[float, int, Hashable]] = []
+        self._seq = 0
+        self._tick_job: Optional[str] = None
+        self._tick_due: Optional[float] = None
+        self._draining = False
+        self.stats = {
+            "enqueued": 0,
+            "coalesced": 0,
+            "executed": 0,
+            "cancelled": 0,
+            "deferred": 0,
+            "ticks": 0,
+            "errors": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # API pública
+    def schedule(
+        self,
+        key: Hashable,
+        callback: Callable[[], object],
+        *,
+        priority: int = PRIORITY_SUMMARY,
+        delay_ms: int = 0,
+        debounce: bool = True,
+    ) -> Hashable:
+        """Marca ``key`` como pendiente y devuelve la propia clave.
+
+        Si la clave ya estaba pendiente se sustituye su ``callback``. Con
+        ``debounce=True`` el vencimiento se reinicia (comportamiento de los
+        validadores); con ``debounce=False`` se conserva el vencimiento
+        original, de modo que una ráfaga de cambios produce una sola
+        ejecución al cumplirse el primer plazo.
+        """
+
+        self.stats["enqueued"] += 1
+        due = self._clock() + max(0, delay_ms) / 1000.0
+        job = self._jobs.get(key)
+        if job is not None:
+            self.stats["coalesced"] += 1
+            job.callback = callback
+            job.priority = min(job.priority, priority)
+            if debounce:
+                job.due = due
+                self._push_due(job)
+        else:
+            self._seq += 1
+            job = self._jobs[key] = _Job(key, callback, priority, due, self._seq)
+            self._push_due(job)
+        self._arm()
+        return key
+
+    def cancel(self, key: Hashable) -> bool:
+        job = self._jobs.pop(key, None)
+        if job is None:
+            return False
+        self.stats["cancelled"] += 1
+        if not self._jobs:
+            self._due_heap.clear()
+            self._cancel_tick()
+        return True
+
+    def is_pending(self, key: Hashable) -> bool:
+        return key in self._jobs
+
+    def pending_count(self) -> int:
+        return len(self._jobs)
+
+    def flush(self, keys: Optional[Iterable[Hashable]] = None) -> int:
+        """Ejecuta de inmediato los trabajos indicados (o todos) sin presupuesto."""
+
+        if keys is None:
+            selected = list(self._jobs.values())
+        else:
+            selected = [self._jobs[key] for key in keys if key in self._jobs]
+        executed = self._run_jobs(sorted(selected, key=_job_order), deadline=None)
+        if self._jobs:
+            self._arm()
+        else:
+            self._cancel_tick()
+        return executed
+
+    # ------------------------------------------------------------------
+    # Implementación
+    def _push_due(self, job: _Job) -> None:
+        heap = self._due_heap
+        if len(heap) > 2 * len(self._jobs) + 64:
+            # Demasiadas entradas viejas debajo de la cima: se reconstruye.
+            heap[:] = [(pending.due, pending.seq, pending.key) for pending in self._jobs.values()]
+            heapq.heapify(heap)
+        else:
+            heapq.heappush(heap, (job.due, job.seq, job.key))
+
+    def _earliest_due(self) -> Optional[float]:
+        heap = self._due_heap
+        while heap:
+            due, seq, key = heap[0]
+            job = self._jobs.get(key)
+            if job is not None and job.seq == seq and job.due == due:
+                return due
+            heapq.heappop(heap)
+        return None
+
+    def _arm(self) -> None:
+        if self._draining or not self._jobs:
+            return
+        earliest = self._earliest_due()
+        if earliest is None:
+            return
+        if self._tick_job is not None and self._tick_due is not None and self._tick_due <= earliest:
+            return
+        self._cancel_tick()
+        delay_ms = max(0, math.ceil((earliest - self._clock()) * 1000))
+        try:
+            if delay_ms == 0:
+                self._tick_job = self.widget.after_idle(self._tick)
+            else:
+                self._tick_job = self.widget.after(delay_ms, self._tick)
+        except (tk.TclError, AttributeError, RuntimeError):
+            # Sin bucle de eventos disponible los trabajos se ejecutan en línea.
+            self._tick_job = None
+            self._tick_due = None
+            self.flush()
+            return
+        self._tick_due = earliest
+
+    def _cancel_tick(self) -> None:
+        job_id = self._tick_job
+        self._tick_job = None
+        self._tick_due = None
+        if job_id is None:
+            return
+        try:
+            self.widget.after_cancel(job_id)
+        except (tk.TclError, AttributeError):
+            pass
+
+    def _tick(self) -> None:
+        self._tick_job = None
+        self._tick_due = None
+        self.stats["ticks"] += 1
+        now = self._clock()
+        due_jobs = sorted(
+            (job for job in self._jobs.values() if job.due <= now), key=_job_order
+        )
+        deadline = now + self.frame_budget_ms / 1000.0 if self.frame_budget_ms else None
+        self._run_jobs(due_jobs, deadline=deadline)
+        self._arm()
+
+    def _run_jobs(self, jobs: list[_Job], *, deadline: Optional[float]) -> int:
+        executed = 0
+        profiler = get_profiler()
+        self._draining = True
+        try:
+            for index, job in enumerate(jobs):
+                if self._jobs.get(job.key) is not job:
+                    continue
+                del self._jobs[job.key]
+                try:
+                    with profiler.callback_span(partial(_span_name, job.key), "ui_scheduler"):
+                        job.callback()
+                except Exception:
+                    self.stats["errors"] += 1
+                    logger.exception("Falló el trabajo diferido %r", job.key)
+                executed += 1
+                self.stats["executed"] += 1
+                if deadline is not None and self._clock() >= deadline:
+                    remaining = sum(1 for pending in jobs[index + 1:] if pending.key in self._jobs)
+                    self.stats["deferred"] += remaining
+                    break
+        finally:
+            self._draining = False
+        return executed
+
+
+def _job_order(job: _Job) -> tuple[int, int]:
+    return (job.priority, job.seq)
+
+
+def _span_name(key: Hashable) -> str:
+    """Nombre del tramo del perfilador para ``key``.
+
+    Las claves en tupla llevan el ``id`` del widget (``("validacion",
+    id(self))``); solo se usa la primera parte para que las estadísticas se
+    agrupen por tipo de trabajo y no crezcan con cada instancia.
+    """
+
+    if isinstance(key, tuple) and key:
+        key = key[0]
+    return str(key)
+
+
+def install_ui_scheduler(root, **options) -> CoalescingScheduler:
+    """Crea (una sola vez) el planificador asociado a la ventana ``root``."""
+
+    scheduler = getattr(root, _SCHEDULER_ATTR, None)
+    if isinstance(scheduler, CoalescingScheduler):
+        return scheduler
+    scheduler = CoalescingScheduler(root, **options)
+    setattr(root, _SCHEDULER_ATTR, scheduler)
+    return scheduler
+
+
+def get_ui_scheduler(widget) -> Optional[CoalescingScheduler]:
+    """Devuelve el planificador de la raíz de ``widget`` si fue instalado."""
+
+    scheduler = getattr(widget, _SCHEDULER_ATTR, None)
+    if isinstance(scheduler, CoalescingScheduler):
+        return scheduler
+    resolve_root = getattr(widget, "_root", None)
+    if not callable(resolve_root):
+        return None
+    try:
+        root = resolve_root()
+    except (tk.TclError, AttributeError, RuntimeError):
+        return None
+    scheduler = getattr(root, _SCHEDULER_ATTR, None)
+    return scheduler if isinstance(scheduler, CoalescingScheduler) else None
+
+
+__all__ = [
+    "CoalescingScheduler",
+    "DEFAULT_FRAME_BUDGET_MS",
+    "PRIORITY_LAYOUT",
+    "PRIORITY_PERSISTENCE",
+    "PRIORITY_SUMMARY",
+    "PRIORITY_VALIDATION",
+    "get_ui_scheduler",
+    "install_ui_scheduler",
+]
@@ -7,6 +7,7 @@ from validation_badge.validation_badge import (
     ValidationBadgeRegistry,
     badge_registry,
     build_message_preview,
+    destroy_badge_subtrees,
     iter_active_badges,
 )
 
@@ -16,6 +17,7 @@ __all__ = [
     "ValidationBadgeRegistry",
     "badge_registry",
     "build_message_preview",
+    "destroy_badge_subtrees",
     "iter_active_badges",
     "WARNING_ICON",
     "SUCCESS_ICON",
@@ -167,7 +167,7 @@ def build_message_preview(message: str, *, max_chars_per_line: int = 18, max_lin
 class ValidationBadge:
     """Displays validation feedback with cycling view modes."""
 
-    instances: set["ValidationBadge"] = set()
+    instances: "weakref.WeakSet[ValidationBadge]" = weakref.WeakSet()
 
     STYLE_MAP = {
         "warning": WARNING_STYLE,
@@ -216,6 +216,10 @@ class ValidationBadge:
         self._message_short = ""
         self._geometry_manager: str | None = None
         self._geometry_options: dict[str, Any] | None = None
+        # Back-references to the (registry, key) slots holding this badge so
+        # unregistering never scans every registry.
+        self._owners: list[tuple[weakref.ref, str]] = []
+        self._tracks_destroy = False
         try:
             self._text_var = self._tk.StringVar()
         except Exception:
@@ -249,7 +253,8 @@ class ValidationBadge:
         _register_badge(self)
         self.instances.add(self)
         try:
-            self._label.bind("<Destroy>", lambda _evt, badge=self: _unregister_badge(badge), add="+")
+            self._label.bind("<Destroy>", lambda _evt, badge=self: _release_destroyed_badge(badge), add="+")
+            self._tracks_destroy = True
         except Exception:
             pass
 
@@ -512,7 +517,7 @@ class ValidationBadgeRegistry:
         self._registry: dict[str, ValidationBadge] = {}
         self._labels: dict[str, tuple[str, str]] = {}
         self._updaters: dict[str, Callable[[], str | None]] = {}
-        _REGISTRIES.add(self)
+        self._ref = weakref.ref(self)
 
     def claim(
         self,
@@ -549,7 +554,13 @@ class ValidationBadgeRegistry:
     ) -> None:
         pending_label = pending_text or self.pending_text
         success_label = success_text or self.success_text
+        previous = self._registry.get(key)
+        if previous is not None and previous is not badge:
+            _drop_owner(previous, self, key)
         self._registry[key] = badge
+        owners = getattr(badge, "_owners", None)
+        if owners is not None and not any(ref() is self and owned == key for ref, owned in owners):
+            owners.append((self._ref, key))
         self._labels[key] = (pending_label, success_label)
         badge.set_neutral(pending_label)
 
@@ -611,11 +622,21 @@ class ValidationBadgeRegistry:
             return False
 
     def _purge_badge(self, badge: ValidationBadge) -> None:
-        stale_keys = [key for key, registered in self._registry.items() if registered is badge]
+        owners = getattr(badge, "_owners", None)
+        if owners is None:
+            stale_keys = [key for key, registered in self._registry.items() if registered is badge]
+        else:
+            stale_keys = [key for ref, key in owners if ref() is self]
+            owners[:] = [(ref, key) for ref, key in owners if ref() is not self]
         for key in stale_keys:
-            self._registry.pop(key, None)
-            self._labels.pop(key, None)
-            self._updaters.pop(key, None)
+            self._release_key(key, badge)
+
+    def _release_key(self, key: str, badge: ValidationBadge) -> None:
+        if self._registry.get(key) is not badge:
+            return
+        self._registry.pop(key, None)
+        self._labels.pop(key, None)
+        self._updaters.pop(key, None)
 
 
 class ValidationBadgeGroup(ValidationBadgeRegistry):
@@ -624,41 +645,127 @@ class ValidationBadgeGroup(ValidationBadgeRegistry):
     create_and_register = ValidationBadgeRegistry.claim
 
 
-_ACTIVE_BADGES: set[ValidationBadge] = set()
-_REGISTRIES: weakref.WeakSet[ValidationBadgeRegistry] = weakref.WeakSet()
+_ACTIVE_BADGES: "weakref.WeakSet[ValidationBadge]" = weakref.WeakSet()
+# Badges indexed by every ancestor Tk path of their label, so releasing the
+# badges under a container only touches that container's badges.
+_BADGES_BY_CONTAINER: "dict[str, weakref.WeakSet[ValidationBadge]]" = {}
 
 
 def _register_badge(badge: ValidationBadge) -> None:
     _ACTIVE_BADGES.add(badge)
+    paths = _container_paths(_widget_path(getattr(badge, "_label", None)))
+    badge._container_paths = paths
+    for path in paths:
+        bucket = _BADGES_BY_CONTAINER.get(path)
+        if bucket is None:
+            bucket = _BADGES_BY_CONTAINER[path] = weakref.WeakSet()
+        bucket.add(badge)
+
+
+def _unindex_badge(badge: ValidationBadge) -> None:
+    for path in badge.__dict__.pop("_container_paths", ()):
+        bucket = _BADGES_BY_CONTAINER.get(path)
+        if bucket is None:
+            continue
+        bucket.discard(badge)
+        if not bucket:
+            del _BADGES_BY_CONTAINER[path]
+
+
+def _drop_owner(badge: ValidationBadge, registry: ValidationBadgeRegistry, key: str) -> None:
+    owners = getattr(badge, "_owners", None)
+    if owners:
+        owners[:] = [(ref, owned) for ref, owned in owners if not (ref() is registry and owned == key)]
 
 
 def _unregister_badge(badge: ValidationBadge) -> None:
+    """Forget ``badge`` in O(number of keys it was registered under)."""
+
     _ACTIVE_BADGES.discard(badge)
-    try:
-        ValidationBadge.instances.discard(badge)
-    except Exception:
-        pass
-    for registry in list(_REGISTRIES):
+    ValidationBadge.instances.discard(badge)
+    _unindex_badge(badge)
+    owners = getattr(badge, "_owners", None)
+    if not owners:
+        return
+    for ref, key in owners:
+        registry = ref()
+        if registry is not None:
+            registry._release_key(key, badge)
+    owners.clear()
+
+
+def _release_destroyed_badge(badge: ValidationBadge) -> None:
+    # Badges already released by ``destroy_badge_subtrees`` skip the work.
+    if badge.__dict__.get("_is_destroyed"):
+        return
+    badge._is_destroyed = True
+    _unregister_badge(badge)
+
+
+def _widget_path(widget) -> str | None:  # noqa: ANN001
+    path = getattr(widget, "_w", None)
+    return path if isinstance(path, str) else None
+
+
+def _container_paths(path: str | None) -> list[str]:
+    """``path`` and the Tk paths of its ancestors, without the root ``.``."""
+
+    paths: list[str] = []
+    while path:
+        paths.append(path)
+        cut = path.rfind(".")
+        if cut <= 0:
+            break
+        path = path[:cut]
+    return paths
+
+
+def destroy_badge_subtrees(widgets: Iterable[Any]) -> int:
+    """Destroy ``widgets`` after releasing every badge they contain in one pass.
+
+    Destroying a product or a whole case fired one ``<Destroy>`` handler per
+    badge. Badges under the given containers are looked up in the index by
+    container path (only those badges are touched), unregistered in bulk and flagged as destroyed, so the handlers triggered
+    by ``destroy()`` become no-ops. Returns the number of released badges.
+    """
+
+    targets = [widget for widget in widgets if widget is not None]
+    released = 0
+    for path in {path for path in map(_widget_path, targets) if path}:
+        bucket = _BADGES_BY_CONTAINER.pop(path, None)
+        for badge in list(bucket or ()):
+            badge._is_destroyed = True
+            _unregister_badge(badge)
+            released += 1
+    for widget in targets:
+        destroy = getattr(widget, "destroy", None)
+        if not callable(destroy):
+            continue
         try:
-            registry._purge_badge(badge)
-        except Exception:
+            destroy()
+        except TclError:
             continue
+    return released
 
 
 def iter_active_badges() -> Iterable[ValidationBadge]:
-    """Yield ValidationBadge instances that are still alive."""
+    """Yield ValidationBadge instances that are still alive.
 
-    stale: set[ValidationBadge] = set()
-    for badge in _ACTIVE_BADGES:
-        try:
-            exists = bool(badge.widget.winfo_exists())
-        except Exception:
-            exists = False
-        if exists:
-            yield badge
-        else:
-            stale.add(badge)
-    _ACTIVE_BADGES.difference_update(stale)
+    Badges whose label reports ``<Destroy>`` are dropped by that handler, so
+    only the few labels that could not bind it are probed here.
+    """
+
+    stale: list[ValidationBadge] = []
+    for badge in list(_ACTIVE_BADGES):
+        if getattr(badge, "_is_destroyed", False):
+            stale.append(badge)
+            continue
+        if not getattr(badge, "_tracks_destroy", False) and not badge._widget_exists():
+            stale.append(badge)
+            continue
+        yield badge
+    for badge in stale:
+        _unregister_badge(badge)
 
 
 badge_registry = ValidationBadgeRegistry()
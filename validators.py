@@ -7,12 +7,14 @@ import unicodedata
 from contextlib import suppress
 from datetime import datetime
 from decimal import Decimal, InvalidOperation, localcontext, ROUND_HALF_UP
+from functools import lru_cache
 from typing import Callable, Dict, List, Optional, Tuple
 
 from tkinter import TclError, messagebox
 
 from settings import RICH_TEXT_MAX_CHARS, TIPO_PRODUCTO_LIST
 from ui.tooltips import ValidationTooltip
+from utils.ui_scheduler import PRIORITY_VALIDATION, get_ui_scheduler
 
 _LOG_QUEUE: List[dict] = []
 LOG_FIELDNAMES = [
@@ -28,10 +30,14 @@ LOG_FIELDNAMES = [
 ]
 
 
+# Caracteres de control que se borran en una sola pasada en C. La categoría
+# ``Cc`` son exactamente C0 (U+0000-U+001F), DEL y C1 (U+0080-U+009F).
+_LOG_CONTROL_RE = re.compile("[\x00-\x09\x0b-\x1f\x7f-\x9f]+")
+_RICH_TEXT_CONTROL_RE = re.compile("[\x00-\x08\x0b-\x1f\x7f]+")
+
+
 def _scrub_control_characters(text: str) -> str:
-    return "".join(
-        ch for ch in text if ch == "\n" or unicodedata.category(ch) != "Cc"
-    )
+    return _LOG_CONTROL_RE.sub("", text)
 
 
 def _sanitize_log_value(
@@ -139,27 +145,52 @@ def validate_product_dates(producto_id: str, fecha_ocurrencia: str, fecha_descub
     return None
 
 
-def validate_money_bounds(value: str, label: str, allow_blank: bool = True):
-    text = (value or "").strip()
-    if not text:
-        return (None, None, "") if allow_blank else (f"Debe ingresar {label}.", None, "")
+MONEY_PARSE_CACHE_SIZE = 8192
+
+_MONEY_ERRORS = {
+    "invalid": "{label} debe ser un número válido.",
+    "decimals": "{label} solo puede tener dos decimales como máximo.",
+    "negative": "{label} no puede ser negativo.",
+    "digits": "{label} no puede tener más de 12 dígitos en la parte entera.",
+}
+
+
+@lru_cache(maxsize=MONEY_PARSE_CACHE_SIZE)
+def _parse_money_text(text: str) -> Tuple[Optional[str], Optional[Decimal], str]:
+    """Interpreta un monto ya recortado y memoriza el resultado por texto crudo.
+
+    Los mismos textos de monto se vuelven a validar en cada autoguardado,
+    refresco del resumen y exportación; ``Decimal`` es inmutable, así que el
+    resultado puede compartirse entre productos.
+    """
+
     try:
         with localcontext() as ctx:
             ctx.prec = 20
             amount = Decimal(text)
     except InvalidOperation:
-        return (f"{label} debe ser un número válido.", None, "")
+        return ("invalid", None, "")
     amount_tuple = amount.as_tuple()
     if amount_tuple.exponent < -2:
-        return (f"{label} solo puede tener dos decimales como máximo.", None, "")
+        return ("decimals", None, "")
     quantized = amount.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
     if quantized < 0:
-        return (f"{label} no puede ser negativo.", None, "")
+        return ("negative", None, "")
 
     normalized_text = f"{quantized:.2f}"
     integer_part = normalized_text.split(".")[0].lstrip("-")
     if len(integer_part) > 12:
-        return (f"{label} no puede tener más de 12 dígitos en la parte entera.", None, "")
+        return ("digits", None, "")
+    return (None, quantized, normalized_text)
+
+
+def validate_money_bounds(value: str, label: str, allow_blank: bool = True):
+    text = (value or "").strip()
+    if not text:
+        return (None, None, "") if allow_blank else (f"Debe ingresar {label}.", None, "")
+    error, quantized, normalized_text = _parse_money_text(text)
+    if error:
+        return (_MONEY_ERRORS[error].format(label=label), None, "")
     return (None, quantized, normalized_text)
 
 
@@ -239,7 +270,7 @@ def validate_risk_id(value: str) -> Optional[str]:
         return "Debe ingresar el ID de riesgo."
     if len(text) > 60:
         return "El ID de riesgo no puede tener más de 60 caracteres."
-    if not all(ch.isprintable() for ch in text):
+    if not text.isprintable():
         return "El ID de riesgo solo puede usar caracteres imprimibles."
     return None
 
@@ -259,11 +290,39 @@ def validate_multi_selection(value: str, label: str) -> Optional[str]:
     return None
 
 
+NORMALIZE_CACHE_SIZE = 4096
+# Solo se memorizan textos cortos (etiquetas de catálogo, opciones de listas).
+_NORMALIZE_CACHE_MAX_CHARS = 128
+# Diacríticos combinantes básicos, los únicos que deja NFKD en texto latino.
+# U+034F (combining grapheme joiner) tiene clase combinante 0 y se conserva.
+_COMBINING_DIACRITICS_RE = re.compile("[\u0300-\u034e\u0350-\u036f]+")
+
+
+def _strip_accents(value: str) -> str:
+    stripped = _COMBINING_DIACRITICS_RE.sub("", unicodedata.normalize("NFKD", value))
+    if stripped.isascii():
+        return stripped
+    return "".join(ch for ch in stripped if not unicodedata.combining(ch))
+
+
+_strip_accents_cached = lru_cache(maxsize=NORMALIZE_CACHE_SIZE)(_strip_accents)
+
+
 def normalize_without_accents(value: str) -> str:
+    """Descompone ``value`` (NFKD) y elimina las marcas combinantes.
+
+    El texto ASCII no cambia con NFKD y se devuelve tal cual; los textos
+    cortos se memorizan porque los catálogos comparan las mismas etiquetas
+    una y otra vez.
+    """
+
     if not isinstance(value, str):
         return ""
-    normalized = unicodedata.normalize("NFKD", value)
-    return "".join(ch for ch in normalized if not unicodedata.combining(ch))
+    if value.isascii():
+        return value
+    if len(value) <= _NORMALIZE_CACHE_MAX_CHARS:
+        return _strip_accents_cached(value)
+    return _strip_accents(value)
 
 
 ProductFamilyRule = Tuple[re.Pattern[str], str]
@@ -398,6 +457,18 @@ class FieldValidator:
     # o ``instances`` apunta a una lista, cada validador se añadirá
     # automáticamente.
     instance_registry: Optional[list] = None
+    # Suspensión global durante cargas masivas: alcanza también a los
+    # validadores creados mientras dura la carga.
+    _global_suspend_count = 0
+
+    @classmethod
+    def suspend_all(cls) -> None:
+        FieldValidator._global_suspend_count += 1
+
+    @classmethod
+    def resume_all(cls) -> None:
+        if FieldValidator._global_suspend_count > 0:
+            FieldValidator._global_suspend_count -= 1
 
     @classmethod
     def set_status_consumer(
@@ -468,8 +539,25 @@ class FieldValidator:
 
         self._bind_widget_events(widget)
 
+    def _is_suspended(self) -> bool:
+        return self._suspend_count > 0 or FieldValidator._global_suspend_count > 0
+
+    def revalidate_if_changed(self) -> bool:
+        """Valida una sola vez si el valor cambió mientras estaba suspendido."""
+
+        if self._is_suspended() or self._capture_current_value() == self._last_validated_value:
+            return False
+        self._cancel_pending_validation()
+        self._run_validation(
+            allow_modal_notifications=False,
+            transient=False,
+            is_focus_out=False,
+            event_context=None,
+        )
+        return True
+
     def _on_change(self, event_name=None, *_args):
-        if self._suspend_count > 0:
+        if self._is_suspended():
             return
         if event_name is not None and not isinstance(event_name, str):
             event = event_name
@@ -559,32 +647,43 @@ class FieldValidator:
         event_context: Optional[str],
         delay_ms: int = 120,
     ) -> None:
+        def run() -> None:
+            self._run_validation(
+                allow_modal_notifications=allow_modal_notifications,
+                transient=transient,
+                is_focus_out=is_focus_out,
+                event_context=event_context,
+            )
+
+        scheduler = get_ui_scheduler(self.widget)
+        if scheduler is not None:
+            # El planificador central fusiona la ráfaga de ``trace`` por
+            # validador y ejecuta todas las validaciones en un solo ``tick``.
+            self._debounce_job = scheduler.schedule(
+                ("validacion", id(self)),
+                run,
+                priority=PRIORITY_VALIDATION,
+                delay_ms=delay_ms,
+            )
+            return
         self._cancel_pending_validation()
         after = getattr(self.widget, "after", None)
         if callable(after):
             try:
-                self._debounce_job = after(
-                    delay_ms,
-                    lambda: self._run_validation(
-                        allow_modal_notifications=allow_modal_notifications,
-                        transient=transient,
-                        is_focus_out=is_focus_out,
-                        event_context=event_context,
-                    ),
-                )
+                self._debounce_job = after(delay_ms, run)
                 return
             except Exception:
                 self._debounce_job = None
-        self._run_validation(
-            allow_modal_notifications=allow_modal_notifications,
-            transient=transient,
-            is_focus_out=is_focus_out,
-            event_context=event_context,
-        )
+        run()
 
     def _cancel_pending_validation(self) -> None:
         if not self._debounce_job:
             return
+        scheduler = get_ui_scheduler(self.widget)
+        if scheduler is not None and scheduler.is_pending(self._debounce_job):
+            scheduler.cancel(self._debounce_job)
+            self._debounce_job = None
+            return
         after_cancel = getattr(self.widget, "after_cancel", None)
         if callable(after_cancel):
             try:
@@ -747,10 +846,11 @@ def sanitize_rich_text(text: str | None, max_chars: Optional[int] = RICH_TEXT_MA
     """
 
     normalized = "" if text is None else str(text).replace("\r\n", "\n").replace("\r", "\n")
-    filtered_chars = [
-        ch for ch in normalized if ch in {"\n", "\t"} or ch.isprintable()
-    ]
-    sanitized = "".join(filtered_chars)
+    sanitized = _RICH_TEXT_CONTROL_RE.sub("", normalized)
+    # Tras borrar los controles ASCII, el texto ASCII ya es imprimible. Para el
+    # resto se comprueba en C y solo se filtra carácter a carácter si hace falta.
+    if not sanitized.isascii() and not sanitized.replace("\n", " ").replace("\t", " ").isprintable():
+        sanitized = "".join(ch for ch in sanitized if ch in "\n\t" or ch.isprintable())
     if max_chars is not None and max_chars > 0:
         return sanitized[:max_chars]
     return sanitized